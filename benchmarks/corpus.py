@@ -0,0 +1,159 @@
+"""
+Synthetic deliverable corpus
+Generates markdown deliverables of every type in campaign-brief.schema.json,
+at any size and markup density, for benchmarking the quality gates. Output
+is deterministic for a given type, size, density and seed.
+
+    from corpus import deliverable_types, generate
+
+    text = generate('press-release', 10 * 1024, markup=0.5)
+"""
+
+import json
+import random
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = ROOT / 'schemas' / 'campaign-brief.schema.json'
+EXAMPLES_DIR = ROOT / 'examples' / 'deliverables'
+
+SIZES = {
+    'tweet': 280,
+    '1KB': 1024,
+    '10KB': 10 * 1024,
+    '100KB': 100 * 1024,
+    '1MB': 1024 * 1024,
+    '10MB': 10 * 1024 * 1024,
+}
+
+# Section headings per deliverable type (types not listed use GENERIC_SECTIONS)
+SECTIONS = {
+    'email-sequence': ['Email 1: Welcome', 'Email 2: Getting Started', 'Email 3: Customer Story',
+                       'Email 4: Last Chance'],
+    'landing-page-copy': ['Hero', 'Why Teams Switch', 'Features', 'Pricing', 'FAQ'],
+    'social-posts': ['Post 1: Launch Announcement', 'Post 2: Customer Quote', 'Post 3: Feature Spotlight'],
+    'ad-copy': ['Headline Options', 'Body Copy', 'Call to Action'],
+    'blog-article': ['Introduction', 'The Problem', 'A Better Approach', 'Results', 'Conclusion'],
+    'newsletter': ['This Month', 'Product Updates', 'Customer Spotlight', 'Upcoming Events'],
+    'case-study': ['Challenge', 'Solution', 'Results', 'About the Customer'],
+    'webinar-script': ['Opening', 'Agenda', 'Demo', 'Q&A', 'Closing'],
+    'press-release': ['FOR IMMEDIATE RELEASE', 'Availability', 'About TechFlow', 'Media Contact'],
+    'media-pitch': ['Subject Line', 'The Story', 'Why Now', 'Available for Interview'],
+    'press-kit': ['Company Overview', 'Leadership', 'Fast Facts', 'Media Assets'],
+    'crisis-communication': ['Holding Statement', 'What Happened', 'What We Are Doing', 'Contact'],
+    'talking-points': ['Key Messages', 'Proof Points', 'Difficult Questions'],
+    'media-advisory': ['What', 'When', 'Where', 'Who', 'Contact'],
+    'op-ed': ['The Argument', 'The Evidence', 'What Comes Next'],
+    'qa-document': ['About the Product', 'Pricing and Availability', 'Security and Compliance'],
+    'fact-sheet': ['At a Glance', 'Key Figures', 'Milestones'],
+    'brand-guidelines': ['Logo Usage', 'Color Palette', 'Typography', 'Imagery'],
+    'brand-positioning': ['Target Audience', 'Category', 'Differentiation', 'Proof Points'],
+    'voice-tone-guide': ['Voice Principles', 'Tone by Channel', 'Words We Use', 'Words We Avoid'],
+    'messaging-framework': ['Core Message', 'Pillars', 'Proof Points by Audience'],
+    'tagline': ['Tagline Options', 'Rationale'],
+    'brand-story': ['Where We Started', 'What We Believe', 'Where We Are Going'],
+}
+GENERIC_SECTIONS = ['Overview', 'Details', 'Next Steps']
+
+# Sentence fragments; the mix of short and long sentences, figures and dates
+# gives the readability and AP Style checks realistic work
+SUBJECTS = ['Our analytics platform', 'The new dashboard', 'TechFlow', 'The operations team',
+            'Every customer', 'Enterprise buyers', 'The integration layer', 'Our research']
+VERBS = ['helps', 'lets', 'shows', 'gives', 'saves', 'connects', 'explains', 'supports']
+OBJECTS = ['teams cut reporting time by 40 percent', 'analysts answer questions in seconds',
+           'managers see every metric in one place', 'customers connect 500 tools without code',
+           'leaders make decisions with confidence', 'the whole company share insights',
+           'finance teams close the books on January 5th, 2026', 'more than 10 people join every call']
+CLAUSES = ['because the data stays fresh', 'while keeping costs predictable',
+           'which matters to regulated industries', 'even when the data set grows past a petabyte',
+           'so nobody waits for a report', 'according to a survey of 1,200 IT leaders']
+KEYWORDS = ['analytics platform', 'real-time dashboards']
+LINKS = ['https://example.com/case-study', 'https://example.com/pricing', '#demo']
+
+
+def deliverable_types(schema_path=SCHEMA_PATH):
+    """Deliverable types enumerated by the campaign brief schema"""
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    return schema['definitions']['deliverable']['properties']['type']['enum']
+
+
+def sentence(rng):
+    words = f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+    if rng.random() < 0.4:
+        words += f" {rng.choice(CLAUSES)}"
+    return words + '.'
+
+
+def marked_up(text, rng):
+    """text with inline markup: bold, emphasis, a link or inline code"""
+    kind = rng.randrange(4)
+    words = text.split(' ')
+    i = rng.randrange(len(words))
+    if kind == 0:
+        words[i] = f"**{words[i]}**"
+    elif kind == 1:
+        words[i] = f"*{words[i]}*"
+    elif kind == 2:
+        words[i] = f"[{words[i]}]({rng.choice(LINKS)})"
+    else:
+        words[i] = f"`{words[i]}`"
+    return ' '.join(words)
+
+
+def block(rng, markup):
+    """A markdown block: a paragraph, or (with probability markup / 2) a structural block"""
+    if rng.random() < markup / 2:
+        kind = rng.randrange(5)
+        if kind == 0:
+            return '\n'.join(f"- {marked_up(sentence(rng), rng)}" for _ in range(3))
+        if kind == 1:
+            return '\n'.join(f"{n}. {sentence(rng)}" for n in range(1, 4))
+        if kind == 2:
+            alt = '' if rng.random() < 0.2 else 'Dashboard screenshot'
+            return f"![{alt}](images/dashboard-{rng.randrange(100)}.png)"
+        if kind == 3:
+            return '```python\nclient = Analytics(api_key="...")\nclient.sync()\n```'
+        return f'<div class="cta">{sentence(rng)}</div>'
+    sentences = [sentence(rng) for _ in range(rng.randint(2, 5))]
+    sentences = [marked_up(s, rng) if rng.random() < markup else s for s in sentences]
+    if rng.random() < 0.3:
+        sentences.append(f"The {rng.choice(KEYWORDS)} is ready.")
+    return ' '.join(sentences)
+
+
+def generate(deliverable_type, size, markup=0.5, seed=0):
+    """
+    Markdown deliverable of about size bytes: a title, then the type's
+    sections repeated with numbered headings until the size is reached, so
+    large sizes read like an archive of the type (a press archive for
+    press-release). Sizes under 1 KB are cut to size, like a post or tagline.
+
+    markup runs from 0.0 (plain prose) to 1.0 (inline markup in every
+    sentence and a structural block, such as a list, image, code block or
+    HTML, for every other paragraph)
+    """
+    rng = random.Random(f"{deliverable_type}:{size}:{markup}:{seed}")
+    sections = SECTIONS.get(deliverable_type, GENERIC_SECTIONS)
+    title = deliverable_type.replace('-', ' ').title()
+    parts = [f"# {title}: Enterprise Analytics Launch", block(rng, markup)]
+    length = sum(len(part.encode('utf-8')) + 2 for part in parts)
+    n = 0
+    while length < size:
+        heading = sections[n % len(sections)]
+        if n >= len(sections):
+            heading += f" ({n // len(sections) + 1})"
+        n += 1
+        new = [f"## {heading}"] + [block(rng, markup) for _ in range(rng.randint(1, 3))]
+        parts += new
+        length += sum(len(part.encode('utf-8')) + 2 for part in new)
+    text = '\n\n'.join(parts) + '\n'
+    if size < 1024:
+        # Short deliverables (a post, a tagline) are cut to size
+        text = text.encode('utf-8')[:size].decode('utf-8', 'ignore')
+    return text
+
+
+def example_deliverables(directory=EXAMPLES_DIR):
+    """(type, path) of the shipped example deliverables, the type taken from the file name"""
+    return [(path.stem, path) for path in sorted(Path(directory).glob('*.md'))]
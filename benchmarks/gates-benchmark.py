@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+
+"""
+Quality Gate Benchmark
+Times the five quality checks (brand, readability, SEO, accessibility, AP
+Style) on a synthetic corpus of every deliverable type, from a tweet to a
+10 MB press archive, and on the shipped example deliverables: warm and
+cold-start time, throughput and peak memory, compared against a saved
+baseline to flag regressions
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCHMARKS_DIR.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from corpus import SIZES, deliverable_types, example_deliverables, generate  # noqa: E402
+from lisa_quality import Document, QualityCheckError  # noqa: E402
+from lisa_quality.api import (  # noqa: E402
+    check_accessibility,
+    check_ap_style,
+    check_brand,
+    check_readability,
+    check_seo,
+)
+
+BRAND_CONFIG = SCRIPTS_DIR / 'brand-config.json'
+SEO_KEYWORDS = ['analytics platform', 'real-time dashboards']
+BASELINE_PATH = BENCHMARKS_DIR / 'gates-baseline.json'
+BASELINE_VERSION = 1
+
+CHECKS = {
+    'brand': lambda document: check_brand(document, BRAND_CONFIG),
+    'readability': lambda document: check_readability(document),
+    'seo': lambda document: check_seo(document, SEO_KEYWORDS),
+    'accessibility': lambda document: check_accessibility(document),
+    'ap-style': lambda document: check_ap_style(document),
+}
+
+# Every type is generated at the small sizes; the large ones are archives of
+# ARCHIVE_TYPE (a year of press releases is the largest thing Lisa checks)
+ARCHIVE_TYPE = 'press-release'
+ARCHIVE_SIZES = ('100KB', '1MB', '10MB')
+
+# A row regresses when it is this much slower (or bigger) than the baseline
+# and the difference is above the noise floor
+DEFAULT_TOLERANCE = 0.25
+NOISE_SECONDS = 0.002
+NOISE_BYTES = 64 * 1024
+
+# Cold start: a fresh interpreter imports the library and runs one check,
+# which is what a check script invocation costs
+COLD_RUN = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from lisa_quality import Document
+from lisa_quality.api import check_accessibility, check_ap_style, check_brand, check_readability, check_seo
+check, path = sys.argv[2], sys.argv[3]
+document = Document(open(path, encoding='utf-8').read(), path=path)
+try:
+    {'brand': lambda: check_brand(document, sys.argv[4]),
+     'readability': lambda: check_readability(document),
+     'seo': lambda: check_seo(document, sys.argv[5:]),
+     'accessibility': lambda: check_accessibility(document),
+     'ap-style': lambda: check_ap_style(document)}[check]()
+except Exception:
+    sys.exit(1)
+"""
+
+
+def run_check(check, text):
+    """Run a check on a fresh Document, so parsing is part of the time"""
+    try:
+        CHECKS[check](Document(text, path='deliverable.md'))
+    except QualityCheckError:
+        pass  # A missing optional library fails the same way every run
+
+
+def warm_time(check, text, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_check(check, text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(check, text):
+    """Peak bytes allocated by Python while the check runs"""
+    tracemalloc.start()
+    try:
+        run_check(check, text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cold_time(check, path):
+    """Wall time of a fresh interpreter running one check on path, or None if it fails"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', COLD_RUN, str(SCRIPTS_DIR), check, str(path), str(BRAND_CONFIG)] + SEO_KEYWORDS,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    return elapsed if result.returncode == 0 else None
+
+
+def corpus_sets(args):
+    """(corpus label, size label, [(type, text)]) per corpus set"""
+    types = args.types or deliverable_types()
+    for markup in args.markup:
+        for label in args.sizes:
+            if label in ARCHIVE_SIZES:
+                docs = [(ARCHIVE_TYPE, generate(ARCHIVE_TYPE, SIZES[label], markup))]
+            else:
+                docs = [(kind, generate(kind, SIZES[label], markup)) for kind in types]
+            yield f"synthetic m={markup:g}", label, docs
+    if args.examples:
+        examples = example_deliverables()
+        if examples:
+            docs = [(kind, path.read_text(encoding='utf-8')) for kind, path in examples]
+            yield 'examples', 'real', docs
+
+
+def measure(corpus, size, docs, check, args, workdir):
+    """One result row: the check on every document of a corpus set"""
+    total_bytes = sum(len(text.encode('utf-8')) for _, text in docs)
+    repeat = args.repeat if total_bytes <= SIZES['1MB'] else max(1, args.repeat // 3)
+    warm = sum(warm_time(check, text, repeat) for _, text in docs)
+    peak = max(peak_memory(check, text) for _, text in docs) if args.memory else None
+
+    cold = None
+    if args.cold:
+        # The first document of the set stands for it (the archive itself for
+        # archive sizes)
+        sample = workdir / 'cold-sample.md'
+        sample.write_text(docs[0][1], encoding='utf-8')
+        cold = min(filter(None, (cold_time(check, sample) for _ in range(args.cold_repeat))), default=None)
+
+    return {
+        'corpus': corpus,
+        'size': size,
+        'check': check,
+        'documents': len(docs),
+        'bytes': total_bytes,
+        'warm': round(warm, 6),
+        'throughput': round(total_bytes / (1024 * 1024) / warm, 3) if warm else None,
+        'peak': peak,
+        'cold': round(cold, 6) if cold is not None else None,
+    }
+
+
+def row_key(row):
+    return f"{row['corpus']} | {row['size']} | {row['check']}"
+
+
+def regressions(rows, baseline, tolerance):
+    """(row key, measure, baseline value, value) for every row worse than the baseline"""
+    previous = {row_key(row): row for row in baseline.get('results', [])}
+    found = []
+    for row in rows:
+        old = previous.get(row_key(row))
+        if old is None:
+            continue
+        for field, noise in (('warm', NOISE_SECONDS), ('cold', NOISE_SECONDS), ('peak', NOISE_BYTES)):
+            if row.get(field) is None or old.get(field) is None:
+                continue
+            if row[field] > old[field] * (1 + tolerance) and row[field] - old[field] > noise:
+                found.append((row_key(row), field, old[field], row[field]))
+    return found
+
+
+def format_seconds(seconds):
+    return '-' if seconds is None else f"{seconds * 1000:.1f}ms"
+
+
+def format_megabytes(size):
+    return '-' if size is None else f"{size / (1024 * 1024):.1f}"
+
+
+def print_row(row):
+    print(f"{row['corpus']:<14}  {row['size']:>6}  {row['check']:<13}  {row['documents']:>4}  "
+          f"{format_seconds(row['warm']):>10}  {format_seconds(row['cold']):>10}  "
+          f"{row['throughput'] or 0:>7.2f}  {format_megabytes(row['peak']):>7}")
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not read baseline {path}: {e}", file=sys.stderr)
+        sys.exit(2)
+    if baseline.get('version') != BASELINE_VERSION:
+        print(f"⚠️  Baseline {path} is from another benchmark version; not comparing", file=sys.stderr)
+        return None
+    return baseline
+
+
+def save_baseline(path, rows):
+    baseline = {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'results': rows,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark the quality checks on a synthetic and a real deliverable corpus',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Corpus:
+  Every deliverable type in campaign-brief.schema.json is generated at the
+  tweet, 1KB and 10KB sizes; {', '.join(ARCHIVE_SIZES)} are press archives
+  ({ARCHIVE_TYPE} sections repeated). --markup sets how much of the text is
+  markup (0 plain prose, 1 markup in every sentence plus lists, images, code
+  and HTML blocks); several densities give one row each. The example
+  deliverables in examples/deliverables/ are the real-world set.
+
+Columns:
+  Warm   best of --repeat in-process runs (fewer above 1 MB), summed over
+         the set's documents; a fresh Document each run, so parsing counts
+  Cold   a fresh interpreter importing the library and running the check on
+         the set's first document, as a check script invocation does
+  MB/s   set bytes / warm time
+  Peak   most memory Python allocated during one check (tracemalloc)
+
+Baseline:
+  --save-baseline stores the results in {BASELINE_PATH.name}; later runs
+  compare against it and list every row whose warm, cold or peak figure grew
+  by more than --tolerance. Baselines are machine-specific: save one on the
+  machine you compare on.
+
+Examples:
+  gates-benchmark.py --save-baseline
+  gates-benchmark.py --sizes tweet 1KB 10KB --checks readability seo
+  gates-benchmark.py --markup 0 0.5 1 --sizes 10KB --no-cold
+  gates-benchmark.py --sizes            # the example deliverables only
+
+The 10MB archive takes several minutes. Exit codes: 0 no regressions,
+1 regressions against the baseline, 2 unreadable baseline
+        """
+    )
+    parser.add_argument('--sizes', nargs='*', choices=list(SIZES), default=list(SIZES),
+                        help='Synthetic sizes to benchmark (default: all; none for examples only)')
+    parser.add_argument('--types', nargs='+', default=None,
+                        help='Deliverable types at the small sizes (default: every type in the schema)')
+    parser.add_argument('--checks', nargs='+', choices=list(CHECKS), default=list(CHECKS),
+                        help='Checks to benchmark (default: all)')
+    parser.add_argument('--markup', nargs='+', type=float, default=[0.5],
+                        help='Markup densities from 0 to 1 (default: 0.5)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Warm runs per measurement, best time reported (default: 3)')
+    parser.add_argument('--cold-repeat', type=int, default=2,
+                        help='Cold-start runs per measurement, best reported (default: 2)')
+    parser.add_argument('--no-cold', dest='cold', action='store_false', help='Skip cold-start runs')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help='Skip peak memory runs')
+    parser.add_argument('--no-examples', dest='examples', action='store_false',
+                        help='Skip the example deliverables')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH,
+                        help=f'Baseline to compare with (default: benchmarks/{BASELINE_PATH.name})')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Growth over the baseline that counts as a regression '
+                             f'(default: {DEFAULT_TOLERANCE:g} = {DEFAULT_TOLERANCE:.0%})')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+
+    args = parser.parse_args(argv)
+
+    # Load every library and compile every rule once, so warm runs are warm
+    for check in args.checks:
+        run_check(check, generate(ARCHIVE_TYPE, SIZES['1KB']))
+
+    rows = []
+    if not args.json:
+        print(f"{'Corpus':<14}  {'Size':>6}  {'Check':<13}  {'Docs':>4}  {'Warm':>10}  {'Cold':>10}  "
+              f"{'MB/s':>7}  {'Peak MB':>7}")
+    with tempfile.TemporaryDirectory(prefix='lisa-gates-benchmark-') as workdir:
+        for corpus, size, docs in corpus_sets(args):
+            for check in args.checks:
+                row = measure(corpus, size, docs, check, args, Path(workdir))
+                rows.append(row)
+                if not args.json:
+                    print_row(row)
+
+    baseline = load_baseline(args.baseline)
+    found = regressions(rows, baseline, args.tolerance) if baseline else []
+    if args.json:
+        print(json.dumps({'results': rows, 'regressions': [
+            {'row': key, 'measure': field, 'baseline': old, 'value': new} for key, field, old, new in found
+        ]}, indent=2))
+    elif baseline is None:
+        print(f"\n💡 No baseline at {args.baseline}; run with --save-baseline to create one")
+    elif found:
+        print(f"\n❌ {len(found)} regression(s) against {args.baseline} (tolerance {args.tolerance:.0%}):")
+        for key, field, old, new in found:
+            if field == 'peak':
+                print(f"  {key}: peak {format_megabytes(old)} → {format_megabytes(new)} MB")
+            else:
+                print(f"  {key}: {field} {format_seconds(old)} → {format_seconds(new)}")
+    else:
+        print(f"\n✅ No regressions against {args.baseline}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, rows)
+        if not args.json:
+            print(f"✅ Baseline saved to {args.baseline}")
+    sys.exit(1 if found else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,72 +9,97 @@ set -euo pipefail
 
 # Read hook input from stdin (advanced stop hook API)
 HOOK_INPUT=$(cat)
+HOOK_STARTED="${EPOCHREALTIME:-$(date +%s)}"
 
-# Check if Lisa campaign is active
-LISA_STATE_FILE=".claude/lisa-campaign.local.md"
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
 
-if [[ ! -f "$LISA_STATE_FILE" ]]; then
+# Check if any Lisa campaign is active in this workspace
+CAMPAIGNS_DIR=".claude/lisa-campaigns"
+LEGACY_STATE_FILES=(".claude/lisa-campaign.local.json" ".claude/lisa-campaign.local.md")
+
+if ! compgen -G "$CAMPAIGNS_DIR/*/state.json" > /dev/null \
+  && [[ ! -f "${LEGACY_STATE_FILES[0]}" ]] && [[ ! -f "${LEGACY_STATE_FILES[1]}" ]]; then
   # No active campaign - allow exit
   exit 0
 fi
 
-# Parse markdown frontmatter (YAML between ---) and extract values
-FRONTMATTER=$(sed -n '/^---$/,/^---$/{ /^---$/d; p; }' "$LISA_STATE_FILE")
-ITERATION=$(echo "$FRONTMATTER" | grep '^iteration:' | sed 's/iteration: *//')
-MAX_ITERATIONS=$(echo "$FRONTMATTER" | grep '^max_iterations:' | sed 's/max_iterations: *//')
-# Extract completion_promise and strip surrounding quotes if present
-COMPLETION_PROMISE=$(echo "$FRONTMATTER" | grep '^completion_promise:' | sed 's/completion_promise: *//' | sed 's/^"\(.*\)"$/\1/')
-# Extract campaign details
-CAMPAIGN_NAME=$(echo "$FRONTMATTER" | grep '^campaign_name:' | sed 's/campaign_name: *//' | sed 's/^"\(.*\)"$/\1/')
-CAMPAIGN_TYPE=$(echo "$FRONTMATTER" | grep '^campaign_type:' | sed 's/campaign_type: *//' | sed 's/^"\(.*\)"$/\1/')
-# Extract progress tracking fields (with defaults for backward compatibility)
-DELIVERABLES_TOTAL=$(echo "$FRONTMATTER" | grep '^deliverables_total:' | sed 's/deliverables_total: *//')
-DELIVERABLES_COMPLETED=$(echo "$FRONTMATTER" | grep '^deliverables_completed:' | sed 's/deliverables_completed: *//')
-QUALITY_CHECKS_PASSED=$(echo "$FRONTMATTER" | grep '^quality_checks_passed:' | sed 's/quality_checks_passed: *//')
-QUALITY_CHECKS_FAILED=$(echo "$FRONTMATTER" | grep '^quality_checks_failed:' | sed 's/quality_checks_failed: *//')
-CURRENT_DELIVERABLE=$(echo "$FRONTMATTER" | grep '^current_deliverable:' | sed 's/current_deliverable: *//' | sed 's/^"\(.*\)"$/\1/')
-COMPLEXITY=$(echo "$FRONTMATTER" | grep '^complexity:' | sed 's/complexity: *//' | sed 's/^"\(.*\)"$/\1/')
-STARTED_AT=$(echo "$FRONTMATTER" | grep '^started_at:' | sed 's/started_at: *//' | sed 's/^"\(.*\)"$/\1/')
-
-# Extract stuck detection fields
-LAST_DELIVERABLE=$(echo "$FRONTMATTER" | grep '^last_deliverable:' | sed 's/last_deliverable: *//' | sed 's/^"\(.*\)"$/\1/')
-CONSECUTIVE_FAILURES=$(echo "$FRONTMATTER" | grep '^consecutive_failures:' | sed 's/consecutive_failures: *//')
-
-# Set defaults if fields don't exist (backward compatibility)
-[[ -z "$DELIVERABLES_TOTAL" ]] && DELIVERABLES_TOTAL=0
-[[ -z "$DELIVERABLES_COMPLETED" ]] && DELIVERABLES_COMPLETED=0
-[[ -z "$QUALITY_CHECKS_PASSED" ]] && QUALITY_CHECKS_PASSED=0
-[[ -z "$QUALITY_CHECKS_FAILED" ]] && QUALITY_CHECKS_FAILED=0
-[[ -z "$CURRENT_DELIVERABLE" ]] && CURRENT_DELIVERABLE="In progress"
-[[ -z "$COMPLEXITY" ]] && COMPLEXITY="Unknown"
-[[ -z "$LAST_DELIVERABLE" ]] && LAST_DELIVERABLE=""
-[[ -z "$CONSECUTIVE_FAILURES" ]] && CONSECUTIVE_FAILURES=0
-
-# Validate numeric fields before arithmetic operations
-if [[ ! "$ITERATION" =~ ^[0-9]+$ ]]; then
+SESSION_ID=$(echo "$HOOK_INPUT" | jq -r '.session_id // empty')
+TRANSCRIPT_PATH=$(echo "$HOOK_INPUT" | jq -r '.transcript_path')
+
+# Everything the hook needs from Python runs in one process (see
+# lisa_campaign/hook.py): find the campaign this session runs (bound on its
+# first stop, by the campaign ID the setup script printed), load its state, read
+# the last assistant message, decide how the iteration ends and record it, and
+# for a continued loop advance the iteration and build the forecast and prompt
+# sections. Every value arrives as a shell variable; HOOK_OUTCOME says which
+# of the messages below applies
+CAMPAIGN_ID=""
+HOOK_OUTCOME=""
+HOOK_ERROR=""
+FORECAST_ITERATION=""
+FORECAST_BASIS=""
+SCHEDULE_SECTION=""
+MEMORY_SECTION=""
+LEARNINGS_SECTION=""
+HOOK_STATUS=0
+HOOK_VARS=$(python3 "$PLUGIN_ROOT/scripts/campaign-state.py" hook \
+  --session "$SESSION_ID" --transcript "$TRANSCRIPT_PATH" --hook-started "$HOOK_STARTED" \
+  --context-dir "$PLUGIN_ROOT/context" 2>&1) || HOOK_STATUS=$?
+
+if [[ $HOOK_STATUS -eq 0 ]]; then
+  eval "$HOOK_VARS"
+else
+  # Python itself failed (it reports its own errors as HOOK_OUTCOME=error)
+  HOOK_OUTCOME="error"
+  HOOK_ERROR="$HOOK_VARS"
+fi
+
+if [[ "$HOOK_OUTCOME" == "none" ]]; then
+  # This session is not running a campaign - allow exit
+  exit 0
+fi
+
+if [[ "$HOOK_OUTCOME" == "error" ]]; then
+  echo "⚠️  Lisa campaign: Stop hook failed" >&2
+  echo "   Problem: $HOOK_ERROR" >&2
+  echo "" >&2
+  if [[ -n "$CAMPAIGN_ID" ]]; then
+    echo "   Lisa campaign is stopping. Run /lisa again to start fresh." >&2
+    rm -rf "$CAMPAIGNS_DIR/$CAMPAIGN_ID"
+  else
+    echo "   The session may stop; the campaigns in $CAMPAIGNS_DIR/ are left as they are." >&2
+  fi
+  exit 0
+fi
+
+if [[ "$HOOK_OUTCOME" == "state-corrupt" ]] && [[ -z "$CAMPAIGN_ID" ]]; then
+  # Only a single-campaign state file from an older version has no campaign ID
   echo "⚠️  Lisa campaign: State file corrupted" >&2
-  echo "   File: $LISA_STATE_FILE" >&2
-  echo "   Problem: 'iteration' field is not a valid number (got: '$ITERATION')" >&2
+  echo "   File: ${LEGACY_STATE_FILES[0]}" >&2
+  echo "   Problem: $HOOK_ERROR" >&2
   echo "" >&2
   echo "   This usually means the state file was manually edited or corrupted." >&2
   echo "   Lisa campaign is stopping. Run /lisa again to start fresh." >&2
-  rm "$LISA_STATE_FILE"
+  rm -f "${LEGACY_STATE_FILES[@]}"
   exit 0
 fi
 
-if [[ ! "$MAX_ITERATIONS" =~ ^[0-9]+$ ]]; then
+CAMPAIGN_DIR="$CAMPAIGNS_DIR/$CAMPAIGN_ID"
+LISA_STATE_FILE="$CAMPAIGN_DIR/state.json"
+
+if [[ "$HOOK_OUTCOME" == "state-corrupt" ]]; then
   echo "⚠️  Lisa campaign: State file corrupted" >&2
   echo "   File: $LISA_STATE_FILE" >&2
-  echo "   Problem: 'max_iterations' field is not a valid number (got: '$MAX_ITERATIONS')" >&2
+  echo "   Problem: $HOOK_ERROR" >&2
   echo "" >&2
   echo "   This usually means the state file was manually edited or corrupted." >&2
   echo "   Lisa campaign is stopping. Run /lisa again to start fresh." >&2
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
 # Check if max iterations reached
-if [[ $MAX_ITERATIONS -gt 0 ]] && [[ $ITERATION -ge $MAX_ITERATIONS ]]; then
+if [[ "$HOOK_OUTCOME" == "max-iterations" ]]; then
   # Use discipline-appropriate messaging
   case "$CAMPAIGN_TYPE" in
     marketing)
@@ -97,70 +122,49 @@ if [[ $MAX_ITERATIONS -gt 0 ]] && [[ $ITERATION -ge $MAX_ITERATIONS ]]; then
       echo "   Campaign: $CAMPAIGN_NAME"
       ;;
   esac
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-# Get transcript path from hook input
-TRANSCRIPT_PATH=$(echo "$HOOK_INPUT" | jq -r '.transcript_path')
-
-if [[ ! -f "$TRANSCRIPT_PATH" ]]; then
+if [[ "$HOOK_OUTCOME" == "no-transcript" ]]; then
   echo "⚠️  Lisa campaign: Transcript file not found" >&2
   echo "   Expected: $TRANSCRIPT_PATH" >&2
   echo "   This is unusual and may indicate a Claude Code internal issue." >&2
   echo "   Lisa campaign is stopping." >&2
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-# Read last assistant message from transcript (JSONL format - one JSON per line)
-# First check if there are any assistant messages
-if ! grep -q '"role":"assistant"' "$TRANSCRIPT_PATH"; then
+# The last assistant message is read backwards from the end of the transcript,
+# bookmarked in the campaign folder, so each iteration only reads what the last
+# turn appended instead of grepping the whole (ever-growing) transcript
+if [[ "$HOOK_OUTCOME" == "no-assistant" ]]; then
   echo "⚠️  Lisa campaign: No assistant messages found in transcript" >&2
   echo "   Transcript: $TRANSCRIPT_PATH" >&2
   echo "   This is unusual and may indicate a transcript format issue" >&2
   echo "   Lisa campaign is stopping." >&2
-  rm "$LISA_STATE_FILE"
-  exit 0
-fi
-
-# Extract last assistant message with explicit error handling
-LAST_LINE=$(grep '"role":"assistant"' "$TRANSCRIPT_PATH" | tail -1)
-if [[ -z "$LAST_LINE" ]]; then
-  echo "⚠️  Lisa campaign: Failed to extract last assistant message" >&2
-  echo "   Lisa campaign is stopping." >&2
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-# Parse JSON with error handling
-LAST_OUTPUT=$(echo "$LAST_LINE" | jq -r '
-  .message.content |
-  map(select(.type == "text")) |
-  map(.text) |
-  join("\n")
-' 2>&1)
-
-# Check if jq succeeded
-if [[ $? -ne 0 ]]; then
+if [[ "$HOOK_OUTCOME" == "transcript-error" ]]; then
   echo "⚠️  Lisa campaign: Failed to parse assistant message JSON" >&2
-  echo "   Error: $LAST_OUTPUT" >&2
+  echo "   $HOOK_ERROR" >&2
   echo "   This may indicate a transcript format issue" >&2
   echo "   Lisa campaign is stopping." >&2
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-if [[ -z "$LAST_OUTPUT" ]]; then
+if [[ "$HOOK_OUTCOME" == "empty-output" ]]; then
   echo "⚠️  Lisa campaign: Assistant message contained no text content" >&2
   echo "   Lisa campaign is stopping." >&2
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-# Stuck detection - check if consecutive failures threshold reached
-STUCK_THRESHOLD=5
-if [[ "$CONSECUTIVE_FAILURES" =~ ^[0-9]+$ ]] && [[ $CONSECUTIVE_FAILURES -ge $STUCK_THRESHOLD ]]; then
+# Stuck detection - consecutive quality check failures reached the threshold
+if [[ "$HOOK_OUTCOME" == "stuck" ]]; then
   # Lisa is stuck on this deliverable - pause and ask for help
   case "$CAMPAIGN_TYPE" in
     marketing)
@@ -190,8 +194,9 @@ This usually means:
   • Quality gate threshold needs adjustment
 
 NEXT STEPS:
-1. Review .claude/lisa-campaign.local.md for current state
-2. Check learnings.txt for what's failing
+1. Review $LISA_STATE_FILE for current state
+2. Check what's been failing:
+   python3 $PLUGIN_ROOT/scripts/campaign-learnings.py query --campaign $CAMPAIGN_ID --event gate-failure --limit 10
 3. Either:
    a) Adjust acceptance criteria in campaign-brief.json
    b) Add missing context to context/ directory
@@ -202,74 +207,57 @@ Campaign paused. Please provide guidance and restart.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 STUCK
 
-  # Log stuck event to learnings.txt
-  LEARNINGS_FILE="learnings.txt"
-  cat >> "$LEARNINGS_FILE" <<LEARNING
-
-[$(date '+%Y-%m-%d %H:%M')] - STUCK EVENT - $CAMPAIGN_TYPE - $CAMPAIGN_NAME
-Deliverable: $CURRENT_DELIVERABLE
-Consecutive failures: $CONSECUTIVE_FAILURES
-Campaign paused for human intervention.
-Action needed: Review acceptance criteria, context, or quality gates.
-
-LEARNING
-
   # Remove state file to stop campaign
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-# Check for completion promise (only if set)
-if [[ "$COMPLETION_PROMISE" != "null" ]] && [[ -n "$COMPLETION_PROMISE" ]]; then
-  # Extract text from <promise> tags using Perl for multiline support
-  # -0777 slurps entire input, s flag makes . match newlines
-  # .*? is non-greedy (takes FIRST tag), whitespace normalized
-  PROMISE_TEXT=$(echo "$LAST_OUTPUT" | perl -0777 -pe 's/.*?<promise>(.*?)<\/promise>.*/$1/s; s/^\s+|\s+$//g; s/\s+/ /g' 2>/dev/null || echo "")
-
-  # Use = for literal string comparison (not pattern matching)
-  # == in [[ ]] does glob pattern matching which breaks with *, ?, [ characters
-  if [[ -n "$PROMISE_TEXT" ]] && [[ "$PROMISE_TEXT" = "$COMPLETION_PROMISE" ]]; then
-    # Calculate efficiency metrics
-    if [[ $DELIVERABLES_TOTAL -gt 0 ]]; then
-      AVG_ITERATIONS_PER_DELIVERABLE=$((ITERATION / DELIVERABLES_TOTAL))
-    else
-      AVG_ITERATIONS_PER_DELIVERABLE=0
-    fi
+# Check for completion promise: the text of the first <promise> tag (the whole
+# message without one), whitespace normalized, compared literally
+if [[ "$HOOK_OUTCOME" == "completed" ]]; then
+  # Calculate efficiency metrics
+  if [[ $DELIVERABLES_TOTAL -gt 0 ]]; then
+    AVG_ITERATIONS_PER_DELIVERABLE=$((ITERATION / DELIVERABLES_TOTAL))
+  else
+    AVG_ITERATIONS_PER_DELIVERABLE=0
+  fi
 
-    # Use discipline-appropriate celebration messaging
-    case "$CAMPAIGN_TYPE" in
-      marketing)
-        echo "✅ Marketing campaign complete! Detected <promise>$COMPLETION_PROMISE</promise>"
-        echo "   Campaign: $CAMPAIGN_NAME"
-        echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
-        echo "   All deliverables approved. Check deliverables/ folder for your content."
-        ;;
-      pr)
-        echo "✅ PR campaign complete! Detected <promise>$COMPLETION_PROMISE</promise>"
-        echo "   Campaign: $CAMPAIGN_NAME"
-        echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
-        echo "   All deliverables approved. Check deliverables/ folder for your content."
-        ;;
-      branding)
-        echo "✅ Branding project complete! Detected <promise>$COMPLETION_PROMISE</promise>"
-        echo "   Project: $CAMPAIGN_NAME"
-        echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
-        echo "   All deliverables approved. Check deliverables/ folder for your brand assets."
-        ;;
-      *)
-        echo "✅ Lisa campaign complete! Detected <promise>$COMPLETION_PROMISE</promise>"
-        echo "   Campaign: $CAMPAIGN_NAME"
-        echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
-        ;;
-    esac
-    rm "$LISA_STATE_FILE"
+  # Use discipline-appropriate celebration messaging
+  case "$CAMPAIGN_TYPE" in
+    marketing)
+      echo "✅ Marketing campaign complete! Detected <promise>$COMPLETION_PROMISE</promise>"
+      echo "   Campaign: $CAMPAIGN_NAME"
+      echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
+      echo "   All deliverables approved. Check deliverables/ folder for your content."
+      ;;
+    pr)
+      echo "✅ PR campaign complete! Detected <promise>$COMPLETION_PROMISE</promise>"
+      echo "   Campaign: $CAMPAIGN_NAME"
+      echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
+      echo "   All deliverables approved. Check deliverables/ folder for your content."
+      ;;
+    branding)
+      echo "✅ Branding project complete! Detected <promise>$COMPLETION_PROMISE</promise>"
+      echo "   Project: $CAMPAIGN_NAME"
+      echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
+      echo "   All deliverables approved. Check deliverables/ folder for your brand assets."
+      ;;
+    *)
+      echo "✅ Lisa campaign complete! Detected <promise>$COMPLETION_PROMISE</promise>"
+      echo "   Campaign: $CAMPAIGN_NAME"
+      echo "   Completed in $ITERATION iterations ($COMPLEXITY complexity, ~$AVG_ITERATIONS_PER_DELIVERABLE iterations/deliverable)"
+      ;;
+  esac
+  echo "   Timings: python3 $PLUGIN_ROOT/scripts/campaign-metrics.py report --campaign $CAMPAIGN_ID"
+  rm -rf "$CAMPAIGN_DIR"
     exit 0
-  fi
 fi
 
 # Calculate time elapsed since campaign start
 if [[ -n "$STARTED_AT" ]]; then
-  START_EPOCH=$(date -j -u -f "%Y-%m-%dT%H:%M:%SZ" "$STARTED_AT" +%s 2>/dev/null || echo 0)
+  # GNU date (Linux) takes -d, BSD date (macOS) -j -f
+  START_EPOCH=$(date -u -d "$STARTED_AT" +%s 2>/dev/null \
+    || date -j -u -f "%Y-%m-%dT%H:%M:%SZ" "$STARTED_AT" +%s 2>/dev/null || echo 0)
   CURRENT_EPOCH=$(date -u +%s)
   if [[ $START_EPOCH -gt 0 ]]; then
     ELAPSED_SECONDS=$((CURRENT_EPOCH - START_EPOCH))
@@ -307,39 +295,76 @@ else
   PROGRESS_DISPLAY="━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━ 0%"
 fi
 
-# Early warning system - check if approaching max iterations
+# Forecast the completion iteration from the iterations past deliverables of
+# the same type, campaign type and complexity took, scaled by this campaign's
+# pace so far (see campaign-forecast.py; FORECAST_* come with HOOK_VARS)
+FORECAST_LINE=""
+FORECAST_BAND=""
+if [[ -n "$FORECAST_ITERATION" ]] && [[ $FORECAST_REMAINING -gt 0 ]]; then
+  if [[ "$FORECAST_BASIS" == "history" ]]; then
+    FORECAST_LINE="
+Forecast: done by ~iteration $FORECAST_ITERATION (80% band $FORECAST_LOW–$FORECAST_HIGH)"
+    FORECAST_BAND=" (80% band $FORECAST_LOW–$FORECAST_HIGH)"
+  else
+    # Too few past approvals: every estimate is the prior, so show it as such
+    # and leave the warnings to the 80%-of-max-iterations check below
+    FORECAST_LINE="
+Forecast: done by ~iteration $FORECAST_ITERATION (prior estimate, too few past approvals yet)"
+  fi
+fi
+
+# Early warning system - check whether the campaign will fit in max iterations
 WARNING_MESSAGE=""
+WARNING_LEVEL=""
 if [[ $MAX_ITERATIONS -gt 0 ]]; then
-  # Calculate warning threshold (80% of max iterations)
-  WARNING_THRESHOLD=$((MAX_ITERATIONS * 80 / 100))
-
-  if [[ $ITERATION -ge $WARNING_THRESHOLD ]]; then
-    ITERATIONS_REMAINING=$((MAX_ITERATIONS - ITERATION))
-    DELIVERABLES_REMAINING=$((DELIVERABLES_TOTAL - DELIVERABLES_COMPLETED))
-
-    # Calculate pace: iterations per deliverable
-    if [[ $DELIVERABLES_COMPLETED -gt 0 ]]; then
-      PACE=$((ITERATION / DELIVERABLES_COMPLETED))
-    else
-      # No deliverables completed yet, use conservative estimate
-      PACE=$ITERATION
+  ITERATIONS_REMAINING=$((MAX_ITERATIONS - ITERATION))
+  DELIVERABLES_REMAINING=$((DELIVERABLES_TOTAL - DELIVERABLES_COMPLETED))
+
+  if [[ "$FORECAST_BASIS" == "history" ]]; then
+    # Warn from the first iteration on, as soon as the band reaches past the limit
+    DELIVERABLES_REMAINING=$FORECAST_REMAINING
+    PACE=$FORECAST_PACE
+    ITERATIONS_NEEDED=$((FORECAST_ITERATION - ITERATION))
+    ESTIMATED_FINAL_ITERATION=$FORECAST_ITERATION
+    if [[ $FORECAST_REMAINING -gt 0 ]]; then
+      if [[ $FORECAST_ITERATION -gt $MAX_ITERATIONS ]]; then
+        WARNING_LEVEL="critical"
+      elif [[ $FORECAST_HIGH -gt $MAX_ITERATIONS ]]; then
+        WARNING_LEVEL="notice"
+      fi
     fi
-
-    # Estimate iterations needed to complete remaining deliverables
-    if [[ $DELIVERABLES_REMAINING -gt 0 ]]; then
-      ITERATIONS_NEEDED=$((PACE * DELIVERABLES_REMAINING))
-    else
-      ITERATIONS_NEEDED=0
+  else
+    # No forecast from history: fall back to this campaign's average pace from
+    # 80% of max iterations
+    WARNING_THRESHOLD=$((MAX_ITERATIONS * 80 / 100))
+    if [[ $ITERATION -ge $WARNING_THRESHOLD ]]; then
+      if [[ $DELIVERABLES_COMPLETED -gt 0 ]]; then
+        PACE=$((ITERATION / DELIVERABLES_COMPLETED))
+      else
+        # No deliverables completed yet, use conservative estimate
+        PACE=$ITERATION
+      fi
+      if [[ $DELIVERABLES_REMAINING -gt 0 ]]; then
+        ITERATIONS_NEEDED=$((PACE * DELIVERABLES_REMAINING))
+      else
+        ITERATIONS_NEEDED=0
+      fi
+      ESTIMATED_FINAL_ITERATION=$((ITERATION + ITERATIONS_NEEDED))
+      if [[ $ITERATIONS_NEEDED -gt $ITERATIONS_REMAINING ]]; then
+        WARNING_LEVEL="critical"
+      else
+        WARNING_LEVEL="notice"
+      fi
     fi
+  fi
 
-    # Check if we'll run out of iterations
-    if [[ $ITERATIONS_NEEDED -gt $ITERATIONS_REMAINING ]]; then
-      # Will NOT complete - critical warning
-      WARNING_MESSAGE=$(cat <<WARNING
+  if [[ "$WARNING_LEVEL" == "critical" ]]; then
+    # Will NOT complete - critical warning
+    WARNING_MESSAGE=$(cat <<WARNING
 
 ⚠️  ITERATION LIMIT WARNING
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Status: Running low on iterations ($ITERATIONS_REMAINING remaining)
+Status: $ITERATIONS_REMAINING iterations remaining, fewer than the remaining work needs
 Current pace: ~$PACE iterations per deliverable
 Remaining work: $DELIVERABLES_REMAINING deliverables
 
@@ -355,22 +380,20 @@ To cancel: Use /lisa:cancel-lisa command
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 WARNING
 )
-    else
-      # Should complete, but warn anyway
-      ESTIMATED_FINAL_ITERATION=$((ITERATION + ITERATIONS_NEEDED))
-      WARNING_MESSAGE=$(cat <<WARNING
+  elif [[ "$WARNING_LEVEL" == "notice" ]]; then
+    # Should complete, but warn anyway
+    WARNING_MESSAGE=$(cat <<WARNING
 
 ⚠️  Iteration Limit Notice
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-You've reached $ITERATION of $MAX_ITERATIONS iterations (${WARNING_THRESHOLD}% threshold)
+You've reached $ITERATION of $MAX_ITERATIONS iterations
 Current pace: ~$PACE iterations per deliverable
-Estimated completion: ~iteration $ESTIMATED_FINAL_ITERATION
+Estimated completion: ~iteration $ESTIMATED_FINAL_ITERATION$FORECAST_BAND
 
 You should complete within the limit, but watch progress closely.
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 WARNING
 )
-    fi
   fi
 fi
 
@@ -383,7 +406,7 @@ Time elapsed: $TIME_ELAPSED
 Complexity: $COMPLEXITY
 
 Deliverables: $DELIVERABLES_COMPLETED/$DELIVERABLES_TOTAL complete
-$PROGRESS_DISPLAY
+$PROGRESS_DISPLAY$FORECAST_LINE
 
 Current: $CURRENT_DELIVERABLE
 Quality checks: $QUALITY_CHECKS_PASSED passed, $QUALITY_CHECKS_FAILED failed
@@ -394,12 +417,7 @@ PROGRESS
 # Not complete - continue loop with SAME PROMPT
 NEXT_ITERATION=$((ITERATION + 1))
 
-# Extract prompt (everything after the closing ---)
-# Skip first --- line, skip until second --- line, then print everything after
-# Use i>=2 instead of i==2 to handle --- in prompt content
-PROMPT_TEXT=$(awk '/^---$/{i++; next} i>=2' "$LISA_STATE_FILE")
-
-if [[ -z "$PROMPT_TEXT" ]]; then
+if [[ "$HOOK_OUTCOME" == "no-prompt" ]]; then
   echo "⚠️  Lisa campaign: State file corrupted or incomplete" >&2
   echo "   File: $LISA_STATE_FILE" >&2
   echo "   Problem: No prompt text found" >&2
@@ -409,15 +427,23 @@ if [[ -z "$PROMPT_TEXT" ]]; then
   echo "     • File was corrupted during writing" >&2
   echo "" >&2
   echo "   Lisa campaign is stopping. Run /lisa again to start fresh." >&2
-  rm "$LISA_STATE_FILE"
+  rm -rf "$CAMPAIGN_DIR"
   exit 0
 fi
 
-# Update iteration in frontmatter (portable across macOS and Linux)
-# Create temp file, then atomically replace
-TEMP_FILE="${LISA_STATE_FILE}.tmp.$$"
-sed "s/^iteration: .*/iteration: $NEXT_ITERATION/" "$LISA_STATE_FILE" > "$TEMP_FILE"
-mv "$TEMP_FILE" "$LISA_STATE_FILE"
+# The iteration is already advanced in the state store (locked, atomically
+# replaced, so progress the agent records at the same time is not lost). Add
+# the deliverable to work on next (dependencies first, stale rework before
+# what derives from it), the memory entries relevant to it (the prompt itself
+# carries no memory, so iterations don't pay for every entry ever learned) and
+# the latest learnings (gate failures, insights) for its deliverable type
+for SECTION in "$SCHEDULE_SECTION" "$MEMORY_SECTION" "$LEARNINGS_SECTION"; do
+  if [[ -n "$SECTION" ]]; then
+    PROMPT_TEXT="$PROMPT_TEXT
+
+$SECTION"
+  fi
+done
 
 # Build system message with discipline-appropriate terminology and progress
 if [[ "$COMPLETION_PROMISE" != "null" ]] && [[ -n "$COMPLETION_PROMISE" ]]; then
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Brand Compliance Check Script
+Validates content against brand guidelines for Lisa campaigns
+"""
+
+import sys
+import argparse
+
+from lisa_quality.api import check_brand
+from lisa_quality.cli import add_report_arguments, exit_with_error, print_report, wants_report
+from lisa_quality.errors import QualityCheckError
+
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+NC = '\033[0m'  # No Color
+
+
+def colour(text, code, stream):
+    """Colour a banner only when writing to a terminal"""
+    return f"{code}{text}{NC}" if stream.isatty() else text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Check content against brand guidelines (brand-config.json)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  brand-check.py deliverables/landing-page.md
+  brand-check.py deliverables/press-release.md --config my-brand-config.json
+
+Checks:
+  ✓ Prohibited terms: none may appear (every occurrence reported with line/column)
+  ✓ Required terms: each must appear at least once
+
+Terms match whole words, case-insensitively ("art" does not match "start").
+brand-config.json is looked up next to this script, then in the current
+directory, then in .claude/plugins/lisa/scripts/.
+        """
+    )
+
+    parser.add_argument('file', help='Path to content file to check')
+    parser.add_argument('-c', '--config', help='Path to brand-config.json')
+    add_report_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    try:
+        result = check_brand(args.file, args.config)
+    except QualityCheckError as e:
+        exit_with_error(e)
+    if wants_report(args):
+        print_report(args, [result.to_dict()])
+
+    config_path = result.metrics['config']
+    if config_path is None:
+        print("⚠️  Warning: brand-config.json not found - using defaults", file=sys.stderr)
+
+    if result.passed:
+        print(colour("✅ Brand compliance check passed", GREEN, sys.stdout))
+        print("")
+        print(f"File: {args.file}")
+        if config_path:
+            print(f"Config: {config_path}")
+        print("No brand guideline violations found.")
+        sys.exit(0)
+    else:
+        print(colour("❌ Brand compliance check failed", RED, sys.stderr), file=sys.stderr)
+        print("", file=sys.stderr)
+        print(f"File: {args.file}", file=sys.stderr)
+        if config_path:
+            print(f"Config: {config_path}", file=sys.stderr)
+        print("", file=sys.stderr)
+        print(f"Violations found: {len(result.issues)}", file=sys.stderr)
+        print("", file=sys.stderr)
+        for issue in result.issues:
+            print(issue, file=sys.stderr)
+            print("", file=sys.stderr)
+        print("──────────────────────────────────────────────────────", file=sys.stderr)
+        print("Review brand guidelines and update content to resolve", file=sys.stderr)
+        print("violations before marking deliverable as approved.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
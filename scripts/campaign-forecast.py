@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+"""
+Campaign Forecast
+Predicts the iteration a campaign completes at, with an 80% band, from the
+iterations past deliverables of the same type, campaign type and complexity
+took, and the campaign's own pace so far (.claude/lisa-metrics.jsonl)
+"""
+
+import sys
+import json
+import shlex
+import argparse
+
+from lisa_campaign.campaigns import find_campaign
+from lisa_campaign.forecast import (
+    BAND,
+    IterationModel,
+    brief_forecast,
+    campaign_forecast,
+    forecast_fields,
+    render_forecast,
+)
+from lisa_campaign.metrics import METRICS_PATH, read_metrics
+from lisa_campaign.state import StateError
+
+
+def load_brief(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            brief = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not read campaign brief {path}: {e}", file=sys.stderr)
+        sys.exit(2)
+    if not isinstance(brief, dict):
+        print(f"❌ Error: Campaign brief {path} does not hold a JSON object", file=sys.stderr)
+        sys.exit(2)
+    return brief
+
+
+def load_records(path):
+    try:
+        return list(read_metrics(path))
+    except OSError as e:
+        print(f"❌ Error: Could not read {path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+def shell_assignments(forecast):
+    """FORECAST_* NAME='value' lines for eval in bash"""
+    return "\n".join(f"{name}={shlex.quote(str(value))}" for name, value in forecast_fields(forecast).items())
+
+
+def print_forecast(forecast, args, details=False):
+    if args.shell:
+        print(shell_assignments(forecast))
+    elif args.json:
+        print(json.dumps(forecast.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(render_forecast(forecast))
+        if details:
+            for remaining in forecast.to_dict()['remaining']:
+                print(f"   {remaining['id']}: ~{remaining['iterations']:g} ({remaining['basis']})")
+
+
+def progress(args):
+    try:
+        campaign = find_campaign(args.campaign)
+        state = campaign.store.load() if campaign is not None else None
+    except StateError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    if state is None:
+        print("💡 No active campaign", file=sys.stderr)
+        sys.exit(1)
+    brief = load_brief(args.brief or state['campaign_brief'])
+    print_forecast(campaign_forecast(state, brief, load_records(args.metrics)), args, details=args.details)
+    sys.exit(0)
+
+
+def estimate(args):
+    if not args.brief:
+        print("❌ Error: estimate needs --brief", file=sys.stderr)
+        sys.exit(2)
+    forecast = brief_forecast(load_brief(args.brief), load_records(args.metrics), args.complexity)
+    print_forecast(forecast, args, details=args.details)
+    if not args.shell and not args.json and forecast.remaining and forecast.from_history:
+        print(f"💡 Suggested --max-iterations {forecast.high} (the top of the {BAND}% band)")
+    sys.exit(0)
+
+
+def history(args):
+    model = IterationModel(load_records(args.metrics))
+    rows = model.table()
+    if args.json:
+        print(json.dumps([
+            {'type': row[0], 'campaign_type': row[1], 'complexity': row[2], 'samples': row[3],
+             'mean': round(row[4], 2), 'stdev': round(row[5], 2) if row[5] is not None else None}
+            for row in rows
+        ], indent=2, ensure_ascii=False))
+        sys.exit(0)
+    if not rows:
+        print("💡 No approvals recorded yet", file=sys.stderr)
+        sys.exit(1)
+    print(f"📈 Iterations per deliverable ({model.samples} approvals)")
+    for deliverable_type, campaign_type, complexity, samples, mean, spread in rows:
+        spread = f" ± {spread:.1f}" if spread is not None else ""
+        print(f"  {deliverable_type or '-'} ({campaign_type or '-'}, {complexity or '-'}): "
+              f"{mean:.1f}{spread} over {samples}")
+    sys.exit(0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Forecast how many iterations a campaign needs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+  progress   Forecast a running campaign's completion iteration (the Stop
+             hook adds this to the progress summary and warns when the
+             band reaches past --max-iterations)
+  estimate   Forecast a brief before starting it, to size --max-iterations
+  history    Print iterations per deliverable by type, campaign type and
+             complexity
+
+Each approval (campaign-state.py approve) logs the iterations the deliverable
+took to the metrics file. A deliverable is estimated from the past approvals
+most like it (type, campaign type and complexity, falling back to broader
+groups while there are fewer than 3), then scaled by the campaign's own pace.
+The band is {BAND}%.
+
+Examples:
+  campaign-forecast.py estimate --brief campaign-brief.json
+  campaign-forecast.py progress --campaign q1-launch --details
+  campaign-forecast.py history
+
+Exit codes: 0 success, 1 no active campaign (progress) or no approvals
+recorded (history), 2 unreadable brief, state or metrics file
+        """
+    )
+
+    parser.add_argument('command', choices=['progress', 'estimate', 'history'])
+    parser.add_argument('-c', '--campaign', default=None, metavar='ID',
+                        help='Campaign ID (default: $LISA_CAMPAIGN, or the only active campaign)')
+    parser.add_argument('--brief', default=None,
+                        help="Campaign brief JSON (estimate; progress defaults to the campaign's)")
+    parser.add_argument('--complexity', default=None,
+                        help='Complexity to estimate for (estimate, default: rated from the deliverable count)')
+    parser.add_argument('--details', action='store_true', help='List the estimate for each remaining deliverable')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--json', action='store_true', help='Print JSON')
+    output.add_argument('--shell', action='store_true', help='Print FORECAST_* NAME=value lines for eval in bash')
+    parser.add_argument('--metrics', default=METRICS_PATH, help=f'Metrics file (default: {METRICS_PATH})')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'progress':
+        progress(args)
+    elif args.command == 'estimate':
+        estimate(args)
+    history(args)
+
+
+if __name__ == '__main__':
+    main()
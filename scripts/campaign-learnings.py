@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+"""
+Campaign Learnings
+Records and queries Lisa's learnings log (learnings/learnings.jsonl): quality
+gate failures, stuck events and insights from every campaign, indexed by
+deliverable type, gate and failure reason
+"""
+
+import sys
+import json
+import argparse
+
+from lisa_campaign.campaigns import find_campaign
+from lisa_campaign.context import next_deliverable
+from lisa_campaign.learnings import (
+    DEFAULT_LIMIT,
+    EVENTS,
+    STORE_PATH,
+    LearningError,
+    LearningsStore,
+    make_record,
+    render_records,
+)
+from lisa_campaign.state import StateError
+
+
+def load_brief(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not read campaign brief {path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+def campaign_discipline(campaign_id):
+    """The campaign type from the campaign's state, if it is active"""
+    try:
+        campaign = find_campaign(campaign_id)
+        state = campaign.store.load() if campaign is not None else None
+    except StateError:
+        return None
+    return state['campaign_type'] if state else None
+
+
+def add(args, store):
+    deliverable_id = args.deliverable.split(':', 1)[0].strip() if args.deliverable else None
+    deliverable_type = args.type
+    if deliverable_type is None and args.brief and deliverable_id:
+        deliverable = next_deliverable(load_brief(args.brief), deliverable_id)
+        if deliverable is not None and deliverable.get('id') == deliverable_id:
+            deliverable_type = deliverable.get('type')
+    lesson = args.lesson if args.lesson is not None else sys.stdin.read()
+
+    try:
+        record = make_record(
+            args.event, lesson,
+            campaign=args.campaign,
+            discipline=args.discipline or (campaign_discipline(args.campaign) if args.campaign else None),
+            deliverable=deliverable_id,
+            type=deliverable_type,
+            gate=args.gate,
+            reason=args.reason,
+        )
+        store.add(record)
+    except LearningError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except OSError as e:
+        print(f"❌ Error: Could not update {store.path}: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(f"✅ Learning recorded ({record['event']})")
+    sys.exit(0)
+
+
+def query(args, store):
+    deliverable_type = args.type
+    if deliverable_type is None and args.brief:
+        deliverable = next_deliverable(load_brief(args.brief), args.deliverable)
+        if deliverable is None:
+            sys.exit(1)
+        deliverable_type = deliverable.get('type')
+
+    try:
+        records = store.query(limit=args.limit or None, type=deliverable_type, gate=args.gate,
+                              reason=args.reason, event=args.event, campaign=args.campaign)
+    except LearningError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not read {store.path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if not records:
+        print("💡 No learnings match", file=sys.stderr)
+        sys.exit(1)
+    if args.json:
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+    else:
+        subject = ' '.join(value for value in (deliverable_type, args.gate, args.reason, args.event) if value)
+        print(render_records(records, f"Learnings for {subject}" if subject else "Learnings"))
+    sys.exit(0)
+
+
+def compact(args, store):
+    try:
+        before, after = store.compact()
+    except OSError as e:
+        print(f"❌ Error: Could not compact {store.path}: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(f"✅ Learnings compacted: {before} records → {after}")
+    sys.exit(0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Record and query Lisa's learnings log",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+  add       Record a learning (--lesson, or read from stdin)
+  query     Print the most recent learnings matching the filters, newest first
+  compact   Merge repeated lessons into counted records
+
+Events: {', '.join(EVENTS)}. The quality gate runner records gate-failure
+learnings itself when given --campaign; the stop hook records stuck events.
+
+Examples:
+  campaign-learnings.py add --campaign q1-launch --deliverable PR-001 --type press-release \\
+      --lesson "Leading with the customer metric got the headline approved first time"
+  campaign-learnings.py query --type press-release --gate readability --limit 5
+  campaign-learnings.py query --brief campaign-brief.json --deliverable "PR-002: Media pitch"
+  campaign-learnings.py compact
+
+With --brief, the deliverable type comes from the brief (for query without
+--deliverable: the highest-priority unapproved deliverable).
+
+Exit codes: 0 success, 1 no learnings match (query), 2 invalid learning or
+unreadable file
+        """
+    )
+
+    parser.add_argument('command', choices=['add', 'query', 'compact'])
+    parser.add_argument('-c', '--campaign', default=None, metavar='ID', help='Campaign ID')
+    parser.add_argument('--event', default=None, choices=EVENTS,
+                        help='Event (add: default insight)')
+    parser.add_argument('--deliverable', default=None,
+                        help='Deliverable ID, or "ID: title" as in the campaign state')
+    parser.add_argument('--type', default=None, help='Deliverable type (e.g. press-release)')
+    parser.add_argument('--brief', default=None, help='Campaign brief to look the deliverable type up in')
+    parser.add_argument('--discipline', default=None,
+                        help='Discipline (add: default the campaign\'s campaign type)')
+    parser.add_argument('--gate', default=None, help='Quality gate (e.g. readability)')
+    parser.add_argument('--reason', default=None, help='Failure reason (issue code, e.g. reading-ease-low)')
+    parser.add_argument('--lesson', default=None, help='What was learned (add)')
+    parser.add_argument('-n', '--limit', type=int, default=DEFAULT_LIMIT,
+                        help=f'Most learnings to print (query, default: {DEFAULT_LIMIT}, 0 = all)')
+    parser.add_argument('--json', action='store_true', help='Print records as JSON (query)')
+    parser.add_argument('--store', default=STORE_PATH, help=f'Learnings log (default: {STORE_PATH})')
+
+    args = parser.parse_args(argv)
+    store = LearningsStore(args.store, args.store.rsplit('.', 1)[0] + '-index.json')
+
+    if args.command == 'add':
+        args.event = args.event or 'insight'
+        add(args, store)
+    if args.command == 'query':
+        query(args, store)
+    compact(args, store)
+
+
+if __name__ == '__main__':
+    main()
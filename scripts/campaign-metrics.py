@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+"""
+Campaign Metrics
+Records loop iteration timings and reports where a campaign's time went:
+latency percentiles per quality gate and per iteration, and the slowest
+gate runs (.claude/lisa-metrics.jsonl)
+"""
+
+import sys
+import json
+import argparse
+
+from lisa_campaign.metrics import (
+    METRICS_PATH,
+    OUTCOMES,
+    append_metrics,
+    iteration_record,
+    read_metrics,
+    render_report,
+    summarize,
+)
+
+
+def iteration(args):
+    if not args.campaign:
+        print("❌ Error: iteration needs --campaign", file=sys.stderr)
+        sys.exit(2)
+    try:
+        hook_started = float(args.hook_started) if args.hook_started else None
+    except ValueError:
+        hook_started = None
+    deliverable = args.deliverable.split(':', 1)[0].strip() if args.deliverable else None
+    record = iteration_record(args.campaign, args.iteration, deliverable, args.outcome,
+                              started_at=args.started_at, hook_started=hook_started, path=args.metrics)
+    try:
+        append_metrics([record], args.metrics)
+    except OSError as e:
+        print(f"❌ Error: Could not update {args.metrics}: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(f"✅ Iteration {args.iteration} recorded ({args.outcome})")
+    sys.exit(0)
+
+
+def report(args):
+    try:
+        records = list(read_metrics(args.metrics, args.campaign))
+    except OSError as e:
+        print(f"❌ Error: Could not read {args.metrics}: {e}", file=sys.stderr)
+        sys.exit(2)
+    if not records:
+        print("💡 No metrics recorded" + (f" for campaign '{args.campaign}'" if args.campaign else ''),
+              file=sys.stderr)
+        sys.exit(1)
+    summary = summarize(records)
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        print(render_report(summary, f"📊 Campaign Metrics: {args.campaign}" if args.campaign
+                            else "📊 Campaign Metrics"))
+    sys.exit(0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Record and report Lisa's campaign timings",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+  iteration   Record a loop iteration (the stop hook calls this)
+  report      Print latency percentiles per gate and iteration, and the slowest gate runs
+
+Gate timings are recorded by quality-gates.py when given --campaign: wall
+time, the part of it spent parsing the document (parse) and the rest (check),
+the bytes checked and whether the result came from the cache. Iteration wall
+time runs from the previous stop to this one.
+
+Outcomes: {', '.join(OUTCOMES)}
+
+Examples:
+  campaign-metrics.py report --campaign q1-launch
+  campaign-metrics.py report --json
+  campaign-metrics.py iteration --campaign q1-launch --iteration 3 --deliverable PR-001 --outcome continued
+
+Exit codes: 0 success, 1 no metrics recorded (report), 2 unreadable or
+unwritable metrics file
+        """
+    )
+
+    parser.add_argument('command', choices=['iteration', 'report'])
+    parser.add_argument('-c', '--campaign', default=None, metavar='ID', help='Campaign ID')
+    parser.add_argument('--iteration', type=int, default=None, help='Iteration number (iteration)')
+    parser.add_argument('--deliverable', default=None,
+                        help='Deliverable ID, or "ID: title" as in the campaign state (iteration)')
+    parser.add_argument('--outcome', default='continued', choices=OUTCOMES,
+                        help='How the iteration ended (iteration, default: continued)')
+    parser.add_argument('--started-at', default=None,
+                        help='Campaign start (%%Y-%%m-%%dT%%H:%%M:%%SZ), for the first iteration')
+    parser.add_argument('--hook-started', default=None,
+                        help='Epoch seconds the stop hook started at (iteration)')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON (report)')
+    parser.add_argument('--metrics', default=METRICS_PATH, help=f'Metrics file (default: {METRICS_PATH})')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'iteration':
+        iteration(args)
+    report(args)
+
+
+if __name__ == '__main__':
+    main()
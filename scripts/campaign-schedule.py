@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+"""
+Campaign Schedule
+Validates a campaign brief's deliverable dependency graph and orders the work:
+dependencies first, then by priority, with approved deliverables whose
+upstream content changed since their approval marked stale for rework
+"""
+
+import sys
+import json
+import argparse
+
+from lisa_campaign.campaigns import find_campaign
+from lisa_campaign.schedule import (
+    DELIVERABLES_DIR,
+    Schedule,
+    ScheduleError,
+    brief_deliverables,
+    label,
+    load_snapshots,
+    render_next,
+    render_schedule,
+    validate,
+)
+from lisa_campaign.state import StateError
+
+DEFAULT_BRIEF = 'campaign-brief.json'
+
+
+def find_brief_and_snapshots(args):
+    """The brief to schedule and the campaign's approval snapshots ({} without a campaign)"""
+    try:
+        campaign = find_campaign(args.campaign)
+        state = campaign.store.load() if campaign is not None else None
+    except StateError as e:
+        if args.campaign:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(2)
+        campaign, state = None, None
+    brief_path = args.brief or (state['campaign_brief'] if state and state['campaign_brief'] else DEFAULT_BRIEF)
+    try:
+        with open(brief_path, 'r', encoding='utf-8') as f:
+            brief = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not read campaign brief {brief_path}: {e}", file=sys.stderr)
+        sys.exit(2)
+    if not isinstance(brief, dict):
+        print(f"❌ Error: Campaign brief {brief_path} does not hold a JSON object", file=sys.stderr)
+        sys.exit(2)
+    snapshots = load_snapshots(campaign.schedule_path) if state is not None else {}
+    return brief, brief_path, snapshots
+
+
+def print_problems(errors, warnings, stream):
+    for error in errors:
+        print(f"  ❌ {error}", file=stream)
+    for warning in warnings:
+        print(f"  ⚠️  {warning}", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Order a campaign's deliverables by their dependencies and priority",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+  validate   Check the dependency graph (unknown or duplicate IDs,
+             self-dependencies, cycles; dependencies with a higher priority
+             number than their dependents are warnings)
+  show       Print every deliverable in work order with its status
+  next       Print the deliverable to work on next (the Stop hook adds this
+             to each iteration's prompt)
+
+Work order is topological: a deliverable comes after everything in its
+"dependencies", and among deliverables whose dependencies are placed, the
+lowest priority number comes first. Approving a deliverable
+(campaign-state.py approve) snapshots its dependencies' files in the
+deliverables folder; if one of them changes afterwards, the deliverable is
+stale and is scheduled for rework before anything that depends on it.
+
+Examples:
+  campaign-schedule.py validate --brief campaign-brief.json
+  campaign-schedule.py show --campaign q1-launch
+  campaign-schedule.py next --campaign q1-launch --json
+
+Without --brief, the brief comes from the campaign's state (else
+{DEFAULT_BRIEF}). Without a campaign, nothing is stale.
+
+Exit codes: 0 success, 1 invalid graph (validate) or nothing left to work
+on (next), 2 unreadable brief or invalid graph (show, next)
+        """
+    )
+
+    parser.add_argument('command', choices=['validate', 'show', 'next'])
+    parser.add_argument('-c', '--campaign', default=None, metavar='ID',
+                        help='Campaign ID (default: $LISA_CAMPAIGN, or the only active campaign)')
+    parser.add_argument('--brief', default=None, help='Campaign brief JSON')
+    parser.add_argument('--deliverables-dir', default=DELIVERABLES_DIR,
+                        help=f'Folder holding the deliverable files (default: {DELIVERABLES_DIR})')
+    parser.add_argument('--json', action='store_true', help='Print JSON')
+
+    args = parser.parse_args(argv)
+    brief, brief_path, snapshots = find_brief_and_snapshots(args)
+
+    if args.command == 'validate':
+        errors, warnings = validate(brief_deliverables(brief))
+        if args.json:
+            print(json.dumps({'valid': not errors, 'errors': errors, 'warnings': warnings},
+                             indent=2, ensure_ascii=False))
+        elif errors:
+            print(f"❌ Invalid deliverable dependencies in {brief_path}:", file=sys.stderr)
+            print_problems(errors, warnings, sys.stderr)
+        else:
+            print(f"✅ Deliverable dependencies are valid ({len(brief_deliverables(brief))} deliverables)")
+            print_problems(errors, warnings, sys.stdout)
+        sys.exit(1 if errors else 0)
+
+    try:
+        schedule = Schedule(brief, snapshots, args.deliverables_dir)
+    except ScheduleError as e:
+        print(f"❌ Invalid deliverable dependencies in {brief_path}:", file=sys.stderr)
+        print_problems(e.problems, [], sys.stderr)
+        sys.exit(2)
+
+    if args.command == 'show':
+        if args.json:
+            print(json.dumps(schedule.to_dict(), indent=2, ensure_ascii=False))
+        else:
+            remaining = len(schedule.remaining)
+            print(f"📋 Schedule: {len(schedule.order) - remaining}/{len(schedule.order)} approved, "
+                  f"{len(schedule.stale)} stale")
+            print(render_schedule(schedule))
+        sys.exit(0)
+
+    if schedule.next is None:
+        if args.json:
+            print(json.dumps({'next': None}))
+        else:
+            print("✅ Every deliverable is approved and none is stale", file=sys.stderr)
+        sys.exit(1)
+    if args.json:
+        entry = next(d for d in schedule.to_dict()['deliverables'] if d['id'] == schedule.next['id'])
+        print(json.dumps(dict(entry, next=label(schedule.next)), indent=2, ensure_ascii=False))
+    else:
+        print(render_next(schedule))
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+"""
+Campaign State
+Reads and updates Lisa campaign state stores (.claude/lisa-campaigns/<id>/)
+for the setup script, the stop hook and the agent's progress tracking
+"""
+
+import os
+import sys
+import json
+import shlex
+import argparse
+
+from lisa_campaign.campaigns import Campaign, campaigns, find_campaign, resolve_session, slugify
+from lisa_campaign.hook import stop
+from lisa_campaign.metrics import append_metrics, approval_record
+from lisa_campaign.schedule import brief_deliverables, record_approval
+from lisa_campaign.state import COUNTERS, DEFAULTS, CampaignStore, StateError, deliverable_id, parse_value
+
+# Shell variable names for the stop hook (field name upper-cased otherwise)
+SHELL_NAMES = {'prompt': 'PROMPT_TEXT'}
+DEFAULT_CONTEXT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'context')
+
+
+def parse_assignments(parser, assignments):
+    """field=value arguments -> dict of typed values"""
+    fields = {}
+    for assignment in assignments:
+        field, sep, value = assignment.partition('=')
+        if not sep:
+            parser.error(f"expected field=value, got: {assignment}")
+        fields[field] = parse_value(field, value)
+    return fields
+
+
+def shell_value(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return ','.join(value)
+    return str(value)
+
+
+def shell_assignments(state):
+    """NAME='value' lines for the stop hook to eval"""
+    return "\n".join(
+        f"{SHELL_NAMES.get(field, field.upper())}={shlex.quote(shell_value(state[field]))}"
+        for field in DEFAULTS
+    )
+
+
+def read_brief(state, deliverable):
+    """The campaign's brief, or None (with a warning) if it is unreadable"""
+    if not state['campaign_brief']:
+        return None
+    try:
+        with open(state['campaign_brief'], 'r', encoding='utf-8') as f:
+            brief = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not record {deliverable_id(deliverable)}'s approval history: {e}", file=sys.stderr)
+        return None
+    return brief if isinstance(brief, dict) else None
+
+
+def log_approval(campaign, state, deliverable):
+    """Record the iterations a first approval took in the metrics log, for forecasting"""
+    brief = read_brief(state, deliverable)
+    if brief is None:
+        return
+    entry = next((d for d in brief_deliverables(brief) if d.get('id') == deliverable_id(deliverable)),
+                 {'id': deliverable_id(deliverable)})
+    try:
+        append_metrics([approval_record(campaign.id, state['iteration'], entry,
+                                        state['campaign_type'], state['complexity'])])
+    except OSError as e:
+        print(f"⚠️  Could not record {deliverable_id(deliverable)}'s approval history: {e}", file=sys.stderr)
+
+
+def snapshot_approval(campaign, state, deliverable):
+    """Snapshot the approved deliverable's dependencies, so upstream edits mark it stale"""
+    brief = read_brief(state, deliverable)
+    if brief is None:
+        return
+    try:
+        record_approval(campaign.schedule_path, brief, deliverable_id(deliverable))
+    except OSError as e:
+        print(f"⚠️  Could not record {deliverable_id(deliverable)}'s approval history: {e}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Read and update Lisa campaign state',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+  show                      Print the state as JSON
+  get FIELD                 Print one field
+  set FIELD=VALUE...        Update fields atomically
+  check pass|fail ID        Record a quality gate run on a deliverable
+                            (updates checks passed/failed, consecutive failures,
+                            current and last deliverable)
+  approve ID                Record a deliverable as approved (counted once),
+                            snapshot its dependencies (see campaign-schedule.py)
+                            and log the iterations it took (campaign-forecast.py)
+  init FIELD=VALUE...       Start a campaign (loop prompt read from stdin)
+  shell                     Print every field as NAME='value' for eval in bash
+  clear                     End the campaign (its learnings are kept)
+  list                      List active campaigns
+  resolve                   Print the ID of the campaign a session runs
+                            (--session, --transcript; binds it on first use)
+  hook                      Run the Stop hook's steps for a session (--session,
+                            --transcript) in one process: print CAMPAIGN_ID,
+                            every field and HOOK_OUTCOME (plus the forecast and
+                            prompt sections of a continued loop) as NAME='value';
+                            exits 0 even without a campaign (HOOK_OUTCOME none)
+                            or on an error (HOOK_OUTCOME error, HOOK_ERROR)
+
+Examples:
+  campaign-state.py --campaign q1-launch check fail "MKT-003: Email nurture sequence"
+  campaign-state.py --campaign q1-launch approve MKT-003
+  campaign-state.py get deliverables_completed
+  campaign-state.py set current_deliverable="PR-002: Media pitch"
+
+Without --campaign (or $LISA_CAMPAIGN), commands use the workspace's only
+active campaign.
+
+Counters: {', '.join(COUNTERS)}
+
+Exit codes: 0 success, 1 no active campaign (or one already active for
+init), 2 invalid state file or value
+        """
+    )
+
+    parser.add_argument('command',
+                        choices=['show', 'get', 'set', 'check', 'approve', 'init', 'shell', 'clear',
+                                 'list', 'resolve', 'hook'])
+    parser.add_argument('arguments', nargs='*')
+    parser.add_argument('-c', '--campaign', default=None, metavar='ID',
+                        help='Campaign ID (default: $LISA_CAMPAIGN, or the only active campaign)')
+    parser.add_argument('--state', default=None, metavar='FILE',
+                        help='State file to use instead of a campaign\'s')
+    parser.add_argument('--session', default=None, help='Session ID (resolve, hook)')
+    parser.add_argument('--transcript', default=None, help='Session transcript (resolve, hook)')
+    parser.add_argument('--hook-started', default=None, metavar='EPOCH',
+                        help='When the Stop hook started, for the iteration timings (hook)')
+    parser.add_argument('--context-dir', default=DEFAULT_CONTEXT_DIR,
+                        help=f'Memory folder for the prompt\'s memory section (hook, default: {DEFAULT_CONTEXT_DIR})')
+
+    args = parser.parse_args(argv)
+    command, arguments = args.command, args.arguments
+
+    try:
+        if command == 'list':
+            for campaign, state in campaigns():
+                print(f"{campaign.id}: {state['campaign_name']} ({state['campaign_type']}, "
+                      f"iteration {state['iteration']}/{state['max_iterations']}, "
+                      f"{state['deliverables_completed']}/{state['deliverables_total']} deliverables)")
+            sys.exit(0)
+
+        if command == 'resolve':
+            campaign = resolve_session(args.session, args.transcript)
+            if campaign is None:
+                sys.exit(1)
+            print(campaign.id)
+            sys.exit(0)
+
+        if command == 'hook':
+            try:
+                hook_started = float(args.hook_started) if args.hook_started else None
+            except ValueError:
+                hook_started = None
+            # Always exit 0 with HOOK_OUTCOME, so the hook can tell no campaign
+            # from a failure
+            try:
+                campaign, state, fields = stop(args.session, args.transcript, args.context_dir, hook_started)
+            except StateError as e:
+                # Only a single-campaign state file from an older version can fail here
+                campaign, state, fields = None, None, {'HOOK_OUTCOME': 'state-corrupt', 'HOOK_ERROR': str(e)}
+            except Exception as e:
+                campaign, state, fields = None, None, {'HOOK_OUTCOME': 'error',
+                                                       'HOOK_ERROR': f"{type(e).__name__}: {e}"}
+            lines = [f"CAMPAIGN_ID={shlex.quote(campaign.id if campaign is not None else '')}"]
+            if state is not None:
+                lines.append(shell_assignments(state))
+            lines.extend(f"{name}={shlex.quote(str(value))}" for name, value in fields.items())
+            print("\n".join(lines))
+            sys.exit(0)
+
+        if command == 'init':
+            fields = parse_assignments(parser, arguments)
+            fields['prompt'] = sys.stdin.read().strip('\n')
+            campaign = Campaign(args.campaign or slugify(fields.get('campaign_name', '')))
+            fields['campaign_id'] = campaign.id
+            try:
+                campaign.store.create(**fields)
+            except FileExistsError:
+                print(f"❌ Error: Campaign '{campaign.id}' is already active ({campaign.state_path})",
+                      file=sys.stderr)
+                sys.exit(1)
+            print(campaign.id)
+            sys.exit(0)
+
+        campaign = None if args.state else find_campaign(args.campaign)
+        if args.state:
+            store = CampaignStore(args.state, legacy_path=None)
+        else:
+            # No campaign: a single-campaign state file from an older version
+            store = campaign.store if campaign is not None else CampaignStore()
+
+        if command == 'clear':
+            if campaign is not None:
+                campaign.delete()
+            else:
+                store.delete()
+            sys.exit(0)
+
+        if command in ('set', 'check', 'approve'):
+            if command == 'set':
+                if not arguments:
+                    parser.error('set needs at least one FIELD=VALUE')
+                state = store.update(**parse_assignments(parser, arguments))
+            elif command == 'check':
+                if len(arguments) != 2 or arguments[0] not in ('pass', 'fail'):
+                    parser.error('usage: check pass|fail DELIVERABLE')
+                state = store.record_check(arguments[1], arguments[0] == 'pass')
+            else:
+                if len(arguments) != 1:
+                    parser.error('usage: approve DELIVERABLE')
+                def on_first(state):
+                    log_approval(campaign, state, arguments[0])
+
+                state = store.complete_deliverable(arguments[0], on_first if campaign is not None else None)
+                if campaign is not None:
+                    snapshot_approval(campaign, state, arguments[0])
+        else:
+            state = store.load()
+            if state is None:
+                raise StateError("No active campaign")
+    except StateError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1 if str(e) == "No active campaign" else 2)
+
+    if command == 'get':
+        if len(arguments) != 1 or arguments[0] not in DEFAULTS:
+            parser.error(f"usage: get FIELD (one of: {', '.join(DEFAULTS)})")
+        print(shell_value(state[arguments[0]]))
+    elif command == 'shell':
+        print(shell_assignments(state))
+    elif command == 'show':
+        print(json.dumps(state, indent=2, ensure_ascii=False))
+    else:
+        progress = (f"{state['deliverables_completed']}/{state['deliverables_total']} deliverables, "
+                    f"checks {state['quality_checks_passed']} passed / "
+                    f"{state['quality_checks_failed']} failed, "
+                    f"{state['consecutive_failures']} consecutive failure(s)")
+        print(f"✅ Campaign state updated: {progress}")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+Context Memory
+Adds learned patterns to Lisa's contextual memory
+(context/lisa-memory-contextual.json) under a file lock, so campaigns
+running in parallel can learn from feedback without overwriting each other,
+and selects the memory entries relevant to a deliverable for its prompt
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from lisa_campaign.context import (
+    DEFAULT_BUDGET,
+    DEFAULT_MAX_ENTRIES,
+    INDEX_PATH,
+    deliverable_query,
+    load_index,
+    next_deliverable,
+    render_selection,
+    select_entries,
+)
+from lisa_campaign.memory import MemoryEntryError, add_memory
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONTEXT_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), 'context')
+
+
+def add(args):
+    memory_file = args.memory_file or os.path.join(args.context_dir, 'lisa-memory-contextual.json')
+    try:
+        entry = json.loads(sys.stdin.read())
+    except ValueError as e:
+        print(f"❌ Error: Memory entry is not valid JSON: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        entry = add_memory(memory_file, entry)
+    except MemoryEntryError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not update {memory_file}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(f"✅ Learned: {entry['name']} ({entry['id']})")
+    sys.exit(0)
+
+
+def select(args):
+    if not args.brief:
+        print("❌ Error: select needs --brief", file=sys.stderr)
+        sys.exit(2)
+    try:
+        with open(args.brief, 'r', encoding='utf-8') as f:
+            brief = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not read campaign brief {args.brief}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    deliverable = next_deliverable(brief, args.deliverable)
+    if deliverable is None:
+        # Every deliverable is approved: nothing to select for
+        sys.exit(1)
+
+    index = load_index(args.context_dir, args.index)
+    query_terms, query_tags = deliverable_query(deliverable, args.discipline or brief.get('campaignType'))
+    selected = select_entries(index, query_terms, query_tags, args.max_entries, args.budget)
+    section = render_selection(selected, deliverable, len(index['entries']))
+    if section:
+        print(section)
+    sys.exit(0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Add to Lisa's contextual memory, or select the entries relevant to a deliverable",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Commands:
+  add       Add the entry read from stdin (a JSON object with at least name,
+            category, whenToUse and content; id and learnedDate are filled
+            in when missing)
+  select    Print the core and contextual memory entries most relevant to a
+            brief's deliverable (--deliverable, default: the highest-priority
+            unapproved one) as a markdown section
+
+Entries are ranked by tag (deliverable type, discipline), category and term
+relevance (BM25), then cut to --max-entries and --budget characters. The
+index is cached in {INDEX_PATH} and rebuilt when a memory file changes.
+
+Examples:
+  echo '{{"name": "Avoid hype words", "category": "voice",
+         "whenToUse": "Enterprise press releases", "tags": ["press-release"],
+         "content": "Prefer transform over revolutionize"}}' | context-memory.py add
+  context-memory.py select --brief campaign-brief.json --deliverable "PR-002: Media pitch"
+
+Exit codes: 0 success, 1 no unapproved deliverable (select), 2 invalid
+entry or unreadable file
+        """
+    )
+
+    parser.add_argument('command', choices=['add', 'select'])
+    parser.add_argument('--context-dir', default=DEFAULT_CONTEXT_DIR,
+                        help="Directory with the memory files (default: the plugin's context/)")
+    parser.add_argument('--memory-file', default=None,
+                        help='Contextual memory file to add to (default: <context-dir>/lisa-memory-contextual.json)')
+    parser.add_argument('--brief', help='Campaign brief JSON (select)')
+    parser.add_argument('--deliverable', default=None,
+                        help='Deliverable ID, or "ID: title" as in the campaign state (select)')
+    parser.add_argument('--discipline', default=None,
+                        help='Discipline tag to match (default: the brief\'s campaignType)')
+    parser.add_argument('--max-entries', type=int, default=DEFAULT_MAX_ENTRIES,
+                        help=f'Most entries to select (default: {DEFAULT_MAX_ENTRIES})')
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET,
+                        help=f'Most characters of entries to select (default: {DEFAULT_BUDGET})')
+    parser.add_argument('--index', default=INDEX_PATH,
+                        help=f'Index cache file (default: {INDEX_PATH})')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'add':
+        add(args)
+    select(args)
+
+
+if __name__ == '__main__':
+    main()
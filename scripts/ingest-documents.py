@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+"""
+Ingest Documents
+Streams brand books, style guides and press archives (Markdown, text, PDF)
+into candidate entries for Lisa's core and contextual memory, re-processing
+only the sections that changed since the last run
+"""
+
+import os
+import sys
+import argparse
+
+from lisa_campaign.ingest import (
+    INDEX_FILENAME,
+    MAX_CHUNK_CHARS,
+    IngestError,
+    ingest,
+)
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONTEXT_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), 'context')
+
+
+def describe(result):
+    name = os.path.basename(result.path)
+    if result.unchanged:
+        return f"✅ {name}: unchanged ({result.chunks} chunks)"
+    parts = [f"{result.chunks} chunks", f"{result.new_chunks} new"]
+    if result.duplicate_chunks:
+        parts.append(f"{result.duplicate_chunks} duplicate")
+    if result.removed_chunks:
+        parts.append(f"{result.removed_chunks} removed")
+    return (f"✅ {name}: {', '.join(parts)} → {len(result.core)} core, "
+            f"{len(result.contextual)} contextual candidate entries")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Ingest company documents into candidate memory entries',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Documents are read as a stream and split into sections of at most
+{MAX_CHUNK_CHARS} characters at Markdown headings and paragraph breaks.
+Sections are deduplicated by a hash of their text (case, punctuation and
+whitespace ignored). Rules ("always...", "avoid...") become contextual memory
+candidates and facts (names, dates, figures) core memory candidates; every
+ingested entry has an id starting with "ingest-" and is tagged "ingested".
+
+The chunk index ({INDEX_FILENAME} in the context directory) remembers each
+document's sections: re-ingesting an updated document only extracts from its
+new sections and removes the entries of sections that were deleted.
+
+PDF documents need the pypdf library (pip install pypdf).
+
+Examples:
+  ingest-documents.py brand-book.pdf style-guide.md
+  ingest-documents.py --dry-run --show press-archive.txt
+
+Exit codes: 0 success, 1 a document could not be read, 2 memory files
+could not be updated
+        """
+    )
+
+    parser.add_argument('documents', nargs='+', help='Markdown, text or PDF documents')
+    parser.add_argument('--context-dir', default=DEFAULT_CONTEXT_DIR,
+                        help="Directory with the memory files (default: the plugin's context/)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Extract and report without updating the memory files or the index')
+    parser.add_argument('--show', action='store_true',
+                        help='Print every candidate entry')
+
+    args = parser.parse_args(argv)
+
+    try:
+        results = ingest(args.documents, args.context_dir, dry_run=args.dry_run)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not update memory in {args.context_dir}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    failed = False
+    for path, result in results:
+        if isinstance(result, IngestError):
+            print(f"❌ Error: {path}: {result}", file=sys.stderr)
+            failed = True
+            continue
+        print(describe(result))
+        if args.show:
+            for entry in result.core:
+                print(f"   core [{entry['category']}] {entry['content']}")
+            for entry in result.contextual:
+                print(f"   contextual [{entry['category']}] {entry['content']}")
+
+    if args.dry_run:
+        print("💡 Dry run: memory files and chunk index not updated")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+"""
+Lisa campaign runtime library
+Building blocks for the campaign loop itself (the stop hook and setup
+script), as opposed to the quality checks in lisa_quality
+"""
+
+from .campaigns import Campaign, find_campaign, resolve_session
+from .state import CampaignStore, StateError
+from .transcript import TranscriptError, last_assistant_message
+
+__all__ = [
+    'Campaign',
+    'CampaignStore',
+    'StateError',
+    'TranscriptError',
+    'find_campaign',
+    'last_assistant_message',
+    'resolve_session',
+]
@@ -0,0 +1,185 @@
+"""
+Campaign registry
+Several campaigns can run in one workspace, each keyed by a campaign ID: its
+state, transcript bookmark and approval snapshots (see schedule.py) live in
+.claude/lisa-campaigns/<id>/ (its learnings go to the shared learnings log,
+tagged with the ID). The stop hook fires for every session in the
+workspace, so each campaign is bound to the Claude Code session that started
+it: on that session's first stop, by the "Campaign ID: <id>" line the setup
+script printed into its transcript.
+"""
+
+import os
+import re
+import shutil
+
+from .files import locked
+from .state import CampaignStore, StateError
+from .transcript import reverse_lines
+
+CAMPAIGNS_DIR = os.path.join('.claude', 'lisa-campaigns')
+CAMPAIGN_ENV_VAR = 'LISA_CAMPAIGN'
+
+ID_PATTERN = re.compile(r'^[a-z0-9][a-z0-9-]{0,63}$')
+# Printed by setup-lisa-campaign.sh, so it lands in the session's transcript
+CAMPAIGN_MARKER = re.compile(rb'Campaign ID: ([a-z0-9][a-z0-9-]{0,63})')
+
+
+def slugify(name):
+    """ "Q1 Product Launch!" -> "q1-product-launch" """
+    slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')[:64].strip('-')
+    return slug or 'campaign'
+
+
+class Campaign:
+    """One campaign's files, by campaign ID"""
+
+    def __init__(self, campaign_id):
+        if not ID_PATTERN.match(campaign_id):
+            raise StateError(f"Invalid campaign ID '{campaign_id}' "
+                             "(lowercase letters, digits and hyphens, at most 64)")
+        self.id = campaign_id
+        self.directory = os.path.join(CAMPAIGNS_DIR, campaign_id)
+        self.state_path = os.path.join(self.directory, 'state.json')
+        self.bookmark_path = os.path.join(self.directory, 'transcript.json')
+        self.schedule_path = os.path.join(self.directory, 'schedule.json')
+        self.store = CampaignStore(self.state_path, legacy_path=None)
+
+    def exists(self):
+        return os.path.exists(self.state_path)
+
+    def delete(self):
+        """End the campaign (its learnings are kept)"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def campaign_ids():
+    """IDs of the workspace's active campaigns, sorted"""
+    try:
+        names = os.listdir(CAMPAIGNS_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(name for name in names
+                  if ID_PATTERN.match(name) and os.path.isfile(os.path.join(CAMPAIGNS_DIR, name, 'state.json')))
+
+
+def campaigns():
+    """(campaign, state) for every active campaign whose state is readable"""
+    loaded = []
+    for campaign_id in campaign_ids():
+        campaign = Campaign(campaign_id)
+        try:
+            state = campaign.store.load()
+        except StateError:
+            continue
+        if state is not None:
+            loaded.append((campaign, state))
+    return loaded
+
+
+def find_campaign(campaign_id=None):
+    """
+    The campaign a command refers to
+
+    An explicit ID (or $LISA_CAMPAIGN) selects that campaign; otherwise the
+    workspace's only campaign.
+
+    Returns:
+        Campaign, or None if no campaign is active (a single-campaign state
+        file from an older version may still be)
+
+    Raises:
+        StateError: if the ID is invalid or several campaigns are active
+    """
+    campaign_id = campaign_id or os.environ.get(CAMPAIGN_ENV_VAR)
+    if campaign_id:
+        return Campaign(campaign_id)
+    ids = campaign_ids()
+    if len(ids) > 1:
+        raise StateError(f"Several campaigns are active ({', '.join(ids)}); pass --campaign ID")
+    return Campaign(ids[0]) if ids else None
+
+
+def migrate_legacy(session_id):
+    """
+    Move a single-campaign state file from an older version into the
+    registry, bound to session_id (it belonged to whichever session stopped)
+
+    Returns:
+        Campaign or None
+    """
+    legacy = CampaignStore()
+    if not legacy.exists():
+        return None
+    state = legacy.load()
+    campaign = Campaign(slugify(state['campaign_name']))
+    state.update(campaign_id=campaign.id, session_id=session_id)
+    try:
+        campaign.store.create(**state)
+    except FileExistsError:
+        # Never clobber a registry campaign; leave the legacy file for a human
+        return None
+    legacy.delete()
+    return campaign
+
+
+def announced_campaign_ids(transcript):
+    """Yield the campaign IDs a transcript announces, most recent first"""
+    try:
+        f = open(transcript, 'rb')
+    except OSError:
+        return
+    with f:
+        for _, line in reverse_lines(f, os.fstat(f.fileno()).st_size):
+            for match in reversed(list(CAMPAIGN_MARKER.finditer(line))):
+                yield match.group(1).decode('ascii')
+
+
+def resolve_session(session_id, transcript=None):
+    """
+    The campaign a session is running, binding it on the session's first stop
+
+    A campaign already bound to the session wins. Otherwise the session
+    claims the unbound campaign whose ID its transcript announces most
+    recently. A campaign whose state is unreadable is matched by its
+    announced ID alone (it cannot be bound), so the stop hook can report it
+    and end it. Without a session ID (older Claude Code), the workspace's
+    only campaign is used, as before campaigns were keyed by ID.
+
+    Returns:
+        Campaign or None if the session is not running a campaign
+
+    Raises:
+        StateError: if a legacy state file is corrupted
+    """
+    with locked(os.path.join(CAMPAIGNS_DIR, 'registry')):
+        if not session_id:
+            ids = campaign_ids()
+            if len(ids) == 1:
+                return Campaign(ids[0])
+            return migrate_legacy(None) if not ids else None
+
+        unbound, unreadable = {}, {}
+        for campaign_id in campaign_ids():
+            campaign = Campaign(campaign_id)
+            try:
+                state = campaign.store.load()
+            except StateError:
+                unreadable[campaign_id] = campaign
+                continue
+            if state is None:
+                continue
+            if state['session_id'] == session_id:
+                return campaign
+            if not state['session_id']:
+                unbound[campaign_id] = campaign
+
+        if (unbound or unreadable) and transcript:
+            for campaign_id in announced_campaign_ids(transcript):
+                if campaign_id in unbound:
+                    campaign = unbound[campaign_id]
+                    campaign.store.update(session_id=session_id)
+                    return campaign
+                if campaign_id in unreadable:
+                    return unreadable[campaign_id]
+        return migrate_legacy(session_id)
@@ -0,0 +1,257 @@
+"""
+Context retrieval
+Selects the memory entries relevant to one deliverable instead of sending
+every entry of lisa-memory-core.json and lisa-memory-contextual.json with
+each iteration's prompt.
+
+The entries are indexed by tag, by category and by term (with term
+frequencies for BM25 scoring). The index is cached in
+.claude/lisa-context-index.json and rebuilt only when a memory file's size
+or modification time changes.
+"""
+
+import os
+import re
+import json
+import math
+from collections import Counter
+
+from .files import write_json_atomic
+from .schedule import ScheduleError, topological_order
+
+MEMORY_FILES = (
+    ('lisa-memory-core.json', 'Core Memory'),
+    ('lisa-memory-contextual.json', 'Contextual Memory'),
+)
+INDEX_PATH = os.path.join('.claude', 'lisa-context-index.json')
+INDEX_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_BUDGET = 4000  # characters of rendered entries
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# A tag naming the deliverable type (or discipline) outweighs a few shared words
+TAG_WEIGHT = 3.0
+# Voice and formatting preferences apply to most deliverables
+CATEGORY_PRIORS = {'voice': 0.5, 'formatting': 0.5, 'quality-threshold': 0.25}
+
+WORD = re.compile(r'[a-z0-9]+')
+STOP_WORDS = frozenset("""
+a an and are as at be but by for from has have in into is it its of on or our
+that the their this to was we when where which with you your all any not use
+should must will can more most than then them they these those such via per
+""".split())
+
+
+def terms(text):
+    """Lower-case word terms, without stop words and single characters"""
+    return [word for word in WORD.findall(text.lower()) if len(word) > 1 and word not in STOP_WORDS]
+
+
+def entry_text(entry):
+    return ' '.join(str(entry.get(field, '')) for field in ('name', 'whenToUse', 'content')) \
+        + ' ' + ' '.join(entry_tags(entry))
+
+
+def entry_tags(entry):
+    tags = entry.get('tags', [])
+    return [tag.lower() for tag in tags if isinstance(tag, str)] if isinstance(tags, list) else []
+
+
+def file_signature(path):
+    """(size, mtime_ns) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_entries(context_dir):
+    """
+    Memory entries of every memory file in context_dir, each with the
+    section it came from
+
+    Unreadable or malformed files contribute no entries.
+    """
+    entries = []
+    for filename, section in MEMORY_FILES:
+        try:
+            with open(os.path.join(context_dir, filename), 'r', encoding='utf-8') as f:
+                memory = json.load(f)
+        except (OSError, ValueError):
+            continue
+        items = memory.get('entries', []) if isinstance(memory, dict) else []
+        entries.extend({'section': section, 'entry': item} for item in items if isinstance(item, dict))
+    return entries
+
+
+def build_index(context_dir):
+    """Inverted index over the memory entries in context_dir"""
+    entries = load_entries(context_dir)
+    postings, by_tag, by_category, lengths = {}, {}, {}, []
+    for number, item in enumerate(entries):
+        entry = item['entry']
+        counts = Counter(terms(entry_text(entry)))
+        lengths.append(sum(counts.values()))
+        for term, count in counts.items():
+            postings.setdefault(term, {})[str(number)] = count
+        for tag in entry_tags(entry):
+            by_tag.setdefault(tag, []).append(number)
+        category = entry.get('category')
+        if isinstance(category, str):
+            by_category.setdefault(category, []).append(number)
+    return {
+        'version': INDEX_VERSION,
+        'context_dir': os.path.abspath(context_dir),
+        'sources': {filename: file_signature(os.path.join(context_dir, filename))
+                    for filename, _ in MEMORY_FILES},
+        'entries': entries,
+        'lengths': lengths,
+        'postings': postings,
+        'tags': by_tag,
+        'categories': by_category,
+    }
+
+
+def load_index(context_dir, index_path=INDEX_PATH):
+    """
+    The memory index for context_dir: the cached one if no memory file has
+    changed since it was built, else a fresh one (which replaces the cache)
+    """
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        current = (index.get('version') == INDEX_VERSION
+                   and index.get('context_dir') == os.path.abspath(context_dir)
+                   and index.get('sources') == {filename: file_signature(os.path.join(context_dir, filename))
+                                                for filename, _ in MEMORY_FILES})
+    except (OSError, ValueError, AttributeError):
+        current = False
+    if current:
+        return index
+    index = build_index(context_dir)
+    try:
+        write_json_atomic(index_path, index)
+    except OSError:
+        pass  # Without a writable cache the index is just rebuilt next time
+    return index
+
+
+def deliverable_query(deliverable, discipline=None):
+    """
+    (query terms, query tags) for a campaign brief deliverable: its type and
+    the discipline as tags, its type, title and description as terms
+    """
+    query_tags = {str(deliverable.get('type', '')).lower()}
+    if discipline:
+        query_tags.add(discipline.lower())
+    text = ' '.join(str(deliverable.get(field, '')) for field in ('type', 'title', 'description'))
+    return terms(text), query_tags - {''}
+
+
+def score_entries(index, query_terms, query_tags):
+    """{entry number: relevance score} for entries that match the query"""
+    count = len(index['entries'])
+    if not count:
+        return {}
+    average_length = sum(index['lengths']) / count or 1
+    scores = Counter()
+
+    for term in set(query_terms):
+        posting = index['postings'].get(term)
+        if not posting:
+            continue
+        idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+        for number, frequency in posting.items():
+            length = index['lengths'][int(number)]
+            scores[int(number)] += idf * frequency * (K1 + 1) / (
+                frequency + K1 * (1 - B + B * length / average_length))
+
+    for tag in query_tags:
+        for number in index['tags'].get(tag, []):
+            scores[number] += TAG_WEIGHT
+
+    # Voice, formatting and threshold preferences are candidates even
+    # without a match, ranked below entries that do match
+    for category, prior in CATEGORY_PRIORS.items():
+        for number in index['categories'].get(category, []):
+            scores[number] += prior
+    return {number: score for number, score in scores.items() if score > 0}
+
+
+def render_entry(entry):
+    line = f"- **{entry.get('name', 'Untitled')}**"
+    if entry.get('whenToUse'):
+        line += f" (when: {entry['whenToUse']})"
+    return f"{line}: {entry.get('content', '')}"
+
+
+def select_entries(index, query_terms, query_tags, max_entries=DEFAULT_MAX_ENTRIES, budget=DEFAULT_BUDGET):
+    """
+    The most relevant entries that fit: at most max_entries, rendered in at
+    most budget characters (an entry too large for what is left is skipped
+    in favor of smaller, less relevant ones)
+
+    Returns:
+        list: (section, entry, score), most relevant first
+    """
+    scores = score_entries(index, query_terms, query_tags)
+    ranked = sorted(scores, key=lambda number: (-scores[number], number))
+    selected, used = [], 0
+    for number in ranked:
+        if len(selected) >= max_entries:
+            break
+        item = index['entries'][number]
+        size = len(render_entry(item['entry'])) + 1
+        if used + size > budget:
+            continue
+        selected.append((item['section'], item['entry'], scores[number]))
+        used += size
+    return selected
+
+
+def render_selection(selected, deliverable, total):
+    """
+    Markdown section listing the selected entries by memory file (empty if
+    there is no memory at all)
+    """
+    if not total:
+        return ""
+    label = deliverable.get('id', 'this deliverable')
+    lines = [f"# Relevant Memory for {label}", ""]
+    if not selected:
+        lines.append(f"No memory entries match {label} (of {total} indexed).")
+        return "\n".join(lines)
+    lines.append(f"{len(selected)} of {total} memory entries, selected for "
+                 f"{deliverable.get('type', 'this deliverable')}:")
+    for _, section in MEMORY_FILES:
+        entries = [entry for entry_section, entry, _ in selected if entry_section == section]
+        if entries:
+            lines += ["", f"## {section}"] + [render_entry(entry) for entry in entries]
+    return "\n".join(lines)
+
+
+def next_deliverable(brief, current=None):
+    """
+    The brief deliverable being worked on: the one whose ID starts
+    `current` ("MKT-003: ..."), else the first unapproved one in work order
+    (see schedule.py), or the highest-priority one if the dependency graph
+    is invalid
+    """
+    deliverables = [d for d in brief.get('deliverables', []) if isinstance(d, dict)]
+    if current:
+        current_id = current.split(':', 1)[0].strip()
+        for deliverable in deliverables:
+            if deliverable.get('id') == current_id:
+                return deliverable
+    try:
+        return next((d for d in topological_order(deliverables) if not d.get('approved')), None)
+    except ScheduleError:
+        pass
+    pending = [d for d in deliverables if not d.get('approved')]
+    if not pending:
+        return None
+    return min(pending, key=lambda d: d['priority'] if isinstance(d.get('priority'), int) else float('inf'))
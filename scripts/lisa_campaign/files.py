@@ -0,0 +1,82 @@
+"""
+Workspace file helpers
+Atomic JSON writes and advisory file locks for the campaign's files under
+.claude/, which the stop hook and the agent's tool calls update concurrently,
+and the lookup of a deliverable's files in the deliverables folder
+"""
+
+import os
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
+
+
+@contextlib.contextmanager
+def atomic_writer(path):
+    """
+    Text file to write path's new content to: a temp file next to path,
+    renamed over it when the block completes (and removed if it raises)
+
+    The file keeps its permissions (new files get 0644, not the temp file's
+    0600).
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix='.tmp')
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_atomic(path, data, indent=None):
+    """Write data as JSON to path atomically (see atomic_writer)"""
+    with atomic_writer(path) as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+        if indent:
+            f.write('\n')
+
+
+@contextlib.contextmanager
+def locked(path):
+    """
+    Hold an exclusive lock for path (on a "<path>.lock" file) inside the block
+
+    Serializes read-modify-write cycles on path between processes.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.lock", 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def find_deliverable_files(directory, deliverable_id):
+    """Files in directory named after the deliverable ID ("MKT-001-...")"""
+    try:
+        return sorted(
+            path for path in Path(directory).iterdir()
+            if path.is_file() and path.name.startswith(deliverable_id)
+        )
+    except OSError:
+        return []
@@ -0,0 +1,281 @@
+"""
+Iteration forecasting
+Predicts the iteration a campaign completes at, with a confidence band, from
+the approval records in the metrics log (see metrics.py): how many
+iterations past deliverables took, by deliverable type, campaign type and
+complexity.
+
+Each remaining deliverable is estimated from the most specific group with at
+least MIN_SAMPLES past approvals: type, campaign type and complexity; type
+and campaign type; type; campaign type and complexity; campaign type; any
+deliverable. Without that much history, PRIOR_ITERATIONS is assumed. The
+campaign's own approvals scale the estimates by its pace (iterations taken
+over iterations estimated, starting from 1 and trusted more with each
+approval), and iterations already spent on the deliverable in progress count
+toward it. The band adds up the remaining deliverables' variances, so it
+narrows as the campaign goes on.
+"""
+
+import math
+
+from .schedule import ScheduleError, brief_deliverables, topological_order
+from .state import deliverable_id
+
+PRIOR_ITERATIONS = 3.0
+MIN_SAMPLES = 3
+# The pace starts out as this many deliverables' worth of estimate at 1.0
+PACE_WEIGHT = 2
+MIN_VARIANCE = 0.25
+BAND = 80
+BAND_Z = 1.2816
+GROUPINGS = (
+    ('type', 'campaign_type', 'complexity'),
+    ('type', 'campaign_type'),
+    ('type',),
+    ('campaign_type', 'complexity'),
+    ('campaign_type',),
+    (),
+)
+
+
+def complexity_for(count):
+    """Complexity of a brief with count deliverables, as setup-lisa-campaign.sh rates it"""
+    if count <= 3:
+        return 'Low'
+    if count <= 8:
+        return 'Moderate'
+    return 'High'
+
+
+def is_approval(record):
+    return (record.get('event') == 'approval' and isinstance(record.get('iterations'), (int, float))
+            and not isinstance(record.get('iterations'), bool))
+
+
+class Estimate:
+    """Iterations one deliverable takes: mean and variance, and the group they come from"""
+
+    __slots__ = ('mean', 'variance', 'samples', 'group')
+
+    def __init__(self, mean, variance, samples=0, group=None):
+        self.mean = mean
+        self.variance = variance
+        self.samples = samples
+        self.group = group
+
+    @property
+    def basis(self):
+        """ "5 past press-release deliverables in pr campaigns" """
+        if self.group is None:
+            return f"no history, {PRIOR_ITERATIONS:g} assumed"
+        words = [f"{self.samples} past"]
+        if 'type' in self.group:
+            words.append(str(self.group['type']))
+        words.append('deliverable' if self.samples == 1 else 'deliverables')
+        if 'campaign_type' in self.group:
+            words.append(f"in {self.group['campaign_type']} campaigns")
+        if 'complexity' in self.group:
+            words.append(f"of {self.group['complexity']} complexity")
+        return ' '.join(words)
+
+
+class IterationModel:
+    """
+    Iterations per deliverable, learned from approval records
+
+    A deliverable approved in the same iteration as another is logged as
+    taking 0 iterations; those records say nothing about its type and are
+    left out, so they don't pull its mean toward 0.
+    """
+
+    def __init__(self, records):
+        self.groups = {}
+        self.samples = 0
+        for record in records:
+            if not is_approval(record) or record['iterations'] <= 0:
+                continue
+            self.samples += 1
+            for grouping in GROUPINGS:
+                key = (grouping, tuple(record.get(field) for field in grouping))
+                self.groups.setdefault(key, []).append(record['iterations'])
+
+    def estimate(self, deliverable_type, campaign_type, complexity):
+        values = {'type': deliverable_type, 'campaign_type': campaign_type, 'complexity': complexity}
+        for grouping in GROUPINGS:
+            key = tuple(values[field] for field in grouping)
+            samples = self.groups.get((grouping, key), [])
+            if len(samples) >= MIN_SAMPLES:
+                mean = sum(samples) / len(samples)
+                variance = sum((sample - mean) ** 2 for sample in samples) / (len(samples) - 1)
+                return Estimate(mean, max(variance, MIN_VARIANCE), len(samples), dict(zip(grouping, key)))
+        return Estimate(PRIOR_ITERATIONS, PRIOR_ITERATIONS)
+
+    def table(self):
+        """(type, campaign type, complexity, samples, mean, standard deviation) per full group"""
+        rows = []
+        for (grouping, key), samples in self.groups.items():
+            if grouping != GROUPINGS[0]:
+                continue
+            mean = sum(samples) / len(samples)
+            spread = (math.sqrt(sum((s - mean) ** 2 for s in samples) / (len(samples) - 1))
+                      if len(samples) > 1 else None)
+            rows.append((*key, len(samples), mean, spread))
+        return sorted(rows, key=lambda row: tuple(str(value) for value in row[:3]))
+
+
+class Forecast:
+    """
+    The iteration a campaign completes at: expected (a float), and low and
+    high, the 80% band around it (whole iterations)
+
+    Args:
+        model: IterationModel of other campaigns' approvals
+        deliverables: the brief's deliverables
+        campaign_type, complexity: the campaign's
+        iteration: iterations used so far (0 before the campaign starts)
+        approvals: the campaign's own approval records, for its pace
+        approved: IDs of the deliverables approved so far
+        current: ID of the deliverable in progress (default: the first
+            remaining in work order)
+    """
+
+    def __init__(self, model, deliverables, campaign_type, complexity, iteration=0, approvals=(),
+                 approved=(), current=None):
+        deliverables = [d for d in deliverables if isinstance(d.get('id'), str)]
+        try:
+            deliverables = topological_order(deliverables)
+        except ScheduleError:
+            pass
+        self.history = model.samples
+        self.estimates = {d['id']: model.estimate(d.get('type'), campaign_type, complexity)
+                          for d in deliverables}
+        approved = set(approved)
+        self.remaining = [d['id'] for d in deliverables if d['id'] not in approved]
+
+        # Pace: this campaign's iterations per estimated iteration so far
+        taken = estimated = 0.0
+        for record in approvals:
+            if not is_approval(record):
+                continue
+            estimate = self.estimates.get(record.get('deliverable')) or model.estimate(
+                record.get('type'), campaign_type, complexity)
+            taken += record['iterations']
+            estimated += estimate.mean
+        spent = max(iteration - max((record.get('iteration') or 0 for record in approvals), default=0), 0)
+        if current not in self.remaining:
+            current = self.remaining[0] if self.remaining else None
+        if current is not None and spent > self.estimates[current].mean:
+            # Overrunning the deliverable in progress is evidence of pace too
+            taken += spent
+            estimated += self.estimates[current].mean
+        means = [estimate.mean for estimate in self.estimates.values()] or [PRIOR_ITERATIONS]
+        weight = PACE_WEIGHT * sum(means) / len(means)
+        self.pace = (taken + weight) / (estimated + weight)
+
+        to_go = variance = 0.0
+        for remaining_id in self.remaining:
+            estimate = self.estimates[remaining_id]
+            mean = self.pace * estimate.mean
+            if remaining_id == current:
+                mean = max(mean - spent, 1.0)
+            to_go += mean
+            variance += self.pace ** 2 * estimate.variance
+
+        self.iteration = iteration
+        self.expected = iteration + to_go
+        spread = BAND_Z * math.sqrt(variance)
+        floor = iteration + (1 if self.remaining else 0)
+        self.low = max(math.floor(self.expected - spread), floor)
+        self.high = max(math.ceil(self.expected + spread), self.low)
+
+    @property
+    def from_history(self):
+        """Whether the estimates come from past approvals (else from the prior)"""
+        return self.history >= MIN_SAMPLES
+
+    @property
+    def per_deliverable(self):
+        """Iterations each remaining deliverable is expected to take, on average"""
+        if not self.remaining:
+            return 0.0
+        return self.pace * sum(self.estimates[i].mean for i in self.remaining) / len(self.remaining)
+
+    def to_dict(self):
+        return {
+            'iteration': self.iteration,
+            'expected': round(self.expected, 1),
+            'low': self.low,
+            'high': self.high,
+            'band': BAND,
+            'pace': round(self.pace, 2),
+            'per_deliverable': round(self.per_deliverable, 1),
+            'history': self.history,
+            'remaining': [
+                {
+                    'id': remaining_id,
+                    'iterations': round(self.estimates[remaining_id].mean, 1),
+                    'basis': self.estimates[remaining_id].basis,
+                }
+                for remaining_id in self.remaining
+            ],
+        }
+
+
+def campaign_forecast(state, brief, records):
+    """
+    The forecast for a running campaign: its state, its brief and the
+    metrics records (other campaigns' approvals are the history)
+    """
+    history, approvals = [], []
+    for record in records:
+        if is_approval(record):
+            (approvals if record.get('campaign') == state['campaign_id'] else history).append(record)
+    deliverables = brief_deliverables(brief)
+    approved = set(state['completed_deliverables'])
+    approved.update(d.get('id') for d in deliverables if d.get('approved'))
+    return Forecast(
+        IterationModel(history), deliverables, state['campaign_type'], state['complexity'],
+        iteration=state['iteration'], approvals=approvals, approved=approved,
+        current=deliverable_id(state['current_deliverable'] or ''),
+    )
+
+
+def brief_forecast(brief, records, complexity=None):
+    """The forecast for a brief before its campaign starts (every deliverable to do)"""
+    deliverables = brief_deliverables(brief)
+    return Forecast(
+        IterationModel(records), deliverables, brief.get('campaignType'),
+        complexity or complexity_for(len(deliverables)),
+    )
+
+
+def forecast_fields(forecast):
+    """FORECAST_* shell variables for the stop hook"""
+    return {
+        'FORECAST_ITERATION': round(forecast.expected),
+        'FORECAST_LOW': forecast.low,
+        'FORECAST_HIGH': forecast.high,
+        'FORECAST_PACE': f"{forecast.per_deliverable:.1f}",
+        'FORECAST_REMAINING': len(forecast.remaining),
+        'FORECAST_HISTORY': forecast.history,
+        'FORECAST_BASIS': 'history' if forecast.from_history else 'prior',
+    }
+
+
+def render_forecast(forecast):
+    """Two lines: the completion iteration and band, then what they rest on"""
+    if not forecast.remaining:
+        return f"🔮 Forecast: every deliverable approved at iteration {forecast.iteration}"
+    count = len(forecast.remaining)
+    if forecast.from_history:
+        basis = f"from {forecast.history} past approvals"
+    else:
+        # Fewer than MIN_SAMPLES: every estimate is the prior
+        basis = (f"{forecast.history} past approval{'s' if forecast.history != 1 else ''}"
+                 if forecast.history else "no history")
+        basis += f" yet, {PRIOR_ITERATIONS:g} per deliverable assumed"
+    pace = f", pace {forecast.pace:.1f}× past campaigns" if forecast.from_history and forecast.iteration else ''
+    return (f"🔮 Forecast: done by ~iteration {round(forecast.expected)} "
+            f"({BAND}% band {forecast.low}–{forecast.high})\n"
+            f"   {count} deliverable{'s' if count != 1 else ''} left at ~{forecast.per_deliverable:.1f} "
+            f"iterations each ({basis}{pace})")
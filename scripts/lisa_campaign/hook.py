@@ -0,0 +1,206 @@
+"""
+Stop hook step
+Everything the stop hook needs from Python, in one process: resolve the
+session's campaign, load its state, read the last assistant message, decide
+how the iteration ends (max iterations, stuck, completed or continued),
+record it, and for a continued loop advance the iteration and build the
+forecast and the prompt sections (next deliverable, relevant memory, latest
+learnings). The hook itself only prints messages and the JSON decision.
+
+Starting the interpreter and importing the libraries once per stop instead
+of once per step is most of the hook's latency.
+"""
+
+import os
+import re
+import json
+
+from .campaigns import resolve_session
+from .context import deliverable_query, load_index, next_deliverable, render_selection, select_entries
+from .forecast import campaign_forecast, forecast_fields
+from .learnings import LearningError, LearningsStore, make_record, render_records
+from .metrics import append_metrics, iteration_record, read_metrics
+from .schedule import DELIVERABLES_DIR, Schedule, ScheduleError, load_snapshots, render_next
+from .state import StateError, deliverable_id
+from .transcript import TranscriptError, last_assistant_message
+
+STUCK_THRESHOLD = 5
+OUTCOMES = ('none', 'error', 'state-corrupt', 'max-iterations', 'no-transcript', 'no-assistant',
+            'transcript-error', 'empty-output', 'stuck', 'completed', 'no-prompt', 'continued')
+
+PROMISE = re.compile(r'<promise>(.*?)</promise>', re.S)
+
+
+def promise_text(output):
+    """The first <promise> tag's text, whitespace collapsed (the whole output without one)"""
+    match = PROMISE.search(output)
+    text = match.group(1) if match else output
+    return re.sub(r'\s+', ' ', text.strip())
+
+
+def record_iteration(campaign, state, outcome, hook_started):
+    """Record how the iteration ended in the campaign metrics (never allowed to stop the loop)"""
+    try:
+        append_metrics([iteration_record(
+            campaign.id, state['iteration'], deliverable_id(state['current_deliverable'] or '') or None,
+            outcome, started_at=state['started_at'], hook_started=hook_started,
+        )])
+    except OSError:
+        pass
+
+
+def record_stuck(campaign, state, brief):
+    """Log the stuck event to the learnings log"""
+    current = deliverable_id(state['current_deliverable'] or '')
+    deliverable = next_deliverable(brief, current) if brief else None
+    lesson = (f"Paused after {state['consecutive_failures']} consecutive quality check failures on "
+              f"{state['current_deliverable']} ({state['campaign_name']}); review acceptance criteria, "
+              "context, or quality gates.")
+    try:
+        LearningsStore().add(make_record(
+            'stuck', lesson, campaign=campaign.id, discipline=state['campaign_type'] or None,
+            deliverable=current or None,
+            type=deliverable.get('type') if deliverable and deliverable.get('id') == current else None,
+            reason='consecutive-failures',
+        ))
+    except (LearningError, OSError):
+        pass
+
+
+def read_brief(path):
+    """The campaign brief, or None if it is unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            brief = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return brief if isinstance(brief, dict) else None
+
+
+def schedule_section(campaign, brief):
+    """What to work on next: dependencies first, stale rework before what derives from it"""
+    try:
+        return render_next(Schedule(brief, load_snapshots(campaign.schedule_path), DELIVERABLES_DIR))
+    except ScheduleError:
+        return ''
+
+
+def memory_section(state, brief, context_dir):
+    """The memory entries relevant to the current deliverable"""
+    deliverable = next_deliverable(brief, state['current_deliverable'])
+    if deliverable is None:
+        return ''
+    index = load_index(context_dir)
+    query_terms, query_tags = deliverable_query(deliverable, state['campaign_type'] or brief.get('campaignType'))
+    return render_selection(select_entries(index, query_terms, query_tags), deliverable, len(index['entries']))
+
+
+def learnings_section(state, brief):
+    """The latest learnings (gate failures, insights) for the current deliverable's type"""
+    deliverable = next_deliverable(brief, state['current_deliverable'])
+    if deliverable is None:
+        return ''
+    deliverable_type = deliverable.get('type')
+    try:
+        records = LearningsStore().query(type=deliverable_type)
+    except (LearningError, OSError, ValueError):
+        return ''
+    if not records:
+        return ''
+    return render_records(records, f"Learnings for {deliverable_type}" if deliverable_type else "Learnings")
+
+
+def stop(session_id, transcript, context_dir, hook_started=None):
+    """
+    Run the stop hook's Python steps for a session
+
+    Returns:
+        (campaign, state, fields): fields holds HOOK_OUTCOME (one of
+        OUTCOMES), HOOK_ERROR for the failures, and for a continued loop the
+        FORECAST_* fields and the prompt sections. campaign is None for
+        'none' (the session runs no campaign); state is None if it is
+        unreadable, or for 'error' (an unexpected exception, so the hook
+        still ends the campaign with a message instead of silently).
+
+    Raises:
+        StateError: if a legacy state file is corrupted
+    """
+    campaign = resolve_session(session_id, transcript)
+    if campaign is None:
+        return None, None, {'HOOK_OUTCOME': 'none'}
+    try:
+        return stop_campaign(campaign, transcript, context_dir, hook_started)
+    except Exception as e:
+        return campaign, None, {'HOOK_OUTCOME': 'error', 'HOOK_ERROR': f"{type(e).__name__}: {e}"}
+
+
+def stop_campaign(campaign, transcript, context_dir, hook_started=None):
+    """The stop hook's steps for the session's campaign (see stop)"""
+    try:
+        state = campaign.store.load()
+        if state is None:
+            raise StateError("No active campaign")
+    except StateError as e:
+        return campaign, None, {'HOOK_OUTCOME': 'state-corrupt', 'HOOK_ERROR': str(e)}
+
+    def ended(outcome, **fields):
+        return campaign, state, dict(fields, HOOK_OUTCOME=outcome)
+
+    if state['max_iterations'] > 0 and state['iteration'] >= state['max_iterations']:
+        record_iteration(campaign, state, 'max-iterations', hook_started)
+        return ended('max-iterations')
+
+    if not transcript or not os.path.isfile(transcript):
+        return ended('no-transcript')
+    try:
+        output = last_assistant_message(transcript, campaign.bookmark_path)
+    except OSError as e:
+        return ended('transcript-error', HOOK_ERROR=f"❌ Error: Could not read transcript: {e}")
+    except TranscriptError as e:
+        return ended('transcript-error', HOOK_ERROR=f"❌ Error: {e}")
+    if output is None:
+        return ended('no-assistant')
+    output = output.rstrip('\n')
+    if not output:
+        return ended('empty-output')
+
+    brief = read_brief(state['campaign_brief']) if state['campaign_brief'] else None
+
+    if state['consecutive_failures'] >= STUCK_THRESHOLD:
+        record_stuck(campaign, state, brief)
+        record_iteration(campaign, state, 'stuck', hook_started)
+        return ended('stuck')
+
+    promise = state['completion_promise']
+    if promise and promise != 'null' and promise_text(output) == promise:
+        try:
+            LearningsStore().compact()
+        except OSError:
+            pass
+        record_iteration(campaign, state, 'completed', hook_started)
+        return ended('completed')
+
+    if not state['prompt']:
+        return ended('no-prompt')
+
+    fields = {}
+    if brief is not None:
+        try:
+            forecast = campaign_forecast(state, brief, read_metrics())
+        except OSError:
+            forecast = None
+        if forecast is not None:
+            fields.update(forecast_fields(forecast))
+
+    # Locked and atomically replaced, so progress the agent records at the
+    # same time is not lost
+    campaign.store.update(iteration=state['iteration'] + 1)
+    record_iteration(campaign, state, 'continued', hook_started)
+
+    if brief is not None:
+        fields.update(
+            SCHEDULE_SECTION=schedule_section(campaign, brief),
+            MEMORY_SECTION=memory_section(state, brief, context_dir),
+            LEARNINGS_SECTION=learnings_section(state, brief),
+        )
+    return ended('continued', **fields)
@@ -0,0 +1,339 @@
+"""
+Document ingestion
+Turns brand books, style guides and press archives into candidate memory
+entries for lisa-memory-core.json and lisa-memory-contextual.json, without
+pasting whole documents into a prompt.
+
+Documents are streamed line by line (PDFs page by page) and split into
+sections of at most MAX_CHUNK_CHARS characters, so memory stays bounded
+however large the document. Each chunk is keyed by a hash of its normalized
+text (case, punctuation and whitespace ignored): a chunk seen before, in
+this document or another, is not processed again. The chunk index
+(lisa-ingest-index.json next to the memory files) records which chunks each
+document had, so re-ingesting an updated document only extracts entries from
+its new chunks and drops the entries of chunks that are gone.
+"""
+
+import os
+import re
+import json
+import hashlib
+
+from .context import file_signature
+from .files import locked, write_json_atomic
+from .memory import merge_entries, utc_timestamp
+
+INDEX_FILENAME = 'lisa-ingest-index.json'
+INDEX_VERSION = 1
+CORE_FILENAME = 'lisa-memory-core.json'
+CONTEXTUAL_FILENAME = 'lisa-memory-contextual.json'
+
+TEXT_EXTENSIONS = ('.md', '.markdown', '.txt', '.text')
+PDF_EXTENSIONS = ('.pdf',)
+
+MAX_CHUNK_CHARS = 2000
+# Candidate entries extracted per chunk, so a dense page cannot flood memory
+MAX_ENTRIES_PER_CHUNK = 4
+ENTRY_ID_PREFIX = 'ingest-'
+
+HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'(])')
+NORMALIZE = re.compile(r'[^a-z0-9]+')
+
+# A sentence stating a rule: a contextual (learned pattern) candidate
+RULE = re.compile(
+    r"\b(always|never|avoid|don't|do not|should|must|prefer|instead of|rather than|use .{1,40} not)\b",
+    re.IGNORECASE)
+# A sentence stating a fact worth remembering: a core memory candidate
+FACT = re.compile(
+    r"\b(founded|launched|raised|acquired|headquartered|customers|employees|revenue|series [a-e]"
+    r"|ceo|cto|cfo|coo|cmo|founder|president|chief \w+ officer|vice president)\b"
+    r"|\$\d|\d+%|\b(19|20)\d\d\b",
+    re.IGNORECASE)
+
+CORE_CATEGORIES = (
+    ('people', re.compile(r'\b(ceo|cto|cfo|coo|cmo|founder|president|chief \w+ officer|vice president)\b', re.I)),
+    ('product', re.compile(r'\b(product|platform|launch(ed)?|release[ds]?|feature)\b', re.I)),
+    ('company', re.compile(r'\b(founded|raised|funding|series [a-e]|customers|revenue|employees|'
+                           r'headquartered|acquired)\b|\$\d', re.I)),
+)
+CONTEXTUAL_CATEGORIES = (
+    ('quality-threshold', re.compile(r'\b(readability|grade level|flesch|word count|score)\b', re.I)),
+    ('formatting', re.compile(r'\b(heading|headline case|bullet|list|bold|italic|capitaliz\w*|'
+                              r'oxford comma|date format|numerals?|spell(ed|ing)?|hyphen\w*)\b', re.I)),
+)
+# Deliverable types a rule can be about, by the words that name them
+DELIVERABLE_TAGS = (
+    ('press-release', re.compile(r'\bpress releases?\b', re.I)),
+    ('media-pitch', re.compile(r'\b(media )?pitch(es)?\b', re.I)),
+    ('email-sequence', re.compile(r'\be-?mails?\b', re.I)),
+    ('blog-post', re.compile(r'\bblog( posts?)?\b', re.I)),
+    ('landing-page', re.compile(r'\blanding pages?\b', re.I)),
+    ('social-media', re.compile(r'\b(social( media)?|tweets?|linkedin)\b', re.I)),
+    ('case-study', re.compile(r'\bcase stud(y|ies)\b', re.I)),
+)
+
+
+class IngestError(Exception):
+    """A document cannot be read (unsupported type, missing library, I/O error)"""
+
+
+def chunk_hash(text):
+    """Hash of a chunk's text with case, punctuation and whitespace ignored"""
+    normalized = NORMALIZE.sub(' ', text.lower()).strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def text_lines(path):
+    """Yield a text file's lines, none longer than MAX_CHUNK_CHARS"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            line = f.readline(MAX_CHUNK_CHARS)
+            if not line:
+                return
+            yield line.rstrip('\n')
+
+
+def pdf_lines(path):
+    """Yield a PDF's text lines page by page (needs the pypdf library)"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise IngestError("pypdf library not installed (needed for PDF documents); "
+                          "install with: pip install pypdf") from None
+    try:
+        reader = PdfReader(path)
+        for page in reader.pages:
+            for line in (page.extract_text() or '').splitlines():
+                yield line
+            yield ''  # A page break ends a paragraph
+    except IngestError:
+        raise
+    except Exception as e:  # pypdf raises its own error types for damaged files
+        raise IngestError(f"Could not read PDF: {e}") from None
+
+
+def document_lines(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in PDF_EXTENSIONS:
+        return pdf_lines(path)
+    if extension in TEXT_EXTENSIONS:
+        return text_lines(path)
+    raise IngestError(f"Unsupported document type '{extension or path}' "
+                      f"(expected: {', '.join(TEXT_EXTENSIONS + PDF_EXTENSIONS)})")
+
+
+def chunks(lines, max_chars=MAX_CHUNK_CHARS):
+    """
+    Yield (heading, text) sections from a stream of lines
+
+    A Markdown heading starts a new section (heading is the heading path,
+    "Voice > Tone"); a section longer than max_chars is split at a paragraph
+    break when there is one, else at a line break.
+    """
+    headings, paragraphs, paragraph, size = [], [], [], 0
+
+    def section():
+        return ' > '.join(text for _, text in headings), '\n\n'.join(paragraphs).strip()
+
+    for line in lines:
+        match = HEADING.match(line)
+        if match:
+            if paragraph:
+                paragraphs.append('\n'.join(paragraph))
+            if paragraphs:
+                yield section()
+            paragraphs, paragraph, size = [], [], 0
+            level = len(match.group(1))
+            headings = [(lvl, text) for lvl, text in headings if lvl < level] + [(level, match.group(2))]
+            continue
+
+        if not line.strip():
+            if paragraph:
+                paragraphs.append('\n'.join(paragraph))
+                paragraph = []
+            continue
+
+        if size + len(line) > max_chars:
+            if paragraphs:
+                # Split at the last paragraph break; the open paragraph carries over
+                yield section()
+                paragraphs = []
+                size = sum(len(text) + 1 for text in paragraph)
+            if size + len(line) > max_chars and paragraph:
+                paragraphs = ['\n'.join(paragraph)]
+                yield section()
+                paragraphs, paragraph, size = [], [], 0
+        paragraph.append(line)
+        size += len(line) + 1
+
+    if paragraph:
+        paragraphs.append('\n'.join(paragraph))
+    if paragraphs:
+        yield section()
+
+
+def sentences(text):
+    return [sentence.strip() for sentence in SENTENCE_END.split(' '.join(text.split())) if sentence.strip()]
+
+
+def entry_name(sentence, words=8):
+    name = ' '.join(sentence.rstrip('.!?').split()[:words])
+    return name if len(sentence.split()) <= words else f"{name}..."
+
+
+def first_match(categories, sentence, default):
+    return next((category for category, pattern in categories if pattern.search(sentence)), default)
+
+
+def extract_entries(heading, text, source, digest, limit=MAX_ENTRIES_PER_CHUNK):
+    """
+    Candidate memory entries in a chunk: rules for contextual memory, facts
+    (names, dates, figures) for core memory
+
+    Returns:
+        tuple: (core entries, contextual entries)
+    """
+    core, contextual = [], []
+    learned_from = f"ingested: {source}" + (f" ({heading})" if heading else '')
+    for sentence in sentences(text):
+        if len(core) + len(contextual) >= limit:
+            break
+        if not 4 <= len(sentence.split()) <= 60:
+            continue
+        entry_id = f"{ENTRY_ID_PREFIX}{digest[:12]}-{len(core) + len(contextual) + 1}"
+        tags = [tag for tag, pattern in DELIVERABLE_TAGS if pattern.search(sentence)]
+        if RULE.search(sentence):
+            contextual.append({
+                'id': entry_id,
+                'name': entry_name(sentence),
+                'category': first_match(CONTEXTUAL_CATEGORIES, sentence,
+                                        'content-type-specific' if tags else 'voice'),
+                'whenToUse': f"When applying \"{heading}\"" if heading else f"When applying {source}",
+                'tags': tags + ['ingested'],
+                'content': sentence,
+                'learnedFrom': learned_from,
+                'learnedDate': utc_timestamp(),
+            })
+        elif FACT.search(sentence):
+            core.append({
+                'id': entry_id,
+                'name': entry_name(sentence),
+                'category': first_match(CORE_CATEGORIES, sentence, 'other'),
+                'tags': tags + ['ingested'],
+                'content': sentence,
+                'learnedFrom': learned_from,
+            })
+    return core, contextual
+
+
+def load_index(index_path):
+    """The chunk index, or an empty one if it is missing or from another version"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = None
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        index = {'version': INDEX_VERSION, 'documents': {}}
+    return index
+
+
+class IngestResult:
+    """What ingesting one document did"""
+
+    def __init__(self, path):
+        self.path = path
+        self.unchanged = False
+        self.chunks = 0
+        self.new_chunks = 0
+        self.duplicate_chunks = 0
+        self.removed_chunks = 0
+        self.core = []
+        self.contextual = []
+
+
+def ingest(paths, context_dir, dry_run=False):
+    """
+    Ingest documents into the memory files in context_dir
+
+    A document whose size and modification time match the chunk index is
+    skipped without being read.
+
+    Returns:
+        list: (path, IngestResult or IngestError) per document, in order
+
+    Raises:
+        OSError, ValueError: if a memory file cannot be read or written
+    """
+    index_path = os.path.join(context_dir, INDEX_FILENAME)
+    results = []
+    with locked(index_path):
+        index = load_index(index_path)
+        documents = index['documents']
+        stale = set()
+
+        for path in paths:
+            key = os.path.abspath(path)
+            result = IngestResult(path)
+            previous = documents.get(key, {})
+            signature = file_signature(path)
+            if signature is not None and previous.get('signature') == signature:
+                result.unchanged = True
+                result.chunks = len(previous.get('chunks', []))
+                results.append((path, result))
+                continue
+
+            # Chunks other documents hold are not extracted again
+            known = {digest for other, record in documents.items() if other != key
+                     for digest in record.get('chunks', [])}
+            known.update(previous.get('chunks', []))
+            digests = []
+            try:
+                for heading, text in chunks(document_lines(path)):
+                    digest = chunk_hash(text)
+                    result.chunks += 1
+                    if digest in digests:
+                        result.duplicate_chunks += 1
+                        continue
+                    digests.append(digest)
+                    if digest in known:
+                        if digest not in previous.get('chunks', []):
+                            result.duplicate_chunks += 1
+                        continue
+                    result.new_chunks += 1
+                    core, contextual = extract_entries(heading, text, os.path.basename(path), digest)
+                    result.core += core
+                    result.contextual += contextual
+            except IngestError as e:
+                results.append((path, e))
+                continue
+            except OSError as e:
+                results.append((path, IngestError(f"Could not read {path}: {e}")))
+                continue
+
+            gone = set(previous.get('chunks', [])) - set(digests)
+            result.removed_chunks = len(gone)
+            stale |= gone
+            documents[key] = {'signature': signature, 'chunks': digests}
+            results.append((path, result))
+
+        # A chunk that left one document may still be held by another
+        held = {digest for record in documents.values() for digest in record.get('chunks', [])}
+        stale_ids = {digest[:12] for digest in stale - held}
+        if dry_run:
+            return results
+
+        def is_stale(entry):
+            entry_id = str(entry.get('id', ''))
+            return (entry_id.startswith(ENTRY_ID_PREFIX)
+                    and entry_id[len(ENTRY_ID_PREFIX):len(ENTRY_ID_PREFIX) + 12] in stale_ids)
+
+        added = [r for _, r in results if isinstance(r, IngestResult)]
+        for filename, field in ((CORE_FILENAME, 'core'), (CONTEXTUAL_FILENAME, 'contextual')):
+            entries = [entry for r in added for entry in getattr(r, field)]
+            if entries or stale_ids:
+                merge_entries(os.path.join(context_dir, filename), entries, remove=is_stale)
+        index['lastUpdated'] = utc_timestamp()
+        write_json_atomic(index_path, index)
+    return results
@@ -0,0 +1,261 @@
+"""
+Learnings store
+Institutional memory across campaigns: one JSON record per line in
+learnings/learnings.jsonl (quality gate failures, stuck events, insights),
+indexed by deliverable type, gate, failure reason, event and campaign in
+learnings/learnings-index.json.
+
+The store is append-only between compactions, so bringing the index up to
+date only reads the lines appended since it was last saved, and a query
+only reads the records it returns. Compaction merges repeated lessons (the
+same gate failing for the same reason on the same deliverable type, the
+same insight) into one record with a count, so the history stays small.
+"""
+
+import os
+import re
+import json
+import contextlib
+
+from .files import atomic_writer, locked, write_json_atomic
+from .memory import utc_timestamp
+
+STORE_PATH = os.path.join('learnings', 'learnings.jsonl')
+INDEX_PATH = os.path.join('learnings', 'learnings-index.json')
+INDEX_VERSION = 1
+
+EVENTS = ('insight', 'gate-failure', 'stuck')
+INDEXED_FIELDS = ('type', 'gate', 'reason', 'event', 'campaign')
+DEFAULT_LIMIT = 5
+MAX_LESSON_CHARS = 500
+
+NORMALIZE = re.compile(r'[^a-z0-9]+')
+
+
+class LearningError(Exception):
+    """A learning record is invalid"""
+
+
+def make_record(event, lesson, campaign=None, discipline=None, deliverable=None, type=None,
+                gate=None, reason=None):
+    """
+    A learning record stamped with the current time (fields left as None are
+    omitted)
+
+    Raises:
+        LearningError: if the event is unknown or there is no lesson
+    """
+    if event not in EVENTS:
+        raise LearningError(f"Unknown event '{event}' (expected: {', '.join(EVENTS)})")
+    lesson = ' '.join(str(lesson or '').split())
+    if not lesson:
+        raise LearningError("A learning needs a lesson")
+    if len(lesson) > MAX_LESSON_CHARS:
+        lesson = lesson[:MAX_LESSON_CHARS - 3].rstrip() + '...'
+    record = {
+        'timestamp': utc_timestamp(),
+        'event': event,
+        'campaign': campaign,
+        'discipline': discipline,
+        'deliverable': deliverable,
+        'type': type,
+        'gate': gate,
+        'reason': reason,
+        'lesson': lesson,
+    }
+    return {field: value for field, value in record.items() if value is not None}
+
+
+def lesson_key(record):
+    """
+    What makes two records the same lesson: the same gate failing for the
+    same reason on the same deliverable type, or the same insight wording
+    """
+    lesson = NORMALIZE.sub(' ', record.get('lesson', '').lower()).strip() \
+        if record.get('event') == 'insight' else None
+    return (record.get('event'), record.get('type'), record.get('gate'), record.get('reason'), lesson)
+
+
+def merge_records(older, newer):
+    """One counted record for two records of the same lesson"""
+    merged = dict(newer)
+    merged['count'] = older.get('count', 1) + newer.get('count', 1)
+    merged['first_seen'] = min(older.get('first_seen', older['timestamp']),
+                               newer.get('first_seen', newer['timestamp']))
+    campaigns = set(older.get('campaigns', [older.get('campaign')]))
+    campaigns.update(newer.get('campaigns', [newer.get('campaign')]))
+    merged['campaigns'] = sorted(campaign for campaign in campaigns if campaign)
+    return merged
+
+
+def indexed_values(record, field):
+    """A record's values for an indexed field (a merged record is filed under each of its campaigns)"""
+    values = {record.get(field)}
+    if field == 'campaign':
+        values.update(record.get('campaigns', []))
+    return sorted(value for value in values if isinstance(value, str) and value)
+
+
+class LearningsStore:
+    """
+    The learnings log and its index
+
+    Appends, index updates and compaction hold the log's lock, so campaigns
+    in several sessions can record learnings at the same time.
+    """
+
+    def __init__(self, path=STORE_PATH, index_path=INDEX_PATH):
+        self.path = path
+        self.index_path = index_path
+
+    def add(self, *records):
+        """Append records to the log"""
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with locked(self.path):
+            with open(self.path, 'ab') as f:
+                if f.tell() and not self._ends_with_newline():
+                    f.write(b'\n')  # Never extend a line a crashed writer left unfinished
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _empty_index(self, inode):
+        return {'version': INDEX_VERSION, 'inode': inode, 'size': 0, 'offsets': [],
+                'postings': {field: {} for field in INDEXED_FIELDS}}
+
+    def _index(self):
+        """
+        The index, updated with the lines appended since it was saved (call
+        with the log locked)
+
+        Compaction replaces the log, so an index for another inode, or for
+        more bytes than the log has, is rebuilt from scratch.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self._empty_index(None)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            current = (index.get('version') == INDEX_VERSION and index.get('inode') == stat.st_ino
+                       and index.get('size', 0) <= stat.st_size)
+        except (OSError, ValueError, AttributeError):
+            current = False
+        if not current:
+            index = self._empty_index(stat.st_ino)
+        if index['size'] == stat.st_size:
+            return index
+
+        with open(self.path, 'rb') as f:
+            f.seek(index['size'])
+            offset = index['size']
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Unfinished last line
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict):
+                    index['offsets'].append(offset)
+                    for field in INDEXED_FIELDS:
+                        for value in indexed_values(record, field):
+                            index['postings'][field].setdefault(value, []).append(offset)
+                offset += len(line)
+        index['size'] = offset
+        with contextlib.suppress(OSError):
+            write_json_atomic(self.index_path, index)
+        return index
+
+    def _read_at(self, f, offset):
+        f.seek(offset)
+        return json.loads(f.readline())
+
+    def query(self, limit=DEFAULT_LIMIT, **filters):
+        """
+        The most recent records matching every filter (type, gate, reason,
+        event, campaign), newest first; limit None returns all of them
+
+            store.query(type='press-release', gate='readability', limit=5)
+        """
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise LearningError(f"Cannot filter on {', '.join(sorted(unknown))} "
+                                f"(indexed: {', '.join(INDEXED_FIELDS)})")
+        with locked(self.path):
+            index = self._index()
+            matches = None
+            for field, value in filters.items():
+                if value is None:
+                    continue
+                offsets = set(index['postings'][field].get(value, []))
+                matches = offsets if matches is None else matches & offsets
+            offsets = sorted(index['offsets'] if matches is None else matches, reverse=True)
+            if limit is not None:
+                offsets = offsets[:limit]
+            if not offsets:
+                return []
+            with open(self.path, 'rb') as f:
+                return [self._read_at(f, offset) for offset in offsets]
+
+    def records(self):
+        """Yield every record in the log, oldest first (skipping damaged lines)"""
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def compact(self):
+        """
+        Merge repeated lessons into counted records and rewrite the log
+
+        Returns:
+            tuple: (records before, records after)
+        """
+        with locked(self.path):
+            merged, before = {}, 0
+            for record in self.records():
+                before += 1
+                key = lesson_key(record)
+                merged[key] = merge_records(merged[key], record) if key in merged else record
+            if not before:
+                return 0, 0
+            compacted = sorted(merged.values(), key=lambda record: record.get('timestamp', ''))
+            with atomic_writer(self.path) as f:
+                for record in compacted:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.index_path)
+        return before, len(compacted)
+
+
+def render_record(record):
+    """One markdown line for a record"""
+    date = record.get('timestamp', '')[:10]
+    subject = ' '.join(str(record[field]) for field in ('type', 'deliverable') if record.get(field))
+    cause = '/'.join(str(record[field]) for field in ('gate', 'reason') if record.get(field))
+    label = ' · '.join(part for part in (record.get('event', ''), subject, cause) if part)
+    if record.get('count', 1) > 1:
+        campaigns = record.get('campaigns', [])
+        label += (f" ×{record['count']} (since {record.get('first_seen', '')[:10]}"
+                  + (f", {len(campaigns)} campaigns" if len(campaigns) > 1 else '') + ")")
+    return f"- [{date}] {label}: {record.get('lesson', '')}"
+
+
+def render_records(records, title):
+    """Markdown section listing records under a title"""
+    return "\n".join([f"# {title}", ""] + [render_record(record) for record in records])
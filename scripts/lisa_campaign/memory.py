@@ -0,0 +1,107 @@
+"""
+Contextual memory
+Adds learned patterns to context/lisa-memory-contextual.json. The file is
+shared by every campaign on the machine, so entries are added under its lock
+with an atomic rewrite: two campaigns learning from feedback at the same
+time both keep their entry.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+from .files import locked, write_json_atomic
+
+CATEGORIES = ('voice', 'formatting', 'content-type-specific', 'quality-threshold', 'other')
+REQUIRED_FIELDS = ('name', 'category', 'whenToUse', 'content')
+
+
+class MemoryEntryError(Exception):
+    """A memory entry is missing required fields or has invalid values"""
+
+
+def utc_timestamp():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def validate_entry(entry):
+    """
+    Raises:
+        MemoryEntryError: if a required field is missing or the category or
+        tags are invalid
+    """
+    if not isinstance(entry, dict):
+        raise MemoryEntryError("Memory entry must be a JSON object")
+    missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
+    if missing:
+        raise MemoryEntryError(f"Memory entry is missing: {', '.join(missing)}")
+    if entry['category'] not in CATEGORIES:
+        raise MemoryEntryError(f"Invalid category '{entry['category']}' (expected: {', '.join(CATEGORIES)})")
+    tags = entry.get('tags', [])
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise MemoryEntryError("'tags' must be an array of strings")
+
+
+def add_memory(path, entry):
+    """
+    Add an entry to a contextual memory file, creating the file if needed
+
+    A missing id or learnedDate is filled in; an id already in the file gets
+    a numeric suffix rather than shadowing the older entry.
+
+    Returns:
+        dict: the entry as stored
+
+    Raises:
+        MemoryEntryError: if the entry is invalid
+        OSError, ValueError: if the memory file cannot be read or parsed
+    """
+    validate_entry(entry)
+    entry = dict(entry)
+    entry.setdefault('id', f"mem-{int(time.time())}")
+    entry.setdefault('learnedDate', utc_timestamp())
+    return merge_entries(path, [entry])[0]
+
+
+def merge_entries(path, entries, remove=None):
+    """
+    Add entries to a memory file (core or contextual), creating the file if
+    needed, and drop the existing entries for which remove(entry) is true
+
+    Entries are not validated here. An id already in the file gets a numeric
+    suffix.
+
+    Returns:
+        list: the added entries as stored
+
+    Raises:
+        OSError, ValueError: if the memory file cannot be read or parsed
+    """
+    added = []
+    with locked(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                memory = json.load(f)
+        except FileNotFoundError:
+            memory = {'version': '1.0', 'entries': []}
+        existing = memory.get('entries', [])
+        if remove is not None:
+            existing = [entry for entry in existing if not remove(entry)]
+        memory['entries'] = existing
+
+        ids = {entry.get('id') for entry in existing}
+        for entry in entries:
+            entry = dict(entry)
+            base_id = entry.get('id')
+            if base_id:
+                suffix = 1
+                while entry['id'] in ids:
+                    suffix += 1
+                    entry['id'] = f"{base_id}-{suffix}"
+                ids.add(entry['id'])
+            existing.append(entry)
+            added.append(entry)
+
+        memory['lastUpdated'] = utc_timestamp()
+        write_json_atomic(path, memory, indent=2)
+    return added
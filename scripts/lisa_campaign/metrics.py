@@ -0,0 +1,274 @@
+"""
+Campaign telemetry
+Timing records for the campaign loop in .claude/lisa-metrics.jsonl: one per
+quality gate run (wall, parse and check time, bytes checked, cache hit,
+outcome), one per loop iteration (wall time since the previous stop, time
+spent in the stop hook, outcome) and one per deliverable approval (the
+iterations it took, with its type, campaign type and complexity, which
+forecast.py learns from). The report turns them into latency percentiles
+per gate and iteration and a list of the slowest gate runs, to show where a
+campaign's time went.
+"""
+
+import os
+import json
+import time
+import math
+from datetime import datetime, timezone
+
+from .files import locked
+from .memory import utc_timestamp
+from .transcript import reverse_lines
+
+METRICS_PATH = os.path.join('.claude', 'lisa-metrics.jsonl')
+OUTCOMES = ('continued', 'completed', 'stuck', 'max-iterations')
+PERCENTILES = (50, 90, 99)
+SLOWEST = 5
+
+
+def append_metrics(records, path=METRICS_PATH):
+    """Append records to the metrics file under its lock"""
+    if not records:
+        return
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with locked(path):
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def read_metrics(path=METRICS_PATH, campaign=None):
+    """Yield the metrics records (of one campaign, if given), oldest first"""
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and (campaign is None or record.get('campaign') == campaign):
+                yield record
+
+
+def gate_record(campaign, iteration, deliverable, gate, status, cached, wall, parse, size):
+    """A gate run record (times in seconds, size in bytes)"""
+    return {
+        'timestamp': utc_timestamp(),
+        'event': 'gate',
+        'campaign': campaign,
+        'iteration': iteration,
+        'deliverable': deliverable.get('id') if deliverable else None,
+        'type': deliverable.get('type') if deliverable else None,
+        'gate': gate,
+        'status': status,
+        'cached': cached,
+        'wall': round(wall, 6),
+        'parse': round(parse, 6),
+        'check': round(max(wall - parse, 0.0), 6),
+        'bytes': size,
+    }
+
+
+def parse_timestamp(value):
+    """Epoch seconds of a "%Y-%m-%dT%H:%M:%SZ" timestamp, or None"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def last_stop(campaign, path=METRICS_PATH):
+    """Epoch seconds of the campaign's most recent iteration record, or None"""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    with f:
+        for _, line in reverse_lines(f, os.fstat(f.fileno()).st_size):
+            if b'"event": "iteration"' not in line or campaign.encode('utf-8') not in line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('event') == 'iteration' and record.get('campaign') == campaign:
+                return record.get('stopped_at')
+    return None
+
+
+def iteration_record(campaign, iteration, deliverable, outcome, started_at=None, hook_started=None,
+                     path=METRICS_PATH):
+    """
+    A loop iteration record: its wall time runs from the campaign's previous
+    stop (or from started_at for the first iteration) to now, and the hook
+    time from hook_started (epoch seconds) to now
+    """
+    now = time.time()
+    previous = last_stop(campaign, path)
+    if previous is None:
+        previous = parse_timestamp(started_at)
+    return {
+        'timestamp': utc_timestamp(),
+        'event': 'iteration',
+        'campaign': campaign,
+        'iteration': iteration,
+        'deliverable': deliverable,
+        'outcome': outcome,
+        'stopped_at': now,
+        'wall': round(now - previous, 3) if previous is not None else None,
+        'hook': round(now - hook_started, 3) if hook_started else None,
+    }
+
+
+def last_approval(campaign, path=METRICS_PATH):
+    """Iteration of the campaign's most recent approval record (0 if none)"""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return 0
+    with f:
+        for _, line in reverse_lines(f, os.fstat(f.fileno()).st_size):
+            if b'"event": "approval"' not in line or campaign.encode('utf-8') not in line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('event') == 'approval' and record.get('campaign') == campaign:
+                return record.get('iteration') or 0
+    return 0
+
+
+def approval_record(campaign, iteration, deliverable, campaign_type, complexity, path=METRICS_PATH):
+    """
+    A deliverable approval record: the iterations it took run from the
+    campaign's previous approval (or its start) to this iteration, so a
+    second approval in the same iteration took 0
+    """
+    return {
+        'timestamp': utc_timestamp(),
+        'event': 'approval',
+        'campaign': campaign,
+        'iteration': iteration,
+        'deliverable': deliverable.get('id'),
+        'type': deliverable.get('type'),
+        'campaign_type': campaign_type,
+        'complexity': complexity,
+        'iterations': max(iteration - last_approval(campaign, path), 0),
+    }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def latency(values):
+    """{p50, p90, p99, max, total} of a list of seconds ({} if empty)"""
+    if not values:
+        return {}
+    stats = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    stats.update(max=max(values), total=sum(values))
+    return stats
+
+
+def summarize(records):
+    """Latency statistics per gate and per iteration, and the slowest gate runs"""
+    gates, iterations, deliverables = {}, [], {}
+    for record in records:
+        if record.get('event') == 'gate':
+            gates.setdefault(record.get('gate'), []).append(record)
+            totals = deliverables.setdefault(record.get('deliverable') or '-', {'gates': 0.0, 'iterations': 0.0})
+            totals['gates'] += record.get('wall') or 0.0
+        elif record.get('event') == 'iteration':
+            iterations.append(record)
+            totals = deliverables.setdefault(record.get('deliverable') or '-', {'gates': 0.0, 'iterations': 0.0})
+            totals['iterations'] += record.get('wall') or 0.0
+
+    summary = {'gates': {}, 'iterations': {}, 'deliverables': deliverables, 'slowest': []}
+    for gate, runs in gates.items():
+        checked = [run for run in runs if not run.get('cached')]
+        summary['gates'][gate] = {
+            'runs': len(runs),
+            'cached': len(runs) - len(checked),
+            'failed': sum(1 for run in runs if run.get('status') != 'passed'),
+            'bytes': sum(run.get('bytes') or 0 for run in checked),
+            'wall': latency([run['wall'] for run in checked]),
+            'parse': latency([run['parse'] for run in checked]),
+            'check': latency([run['check'] for run in checked]),
+        }
+    summary['iterations'] = {
+        'count': len(iterations),
+        'outcomes': {outcome: sum(1 for r in iterations if r.get('outcome') == outcome)
+                     for outcome in OUTCOMES if any(r.get('outcome') == outcome for r in iterations)},
+        'wall': latency([r['wall'] for r in iterations if r.get('wall') is not None]),
+        'hook': latency([r['hook'] for r in iterations if r.get('hook') is not None]),
+    }
+    every_run = [run for runs in gates.values() for run in runs if not run.get('cached')]
+    summary['slowest'] = sorted(every_run, key=lambda run: -run['wall'])[:SLOWEST]
+    return summary
+
+
+def duration(seconds):
+    """Seconds as 12ms, 3.4s, 5m 02s or 2h 05m"""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def latency_columns(stats):
+    if not stats:
+        return "-"
+    return "  ".join(f"{name} {duration(stats[name])}" for name in ('p50', 'p90', 'p99', 'max'))
+
+
+def render_report(summary, title):
+    """Text report of a summary"""
+    lines = [title, "──────────────────────────────────────────────────────"]
+    iterations = summary['iterations']
+    if iterations['count']:
+        outcomes = ', '.join(f"{count} {outcome}" for outcome, count in iterations['outcomes'].items())
+        lines.append(f"Iterations: {iterations['count']} ({outcomes})")
+        if iterations['wall']:
+            lines.append(f"  Wall time: {latency_columns(iterations['wall'])}  "
+                         f"total {duration(iterations['wall']['total'])}")
+        if iterations['hook']:
+            lines.append(f"  Stop hook: {latency_columns(iterations['hook'])}")
+        lines.append("")
+
+    if summary['gates']:
+        lines.append("Quality gates (checked runs; cached runs cost no check time):")
+        ranked = sorted(summary['gates'].items(), key=lambda item: -item[1]['wall'].get('total', 0))
+        for gate, stats in ranked:
+            lines.append(f"  {gate}: {stats['runs']} runs, {stats['cached']} cached, "
+                         f"{stats['failed']} failed, {stats['bytes']:,} bytes checked")
+            if stats['wall']:
+                lines.append(f"    wall   {latency_columns(stats['wall'])}  total {duration(stats['wall']['total'])}")
+                lines.append(f"    parse  {latency_columns(stats['parse'])}")
+                lines.append(f"    check  {latency_columns(stats['check'])}")
+        lines.append("")
+
+    if summary['slowest']:
+        lines.append("Slowest gate runs:")
+        for run in summary['slowest']:
+            lines.append(f"  {duration(run['wall'])}  {run['gate']} on {run.get('deliverable') or '-'} "
+                         f"(iteration {run.get('iteration') or '-'}, parse {duration(run['parse'])}, "
+                         f"{run.get('bytes') or 0:,} bytes, {run.get('status')})")
+        lines.append("")
+
+    if summary['deliverables']:
+        lines.append("Time by deliverable (iterations / gates):")
+        ranked = sorted(summary['deliverables'].items(), key=lambda item: -item[1]['iterations'])
+        for deliverable, totals in ranked:
+            lines.append(f"  {deliverable}: {duration(totals['iterations'])} / {duration(totals['gates'])}")
+    return "\n".join(lines).rstrip()
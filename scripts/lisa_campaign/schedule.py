@@ -0,0 +1,320 @@
+"""
+Deliverable scheduler
+Orders a campaign brief's deliverables so none is started before the ones in
+its `dependencies`: a topological order of the dependency graph that, among
+the deliverables whose dependencies are scheduled, takes the lowest priority
+number first (brief order breaks ties). The graph is validated first:
+duplicate or missing IDs, unknown dependencies, self-dependencies and cycles
+are errors.
+
+Derived deliverables (social posts from a messaging framework, talking points
+from a press release) go stale when upstream content changes after they were
+approved. Approving a deliverable snapshots the content hash of each of its
+dependencies' files in the deliverables folder
+(.claude/lisa-campaigns/<id>/schedule.json). An approved deliverable is
+stale while a dependency's files no longer match its snapshot, or a
+dependency is stale itself; re-approving it after rework takes a new
+snapshot. The next deliverable to work on is the first in order that is
+unapproved or stale, so upstream rework always comes before what derives
+from it.
+"""
+
+import json
+import heapq
+import hashlib
+
+from .files import find_deliverable_files, locked, write_json_atomic
+
+DELIVERABLES_DIR = 'deliverables'
+
+STATUSES = ('approved', 'stale', 'next', 'ready', 'waiting')
+STATUS_ICONS = {
+    'approved': '✅',
+    'stale': '🔁',
+    'next': '▶️ ',
+    'ready': '⬜',
+    'waiting': '⏳',
+}
+
+
+class ScheduleError(Exception):
+    """The brief's dependency graph is invalid"""
+
+    def __init__(self, problems):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+def dependencies_of(deliverable):
+    """The deliverable's dependency IDs (entries that are not strings are ignored)"""
+    dependencies = deliverable.get('dependencies') or []
+    if not isinstance(dependencies, list):
+        return []
+    return [dependency for dependency in dependencies if isinstance(dependency, str)]
+
+
+def priority_of(deliverable):
+    priority = deliverable.get('priority')
+    return priority if isinstance(priority, int) and not isinstance(priority, bool) else float('inf')
+
+
+def brief_deliverables(brief):
+    return [d for d in brief.get('deliverables', []) if isinstance(d, dict)]
+
+
+def find_cycle(graph):
+    """One dependency cycle in graph (id -> dependency IDs) as [a, b, ..., a], or None"""
+    visiting, done = set(), set()
+    for start in graph:
+        if start in done:
+            continue
+        path = [start]
+        stack = [iter(graph[start])]
+        visiting.add(start)
+        while stack:
+            dependency = next(stack[-1], None)
+            if dependency is None:
+                stack.pop()
+                finished = path.pop()
+                visiting.discard(finished)
+                done.add(finished)
+            elif dependency in visiting:
+                return path[path.index(dependency):] + [dependency]
+            elif dependency not in done and dependency in graph:
+                path.append(dependency)
+                stack.append(iter(graph[dependency]))
+                visiting.add(dependency)
+    return None
+
+
+def validate(deliverables):
+    """
+    Problems with the dependency graph
+
+    Returns:
+        tuple: (errors, warnings) as lists of messages; a dependency with a
+        higher priority number than its dependent is only a warning, since
+        the scheduler orders it first anyway
+    """
+    errors, warnings = [], []
+    by_id = {}
+    for index, deliverable in enumerate(deliverables, 1):
+        deliverable_id = deliverable.get('id')
+        if not isinstance(deliverable_id, str) or not deliverable_id:
+            errors.append(f"Deliverable {index} has no ID")
+        elif deliverable_id in by_id:
+            errors.append(f"Duplicate deliverable ID '{deliverable_id}'")
+        else:
+            by_id[deliverable_id] = deliverable
+
+    for deliverable_id, deliverable in by_id.items():
+        for dependency in dependencies_of(deliverable):
+            if dependency == deliverable_id:
+                errors.append(f"{deliverable_id} depends on itself")
+            elif dependency not in by_id:
+                errors.append(f"{deliverable_id} depends on unknown deliverable '{dependency}'")
+            elif priority_of(by_id[dependency]) > priority_of(deliverable):
+                warnings.append(f"{deliverable_id} (priority {deliverable.get('priority')}) depends on "
+                                f"{dependency} (priority {by_id[dependency].get('priority')}); "
+                                f"{dependency} is scheduled first")
+
+    graph = {deliverable_id: [d for d in dependencies_of(deliverable) if d in by_id and d != deliverable_id]
+             for deliverable_id, deliverable in by_id.items()}
+    cycle = find_cycle(graph)
+    if cycle:
+        errors.append(f"Dependency cycle: {' → '.join(cycle)}")
+    return errors, warnings
+
+
+def topological_order(deliverables):
+    """
+    The deliverables in work order: each after its dependencies, the lowest
+    priority number first among those whose dependencies are placed
+
+    Raises:
+        ScheduleError: if the dependency graph is invalid
+    """
+    errors, _ = validate(deliverables)
+    if errors:
+        raise ScheduleError(errors)
+    index = {deliverable['id']: position for position, deliverable in enumerate(deliverables)}
+    waiting_on = {deliverable['id']: set(dependencies_of(deliverable)) for deliverable in deliverables}
+    dependents = {deliverable_id: [] for deliverable_id in index}
+    for deliverable_id, dependencies in waiting_on.items():
+        for dependency in dependencies:
+            dependents[dependency].append(deliverable_id)
+
+    ready = [(priority_of(d), index[d['id']]) for d in deliverables if not waiting_on[d['id']]]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, position = heapq.heappop(ready)
+        deliverable = deliverables[position]
+        order.append(deliverable)
+        for dependent in dependents[deliverable['id']]:
+            waiting_on[dependent].discard(deliverable['id'])
+            if not waiting_on[dependent]:
+                heapq.heappush(ready, (priority_of(deliverables[index[dependent]]), index[dependent]))
+    return order
+
+
+def content_digest(directory, deliverable_id):
+    """SHA-256 of a deliverable's files in directory, or None if it has none yet"""
+    files = find_deliverable_files(directory, deliverable_id)
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode('utf-8') + b'\0')
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            continue
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def load_snapshots(path):
+    """{deliverable ID: {dependency ID: content digest at approval}} ({} if unreadable)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    snapshots = data.get('approved') if isinstance(data, dict) else None
+    return snapshots if isinstance(snapshots, dict) else {}
+
+
+def record_approval(path, brief, deliverable_id, directory=DELIVERABLES_DIR):
+    """
+    Snapshot the deliverable's dependencies as they are now, so later
+    upstream changes mark it stale
+
+    Returns:
+        dict: the snapshot ({dependency ID: digest})
+    """
+    deliverable = next((d for d in brief_deliverables(brief) if d.get('id') == deliverable_id), None)
+    dependencies = dependencies_of(deliverable) if deliverable else []
+    snapshot = {dependency: content_digest(directory, dependency) for dependency in dependencies}
+    with locked(path):
+        snapshots = load_snapshots(path)
+        snapshots[deliverable_id] = snapshot
+        write_json_atomic(path, {'approved': snapshots}, indent=2)
+    return snapshot
+
+
+class Schedule:
+    """
+    A brief's deliverables in work order, each with a status: approved,
+    stale (approved, but an upstream deliverable changed since), next (the
+    one to work on), ready (unapproved, dependencies approved) or waiting
+    (unapproved, on dependencies that are not yet)
+
+    changed maps each stale deliverable to the dependencies that changed or
+    went stale.
+
+    Raises:
+        ScheduleError: if the dependency graph is invalid
+    """
+
+    def __init__(self, brief, snapshots=None, directory=DELIVERABLES_DIR):
+        self.order = topological_order(brief_deliverables(brief))
+        self.status = {}
+        self.changed = {}
+        snapshots = snapshots or {}
+        digests = {}
+
+        def digest(deliverable_id):
+            if deliverable_id not in digests:
+                digests[deliverable_id] = content_digest(directory, deliverable_id)
+            return digests[deliverable_id]
+
+        for deliverable in self.order:
+            deliverable_id = deliverable['id']
+            dependencies = dependencies_of(deliverable)
+            if deliverable.get('approved'):
+                snapshot = snapshots.get(deliverable_id)
+                changed = [] if not isinstance(snapshot, dict) else [
+                    dependency for dependency in dependencies
+                    if self.status[dependency] == 'stale'
+                    or (dependency in snapshot and snapshot[dependency] != digest(dependency))
+                ]
+                if changed:
+                    self.status[deliverable_id] = 'stale'
+                    self.changed[deliverable_id] = changed
+                else:
+                    self.status[deliverable_id] = 'approved'
+            elif all(self.status[dependency] == 'approved' for dependency in dependencies):
+                self.status[deliverable_id] = 'ready'
+            else:
+                self.status[deliverable_id] = 'waiting'
+
+        self.next = next((d for d in self.order if self.status[d['id']] in ('stale', 'ready')), None)
+        if self.next is not None and self.status[self.next['id']] == 'ready':
+            self.status[self.next['id']] = 'next'
+
+    @property
+    def stale(self):
+        return [d for d in self.order if self.status[d['id']] == 'stale']
+
+    @property
+    def remaining(self):
+        return [d for d in self.order if self.status[d['id']] != 'approved']
+
+    def to_dict(self):
+        return {
+            'next': self.next['id'] if self.next else None,
+            'deliverables': [
+                {
+                    'id': d['id'],
+                    'title': d.get('title', ''),
+                    'priority': d.get('priority'),
+                    'dependencies': dependencies_of(d),
+                    'status': self.status[d['id']],
+                    'changed': self.changed.get(d['id'], []),
+                }
+                for d in self.order
+            ],
+        }
+
+
+def label(deliverable):
+    """ "PR-002: Media pitch" """
+    title = deliverable.get('title')
+    return f"{deliverable['id']}: {title}" if title else deliverable['id']
+
+
+def render_schedule(schedule):
+    """The schedule as text, one deliverable per line in work order"""
+    lines = []
+    for deliverable in schedule.order:
+        deliverable_id = deliverable['id']
+        status = schedule.status[deliverable_id]
+        line = f"{STATUS_ICONS[status]} {label(deliverable)} (priority {deliverable.get('priority', '-')})"
+        if status == 'stale':
+            line += f" — stale, upstream changed: {', '.join(schedule.changed[deliverable_id])}"
+        elif status == 'waiting':
+            pending = [d for d in dependencies_of(deliverable) if schedule.status[d] != 'approved']
+            line += f" — waiting on {', '.join(pending)}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def render_next(schedule):
+    """What the loop should work on next, for the iteration prompt ('' when nothing is left)"""
+    if schedule.next is None:
+        return ""
+    deliverable = schedule.next
+    lines = ["# Next Deliverable", ""]
+    if schedule.status[deliverable['id']] == 'stale':
+        lines.append(f"Rework {label(deliverable)}: it was approved, but "
+                     f"{', '.join(schedule.changed[deliverable['id']])} changed since. Bring it in line "
+                     f"with the current upstream content, re-run its quality gates and approve it again.")
+    else:
+        dependencies = dependencies_of(deliverable)
+        lines.append(f"Work on {label(deliverable)}"
+                     + (f" (its dependencies are approved: {', '.join(dependencies)})." if dependencies else "."))
+    later = [d['id'] for d in schedule.stale if d is not deliverable]
+    if later:
+        lines.append(f"Also stale, after this one: {', '.join(later)}.")
+    return "\n".join(lines)
@@ -0,0 +1,273 @@
+"""
+Campaign state store
+A campaign's settings, progress counters and loop prompt, kept as one
+versioned JSON document (.claude/lisa-campaigns/<id>/state.json, see
+campaigns.py). It is loaded in a single read and updated under a lock with
+an atomic rename, so the stop hook and the agent can bump counters without
+clobbering each other.
+
+Before campaigns were keyed by ID, a workspace's one campaign kept its state
+in .claude/lisa-campaign.local.json, and before that as YAML frontmatter in
+.claude/lisa-campaign.local.md; the store's defaults still read (and
+migrate) those.
+"""
+
+import os
+import json
+import contextlib
+
+from .files import locked, write_json_atomic
+
+STATE_PATH = os.path.join('.claude', 'lisa-campaign.local.json')
+LEGACY_STATE_PATH = os.path.join('.claude', 'lisa-campaign.local.md')
+SCHEMA_VERSION = 1
+
+# Every field and its default (older state files get the defaults for
+# fields they lack)
+DEFAULTS = {
+    'campaign_id': None,
+    'session_id': None,
+    'active': True,
+    'iteration': 1,
+    'max_iterations': 30,
+    'completion_promise': None,
+    'campaign_name': 'Untitled Campaign',
+    'campaign_type': 'unknown',
+    'campaign_brief': '',
+    'started_at': None,
+    'deliverables_total': 0,
+    'deliverables_completed': 0,
+    'completed_deliverables': [],
+    'quality_checks_passed': 0,
+    'quality_checks_failed': 0,
+    'current_deliverable': 'In progress',
+    'complexity': 'Unknown',
+    'last_deliverable': '',
+    'consecutive_failures': 0,
+    'prompt': '',
+}
+
+COUNTERS = (
+    'iteration',
+    'max_iterations',
+    'deliverables_total',
+    'deliverables_completed',
+    'quality_checks_passed',
+    'quality_checks_failed',
+    'consecutive_failures',
+)
+
+
+class StateError(Exception):
+    """The state file is unreadable, or a field holds an invalid value"""
+
+
+def deliverable_id(deliverable):
+    """ "MKT-003: Email nurture sequence" -> "MKT-003" """
+    return deliverable.split(':', 1)[0].strip()
+
+
+def parse_value(field, text):
+    """
+    Convert a command-line or frontmatter value to the field's type
+
+    Raises:
+        StateError: for an unknown field or a counter that is not a number
+    """
+    if field not in DEFAULTS:
+        raise StateError(f"Unknown field '{field}' (expected: {', '.join(DEFAULTS)})")
+    if field in COUNTERS:
+        if not text.isdigit():
+            raise StateError(f"'{field}' field is not a valid number (got: '{text}')")
+        return int(text)
+    if field == 'active':
+        return text.lower() == 'true'
+    if field in ('completion_promise', 'campaign_id', 'session_id') and text in ('', 'null'):
+        return None
+    if field == 'completed_deliverables':
+        return [item.strip() for item in text.split(',') if item.strip()]
+    return text
+
+
+def parse_legacy(text):
+    """State from the old markdown format: YAML frontmatter, then the prompt"""
+    lines = text.split('\n')
+    if not lines or lines[0] != '---' or '---' not in lines[1:]:
+        raise StateError("No frontmatter found")
+    end = lines.index('---', 1)
+    state = {}
+    for line in lines[1:end]:
+        field, sep, value = line.partition(':')
+        if not sep or field not in DEFAULTS:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        state[field] = parse_value(field, value)
+    state['prompt'] = '\n'.join(line for line in lines[end + 1:] if line != '---').strip('\n')
+    return state
+
+
+def validate(state):
+    """
+    Raises:
+        StateError: if a counter is not a non-negative integer
+    """
+    for field in COUNTERS:
+        value = state[field]
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise StateError(f"'{field}' field is not a valid number (got: '{value}')")
+
+
+class CampaignStore:
+    """
+    The active campaign's state file
+
+    load() reads it (None when no campaign is active); create() starts a
+    campaign; update() and transaction() change fields atomically.
+    """
+
+    def __init__(self, path=STATE_PATH, legacy_path=LEGACY_STATE_PATH):
+        self.path = path
+        self.legacy_path = legacy_path
+
+    def exists(self):
+        return os.path.exists(self.path) or bool(self.legacy_path and os.path.exists(self.legacy_path))
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return self._migrate()
+        except (OSError, ValueError) as e:
+            raise StateError(f"Could not read state file: {e}") from None
+        if not isinstance(data, dict):
+            raise StateError("State file does not hold a JSON object")
+        if data.get('schema_version', 0) > SCHEMA_VERSION:
+            raise StateError(f"State file schema version {data['schema_version']} is newer than "
+                             f"this version of Lisa supports ({SCHEMA_VERSION})")
+        return data
+
+    def _migrate(self):
+        """Convert a legacy markdown state file, if there is one"""
+        if not self.legacy_path:
+            return None
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                data = parse_legacy(f.read())
+        except FileNotFoundError:
+            return None
+        self._write(dict(DEFAULTS, **data))
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.legacy_path)
+        return data
+
+    def _write(self, state):
+        write_json_atomic(self.path, dict(state, schema_version=SCHEMA_VERSION), indent=2)
+
+    def load(self):
+        """
+        The campaign state with defaults filled in, or None if no campaign
+        is active
+
+        Raises:
+            StateError: if the state file is corrupted
+        """
+        data = self._read()
+        if data is None:
+            return None
+        state = dict(DEFAULTS, **data)
+        state.pop('schema_version', None)
+        validate(state)
+        return state
+
+    def create(self, **fields):
+        """
+        Start a campaign with the given fields
+
+        Raises:
+            FileExistsError: if a campaign is already active
+            StateError: if a field is unknown or invalid
+        """
+        unknown = set(fields) - set(DEFAULTS)
+        if unknown:
+            raise StateError(f"Unknown field '{sorted(unknown)[0]}' (expected: {', '.join(DEFAULTS)})")
+        with locked(self.path):
+            if self.exists():
+                raise FileExistsError(self.path)
+            state = dict(DEFAULTS, **fields)
+            validate(state)
+            self._write(state)
+        return state
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Yield the state for in-place changes; they are validated and written
+        atomically when the block exits without an exception
+
+        Raises:
+            StateError: if no campaign is active or a change is invalid
+        """
+        with locked(self.path):
+            state = self.load()
+            if state is None:
+                raise StateError("No active campaign")
+            yield state
+            validate(state)
+            self._write(state)
+
+    def update(self, **changes):
+        """Set fields atomically and return the new state"""
+        with self.transaction() as state:
+            unknown = set(changes) - set(DEFAULTS)
+            if unknown:
+                raise StateError(f"Unknown field '{sorted(unknown)[0]}' (expected: {', '.join(DEFAULTS)})")
+            state.update(changes)
+        return state
+
+    def record_check(self, deliverable, passed):
+        """
+        Count a quality gate run on a deliverable
+
+        Failures on the same deliverable in a row add up in
+        consecutive_failures (the stop hook's stuck detection); a pass, or
+        moving to another deliverable, starts the count again.
+        """
+        with self.transaction() as state:
+            same = deliverable_id(deliverable) == deliverable_id(state['last_deliverable'])
+            if passed:
+                state['quality_checks_passed'] += 1
+                state['consecutive_failures'] = 0
+            else:
+                state['quality_checks_failed'] += 1
+                state['consecutive_failures'] = state['consecutive_failures'] + 1 if same else 1
+            state['current_deliverable'] = state['last_deliverable'] = deliverable
+        return state
+
+    def complete_deliverable(self, deliverable, on_first=None):
+        """
+        Count a deliverable as approved (once, however often it is reported)
+
+        on_first(state) is called under the state lock when this is the
+        deliverable's first approval, so of several concurrent approvals of
+        one deliverable exactly one calls it.
+        """
+        with self.transaction() as state:
+            approved = list(state['completed_deliverables'])
+            if deliverable_id(deliverable) not in approved:
+                approved.append(deliverable_id(deliverable))
+                state['deliverables_completed'] += 1
+                if on_first is not None:
+                    on_first(state)
+            state['completed_deliverables'] = approved
+            state['consecutive_failures'] = 0
+            state['current_deliverable'] = deliverable
+        return state
+
+    def delete(self):
+        """End the campaign (removes the state file, legacy or current)"""
+        for path in filter(None, (self.path, self.legacy_path)):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
@@ -0,0 +1,148 @@
+"""
+Session transcript reader
+Finds the last assistant message in a Claude Code JSONL transcript by reading
+backwards from the end of the file. A bookmark records where that message
+starts and how far the file had been read, so the next call only reads what
+was appended since: each stop hook call costs the size of the last turn, not
+of the whole session.
+"""
+
+import os
+import re
+import json
+
+from .files import write_json_atomic
+
+BLOCK_SIZE = 64 * 1024
+
+# Cheap pre-filter before a line is parsed (what the stop hook used to grep for)
+ASSISTANT_ROLE = re.compile(rb'"role"\s*:\s*"assistant"')
+
+
+class TranscriptError(Exception):
+    """The last assistant message is not valid transcript JSON"""
+
+
+def reverse_lines(f, end, start=0, block_size=BLOCK_SIZE):
+    """
+    Yield (offset, line) for the lines of f between start and end, last first
+
+    start must be the beginning of a line. Reads block_size chunks backwards
+    from end; lines exclude their newline and empty lines are skipped.
+    """
+    position, tail = end, b''
+    while position > start:
+        size = min(block_size, position - start)
+        position -= size
+        f.seek(position)
+        chunk = f.read(size) + tail
+        lines = chunk.split(b'\n')
+        # The first piece may continue in the previous block
+        tail = lines[0]
+        line_end = position + len(chunk)
+        for line in reversed(lines[1:]):
+            line_start = line_end - len(line)
+            if line:
+                yield line_start, line
+            line_end = line_start - 1
+    if tail:
+        yield start, tail
+
+
+def find_last_assistant(f, end, start=0):
+    """
+    Offset and bytes of the last assistant line between start and end
+
+    Returns:
+        tuple: (found, last_line) where found is (offset, line) or None and
+        last_line is the offset of the final line read (None if none)
+    """
+    last_line = None
+    for offset, line in reverse_lines(f, end, start):
+        if last_line is None:
+            last_line = offset
+        if ASSISTANT_ROLE.search(line):
+            return (offset, line), last_line
+    return None, last_line
+
+
+def message_text(line):
+    """
+    Text blocks of a transcript line's message, joined by newlines
+
+    Raises:
+        TranscriptError: if the line is not JSON or has no message content
+    """
+    try:
+        content = json.loads(line)['message']['content']
+    except (ValueError, KeyError, TypeError) as e:
+        raise TranscriptError(f"Could not parse assistant message: {e}") from None
+    if isinstance(content, str):
+        return content
+    try:
+        return "\n".join(block['text'] for block in content
+                         if isinstance(block, dict) and block.get('type') == 'text')
+    except (KeyError, TypeError) as e:
+        raise TranscriptError(f"Could not parse assistant message: {e}") from None
+
+
+def load_bookmark(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            bookmark = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return bookmark if isinstance(bookmark, dict) else {}
+
+
+def last_assistant_message(transcript, bookmark_path=None):
+    """
+    Text of the last assistant message in a transcript
+
+    With a bookmark_path, resume from the previous call: only bytes appended
+    since are searched, and if none of them is an assistant message the one
+    found last time is re-read at its offset. A bookmark for another file,
+    or for a file that has since shrunk or been replaced, is ignored.
+
+    Returns:
+        str or None: the message text (possibly empty), None if the
+        transcript has no assistant message
+
+    Raises:
+        OSError: if the transcript cannot be read
+        TranscriptError: if the last assistant message is not valid JSON
+    """
+    path = os.path.abspath(transcript)
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        size = stat.st_size
+        bookmark = load_bookmark(bookmark_path) if bookmark_path else {}
+        resume = (bookmark.get('transcript') == path and bookmark.get('inode') == stat.st_ino
+                  and isinstance(bookmark.get('scanned'), int) and bookmark['scanned'] <= size)
+
+        start = bookmark['scanned'] if resume else 0
+        found, last_line = find_last_assistant(f, size, start)
+        if found is None and resume and bookmark.get('offset') is not None:
+            f.seek(bookmark['offset'])
+            line = f.readline().rstrip(b'\n')
+            if ASSISTANT_ROLE.search(line):
+                found = bookmark['offset'], line
+            else:
+                # The file changed under the bookmark: search all of it
+                found, last_line = find_last_assistant(f, size)
+
+        # A final line without its newline may still be being written, so
+        # the next call reads it again
+        complete = size == 0 or last_line is None
+        if not complete:
+            f.seek(size - 1)
+            complete = f.read(1) == b'\n'
+
+    if bookmark_path:
+        write_json_atomic(bookmark_path, {
+            'transcript': path,
+            'inode': stat.st_ino,
+            'scanned': size if complete else last_line,
+            'offset': found[0] if found else None,
+        })
+    return message_text(found[1]) if found else None
@@ -0,0 +1,51 @@
+"""
+Lisa quality gate library
+Shared building blocks for the quality check scripts in scripts/, and the
+in-process check API (see api.py): every check takes a Document or a path
+and returns a CheckResult, raising QualityCheckError instead of exiting
+"""
+
+from .document import Document, load_document
+from .cache import ResultCache, cache_enabled
+from .gates import GATE_MATRIX, GATE_LABELS, GATE_SCRIPTS, gates_for_discipline
+from .errors import ConfigurationError, DependencyError, DocumentError, QualityCheckError
+from .results import CheckResult, Issue
+from .budget import CheckTimeout
+from .api import (
+    CHECK_FUNCTIONS,
+    check_accessibility,
+    check_ap_style,
+    check_brand,
+    check_readability,
+    check_readability_items,
+    check_seo,
+    open_document,
+    run_check,
+)
+
+__all__ = [
+    'Document',
+    'load_document',
+    'open_document',
+    'GATE_MATRIX',
+    'GATE_LABELS',
+    'GATE_SCRIPTS',
+    'ResultCache',
+    'cache_enabled',
+    'gates_for_discipline',
+    'CheckResult',
+    'Issue',
+    'QualityCheckError',
+    'DocumentError',
+    'ConfigurationError',
+    'DependencyError',
+    'CheckTimeout',
+    'CHECK_FUNCTIONS',
+    'check_brand',
+    'check_readability',
+    'check_readability_items',
+    'check_seo',
+    'check_accessibility',
+    'check_ap_style',
+    'run_check',
+]
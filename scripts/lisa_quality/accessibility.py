@@ -0,0 +1,80 @@
+"""
+Accessibility checks
+WCAG 2.1 AA checks on the HTML outline of a deliverable's blocks (see
+lisa_quality.outline): heading hierarchy, image alt text, descriptive links
+and color contrast guidance. Issues carry the offending element's line when
+the outline knows it (HTML and plain-text sources)
+"""
+
+import re
+
+from .results import Issue
+
+COLOR_SPEC = re.compile(r'(color|background|bg):\s*#?[0-9a-fA-F]{3,6}')
+VAGUE_LINK_TEXT = ('click here', 'here', 'read more', 'more')
+
+
+def check_heading_hierarchy(headings):
+    """
+    Check that headings follow proper hierarchy (H1 → H2 → H3, no skipping)
+
+    headings holds (level, text, line) for every heading in document order.
+    """
+    issues = []
+    prev_level = 0
+    for current_level, _, line in headings:
+        if current_level > prev_level + 1:
+            issues.append(Issue('warning', f"Heading hierarchy skip: H{current_level} "
+                                           f"follows H{prev_level} (should not skip levels)",
+                                line=line, code='heading-skip'))
+        prev_level = current_level
+    return issues
+
+
+def check_alt_text(images):
+    """Check that all images have alt text (images holds (src, alt, line))"""
+    issues = []
+    for src, alt, line in images:
+        if not alt:
+            issues.append(Issue('error', f"Image missing alt text: {src}", line=line,
+                                code='image-alt-missing'))
+        elif len(alt.strip()) == 0:
+            issues.append(Issue('error', f"Image has empty alt text: {src}", line=line,
+                                code='image-alt-empty'))
+    return issues
+
+
+def check_semantic_html(links):
+    """
+    Check for descriptive link text and links used as buttons (links holds
+    (text, href, line)); links used as buttons are one issue at the first
+    such link's line
+    """
+    issues = []
+    for text, _, line in links:
+        if text.strip().lower() in VAGUE_LINK_TEXT:
+            issues.append(Issue('warning', f"Link text not descriptive: '{text.strip()}' "
+                                           f"(use descriptive link text)",
+                                line=line, code='link-text-vague'))
+
+    buttons_as_links = [line for _, href, line in links if href == '#']
+    if buttons_as_links:
+        issues.append(Issue('warning', f"Found {len(buttons_as_links)} links with href='#' "
+                                       f"(consider using <button> for interactive elements)",
+                            line=buttons_as_links[0], code='link-as-button'))
+    return issues
+
+
+def check_color_contrast_warnings(content):
+    """
+    Provide guidance on color contrast (can't fully check without rendering)
+    This is a simplified check that looks for color specifications
+    """
+    if not COLOR_SPEC.search(content):
+        return []
+    return [Issue('info', "\n".join((
+        "Colors specified in content - please verify contrast ratios meet WCAG 2.1 AA standards:",
+        "    • Normal text: 4.5:1 contrast ratio",
+        "    • Large text (18pt+ or 14pt+ bold): 3:1 contrast ratio",
+        "    • Use a tool like WebAIM Contrast Checker to verify",
+    )), code='color-contrast')]
@@ -0,0 +1,390 @@
+"""
+Quality check API
+Every check as a function: pass a Document or a file path, get a
+CheckResult. Checks raise QualityCheckError subclasses instead of exiting,
+so one process can run any number of checks; the scripts in scripts/ are
+thin command-line wrappers around these functions.
+
+    from lisa_quality import check_readability, QualityCheckError
+
+    result = check_readability('deliverables/MKT-001-landing-page.md', threshold=65)
+    if not result.passed:
+        for issue in result.issues:
+            print(issue.line, issue.message)
+"""
+
+import os
+import importlib
+
+from .accessibility import (
+    check_alt_text,
+    check_color_contrast_warnings,
+    check_heading_hierarchy,
+    check_semantic_html,
+)
+from .brand import check_brand_terms, find_brand_config, load_brand_config
+from .checks import SCRIPTS_DIR
+from .document import Document, load_document
+from .errors import ConfigurationError, DependencyError, DocumentError
+from .keywords import index_document, meta_description
+from .readability import analyze_document, excerpt, has_text, interpret_score, score_items
+from .results import CheckResult, Issue
+from .rules import RulePackError, compile_rule_packs
+
+DEFAULT_RULE_PACK = SCRIPTS_DIR / 'ap-style-rules.json'
+RULE_PACKS_ENV_VAR = 'LISA_AP_STYLE_RULES'
+
+# Sentences reported per readability result
+HARDEST_SENTENCES = 5
+
+# Secondary SEO keywords above this density look like keyword stuffing
+MAX_KEYWORD_DENSITY = 5.0
+
+
+def open_document(source):
+    """
+    A Document for a Document or a file path
+
+    Raises:
+        DocumentError: if the file is missing or cannot be read as UTF-8
+    """
+    if isinstance(source, Document):
+        return source
+    try:
+        return load_document(source)
+    except FileNotFoundError:
+        raise DocumentError(f"File not found: {source}") from None
+    except (OSError, UnicodeDecodeError) as e:
+        raise DocumentError(f"Could not read file: {e}") from None
+
+
+def require(module, library=None):
+    """Import an optional dependency, raising DependencyError if it is missing"""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise DependencyError(library or module) from None
+
+
+def _require_html(document):
+    """Libraries needed to outline a document's HTML (the parser itself is html.parser)"""
+    if document.is_markdown:
+        require('markdown')
+
+
+def check_brand(source, config_path=None):
+    """
+    Check content against brand-config.json term lists
+
+    Every prohibited term occurrence is an error (with its line and column);
+    every required term that never appears is a warning. Any issue fails the
+    check. Without a config_path, brand-config.json is looked up next to the
+    scripts, in the current directory, then in the plugin install; if none is
+    found the check runs with empty term lists (metrics['config'] is None).
+
+    Raises:
+        DocumentError, ConfigurationError
+    """
+    document = open_document(source)
+    if config_path is None:
+        config_path = find_brand_config()
+
+    terms = {}
+    if config_path is not None:
+        try:
+            terms = load_brand_config(config_path)
+        except FileNotFoundError:
+            raise ConfigurationError(f"Brand config not found: {config_path}") from None
+        except ValueError as e:
+            raise ConfigurationError(f"Brand config is not valid JSON: {config_path}", (str(e),)) from None
+
+    found = check_brand_terms(document.content, terms, blocks=document.blocks)
+    issues = []
+    for term, hits in found['prohibited'].items():
+        lines = [f"  line {line}, col {column}: {text.strip()}" for line, column, text in hits]
+        issues.append(Issue('error', f"Prohibited term '{term}' found:\n" + "\n".join(lines),
+                            line=hits[0][0], column=hits[0][1], code='prohibited-term'))
+    for term in found['missing_required']:
+        issues.append(Issue('warning', f"Required term '{term}' not found in content",
+                            code='required-term-missing'))
+
+    passed = not issues
+    summary = ('No brand guideline violations found' if passed
+               else f"{len(issues)} brand guideline violation(s)")
+    metrics = {
+        'config': str(config_path) if config_path else None,
+        'prohibited': len(found['prohibited']),
+        'missing_required': len(found['missing_required']),
+    }
+    return CheckResult('brand', passed, summary, issues, metrics)
+
+
+def check_readability(source, threshold=60):
+    """
+    Check Flesch Reading Ease against a minimum score
+
+    A document below the threshold gets an error issue; the other issues
+    point at what drags the score down: each heading section below the
+    threshold (warning) and the hardest sentences below it (suggestion), with
+    source lines. data['report'] is the full ReadabilityReport.
+
+    Raises:
+        DocumentError: if no text is left once formatting is removed
+        DependencyError: if textstat is not installed
+    """
+    require('textstat')
+    document = open_document(source)
+    if not has_text(document):
+        raise DocumentError("No text content found after removing formatting",
+                            ("File may be empty or contain only markup/code.",))
+
+    report = analyze_document(document)
+    reading_ease, grade_level = report.reading_ease, report.grade_level
+    issues = []
+    if reading_ease < threshold:
+        issues.append(Issue('error', f"Flesch Reading Ease {reading_ease:.1f} is below the "
+                                     f"threshold of {threshold}", code='reading-ease-low'))
+    for section in report.sections_below(threshold):
+        title = excerpt(section.title) if section.title else "(before first heading)"
+        issues.append(Issue('warning', f"Section '{title}' scores {section.reading_ease:.1f} "
+                                       f"(grade {section.grade_level:.1f})", line=section.line,
+                            code='section-reading-ease-low'))
+    for sentence in report.hardest_sentences(HARDEST_SENTENCES):
+        if sentence.reading_ease < threshold:
+            issues.append(Issue('suggestion', f"Hard sentence ({sentence.words} words, "
+                                              f"{sentence.reading_ease:.1f}): \"{excerpt(sentence.text)}\"",
+                                line=sentence.line, code='hard-sentence'))
+
+    summary = (f"Flesch Reading Ease {reading_ease:.1f} (threshold: {threshold}), "
+               f"grade level {grade_level:.1f}")
+    metrics = {
+        'reading_ease': reading_ease,
+        'grade_level': grade_level,
+        'threshold': threshold,
+        'interpretation': interpret_score(reading_ease),
+    }
+    return CheckResult('readability', reading_ease >= threshold, summary, issues, metrics,
+                       {'report': report})
+
+
+def check_readability_items(source, threshold=60, mode='auto'):
+    """
+    Score each item of a batch deliverable (social posts, email variants)
+
+    Passes only if every item meets the threshold; each item below it is an
+    error at the item's source line. data['items'] holds the scored Items.
+
+    Raises:
+        DocumentError: if no items are found
+        ConfigurationError: for an unknown split mode
+        DependencyError: if textstat is not installed
+    """
+    require('textstat')
+    document = open_document(source)
+    try:
+        items = score_items(document.content, mode)
+    except ValueError as e:
+        raise ConfigurationError(str(e)) from None
+    if not items:
+        raise DocumentError(f"No items found (split mode: {mode})",
+                            ("Items are split by heading, list item or --- separator.",))
+
+    issues = [
+        Issue('error', f"Item '{excerpt(item.title or item.text, 50)}' scores "
+                       f"{item.reading_ease:.1f} (grade {item.grade_level:.1f})", line=item.line,
+              code='item-reading-ease-low')
+        for item in items if item.reading_ease < threshold
+    ]
+    lowest = min(items, key=lambda item: item.reading_ease)
+    summary = (f"{len(issues)} of {len(items)} items below Flesch Reading Ease {threshold}, "
+               f"lowest {lowest.reading_ease:.1f}")
+    metrics = {
+        'items': len(items),
+        'failing': len(issues),
+        'lowest': lowest.reading_ease,
+        'threshold': threshold,
+    }
+    return CheckResult('readability', not issues, summary, issues, metrics, {'items': items})
+
+
+def check_seo(source, keywords):
+    """
+    Check SEO elements of content
+
+    keywords is a keyword or a list whose first entry is the primary keyword
+    (density range and H1 placement); the others only need to appear and
+    must not be stuffed. Missing H1 or meta description fail the check.
+    metrics['density'] is the primary keyword's density; data['keywords']
+    holds KeywordStats for every keyword.
+
+    Raises:
+        DocumentError, DependencyError
+        ConfigurationError: if no keyword is given
+    """
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    keywords = [keyword for keyword in keywords or [] if keyword]
+    if not keywords:
+        raise ConfigurationError("At least one keyword is required")
+    document = open_document(source)
+    _require_html(document)
+    headings = [heading for outline in document.outlines for heading in outline.headings]
+    issues = []
+
+    # One tokenization and n-gram index answers every keyword
+    stats = index_document(document).analyze(keywords)
+    primary = stats[0]
+
+    # 1. Keyword density (2-4% is ideal, 1-5% is accepted)
+    density = primary.density
+    if density < 1.0:
+        issues.append(Issue('warning', f"Keyword density too low: {density:.2f}% (target: 2-4%)",
+                            code='keyword-density-low'))
+    elif density > MAX_KEYWORD_DENSITY:
+        issues.append(Issue('warning', f"Keyword density too high: {density:.2f}% (target: 2-4%). "
+                                       f"May appear as keyword stuffing.", code='keyword-density-high'))
+    for keyword in stats[1:]:
+        if keyword.count == 0:
+            issues.append(Issue('warning', f"Secondary keyword '{keyword.keyword}' not found",
+                                code='secondary-keyword-missing'))
+        elif keyword.density > MAX_KEYWORD_DENSITY:
+            issues.append(Issue('warning', f"Secondary keyword '{keyword.keyword}' density too high: "
+                                           f"{keyword.density:.2f}%. May appear as keyword stuffing.",
+                                code='secondary-keyword-density-high'))
+
+    # 2. Exactly one H1
+    h1_lines = [line for level, _, line in headings if level == 1]
+    if len(h1_lines) == 0:
+        issues.append(Issue('error', "No H1 header found (required for SEO)", code='h1-missing'))
+    elif len(h1_lines) > 1:
+        issues.append(Issue('warning', f"Multiple H1 headers found ({len(h1_lines)}). "
+                                       f"Best practice: use only one H1.", line=h1_lines[1],
+                            code='h1-multiple'))
+
+    # 3. At least one H2
+    if not any(level == 2 for level, _, _ in headings):
+        issues.append(Issue('warning', "No H2 headers found (recommended for content structure)",
+                            code='h2-missing'))
+
+    # 4. Meta description (HTML meta tag or markdown metadata)
+    description = meta_description(document)
+    if not description:
+        issues.append(Issue('error', "No meta description found (required for search snippets)",
+                            code='meta-description-missing'))
+    elif len(description) > 160:
+        issues.append(Issue('warning', f"Meta description too long: {len(description)} chars "
+                                       f"(recommended: < 160)", code='meta-description-long'))
+
+    # 5. Title tag (HTML only)
+    if not document.is_markdown:
+        title = next((outline.title for outline in document.outlines if outline.title is not None), None)
+        if not title or not title.strip():
+            issues.append(Issue('warning', "No title tag found (recommended for HTML pages)",
+                                code='title-missing'))
+
+    # 6. Primary keyword in the H1
+    if h1_lines and not primary.placements['h1']:
+        issues.append(Issue('warning', f"Target keyword '{primary.keyword}' not found in H1 header "
+                                       f"(recommended)", code='keyword-not-in-h1'))
+
+    summary = f"Keyword '{primary.keyword}' density {density:.2f}%"
+    if len(stats) > 1:
+        summary += f" (+{len(stats) - 1} secondary)"
+    metrics = {
+        'density': density,
+        'keywords': [
+            {'keyword': k.keyword, 'count': k.count, 'density': k.density, 'placements': k.placements}
+            for k in stats
+        ],
+    }
+    passed = not any(issue.severity == 'error' for issue in issues)
+    return CheckResult('seo', passed, summary, issues, metrics, {'keywords': stats})
+
+
+def check_accessibility(source):
+    """
+    Check content against WCAG 2.1 AA basics
+
+    Images without alt text are errors and fail the check; heading skips and
+    vague link text are warnings; color specifications add contrast guidance.
+
+    Raises:
+        DocumentError, DependencyError
+    """
+    document = open_document(source)
+    _require_html(document)
+    outlines = document.outlines
+    issues = (check_heading_hierarchy([heading for outline in outlines for heading in outline.headings])
+              + check_alt_text([image for outline in outlines for image in outline.images])
+              + check_semantic_html([link for outline in outlines for link in outline.links])
+              + check_color_contrast_warnings(document.content))
+    critical = sum(1 for issue in issues if issue.severity == 'error')
+    summary = f"{critical} critical issue(s), {len(issues) - critical} note(s)"
+    return CheckResult('accessibility', critical == 0, summary, issues, {'critical': critical})
+
+
+def ap_style_rule_packs(extra_packs=None):
+    """
+    Rule packs to load, in order: the bundled AP Stylebook pack, any listed
+    in $LISA_AP_STYLE_RULES (os.pathsep-separated), then extra_packs
+    """
+    paths = [str(DEFAULT_RULE_PACK)]
+    paths += [p for p in os.environ.get(RULE_PACKS_ENV_VAR, '').split(os.pathsep) if p]
+    paths += list(extra_packs or [])
+    return paths
+
+
+def check_ap_style(source, rule_packs=None):
+    """
+    Check content for AP Style compliance
+
+    Every rule match is an issue with its line, column and rule ID; only
+    rules with severity "error" fail the check.
+
+    Raises:
+        DocumentError
+        ConfigurationError: if a rule pack is missing or invalid
+    """
+    document = open_document(source)
+    try:
+        rule_set = compile_rule_packs(ap_style_rule_packs(rule_packs))
+    except FileNotFoundError as e:
+        raise ConfigurationError(f"Rule pack not found: {e.filename}") from None
+    except RulePackError as e:
+        raise ConfigurationError(f"Invalid rule pack: {e}") from None
+
+    issues = [
+        Issue(finding.rule.severity, finding.message, finding.line, finding.column, finding.rule.id,
+              offset=finding.start)
+        for finding in rule_set.scan(document.content, document.blocks)
+    ]
+    violations = sum(1 for issue in issues if issue.severity != 'suggestion')
+    summary = f"{violations} violation(s), {len(issues) - violations} suggestion(s)"
+    passed = not any(issue.severity == 'error' for issue in issues)
+    return CheckResult('ap-style', passed, summary, issues)
+
+
+# Check name -> function, for callers that pick checks by name
+CHECK_FUNCTIONS = {
+    'brand': check_brand,
+    'readability': check_readability,
+    'seo': check_seo,
+    'accessibility': check_accessibility,
+    'ap-style': check_ap_style,
+}
+
+
+def run_check(check, source, **options):
+    """
+    Run a check by name (brand, readability, seo, accessibility, ap-style)
+
+    Raises:
+        ConfigurationError: for an unknown check name
+    """
+    try:
+        function = CHECK_FUNCTIONS[check]
+    except KeyError:
+        raise ConfigurationError(
+            f"Unknown check '{check}' (expected: {', '.join(CHECK_FUNCTIONS)})"
+        ) from None
+    return function(source, **options)
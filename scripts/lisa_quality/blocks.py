@@ -0,0 +1,107 @@
+"""
+Block-level incremental analysis
+Splits a deliverable into stable blocks and memoizes each check's analysis
+of a block by the block's hash, so re-checking an edited deliverable only
+re-analyzes the blocks that changed; the checks assemble document results
+from the per-block statistics
+
+A block starts at every markdown heading line outside a code fence, and a
+section longer than MAX_BLOCK_CHARS is split further where a paragraph
+starts after a blank line. Block analyses keep offsets and lines relative
+to the block, so a block that moved because text above it was edited is
+still a cache hit; Block.start and Block.line place it in the document.
+HTML documents are a single block, since their markup can span anything.
+
+Analyses are memoized for the life of the process, like the syllable and
+report caches, so the warm check server re-checks a deliverable at the
+cost of the edit rather than of the whole document. Inline markup that
+spans a block boundary (an emphasis or code span opened in one section and
+closed in the next) is read per block, as markdown itself does.
+"""
+
+import re
+import time
+
+from .cache import content_hash
+from .outline import Outline
+
+MAX_BLOCK_CHARS = 4096
+BLOCK_CACHE_SIZE = 20000
+
+FENCE_LINE = re.compile(r'[ \t]*```')
+HEADING_LINE = re.compile(r'#{1,6}(?:[ \t]|$)')
+
+_analyses = {}
+
+
+class Block:
+    """A run of whole source lines, analyzed and cached on its own"""
+
+    def __init__(self, text, start=0, line=1):
+        self.text = text
+        self.start = start
+        self.line = line
+        self._hash = None
+
+    @property
+    def hash(self):
+        """SHA-256 of the block's text (the memo key)"""
+        if self._hash is None:
+            self._hash = content_hash(self.text)
+        return self._hash
+
+
+def split_blocks(content):
+    """
+    Split markdown or plain-text source into Blocks
+
+    Blocks cover the source exactly: joined in order they give it back.
+    """
+    lines = content.split('\n')
+    blocks = []
+    start = offset = first_line = 0
+    in_fence = False
+    for number, line in enumerate(lines):
+        if not in_fence and offset > start and (
+                HEADING_LINE.match(line)
+                or (offset - start >= MAX_BLOCK_CHARS and line[:1].strip() and not lines[number - 1].strip())):
+            blocks.append(Block(content[start:offset], start, first_line + 1))
+            start, first_line = offset, number
+        if FENCE_LINE.match(line):
+            in_fence = not in_fence
+        offset += len(line) + 1
+    blocks.append(Block(content[start:], start, first_line + 1))
+    return blocks
+
+
+def analyze_block(kind, block, analyze, key=None, document=None):
+    """
+    analyze(block.text), memoized by kind, key (anything else the analysis
+    depends on, such as a term list digest) and the block's hash
+
+    An analysis that parses the block (plain text, HTML outline) passes its
+    Document, so the time spent on blocks not seen before adds to
+    document.parse_seconds.
+    """
+    cache_key = (kind, key, block.hash)
+    analysis = _analyses.get(cache_key)
+    if analysis is None:
+        started = time.perf_counter()
+        analysis = analyze(block.text)
+        if document is not None:
+            document.parse_seconds += time.perf_counter() - started
+        if len(_analyses) >= BLOCK_CACHE_SIZE:
+            _analyses.clear()
+        _analyses[cache_key] = analysis
+    return analysis
+
+
+def block_outlines(document):
+    """
+    Outline of each of a Document's blocks (see lisa_quality.outline),
+    parsing only blocks not seen before; element lines are source lines
+    """
+    source_format = 'markdown' if document.is_markdown else 'html' if document.is_html else 'text'
+    return [analyze_block('outline', block, lambda text: Outline.parse(text, source_format),
+                          source_format).moved(block.line - 1)
+            for block in document.blocks]
@@ -0,0 +1,240 @@
+"""
+Brand compliance engine
+Matches every prohibited, required and approved term from brand-config.json
+in a single pass over the content, however long the term lists get
+
+Terms are compiled into one Aho-Corasick automaton over word tokens rather
+than characters: tokenizing in C and walking the automaton once per token
+keeps the Python loop short, and whole-token matching gives word boundaries
+for free ("art" never matches "start"). Matching is case-insensitive.
+Given the document's blocks, each block's matches are memoized by its hash,
+so a re-check only scans the blocks that changed.
+"""
+
+import os
+import re
+import json
+import tempfile
+from collections import deque
+from pathlib import Path
+
+from .blocks import Block, analyze_block
+from .cache import content_hash
+from .document import LineIndex
+
+# Words (keeping internal hyphens/apostrophes, so "game-changer" is one token)
+# and individual symbols (so "YourBrand®" must include the ®)
+TOKEN_PATTERN = re.compile(r"\w+(?:[-'’]\w+)*|[^\w\s]")
+
+AUTOMATON_CACHE_DIR = os.path.join('.claude', 'lisa-brand-cache')
+AUTOMATON_FORMAT = 1
+
+TERM_KINDS = ('prohibited', 'required', 'approved')
+CONFIG_KEYS = {
+    'prohibited': 'prohibitedTerms',
+    'required': 'requiredTerms',
+    'approved': 'approvedTerms',
+}
+
+_automata = {}
+
+
+def find_brand_config(scripts_dir=None):
+    """Locate brand-config.json: next to the scripts, in cwd, or in the plugin install"""
+    scripts_dir = Path(scripts_dir) if scripts_dir else Path(__file__).resolve().parent.parent
+    for candidate in (
+        scripts_dir / 'brand-config.json',
+        Path('brand-config.json'),
+        Path('.claude/plugins/lisa/scripts/brand-config.json'),
+    ):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_brand_config(path):
+    """Read the term lists from a brand-config.json (missing lists are empty)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    return {kind: [t for t in config.get(key) or [] if isinstance(t, str) and t.strip()]
+            for kind, key in CONFIG_KEYS.items()}
+
+
+def tokenize(text):
+    """Case-folded tokens of text as (token, start, end) offsets into text"""
+    return [(m.group().casefold(), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+
+class TermAutomaton:
+    """
+    Aho-Corasick automaton over word tokens
+
+    goto[node] maps a token to the next node, fail[node] is the longest
+    proper suffix state, and out[node] lists (term index, token length) for
+    every term ending at node, including those inherited through fail links.
+    """
+
+    def __init__(self, goto, fail, out, terms):
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+        self.terms = terms
+
+    @classmethod
+    def build(cls, terms):
+        """Compile a list of term strings"""
+        goto, out = [{}], [[]]
+        for index, term in enumerate(terms):
+            node = 0
+            tokens = [token for token, _, _ in tokenize(term)]
+            if not tokens:
+                continue
+            for token in tokens:
+                nxt = goto[node].get(token)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][token] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append((index, len(tokens)))
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and token not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(token, 0)
+                fail[child] = target if target != child else 0
+                out[child] = out[child] + out[fail[child]]
+        return cls(goto, fail, out, list(terms))
+
+    def to_json(self):
+        return {
+            'format': AUTOMATON_FORMAT,
+            'terms': self.terms,
+            'goto': self.goto,
+            'fail': self.fail,
+            'out': self.out,
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        out = [[tuple(pair) for pair in node] for node in data['out']]
+        return cls(data['goto'], data['fail'], out, data['terms'])
+
+    def scan(self, text):
+        """
+        Yield (term index, start offset, end offset) for every term occurrence
+
+        Overlapping occurrences are all reported.
+        """
+        tokens = tokenize(text)
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        for position, (token, _, end) in enumerate(tokens):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            for index, length in out[node]:
+                yield index, tokens[position - length + 1][1], end
+
+
+def config_digest(terms_by_kind):
+    """Stable hash of the term lists (the automaton cache key)"""
+    return content_hash(json.dumps(terms_by_kind, sort_keys=True))[:16]
+
+
+def compile_terms(terms_by_kind, cache_dir=AUTOMATON_CACHE_DIR):
+    """
+    Automaton and per-term kinds for a brand config, reusing a cached build
+
+    Compiled automata are memoized in-process and persisted as JSON under
+    cache_dir keyed by the config hash, so a large brand book is compiled
+    once rather than on every check.
+    """
+    digest = config_digest(terms_by_kind)
+    if digest in _automata:
+        return _automata[digest]
+
+    terms, kinds = [], []
+    for kind in TERM_KINDS:
+        for term in terms_by_kind.get(kind, []):
+            terms.append(term)
+            kinds.append(kind)
+
+    automaton = None
+    cache_path = Path(cache_dir) / f"automaton-{digest}.json" if cache_dir else None
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == AUTOMATON_FORMAT and data.get('terms') == terms:
+                automaton = TermAutomaton.from_json(data)
+        except (OSError, ValueError, KeyError):
+            automaton = None
+
+    if automaton is None:
+        automaton = TermAutomaton.build(terms)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(automaton.to_json(), f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
+
+    _automata[digest] = (automaton, kinds)
+    return _automata[digest]
+
+
+def scan_block(automaton, kinds, content):
+    """(term index, line, column, line text) of every term in content; lines only for prohibited terms"""
+    lines = LineIndex(content)
+    hits = []
+    for index, start, _ in automaton.scan(content):
+        if kinds[index] == 'prohibited':
+            line, column = lines.position(start)
+            hits.append((index, line, column, lines.line_text(line)))
+        else:
+            hits.append((index, None, None, None))
+    return hits
+
+
+def check_brand_terms(content, terms_by_kind, cache_dir=AUTOMATON_CACHE_DIR, blocks=None):
+    """
+    Scan content once for every configured term
+
+    With blocks (content split into Blocks, see lisa_quality.blocks), each
+    block is scanned on its own, so a term never spans two blocks.
+
+    Returns:
+        dict with
+          'prohibited': {term: [(line, column, line_text), ...]} for terms found
+          'missing_required': [term, ...] required terms never found
+          'approved': {term: count} approved terms found
+    """
+    automaton, kinds = compile_terms(terms_by_kind, cache_dir)
+    digest = config_digest(terms_by_kind)
+
+    prohibited, approved, found = {}, {}, set()
+    for block in blocks if blocks is not None else [Block(content)]:
+        hits = analyze_block('brand', block, lambda text: scan_block(automaton, kinds, text), digest)
+        for index, line, column, line_text in hits:
+            term, kind = automaton.terms[index], kinds[index]
+            found.add(index)
+            if kind == 'prohibited':
+                prohibited.setdefault(term, []).append((block.line + line - 1, column, line_text))
+            elif kind == 'approved':
+                approved[term] = approved.get(term, 0) + 1
+
+    missing_required = [term for index, term in enumerate(automaton.terms)
+                        if kinds[index] == 'required' and index not in found]
+
+    return {'prohibited': prohibited, 'missing_required': missing_required, 'approved': approved}
@@ -0,0 +1,68 @@
+"""
+Per-check time budgets
+Stops a check that runs past its wall-clock budget (a pathological document,
+a catastrophic pattern in a custom rule pack) and reports it as timed out,
+so a single check can never hang the campaign loop
+
+Budgets use SIGALRM. The regex engine checks for pending signals while it
+matches, so even a backtracking pattern is interrupted, and the check runs
+in-process with the shared Document intact. Where SIGALRM is unavailable
+(Windows, or outside the main thread) checks run without a budget.
+"""
+
+import os
+import signal
+import threading
+import contextlib
+
+TIMEOUT_ENV_VAR = 'LISA_CHECK_TIMEOUT'
+DEFAULT_TIMEOUT = 30.0
+
+# Same convention as coreutils timeout(1)
+TIMEOUT_EXIT_CODE = 124
+
+
+class CheckTimeout(Exception):
+    """A check ran past its time budget"""
+
+    def __init__(self, seconds):
+        super().__init__(f"exceeded its {seconds:g}s time budget")
+        self.seconds = seconds
+
+
+def default_timeout():
+    """Budget in seconds from $LISA_CHECK_TIMEOUT, else DEFAULT_TIMEOUT (0 = none)"""
+    value = os.environ.get(TIMEOUT_ENV_VAR)
+    if not value:
+        return DEFAULT_TIMEOUT
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return DEFAULT_TIMEOUT
+
+
+def budget_supported():
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+@contextlib.contextmanager
+def time_budget(seconds):
+    """
+    Raise CheckTimeout inside the block once it has run for seconds
+
+    A falsy or zero budget, or a platform without SIGALRM, means no limit.
+    """
+    if not seconds or seconds <= 0 or not budget_supported():
+        yield
+        return
+
+    def expire(signum, frame):
+        raise CheckTimeout(seconds)
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
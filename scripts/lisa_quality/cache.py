@@ -0,0 +1,185 @@
+"""
+Check result cache
+Persistent, size-bounded cache of quality check results keyed by content
+hash, check name, check code version and check configuration, so unchanged
+deliverables skip re-checking across campaign iterations
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import contextlib
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: evictions are not serialized
+    fcntl = None
+
+DEFAULT_CACHE_DIR = os.path.join('.claude', 'lisa-check-cache')
+CACHE_DIR_ENV_VAR = 'LISA_CHECK_CACHE_DIR'
+CACHE_DISABLE_ENV_VAR = 'LISA_CHECK_CACHE'
+
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = PACKAGE_DIR.parent
+
+_version_cache = {}
+
+
+def content_hash(content):
+    """SHA-256 of text or bytes content"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_hash(path):
+    """SHA-256 of a file's bytes, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except OSError:
+        return None
+
+
+def code_version(script_name):
+    """
+    Version of a check's code: hash of its script, the shared library and
+    the bundled data files next to the scripts (rule packs, brand config)
+
+    Any edit to the check or to lisa_quality invalidates cached results, so
+    there is no version number to forget to bump.
+    """
+    if script_name not in _version_cache:
+        digest = hashlib.sha256()
+        paths = ([SCRIPTS_DIR / script_name] + sorted(PACKAGE_DIR.glob('*.py'))
+                 + sorted(SCRIPTS_DIR.glob('*.json')))
+        for path in paths:
+            digest.update(path.name.encode('utf-8'))
+            digest.update((file_hash(path) or '').encode('utf-8'))
+        _version_cache[script_name] = digest.hexdigest()[:16]
+    return _version_cache[script_name]
+
+
+def cache_enabled():
+    """Caching is on unless $LISA_CHECK_CACHE is set to 0/off/false"""
+    return os.environ.get(CACHE_DISABLE_ENV_VAR, '1').lower() not in ('0', 'off', 'false', 'no')
+
+
+class ResultCache:
+    """
+    On-disk cache of JSON-serializable check results
+
+    One file per entry under the cache directory. Reads refresh the entry's
+    mtime, and writes evict least-recently-used entries once the cache holds
+    more than max_entries files or max_bytes bytes.
+    """
+
+    def __init__(self, directory=None, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory or os.environ.get(CACHE_DIR_ENV_VAR) or DEFAULT_CACHE_DIR)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(check, content_digest, version, config=None):
+        """Combine everything a result depends on into one cache key"""
+        material = json.dumps(
+            {'check': check, 'content': content_digest, 'version': version, 'config': config or {}},
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached result for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get('result')
+
+    def put(self, key, check, result):
+        """Store a result atomically, then evict old entries if over budget"""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'check': check, 'stored_at': time.time(), 'result': result}, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # A cache that can't be written is just a cache miss next time
+            return
+        self.evict()
+
+    @contextlib.contextmanager
+    def _eviction_lock(self):
+        """
+        Yield whether this process may evict: campaigns running in parallel
+        share the cache, and one trimming it at a time is enough (the others
+        skip rather than wait)
+        """
+        if fcntl is None:
+            yield True
+            return
+        try:
+            lock_file = open(self.directory / '.evict.lock', 'a')
+        except OSError:
+            yield False
+            return
+        with lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def evict(self):
+        """Delete least-recently-used entries until within both limits"""
+        with self._eviction_lock() as acquired:
+            if acquired:
+                self._evict()
+
+    def _evict(self):
+        try:
+            entries = []
+            for path in self.directory.glob('*.json'):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            return
+        total_bytes = sum(size for _, size, _ in entries)
+        if len(entries) <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+        entries.sort()
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total_bytes -= size
+
+    def clear(self):
+        """Remove every cached entry"""
+        for path in self.directory.glob('*.json'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,34 @@
+"""
+Check script loader
+Imports the hyphenated check scripts (readability-check.py, ...) as modules
+so runners can call their functions in-process
+"""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+# Check name -> script file, for everything that can run in-process
+CHECK_SCRIPTS = {
+    'brand': 'brand-check.py',
+    'readability': 'readability-check.py',
+    'seo': 'seo-check.py',
+    'accessibility': 'accessibility-check.py',
+    'ap-style': 'ap-style-check.py',
+    'gates': 'quality-gates.py',
+}
+
+_modules = {}
+
+
+def load_check_module(script_name):
+    """Import a hyphenated check script (e.g. seo-check.py) as a module, once"""
+    if script_name not in _modules:
+        path = SCRIPTS_DIR / script_name
+        module_name = script_name[:-3].replace('-', '_')
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[script_name] = module
+    return _modules[script_name]
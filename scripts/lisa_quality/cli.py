@@ -0,0 +1,57 @@
+"""
+Command-line helpers
+Shared by the check scripts, which wrap the check API for the shell
+"""
+
+import sys
+
+from .report import DEFAULT_TOKEN_BUDGET, FORMATS, all_passed, normalize, render_report
+
+
+def exit_with_error(error):
+    """Print a QualityCheckError the way the scripts always have, then exit"""
+    print(f"❌ Error: {error}", file=sys.stderr)
+    for line in error.details:
+        print(f"   {line}", file=sys.stderr)
+    sys.exit(error.exit_code)
+
+
+def print_issues(issues, stream, indent="  ", lines=False):
+    """
+    One issue per line (multi-line issues keep their indentation); with
+    lines, issues that know their line but show no location end with it
+    """
+    for issue in issues:
+        text = str(issue)
+        if lines and issue.line is not None and not issue.rule:
+            text += f" (line {issue.line})"
+        print(indent + text.replace("\n", "\n" + indent), file=stream)
+
+
+def add_report_arguments(parser):
+    """--format, --compact and --max-tokens, shared by every check script"""
+    group = parser.add_argument_group('report format')
+    group.add_argument('--format', choices=FORMATS, default='text', dest='output_format',
+                       help='text (default), json, or sarif (SARIF 2.1.0 for code scanning)')
+    group.add_argument('--compact', action='store_true',
+                       help='Deduplicated, ranked findings cut to a token budget (text or json; '
+                            'ignored with --format sarif, which always lists every finding)')
+    group.add_argument('--max-tokens', type=int, metavar='N',
+                       help=f'Token budget for --compact (default: {DEFAULT_TOKEN_BUDGET}; implies --compact; '
+                            'ignored with --format sarif)')
+
+
+def wants_report(args):
+    """Whether to print a rendered report instead of the human-readable output"""
+    return args.output_format != 'text' or args.compact or args.max_tokens is not None
+
+
+def print_report(args, results, **fields):
+    """Print results in the requested report format on stdout, then exit 0 or 1"""
+    print(render_report(
+        results, args.file, args.output_format,
+        compact=args.compact or args.max_tokens is not None,
+        max_tokens=args.max_tokens or DEFAULT_TOKEN_BUDGET,
+        **fields,
+    ))
+    sys.exit(0 if all_passed([normalize(result) for result in results]) else 1)
@@ -0,0 +1,152 @@
+"""
+Shared document model
+Reads a deliverable once and lazily builds the views each quality gate needs
+(raw source, rendered HTML, parsed HTML tree, plain text, and the blocks the
+checks analyze incrementally)
+"""
+
+import re
+import time
+import bisect
+from pathlib import Path
+
+from .cache import content_hash
+
+MARKDOWN_EXTENSIONS = ('.md', '.markdown')
+HTML_EXTENSIONS = ('.html', '.htm')
+
+
+class LineIndex:
+    """Maps character offsets to 1-based (line, column)"""
+
+    def __init__(self, text):
+        self.text = text
+        self.starts = [0] + [m.end() for m in re.finditer(r'\n', text)]
+
+    def position(self, offset):
+        line = bisect.bisect_right(self.starts, offset) - 1
+        return line + 1, offset - self.starts[line] + 1
+
+    def line_text(self, line):
+        start = self.starts[line - 1]
+        end = self.starts[line] - 1 if line < len(self.starts) else len(self.text)
+        return self.text[start:end]
+
+
+class Document:
+    """
+    A deliverable parsed once and shared by every gate
+
+    Views are computed on first access and cached, so a gate that only needs
+    the raw source (AP Style, brand compliance) never pays for HTML parsing.
+    parse_seconds adds up the time spent building views, including splitting
+    the source into blocks and converting new blocks to plain text or an
+    HTML outline, so callers can tell parsing from checking.
+    """
+
+    def __init__(self, content, path=None):
+        self.path = str(path) if path is not None else None
+        self.content = content
+        suffix = Path(self.path).suffix.lower() if self.path else ''
+        self.is_markdown = suffix in MARKDOWN_EXTENSIONS
+        self.is_html = suffix in HTML_EXTENSIONS
+        self._html = None
+        self._soup = None
+        self._text = None
+        self._plain = None
+        self._content_hash = None
+        self._blocks = None
+        self._outlines = None
+        self.parse_seconds = 0.0
+
+    @property
+    def content_hash(self):
+        """SHA-256 of the source, used as the result cache key"""
+        if self._content_hash is None:
+            self._content_hash = content_hash(self.content)
+        return self._content_hash
+
+    @property
+    def html(self):
+        """HTML rendering of the source (markdown converted, plain text wrapped)"""
+        if self._html is None:
+            started = time.perf_counter()
+            if self.is_markdown:
+                import markdown
+                self._html = markdown.markdown(self.content)
+            elif self.is_html:
+                self._html = self.content
+            else:
+                # Assume plain text, wrap in HTML
+                self._html = f"<div>{self.content}</div>"
+            self.parse_seconds += time.perf_counter() - started
+        return self._html
+
+    @property
+    def soup(self):
+        """BeautifulSoup tree of the HTML rendering"""
+        if self._soup is None:
+            html = self.html
+            started = time.perf_counter()
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(html, 'html.parser')
+            self.parse_seconds += time.perf_counter() - started
+        return self._soup
+
+    @property
+    def text(self):
+        """Text content of the HTML rendering (used for keyword density)"""
+        if self._text is None:
+            soup = self.soup
+            started = time.perf_counter()
+            self._text = soup.get_text()
+            self.parse_seconds += time.perf_counter() - started
+        return self._text
+
+    @property
+    def plain(self):
+        """PlainText view: formatting stripped, with offsets mapped back to the source"""
+        if self._plain is None:
+            started = time.perf_counter()
+            from .plaintext import to_plain_text
+            self._plain = to_plain_text(self.content)
+            self.parse_seconds += time.perf_counter() - started
+        return self._plain
+
+    @property
+    def blocks(self):
+        """The source as Blocks (see lisa_quality.blocks); an HTML document is one block"""
+        if self._blocks is None:
+            started = time.perf_counter()
+            from .blocks import Block, split_blocks
+            self._blocks = [Block(self.content)] if self.is_html else split_blocks(self.content)
+            self.parse_seconds += time.perf_counter() - started
+        return self._blocks
+
+    @property
+    def outlines(self):
+        """HTML Outline of every block, parsed per block and memoized by block hash"""
+        if self._outlines is None:
+            started = time.perf_counter()
+            from .blocks import block_outlines
+            self._outlines = block_outlines(self)
+            self.parse_seconds += time.perf_counter() - started
+        return self._outlines
+
+    @property
+    def plain_text(self):
+        """Source with markdown/HTML formatting stripped (used for readability)"""
+        return self.plain.text
+
+
+def load_document(file_path):
+    """
+    Read a deliverable from disk into a Document
+
+    Raises:
+        FileNotFoundError: if the file does not exist
+        OSError / UnicodeDecodeError: if the file cannot be read as UTF-8
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return Document(content, path=file_path)
@@ -0,0 +1,44 @@
+"""
+Check errors
+Exceptions raised when a check cannot produce a result. The command-line
+scripts turn them into an error message and exit code; library callers
+catch them like any other exception.
+"""
+
+INSTALL_HINT = "Or: pip install -r scripts/requirements.txt"
+
+
+class QualityCheckError(Exception):
+    """
+    A check could not run
+
+    details holds extra lines of explanation (shown indented under the
+    message); exit_code is what a command-line script exits with.
+    """
+
+    exit_code = 1
+
+    def __init__(self, message, details=()):
+        super().__init__(message)
+        self.details = tuple(details)
+
+
+class DocumentError(QualityCheckError):
+    """The deliverable is missing, unreadable or has no text to check"""
+
+
+class ConfigurationError(QualityCheckError):
+    """Bad check configuration: brand config, rule pack, keyword list"""
+
+    exit_code = 2
+
+
+class DependencyError(QualityCheckError):
+    """A library the check needs is not installed"""
+
+    def __init__(self, library):
+        super().__init__(
+            f"{library} library not installed",
+            (f"Install with: pip install {library}", INSTALL_HINT),
+        )
+        self.library = library
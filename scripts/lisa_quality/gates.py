@@ -0,0 +1,45 @@
+"""
+Quality gate matrix
+Which gates each discipline runs (mirrors the matrix in QUALITY-GATES.md)
+"""
+
+from .checks import CHECK_SCRIPTS
+
+# Order matters: gates run (and are reported) in this order
+GATE_MATRIX = {
+    'marketing': ['brand', 'readability', 'seo', 'accessibility'],
+    'pr': ['brand', 'readability', 'ap-style'],
+    'branding': ['brand', 'accessibility'],
+}
+
+GATE_LABELS = {
+    'brand': 'Brand compliance',
+    'readability': 'Readability',
+    'seo': 'SEO',
+    'accessibility': 'Accessibility',
+    'ap-style': 'AP Style',
+}
+
+# Gate outcomes, and the ones that block approval
+STATUS_ICONS = {
+    'passed': '✅',
+    'failed': '❌',
+    'error': '❌',
+    'skipped': '⏭️ ',
+    'timed_out': '⏱️ ',
+}
+FAILING_STATUSES = ('failed', 'error', 'timed_out')
+
+
+# Script implementing each gate (its source hash versions cached results)
+GATE_SCRIPTS = {gate: CHECK_SCRIPTS[gate] for gate in GATE_LABELS}
+
+
+def gates_for_discipline(discipline):
+    """Return the ordered gate list for a campaignType, or raise ValueError"""
+    try:
+        return list(GATE_MATRIX[discipline])
+    except KeyError:
+        raise ValueError(
+            f"Unknown discipline '{discipline}' (expected: {', '.join(GATE_MATRIX)})"
+        ) from None
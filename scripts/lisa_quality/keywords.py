@@ -0,0 +1,164 @@
+"""
+Keyword index
+Tokenizes a deliverable once and answers counts, density and placement for
+any number of target keywords from an n-gram frequency index
+
+Keywords are matched on whole words: the text and each keyword are split
+into lower-case word tokens, so "art" never counts inside "start" and
+"read-only" matches "read only". Density is the share of all words that
+belong to keyword occurrences (count x keyword length / total words).
+"""
+
+import re
+from collections import Counter
+
+from .errors import ConfigurationError
+
+WORD = re.compile(r'\w+')
+
+# Markdown/frontmatter meta description ("description: ...")
+META_DESCRIPTION = re.compile(
+    r'(?:meta[_ ]?description|description):\s*["\']?([^"\'\n]+)["\']?', re.IGNORECASE
+)
+
+PLACEMENTS = ('h1', 'h2', 'meta', 'first_paragraph')
+
+_indexes = {}
+_INDEX_CACHE_SIZE = 32
+
+
+def tokenize(text):
+    """Lower-case word tokens"""
+    return WORD.findall(text.lower())
+
+
+def _contains(tokens, phrase):
+    """Whether the token list contains the phrase tokens contiguously"""
+    size = len(phrase)
+    first = phrase[0]
+    return any(
+        token == first and tokens[index:index + size] == phrase
+        for index, token in enumerate(tokens)
+    )
+
+
+def meta_description(document):
+    """Meta description from an HTML meta tag or markdown metadata, else None"""
+    meta_tag = next((outline.meta for outline in document.outlines if outline.meta is not None), None)
+    if meta_tag is not None:
+        return meta_tag
+    meta_match = META_DESCRIPTION.search(document.content)
+    if meta_match:
+        return meta_match.group(1).strip()
+    return None
+
+
+class KeywordStats:
+    """How one keyword is used in a document"""
+
+    def __init__(self, keyword, count, density, placements):
+        self.keyword = keyword
+        self.count = count
+        self.density = density
+        self.placements = placements
+
+    @property
+    def missing_placements(self):
+        return [place for place in PLACEMENTS if not self.placements[place]]
+
+
+class KeywordIndex:
+    """
+    N-gram frequency index over a document's text, plus the tokens of the
+    places a keyword should appear (H1, H2s, meta description, first
+    paragraph)
+
+    N-gram counts are built per phrase length on first use, so a keyword
+    set of one-, two- and three-word phrases walks the tokens three times
+    however many keywords it has.
+    """
+
+    def __init__(self, tokens, placements=None):
+        self.tokens = tokens
+        self.total_words = len(tokens)
+        self.placements = placements or {}
+        self._ngrams = {}
+
+    @classmethod
+    def from_document(cls, document):
+        """Index assembled from the document's block outlines (see lisa_quality.outline)"""
+        outlines = document.outlines
+        headings = [heading for outline in outlines for heading in outline.headings]
+        paragraph = next((outline.paragraph for outline in outlines if outline.paragraph is not None), None)
+        placements = {
+            'h1': [tokenize(text) for level, text, _ in headings if level == 1],
+            'h2': [tokenize(text) for level, text, _ in headings if level == 2],
+            'meta': [tokenize(meta_description(document) or '')],
+            'first_paragraph': [tokenize(paragraph) if paragraph is not None else []],
+        }
+        return cls([token for outline in outlines for token in outline.tokens], placements)
+
+    def ngrams(self, size):
+        """Counter of size-token tuples"""
+        counts = self._ngrams.get(size)
+        if counts is None:
+            tokens = self.tokens
+            counts = Counter(zip(*(tokens[offset:] for offset in range(size))))
+            self._ngrams[size] = counts
+        return counts
+
+    def count(self, keyword):
+        """Whole-word occurrences of keyword"""
+        phrase = tuple(tokenize(keyword))
+        if not phrase:
+            return 0
+        return self.ngrams(len(phrase))[phrase]
+
+    def stats(self, keyword):
+        phrase = tokenize(keyword)
+        if not phrase:
+            return KeywordStats(keyword, 0, 0.0, {place: False for place in PLACEMENTS})
+        count = self.ngrams(len(phrase))[tuple(phrase)]
+        density = count * len(phrase) / self.total_words * 100 if self.total_words else 0.0
+        placements = {
+            place: any(_contains(tokens, phrase) for tokens in self.placements.get(place, ()))
+            for place in PLACEMENTS
+        }
+        return KeywordStats(keyword, count, density, placements)
+
+    def analyze(self, keywords):
+        """KeywordStats for each keyword, in order"""
+        return [self.stats(keyword) for keyword in keywords]
+
+
+def read_keywords_file(path):
+    """Keywords from a file, one per line ('#' comments and blank lines skipped)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+    except OSError as e:
+        raise ConfigurationError(f"Could not read keywords file: {e}") from None
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def format_keyword_table(stats):
+    """One line per keyword: count, density and where it appears"""
+    width = max(len('keyword'), *(len(keyword.keyword) for keyword in stats))
+    lines = [f"  {'keyword':<{width}}  count  density  H1  H2  meta  first para"]
+    for keyword in stats:
+        marks = ['✓' if keyword.placements[place] else '·' for place in PLACEMENTS]
+        lines.append(f"  {keyword.keyword:<{width}}  {keyword.count:>5}  {keyword.density:>6.2f}%  "
+                     f"{marks[0]:<2}  {marks[1]:<2}  {marks[2]:<4}  {marks[3]}")
+    return lines
+
+
+def index_document(document):
+    """KeywordIndex for a Document, memoized by content and format"""
+    key = (document.content_hash, document.is_markdown, document.is_html)
+    index = _indexes.get(key)
+    if index is None:
+        index = KeywordIndex.from_document(document)
+        if len(_indexes) >= _INDEX_CACHE_SIZE:
+            _indexes.clear()
+        _indexes[key] = index
+    return index
@@ -0,0 +1,274 @@
+"""
+Streaming HTML outline
+Reads what the SEO and accessibility checks need from a block's HTML in one
+pass over html.parser events, without building a tree: headings, images and
+links with the line they start on, the first paragraph, the meta
+description and title tags, and the word tokens of the text. Memory grows
+with what is collected, not with the markup, so megabyte landing pages and
+brand guideline exports outline in a single streaming pass.
+
+Element text is what BeautifulSoup's html.parser tree would give for
+tag.get_text(): an end tag closes the most recent open element of its name
+and everything opened inside it, void elements close at once, text runs of
+only whitespace collapse to one space or newline outside <pre> and
+<textarea>, and the text of <script>, <style>, <template>, <rt> and <rp>
+belongs to no element.
+"""
+
+import re
+from collections import Counter
+from html.entities import html5
+from html.parser import HTMLParser
+
+from .keywords import tokenize
+
+HEADING_TAG = re.compile('^h[1-6]$')
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem', 'meta',
+    'param', 'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame', 'image', 'isindex',
+    'nextid', 'spacer',
+})
+PRESERVE_WHITESPACE = frozenset({'pre', 'textarea'})
+HIDDEN_TEXT = frozenset({'script', 'style', 'template', 'rt', 'rp'})
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+ENTITIES = {name[:-1]: text for name, text in html5.items() if name.endswith(';')}
+
+_markdown = None
+
+
+def render_html(source, source_format):
+    """HTML for source: markdown converted, HTML as is, plain text wrapped"""
+    global _markdown
+    if source_format == 'markdown':
+        if _markdown is None:
+            import markdown
+            _markdown = markdown.Markdown()
+        return _markdown.reset().convert(source)
+    if source_format == 'html':
+        return source
+    return f"<div>{source}</div>"
+
+
+class Capture:
+    """Text collected for one open element"""
+
+    __slots__ = ('parts', 'open')
+
+    def __init__(self):
+        self.parts = []
+        self.open = True
+
+    @property
+    def text(self):
+        return ''.join(self.parts)
+
+
+class OutlineParser(HTMLParser):
+    """
+    html.parser events to outline fields
+
+    The only state kept is the stack of open element names, the Captures of
+    the open elements being collected, and the current text run. Paragraphs
+    are only collected until the first one with text is known.
+    """
+
+    def __init__(self, lines=True):
+        super().__init__(convert_charrefs=False)
+        self.lines = lines
+        self.headings = []
+        self.images = []
+        self.links = []
+        self.paragraph = None
+        self.meta = None
+        self.title = None
+        self.text = []
+        self._paragraphs = []
+        self._stack = []
+        self._open = Counter()
+        self._capturing = []
+        self._closed_void = []
+        self._run = []
+        self._preserve = 0
+        self._hidden = 0
+
+    def handle_starttag(self, tag, attrs, void=True):
+        self._end_run()
+        attributes = {name: '' if value is None else value for name, value in attrs}
+        line = self.getpos()[0] if self.lines else None
+        capture = None
+        if HEADING_TAG.match(tag):
+            capture = Capture()
+            self.headings.append((int(tag[1]), capture, line))
+        elif tag == 'a':
+            capture = Capture()
+            self.links.append((capture, attributes.get('href'), line))
+        elif tag == 'img':
+            self.images.append((attributes.get('src', 'unknown'), attributes.get('alt', ''), line))
+        elif tag == 'p' and self.paragraph is None:
+            capture = Capture()
+            self._paragraphs.append(capture)
+        elif tag == 'title' and self.title is None:
+            capture = self.title = Capture()
+        elif tag == 'meta' and self.meta is None and attributes.get('name') == 'description':
+            self.meta = attributes.get('content', '')
+
+        self._stack.append((tag, capture))
+        self._open[tag] += 1
+        if capture is not None:
+            self._capturing.append(capture)
+        if tag in PRESERVE_WHITESPACE:
+            self._preserve += 1
+        if tag in HIDDEN_TEXT:
+            self._hidden += 1
+        if void and tag in VOID_ELEMENTS:
+            # html.parser sends no end event for <img>; a later </img> is ignored
+            self._pop_to(tag)
+            self._closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, void=False)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+            return
+        self._end_run()
+        self._pop_to(tag)
+
+    def handle_data(self, data):
+        self._run.append(data)
+
+    def handle_charref(self, name):
+        number = int(name[1:], 16) if name[:1] in ('x', 'X') else int(name)
+        data = None
+        if number < 256:
+            # &#147; and friends mean Windows-1252, not Unicode, in practice
+            try:
+                data = bytes([number]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(number)
+            except (ValueError, OverflowError):
+                pass
+        self.handle_data(data or '\N{REPLACEMENT CHARACTER}')
+
+    def handle_entityref(self, name):
+        self.handle_data(ENTITIES.get(name, f"&{name}"))
+
+    def handle_comment(self, data):
+        self._end_run()
+
+    def handle_decl(self, decl):
+        self._end_run()
+
+    def handle_pi(self, data):
+        self._end_run()
+
+    def unknown_decl(self, data):
+        self._end_run()
+        if data.upper().startswith('CDATA['):
+            self._run.append(data[len('CDATA['):])
+            self._end_run(cdata=True)
+
+    def close(self):
+        super().close()
+        self._end_run()
+        while self._stack:
+            self._pop()
+
+    def _end_run(self, cdata=False):
+        """Add the current text run to the text of every open element"""
+        if not self._run:
+            return
+        data = ''.join(self._run)
+        self._run = []
+        if not self._preserve and not data.strip(ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        if self._hidden and not cdata:
+            return
+        self.text.append(data)
+        for capture in self._capturing:
+            capture.parts.append(data)
+
+    def _pop_to(self, tag):
+        """Close the most recent open tag element and everything opened inside it"""
+        if not self._open[tag]:
+            return
+        while self._pop() != tag:
+            pass
+
+    def _pop(self):
+        tag, capture = self._stack.pop()
+        self._open[tag] -= 1
+        if tag in PRESERVE_WHITESPACE:
+            self._preserve -= 1
+        if tag in HIDDEN_TEXT:
+            self._hidden -= 1
+        if capture is not None:
+            self._capturing.pop()
+            capture.open = False
+            if tag == 'p':
+                self._settle_paragraph()
+        return tag
+
+    def _settle_paragraph(self):
+        """Take the first paragraph with text once every paragraph before it has closed"""
+        while self._paragraphs and not self._paragraphs[0].open:
+            text = self._paragraphs.pop(0).text
+            if text.strip():
+                self.paragraph = text
+                self._paragraphs = []
+
+
+class Outline:
+    """
+    What the SEO and accessibility checks read from a block's HTML:
+    headings as (level, text, line), images as (src, alt, line), links as
+    (text, href, line), the first paragraph, the meta description and title
+    tags (None when absent), and the word tokens of its text
+
+    Lines are 1-based lines of the parsed HTML, or None for markdown, whose
+    HTML is rendered rather than written.
+    """
+
+    def __init__(self, headings, images, links, paragraph, meta, title, tokens):
+        self.headings = headings
+        self.images = images
+        self.links = links
+        self.paragraph = paragraph
+        self.meta = meta
+        self.title = title
+        self.tokens = tokens
+
+    @classmethod
+    def parse(cls, source, source_format):
+        parser = OutlineParser(lines=source_format != 'markdown')
+        parser.feed(render_html(source, source_format))
+        parser.close()
+        return cls(
+            [(level, capture.text, line) for level, capture, line in parser.headings],
+            parser.images,
+            [(capture.text, href, line) for capture, href, line in parser.links],
+            parser.paragraph,
+            parser.meta,
+            parser.title.text if parser.title is not None else None,
+            tokenize(''.join(parser.text)),
+        )
+
+    def moved(self, lines):
+        """This outline with its element lines moved down by lines"""
+        if not lines:
+            return self
+
+        def move(line):
+            return line + lines if line is not None else None
+
+        return Outline(
+            [(level, text, move(line)) for level, text, line in self.headings],
+            [(src, alt, move(line)) for src, alt, line in self.images],
+            [(text, href, move(line)) for text, href, line in self.links],
+            self.paragraph, self.meta, self.title, self.tokens,
+        )
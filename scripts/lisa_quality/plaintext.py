@@ -0,0 +1,190 @@
+"""
+Markdown to plain text
+Single-pass tokenizer that strips markdown/HTML formatting and keeps a map
+from every plain-text offset back to its offset in the source, so findings
+on the plain text (a hard sentence, a keyword) can point at source lines
+
+One master pattern matches every markup construct; the source is walked
+once with finditer, text between constructs is copied through unchanged,
+and constructs that keep part of their content (link text, image alt text,
+emphasis) re-enter the same walk over just that span. Output matches the
+previous strip_markdown() regex cascade except where the cascade was wrong:
+images are handled before links (so ![alt](src) becomes "alt", not "!alt"),
+intra-word underscores (snake_case) are not treated as emphasis, and a bare
+"###" separator line is removed rather than kept as text.
+"""
+
+import re
+import bisect
+
+from .document import LineIndex
+
+# Line prefixes removed at the start of a line: horizontal rules, heading
+# markers and list markers. A list marker right after a heading marker is
+# removed too ("### 1. Title"), as is one that only becomes line-initial once
+# emphasis is removed ("**1. Title**")
+LINE_PREFIX = r'''
+    [-*_]{3,}$
+  | \#{1,6}(?:[ \t]+(?:[-*+][ \t]+|\d+\.[ \t]+)?|$)
+  | [ \t]*[-*+][ \t]+(?:\d+\.[ \t]+)?
+  | [ \t]*\d+\.[ \t]+
+'''
+
+# Named alternatives, tried in order at each position. Every alternative
+# starts with a literal character (line prefixes are matched together with
+# the newline before them), which lets the regex engine skip plain text
+# quickly. Every pattern runs in linear time: delimited spans exclude their
+# own opening delimiter and line prefixes never skip across newlines.
+MARKUP = re.compile(r'''
+    (?P<fence>```[\s\S]*?```)
+  | (?P<code>`[^`]+`)
+  | (?P<tag></?[A-Za-z][^<>]*>|<![^<>]*>)
+  | !\[(?P<image>[^\[\]]*)\]\([^()]+\)
+  | \[(?P<link>[^\[\]]+)\]\([^()]+\)
+  | \*\*(?P<strong>[^*]+)\*\*
+  | \*(?P<em>[^*]+)\*
+  | __(?<!\w__)(?P<strong_u>[^_]+)__(?!\w)
+  | _(?<!\w_)(?P<em_u>[^_]+)_(?!\w)
+  | \n(?:(?P<blank>(?:[^\S\n]*\n)+)(?:''' + LINE_PREFIX + r''')?
+        |(?P<prefix>''' + LINE_PREFIX + r'''))
+''', re.MULTILINE | re.VERBOSE)
+
+START_PREFIX = re.compile(LINE_PREFIX, re.MULTILINE | re.VERBOSE)
+LIST_MARKER = re.compile(r'[ \t]*(?:[-*+]|\d+\.)[ \t]+')
+
+HTML_HEADING = re.compile(r'<h([1-6])\b', re.IGNORECASE)
+
+# Characters that can start markup inside a kept span
+MARKUP_START = re.compile(r'[`<!\[*_\n]')
+
+# Constructs whose inner span is kept (and itself tokenized)
+KEEP_GROUPS = frozenset(('image', 'link', 'strong', 'em', 'strong_u', 'em_u'))
+
+
+class PlainText:
+    """
+    Plain-text view of a source document with an offset map back to it
+
+    segments holds (plain offset, source offset) pairs, one per run of text
+    copied from the source: plain offset p maps to source offset
+    source + (p - plain) for the last segment starting at or before p.
+    headings holds (plain offset, level) for each markdown or HTML heading,
+    the offset being where the heading's text starts.
+    """
+
+    def __init__(self, source, text, segments, headings=None):
+        self.source = source
+        self.text = text
+        self.segments = segments
+        self.headings = headings or []
+        self._plain_starts = [plain for plain, _ in segments]
+        self._lines = None
+
+    def source_offset(self, offset):
+        """Offset in the source of the character at plain-text offset"""
+        index = bisect.bisect_right(self._plain_starts, offset) - 1
+        if index < 0:
+            return 0
+        plain, source = self.segments[index]
+        return source + (offset - plain)
+
+    def source_position(self, offset):
+        """1-based (line, column) in the source of a plain-text offset"""
+        if self._lines is None:
+            self._lines = LineIndex(self.source)
+        return self._lines.position(self.source_offset(offset))
+
+
+def _heading_level(marker):
+    """Level of a heading line prefix ("\n\n## "), or 0 for other prefixes"""
+    marker = marker.lstrip()
+    return len(marker) - len(marker.lstrip('#'))
+
+
+def _tokenize(source, start, end, parts, segments, headings, length, line_start):
+    """
+    Append the plain text of source[start:end] to parts
+
+    line_start says whether only removed markup precedes start on its line.
+    Returns the new plain-text length.
+    """
+    position = start
+    if line_start:
+        marker = LIST_MARKER.match(source, position, end)
+        if marker:
+            position = marker.end()
+
+    add_part, add_segment = parts.append, segments.append
+    for m in MARKUP.finditer(source, position, end):
+        match_start = m.start()
+        if match_start > position:
+            add_segment((length, position))
+            add_part(source[position:match_start])
+            length += match_start - position
+            line_start = source[match_start - 1] == '\n'
+        kind = m.lastgroup
+        if kind in KEEP_GROUPS:
+            inner_start, inner_end = m.span(kind)
+            if line_start or MARKUP_START.search(source, inner_start, inner_end):
+                length = _tokenize(source, inner_start, inner_end, parts, segments, headings,
+                                   length, line_start)
+            elif inner_end > inner_start:
+                # Nothing to strip inside (the common case for link text and emphasis)
+                add_segment((length, inner_start))
+                add_part(source[inner_start:inner_end])
+                length += inner_end - inner_start
+            line_start = False
+        elif kind == 'blank' or kind == 'prefix':
+            # Line breaks already emitted with only removed markup since (a
+            # horizontal rule, a code fence) count toward this one, so blank
+            # lines collapse to one paragraph break as they did in the cascade
+            newlines = '\n\n' if kind == 'blank' else '\n'
+            if parts and parts[-1][-1] == '\n':
+                if parts[-1][-2:] == '\n\n':
+                    newlines = ''
+                elif kind == 'blank':
+                    newlines = '\n'
+            if newlines:
+                add_segment((length, match_start))
+                add_part(newlines)
+                length += len(newlines)
+            level = _heading_level(m.group())
+            # A bare "###" line is a separator, not a heading
+            if level and source[m.end():m.end() + 1].strip():
+                headings.append((length, level))
+            line_start = True
+        elif kind == 'tag':
+            heading = HTML_HEADING.match(m.group())
+            if heading:
+                headings.append((length, int(heading.group(1))))
+        position = m.end()
+
+    if position < end:
+        add_segment((length, position))
+        add_part(source[position:end])
+        length += end - position
+    return length
+
+
+def to_plain_text(source):
+    """Strip markdown/HTML formatting in one pass, keeping the offset map"""
+    parts, segments, headings = [], [], []
+    prefix = START_PREFIX.match(source)
+    level = _heading_level(prefix.group()) if prefix else 0
+    if level and source[prefix.end():prefix.end() + 1].strip():
+        headings.append((0, level))
+    _tokenize(source, prefix.end() if prefix else 0, len(source), parts, segments, headings,
+              0, True)
+    text = ''.join(parts)
+
+    # Trim surrounding whitespace, shifting the map to match
+    stripped = text.strip()
+    lead = len(text) - len(text.lstrip())
+    if lead:
+        index = bisect.bisect_right([plain for plain, _ in segments], lead) - 1
+        plain, offset = segments[index]
+        segments = [(0, offset + lead - plain)] + [
+            (plain - lead, offset) for plain, offset in segments[index + 1:]
+        ]
+        headings = [(max(plain - lead, 0), level) for plain, level in headings]
+    return PlainText(source, stripped, segments, headings)
@@ -0,0 +1,55 @@
+"""
+Check server protocol
+JSON-lines messages shared by quality-server.py and quality-client.py
+
+Request:  {"check": "readability", "args": ["file.md", "-t", "65"], "cwd": "/work",
+           "env": {"LISA_AP_STYLE_RULES": "house-style.json"}}
+          {"op": "ping"} | {"op": "shutdown"}
+Response: {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+"env" holds the client's FORWARDED_ENV_VARS (those it has set), so a check
+answers for the client's settings rather than those of whichever client
+started the server.
+
+Kept dependency-free so the client starts in milliseconds.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+from .api import RULE_PACKS_ENV_VAR
+from .cache import CACHE_DIR_ENV_VAR, CACHE_DISABLE_ENV_VAR
+
+SOCKET_ENV_VAR = 'LISA_QUALITY_SOCKET'
+
+# Settings the checks read from the environment, sent with every request
+FORWARDED_ENV_VARS = (RULE_PACKS_ENV_VAR, CACHE_DISABLE_ENV_VAR, CACHE_DIR_ENV_VAR)
+
+
+def default_socket_path():
+    """
+    Per-user, per-install socket path
+
+    Lives in the temp dir rather than the workspace because Unix socket paths
+    are limited to ~100 characters. Override with $LISA_QUALITY_SOCKET.
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return override
+    scripts_dir = str(Path(__file__).resolve().parent.parent)
+    install_id = hashlib.sha1(scripts_dir.encode('utf-8')).hexdigest()[:10]
+    uid = os.getuid() if hasattr(os, 'getuid') else 'user'
+    return os.path.join(tempfile.gettempdir(), f"lisa-quality-{uid}-{install_id}.sock")
+
+
+def encode(message):
+    """Serialize one message as a newline-terminated JSON line"""
+    return (json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def decode(line):
+    """Parse one JSON line back into a message"""
+    return json.loads(line.decode('utf-8'))
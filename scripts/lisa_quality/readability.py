@@ -0,0 +1,458 @@
+"""
+Readability engine
+Flesch Reading Ease and Flesch-Kincaid Grade for a whole document, each
+heading section and each sentence, assembled from per-block statistics so
+an edited document only re-scores the blocks that changed
+
+Counting follows textstat exactly (punctuation-stripped whitespace words,
+pyphen syllables, sentences of three or more words, one-decimal rounding of
+the averages), so document scores are identical to textstat's. Syllables
+are counted once per distinct word and cached for the life of the process.
+
+Batch mode (score_items) splits a deliverable of many short pieces, such as
+social posts or email variants, into items by heading, list item or
+separator line and scores each item on its own.
+"""
+
+import re
+import math
+import bisect
+from collections import Counter
+
+# textstat's sentence pattern and punctuation rule
+SENTENCE = re.compile(r'\b[^.!?]+[.!?]*')
+PUNCTUATION = re.compile(r'[^\w\s]')
+
+# Sentence-ending punctuation before a text's first word: ends a sentence
+# left open by the text before it
+LEADING_END = re.compile(r'[^\w.!?]*[.!?]')
+
+MIN_SENTENCE_WORDS = 3
+
+EXCERPT_LENGTH = 70
+
+ITEM_MODES = ('auto', 'heading', 'list', 'separator')
+
+# Source lines that delimit items (see split_items)
+FENCE_LINE = re.compile(r'[ \t]*```')
+HEADING_LINE = re.compile(r'(#{1,6})[ \t]+(.*?)[ \t#]*$')
+LIST_LINE = re.compile(r'(?:[-*+]|\d+\.)[ \t]+\S')
+SEPARATOR_LINE = re.compile(r'[ \t]*(?:-[ \t]*){3,}$|[ \t]*(?:\*[ \t]*){3,}$|[ \t]*(?:_[ \t]*){3,}$')
+
+SYLLABLE_CACHE_SIZE = 200000
+_syllables = {}
+_reports = {}
+_REPORT_CACHE_SIZE = 32
+
+
+def syllables(word):
+    """Syllables in a punctuation-free word (cached)"""
+    count = _syllables.get(word)
+    if count is None:
+        import textstat
+        count = textstat.syllable_count(word)
+        if len(_syllables) >= SYLLABLE_CACHE_SIZE:
+            _syllables.clear()
+        _syllables[word] = count
+    return count
+
+
+def _round(number, points):
+    """textstat's rounding: half away from zero"""
+    scale = 10 ** points
+    return float(math.floor(number * scale + math.copysign(0.5, number))) / scale
+
+
+class Scores:
+    """Word, sentence and syllable totals for a span of text"""
+
+    def __init__(self, words=0, sentences=0, syllables=0):
+        self.words = words
+        self.sentences = sentences
+        self.syllables = syllables
+
+    def add(self, other):
+        self.words += other.words
+        self.sentences += other.sentences
+        self.syllables += other.syllables
+
+    def _averages(self):
+        sentences = max(1, self.sentences)
+        if not self.words:
+            return 0.0, 0.0
+        return (_round(self.words / sentences, 1), _round(self.syllables / self.words, 1))
+
+    @property
+    def reading_ease(self):
+        """Flesch Reading Ease (higher is easier)"""
+        sentence_length, syllables_per_word = self._averages()
+        return _round(206.835 - 1.015 * sentence_length - 84.6 * syllables_per_word, 2)
+
+    @property
+    def grade_level(self):
+        """Flesch-Kincaid Grade Level"""
+        sentence_length, syllables_per_word = self._averages()
+        return _round(0.39 * sentence_length + 11.8 * syllables_per_word - 15.59, 1)
+
+
+class Sentence(Scores):
+    """One sentence, located in the source (start is its source offset)"""
+
+    def __init__(self, text, start, line, words, syllables, counted):
+        super().__init__(words, 1 if counted else 0, syllables)
+        self.text = text
+        self.start = start
+        self.line = line
+        self.counted = counted
+
+
+class Section(Scores):
+    """The text under one heading (or before the first heading)"""
+
+    def __init__(self, title, level, line):
+        super().__init__()
+        self.title = title
+        self.level = level
+        self.line = line
+        self.sentence_list = []
+
+
+class ReadabilityReport:
+    """Scores for a document, its sections and its sentences"""
+
+    def __init__(self, document, sections, sentences):
+        self.document = document
+        self.sections = sections
+        self.sentences = sentences
+
+    @property
+    def reading_ease(self):
+        return self.document.reading_ease
+
+    @property
+    def grade_level(self):
+        return self.document.grade_level
+
+    def hardest_sentences(self, limit=5):
+        """Counted sentences with the lowest Reading Ease, hardest first"""
+        ranked = sorted((s for s in self.sentences if s.counted),
+                        key=lambda s: (s.reading_ease, -s.words))
+        return ranked[:limit]
+
+    def sections_below(self, threshold):
+        """Sections with text whose Reading Ease is under threshold, in order"""
+        return [s for s in self.sections if s.words and s.reading_ease < threshold]
+
+
+class Item(Scores):
+    """One item of a batch deliverable (a post, an email variant)"""
+
+    def __init__(self, title, line, text):
+        super().__init__()
+        self.title = title
+        self.line = line
+        self.text = text
+
+
+def _count(words):
+    """Total syllables in a list of punctuation-free, lower-case words"""
+    cached = _syllables.get
+    return sum([cached(word) or syllables(word) for word in words])
+
+
+def _score(text, scores):
+    """Fill in scores for plain text, counted as textstat counts a document"""
+    words = PUNCTUATION.sub('', text).lower().split()
+    scores.words = len(words)
+    scores.syllables = _count(words)
+    scores.sentences = max(1, sum(
+        1 for m in SENTENCE.finditer(text)
+        if len(PUNCTUATION.sub('', m.group()).split()) >= MIN_SENTENCE_WORDS
+    ))
+    return scores
+
+
+class BlockText:
+    """
+    Readability statistics of one block's plain text: word and syllable
+    totals, headings and sentence fragments, with offsets and lines
+    relative to the block
+
+    A fragment is what the sentence pattern matches within the block. The
+    pattern runs on across blocks until a sentence ends, so a block's
+    unfinished last fragment joins the next block's first (see
+    analyze_blocks); closes_open says the next block ends it before its
+    first word instead.
+    """
+
+    def __init__(self, source):
+        from .plaintext import to_plain_text
+
+        plain = to_plain_text(source)
+        text = plain.text
+        self.has_text = bool(text)
+        words = PUNCTUATION.sub('', text).lower().split()
+        self.words = len(words)
+        self.syllables = _count(words)
+
+        self.headings = []
+        for offset, level in plain.headings:
+            end = text.find('\n', offset)
+            title = text[offset:end if end >= 0 else len(text)]
+            self.headings.append((offset, level, title.strip(), plain.source_position(offset)[0]))
+
+        self.fragments = []
+        for m in SENTENCE.finditer(text):
+            words = PUNCTUATION.sub('', m.group()).lower().split()
+            start = m.start()
+            self.fragments.append((m.group(), start, plain.source_offset(start),
+                                   plain.source_position(start)[0], len(words), _count(words)))
+        self.lead = text[:self.fragments[0][1]] if self.fragments else text
+        self.closes_open = LEADING_END.match(text) is not None
+        self.open = bool(self.fragments) and self.fragments[-1][0][-1] not in '.!?'
+
+
+def analyze_blocks(blocks, document=None):
+    """
+    Score a document from its Blocks (see lisa_quality.blocks), reusing the
+    BlockText of every block seen before (the time spent on new blocks is
+    parse time of document, if given)
+
+    Totals and sentences are assembled exactly as one pass over the whole
+    plain text counts them, as textstat does: words and syllables add up,
+    and a sentence that runs across a block boundary counts once.
+    """
+    from .blocks import analyze_block
+
+    totals = Scores()
+    section = Section(None, 0, 1)
+    sections, sentences = [section], []
+    carry = None  # Unfinished sentence: [text, source offset, line, words, syllables, section]
+
+    def finish(text, start, line, words, syllable_count, owner):
+        sentence = Sentence(text.strip(), start, line, words, syllable_count, words >= MIN_SENTENCE_WORDS)
+        sentences.append(sentence)
+        owner.add(sentence)
+        owner.sentence_list.append(sentence)
+
+    for block in blocks:
+        stats = analyze_block('readability', block, BlockText, document=document)
+        totals.words += stats.words
+        totals.syllables += stats.syllables
+        local = [Section(title, level, block.line + line - 1) for _, level, title, line in stats.headings]
+        heading_starts = [offset for offset, _, _, _ in stats.headings]
+
+        fragments = stats.fragments
+        if carry is not None:
+            if stats.closes_open:
+                finish(*carry)
+                carry = None
+            elif fragments:
+                text, _, _, _, words, syllable_count = fragments[0]
+                carry[0] += '\n\n' + stats.lead + text
+                carry[3] += words
+                carry[4] += syllable_count
+                fragments = fragments[1:]
+                if fragments or not stats.open:
+                    finish(*carry)
+                    carry = None
+            else:
+                carry[0] += '\n\n' + stats.lead
+
+        for index, (text, start, source_offset, line, words, syllable_count) in enumerate(fragments):
+            position = bisect.bisect_right(heading_starts, start)
+            owner = local[position - 1] if position else section
+            fragment = [text, block.start + source_offset, block.line + line - 1, words, syllable_count, owner]
+            if index == len(fragments) - 1 and stats.open:
+                carry = fragment
+            else:
+                finish(*fragment)
+
+        if local:
+            sections.extend(local)
+            section = local[-1]
+
+    if carry is not None:
+        finish(*carry)
+    totals.sentences = max(1, sum(1 for sentence in sentences if sentence.counted))
+    if not sections[0].words:
+        sections = sections[1:]
+    return ReadabilityReport(totals, sections, sentences)
+
+
+def analyze_document(document):
+    """ReadabilityReport for a Document, memoized by content"""
+    key = document.content_hash
+    report = _reports.get(key)
+    if report is None:
+        report = analyze_blocks(document.blocks, document)
+        if len(_reports) >= _REPORT_CACHE_SIZE:
+            _reports.clear()
+        _reports[key] = report
+    return report
+
+
+def has_text(document):
+    """Whether any text is left once formatting is removed"""
+    from .blocks import analyze_block
+
+    return any(analyze_block('readability', block, BlockText, document=document).has_text
+               for block in document.blocks)
+
+
+def interpret_score(score):
+    """Provide human-readable interpretation of Flesch Reading Ease score"""
+    if score >= 90:
+        return "Very easy to read (5th grade level)"
+    elif score >= 80:
+        return "Easy to read (6th grade level)"
+    elif score >= 70:
+        return "Fairly easy to read (7th grade level)"
+    elif score >= 60:
+        return "Plain English (8th-9th grade level)"
+    elif score >= 50:
+        return "Fairly difficult to read (10th-12th grade level)"
+    elif score >= 30:
+        return "Difficult to read (college level)"
+    else:
+        return "Very difficult to read (college graduate level)"
+
+
+def excerpt(text, length=EXCERPT_LENGTH):
+    """Single-line excerpt of a sentence for reports"""
+    text = ' '.join(text.split())
+    return text if len(text) <= length else text[:length - 1].rstrip() + '…'
+
+
+def format_breakdown(report, threshold, sentences=5):
+    """
+    Lines pointing at the sections and sentences that drag the score down
+
+    Returns:
+        list of str: a "Sections below threshold" block and a "Hardest
+        sentences" block, each line starting with its source line number
+    """
+    lines = []
+    sections = report.sections_below(threshold)
+    if sections:
+        lines.append("Sections below threshold:")
+        for section in sections:
+            title = excerpt(section.title) if section.title else "(before first heading)"
+            lines.append(f"  line {section.line:>4}  FRE {section.reading_ease:>6.1f}  "
+                         f"grade {section.grade_level:>4.1f}  {title}")
+    hardest = [s for s in report.hardest_sentences(sentences) if s.reading_ease < threshold]
+    if hardest:
+        lines.append("Hardest sentences:")
+        for sentence in hardest:
+            lines.append(f"  line {sentence.line:>4}  FRE {sentence.reading_ease:>6.1f}  "
+                         f"{sentence.words:>3} words  \"{excerpt(sentence.text)}\"")
+    return lines
+
+
+def _scan_lines(lines):
+    """Heading (index, level), list item and separator line indexes, outside fences"""
+    in_fence = False
+    headings, lists, separators = [], [], []
+    for index, line in enumerate(lines):
+        if FENCE_LINE.match(line):
+            in_fence = not in_fence
+        elif in_fence:
+            continue
+        elif HEADING_LINE.match(line):
+            headings.append((index, len(HEADING_LINE.match(line).group(1))))
+        elif SEPARATOR_LINE.match(line):
+            separators.append(index)
+        elif LIST_LINE.match(line):
+            lists.append(index)
+    return headings, lists, separators
+
+
+def _list_item_end(lines, start, end):
+    """Where a list item starting at start ends: a heading, a rule, or an
+    unindented paragraph after a blank line, else end"""
+    for index in range(start + 1, end):
+        line = lines[index]
+        if HEADING_LINE.match(line) or SEPARATOR_LINE.match(line):
+            return index
+        if line[:1].strip() and not lines[index - 1].strip():
+            return index
+    return end
+
+
+def split_items(source, mode='auto'):
+    """
+    Split a deliverable into items
+
+    Modes:
+        heading     each heading at the most common heading level starts an
+                    item titled by the heading; a shallower heading (a group
+                    title such as "Week 1") ends the item before it
+        list        each top-level list item is an item
+        separator   text between horizontal rules (---, ***, ___) is an item
+        auto        heading if some heading level repeats, else separator if
+                    the source has rules, else list
+
+    Returns:
+        list of (title, line, markdown) tuples; title is None outside
+        heading mode and line is the 1-based source line the item starts on
+    """
+    if mode not in ITEM_MODES:
+        raise ValueError(f"Unknown item mode '{mode}' (expected: {', '.join(ITEM_MODES)})")
+    lines = source.split('\n')
+    headings, lists, separators = _scan_lines(lines)
+    levels = Counter(level for _, level in headings)
+
+    if mode == 'auto':
+        if levels and max(levels.values()) > 1:
+            mode = 'heading'
+        elif separators:
+            mode = 'separator'
+        else:
+            mode = 'list'
+
+    items = []
+    if mode == 'heading':
+        if not levels:
+            return items
+        item_level = max(levels, key=lambda level: (levels[level], level))
+        bounds = [(index, level) for index, level in headings if level <= item_level]
+        for position, (index, level) in enumerate(bounds):
+            if level != item_level:
+                continue
+            end = bounds[position + 1][0] if position + 1 < len(bounds) else len(lines)
+            title = HEADING_LINE.match(lines[index]).group(2).strip()
+            items.append((title, index + 1, '\n'.join(lines[index + 1:end])))
+    elif mode == 'list':
+        for position, index in enumerate(lists):
+            end = lists[position + 1] if position + 1 < len(lists) else len(lines)
+            end = _list_item_end(lines, index, end)
+            items.append((None, index + 1, '\n'.join(lines[index:end])))
+    else:
+        edges = [-1] + separators + [len(lines)]
+        for begin, end in zip(edges, edges[1:]):
+            body = '\n'.join(lines[begin + 1:end])
+            if body.strip():
+                items.append((None, begin + 2, body))
+    return items
+
+
+def score_items(source, mode='auto'):
+    """
+    Score every item of a deliverable in one pass
+
+    Each item is converted to plain text and scored like a document of its
+    own; the syllable cache is shared, so a word repeated across items
+    (a product name, a call to action) is counted once.
+
+    Returns:
+        list of Item with text (items without words are dropped)
+    """
+    from .plaintext import to_plain_text
+
+    scored = []
+    for title, line, body in split_items(source, mode):
+        text = to_plain_text(body).text
+        item = _score(text, Item(title, line, text))
+        if item.words:
+            scored.append(item)
+    return scored
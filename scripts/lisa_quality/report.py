@@ -0,0 +1,291 @@
+"""
+Machine-readable reports
+Renders check and gate results as JSON, as SARIF 2.1.0 for code-scanning
+tools, or as a compact digest that fits a token budget, so an agent can read
+a whole gate run into context without paying for every repeated finding.
+
+Every renderer takes a list of result dicts: CheckResult.to_dict() records
+or the gate records quality-gates.py produces (which carry 'gate' and
+'status' instead of 'check' and 'passed').
+"""
+
+import json
+from pathlib import PurePath
+
+from .gates import FAILING_STATUSES, STATUS_ICONS
+from .readability import excerpt
+from .results import SEVERITIES, SEVERITY_ICONS
+
+FORMATS = ('text', 'json', 'sarif')
+
+TOOL_NAME = 'lisa-quality'
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_LEVELS = {
+    'error': 'error',
+    'warning': 'warning',
+    'suggestion': 'note',
+    'info': 'note',
+}
+
+# Compact mode: rough token cost of report text, default budget and the
+# longest message kept per finding
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 400
+MESSAGE_LENGTH = 120
+LINES_SHOWN = 3
+FINDINGS_PER_RULE = 3
+
+SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITIES)}
+
+
+def estimate_tokens(text):
+    """Approximate LLM token count of text (about four characters a token)"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def normalize(result):
+    """check, status, summary, metrics and issues of a check or gate result"""
+    entry = {
+        'check': result.get('check') or result['gate'],
+        'status': result.get('status') or ('passed' if result['passed'] else 'failed'),
+        'summary': result['summary'],
+        'metrics': result.get('metrics', {}),
+        'issues': result.get('issues', []),
+    }
+    if result.get('cached'):
+        entry['cached'] = True
+    return entry
+
+
+def rule_id(check, issue):
+    """Namespaced rule ID of an issue: "seo/h1-missing", "ap-style/AP001" """
+    return f"{check}/{issue['code']}" if issue.get('code') else check
+
+
+def all_passed(entries):
+    return not any(entry['status'] in FAILING_STATUSES for entry in entries)
+
+
+def group_issues(entries, per_rule=None):
+    """
+    Merge repeated findings and rank them
+
+    Matches of the same rule-pack rule, and issues with the same code and
+    message, become one finding with a count and every line they occur on.
+    Findings are ranked most severe first; within a severity each kind of
+    finding (code) gets a turn before any kind repeats, so one noisy code
+    cannot crowd the rest out of a budget. Ties go to the most frequent,
+    then the earliest line. With per_rule, findings of a rule past the
+    first per_rule are folded into one "N more similar" finding.
+    """
+    groups = {}
+    for entry in entries:
+        for issue in entry['issues']:
+            key = (entry['check'], issue['rule'] or (issue['code'], issue['message']))
+            group = groups.get(key)
+            if group is None:
+                groups[key] = group = {
+                    'check': entry['check'],
+                    'rule': rule_id(entry['check'], issue),
+                    'severity': issue['severity'],
+                    'message': issue['message'],
+                    'line': issue['line'],
+                    'column': issue['column'],
+                    'count': 0,
+                    'lines': [],
+                }
+            group['count'] += 1
+            if issue['line'] is not None and issue['line'] not in group['lines']:
+                group['lines'].append(issue['line'])
+            if SEVERITY_RANK[issue['severity']] < SEVERITY_RANK[group['severity']]:
+                group['severity'] = issue['severity']
+
+    def rank(group):
+        return SEVERITY_RANK[group['severity']], -group['count'], group['line'] or 0
+
+    turns = {}
+    for group in sorted(groups.values(), key=rank):
+        group['turn'] = turns[group['rule']] = turns.get(group['rule'], -1) + 1
+    ranked = sorted(groups.values(), key=lambda g: (rank(g)[0], g['turn']) + rank(g)[1:])
+    if per_rule is not None:
+        ranked = fold_repeats(ranked, per_rule)
+    for group in ranked:
+        del group['turn']
+    return ranked
+
+
+def fold_repeats(ranked, per_rule):
+    """Merge each rule's findings past the first per_rule into the next one"""
+    folded, folds = [], {}
+    for group in ranked:
+        if group['turn'] < per_rule:
+            folded.append(group)
+            continue
+        fold = folds.get(group['rule'])
+        if fold is None:
+            fold = folds[group['rule']] = dict(group, count=0, lines=[], findings=0)
+            folded.append(fold)
+        fold['findings'] += 1
+        fold['count'] += group['count']
+        fold['lines'] += [line for line in group['lines'] if line not in fold['lines']]
+        fold['message'] = f"{fold['findings']} more similar finding(s)"
+    for fold in folds.values():
+        del fold['findings']
+    return folded
+
+
+def short_message(message):
+    """First line of a message, trimmed for compact reports"""
+    return excerpt(message.splitlines()[0].rstrip(':'), MESSAGE_LENGTH)
+
+
+def finding_line(group):
+    """One compact line: icon, rule, count, source lines and message"""
+    parts = [SEVERITY_ICONS[group['severity']], f"[{group['rule']}]"]
+    if group['count'] > 1:
+        parts.append(f"×{group['count']}")
+    lines = sorted(group['lines'])
+    if lines:
+        shown = ",".join(str(line) for line in lines[:LINES_SHOWN])
+        if len(lines) > LINES_SHOWN:
+            shown += f",+{len(lines) - LINES_SHOWN}"
+        parts.append(f"L{shown}")
+    return " ".join(parts) + f" {short_message(group['message'])}"
+
+
+def within_budget(rendered, budget):
+    """How many rendered findings fit in budget tokens, taken in rank order"""
+    spent = 0
+    for kept, text in enumerate(rendered):
+        spent += estimate_tokens(text) + 1
+        if spent > budget:
+            return kept
+    return len(rendered)
+
+
+def compact_text(results, file, max_tokens=DEFAULT_TOKEN_BUDGET):
+    """
+    Compact text digest of one or more results
+
+    A verdict line per check is always included; ranked, deduplicated
+    findings follow until max_tokens is spent, then a count of the rest.
+    """
+    entries = [normalize(result) for result in results]
+    passed = all_passed(entries)
+    if len(entries) == 1:
+        entry = entries[0]
+        lines = [f"{STATUS_ICONS[entry['status']].strip()} {entry['check']}: {entry['summary']} ({file})"]
+    else:
+        failed = sum(1 for entry in entries if entry['status'] in FAILING_STATUSES)
+        verdict = (f"all {len(entries)} checks passed" if passed
+                   else f"{failed} of {len(entries)} checks failed")
+        lines = [f"{'✅' if passed else '❌'} {file}: {verdict}"]
+        lines += [f"  {STATUS_ICONS[entry['status']].strip()} {entry['check']}: {entry['summary']}"
+                  for entry in entries]
+
+    rendered = ["  " + finding_line(group) for group in group_issues(entries, FINDINGS_PER_RULE)]
+
+    def omitted(count):
+        return f"  … {count} more finding(s) omitted (budget: {max_tokens} tokens)"
+
+    budget = max_tokens - estimate_tokens("\n".join(lines)) - estimate_tokens(omitted(len(rendered)))
+    kept = within_budget(rendered, budget)
+    lines += rendered[:kept]
+    if kept < len(rendered):
+        lines.append(omitted(len(rendered) - kept))
+    return "\n".join(lines)
+
+
+def json_report(results, file, compact=False, max_tokens=DEFAULT_TOKEN_BUDGET, **fields):
+    """
+    JSON report: file, any extra fields (e.g. discipline), overall verdict
+    and one record per check
+
+    With compact, metrics and per-check issues are dropped in favour of one
+    ranked, deduplicated findings list cut to max_tokens.
+    """
+    entries = [normalize(result) for result in results]
+    report = {'tool': TOOL_NAME, 'file': file, **fields, 'passed': all_passed(entries)}
+    if not compact:
+        report['checks'] = entries
+        return json.dumps(report, indent=2, ensure_ascii=False)
+
+    report['checks'] = [{key: entry[key] for key in ('check', 'status', 'summary')}
+                        for entry in entries]
+    findings = [dict(group, message=short_message(group['message']))
+                for group in group_issues(entries, FINDINGS_PER_RULE)]
+    rendered = [json.dumps(finding, ensure_ascii=False) for finding in findings]
+    envelope = json.dumps(dict(report, findings=[], omitted=len(findings)), ensure_ascii=False)
+    kept = within_budget(rendered, max_tokens - estimate_tokens(envelope))
+    report['findings'] = findings[:kept]
+    report['omitted'] = len(findings) - kept
+    return json.dumps(report, ensure_ascii=False)
+
+
+def sarif_location(file, issue):
+    location = {'artifactLocation': {'uri': PurePath(file).as_posix()}}
+    region = {}
+    if issue['line'] is not None:
+        region['startLine'] = issue['line']
+        if issue['column'] is not None:
+            region['startColumn'] = issue['column']
+    if issue.get('offset') is not None:
+        region['charOffset'] = issue['offset']
+    if region:
+        location['region'] = region
+    return {'physicalLocation': location}
+
+
+def sarif_report(results, file):
+    """SARIF 2.1.0 log with one run; checks that could not run become notifications"""
+    entries = [normalize(result) for result in results]
+    rules, findings, notifications = {}, [], []
+    for entry in entries:
+        if entry['status'] in ('error', 'timed_out'):
+            notifications.append({
+                'level': 'error',
+                'message': {'text': f"{entry['check']}: {entry['summary']}"},
+            })
+        for issue in entry['issues']:
+            rule = rule_id(entry['check'], issue)
+            if rule not in rules:
+                rules[rule] = len(rules), {
+                    'id': rule,
+                    'defaultConfiguration': {'level': SARIF_LEVELS[issue['severity']]},
+                    'properties': {'check': entry['check']},
+                }
+            findings.append({
+                'ruleId': rule,
+                'ruleIndex': rules[rule][0],
+                'level': SARIF_LEVELS[issue['severity']],
+                'message': {'text': issue['message']},
+                'locations': [sarif_location(file, issue)],
+                'properties': {'severity': issue['severity']},
+            })
+    run = {
+        'tool': {'driver': {'name': TOOL_NAME, 'rules': [rule for _, rule in rules.values()]}},
+        'invocations': [{
+            'executionSuccessful': not notifications,
+            'toolExecutionNotifications': notifications,
+        }],
+        'results': findings,
+    }
+    return json.dumps({'$schema': SARIF_SCHEMA, 'version': '2.1.0', 'runs': [run]},
+                      indent=2, ensure_ascii=False)
+
+
+def render_report(results, file, output_format='json', compact=False,
+                  max_tokens=DEFAULT_TOKEN_BUDGET, **fields):
+    """
+    Render results as output_format (json, sarif or, with compact, text)
+
+    Plain text without compact is each script's own human-readable output
+    and is not rendered here.
+    """
+    if output_format == 'sarif':
+        return sarif_report(results, file)
+    if output_format == 'json':
+        return json_report(results, file, compact, max_tokens, **fields)
+    if compact:
+        return compact_text(results, file, max_tokens)
+    raise ValueError("Plain text reports are printed by the check scripts")
@@ -0,0 +1,104 @@
+"""
+Check results
+What every check returns: a pass/fail verdict, a one-line summary, the
+individual issues found and the check's numeric measurements
+"""
+
+SEVERITIES = ('error', 'warning', 'suggestion', 'info')
+
+# Icons as the command-line scripts print them (two-codepoint emoji get an
+# extra space so messages line up)
+SEVERITY_ICONS = {
+    'error': '❌',
+    'warning': '⚠️ ',
+    'suggestion': '💡',
+    'info': 'ℹ️ ',
+}
+
+
+class Issue:
+    """
+    One finding from a check
+
+    severity is error (blocks approval), warning, suggestion or info. line
+    and column are 1-based source positions when the check knows them, and
+    offset the 0-based character offset. code is a stable identifier for the
+    kind of finding (e.g. "h1-missing"); rule is the rule-pack ID shown in
+    text output for rule-based checks (AP Style), which doubles as the code.
+    """
+
+    def __init__(self, severity, message, line=None, column=None, rule=None, code=None,
+                 offset=None):
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity '{severity}' (expected: {', '.join(SEVERITIES)})")
+        self.severity = severity
+        self.message = message
+        self.line = line
+        self.column = column
+        self.rule = rule
+        self.code = code or rule
+        self.offset = offset
+
+    def __str__(self):
+        location = f"line {self.line}, col {self.column} " if self.rule and self.line else ""
+        rule = f"[{self.rule}] " if self.rule else ""
+        return f"{SEVERITY_ICONS[self.severity]} {location}{rule}{self.message}"
+
+    def __repr__(self):
+        return f"Issue({self.severity!r}, {self.message!r}, line={self.line!r})"
+
+    def to_dict(self):
+        return {
+            'severity': self.severity,
+            'message': self.message,
+            'line': self.line,
+            'column': self.column,
+            'rule': self.rule,
+            'code': self.code,
+            'offset': self.offset,
+        }
+
+
+class CheckResult:
+    """
+    Outcome of one check on one deliverable
+
+    metrics holds the check's measurements (reading_ease, density, ...);
+    data holds richer objects for callers that want them (the readability
+    report, keyword statistics) and is not serialized.
+    """
+
+    def __init__(self, check, passed, summary, issues=None, metrics=None, data=None):
+        self.check = check
+        self.passed = passed
+        self.summary = summary
+        self.issues = list(issues or [])
+        self.metrics = dict(metrics or {})
+        self.data = dict(data or {})
+
+    def __bool__(self):
+        return self.passed
+
+    def __repr__(self):
+        status = 'passed' if self.passed else 'failed'
+        return f"CheckResult({self.check!r}, {status}, {self.summary!r})"
+
+    def by_severity(self, *severities):
+        return [issue for issue in self.issues if issue.severity in severities]
+
+    @property
+    def errors(self):
+        return self.by_severity('error')
+
+    @property
+    def warnings(self):
+        return self.by_severity('warning')
+
+    def to_dict(self):
+        return {
+            'check': self.check,
+            'passed': self.passed,
+            'summary': self.summary,
+            'issues': [issue.to_dict() for issue in self.issues],
+            'metrics': self.metrics,
+        }
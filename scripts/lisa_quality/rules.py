@@ -0,0 +1,210 @@
+"""
+Declarative pattern rule engine
+Loads regex rules from JSON rule packs and scans content for all of them in
+a single pass, reporting every match with its rule ID, line and column
+
+A rule pack is a JSON object with a "rules" list. Each rule has:
+    id          unique rule ID (a later pack's rule replaces an earlier one)
+    pattern     regular expression (no named groups or numbered backreferences)
+    message     text shown per match; {match} and {count} are substituted
+    severity    "error" (fails the check), "warning" or "suggestion"
+    ignoreCase  optional, match case-insensitively
+    minMatches  optional, only report once the pattern matches this many times
+    reportOnce  optional, report the first match only (with the total {count})
+    enabled     optional, false removes the rule with this ID (only id needed)
+
+Every rule becomes a zero-width lookahead alternative of one combined
+pattern, so the text is walked once regardless of how many rules there are.
+Given the document's blocks, each block's matches are memoized by its hash,
+so a re-check only walks the blocks that changed.
+"""
+
+import re
+import json
+
+from .blocks import Block, analyze_block
+from .cache import content_hash
+from .document import LineIndex
+
+SEVERITIES = ('error', 'warning', 'suggestion')
+
+_UNSUPPORTED_SYNTAX = re.compile(r'\(\?P[<=]|\\[1-9]')
+
+_rule_sets = {}
+
+
+class RulePackError(ValueError):
+    """A rule pack that cannot be loaded or compiled"""
+
+
+class Rule:
+    """One pattern rule from a rule pack"""
+
+    def __init__(self, spec, source=None):
+        self.source = source
+        try:
+            self.id = str(spec['id'])
+            self.pattern = spec['pattern']
+            self.message = spec['message']
+        except (KeyError, TypeError) as e:
+            raise RulePackError(f"{source}: rule is missing required field {e}") from None
+        self.name = spec.get('name', self.id)
+        self.severity = spec.get('severity', 'warning')
+        self.ignore_case = bool(spec.get('ignoreCase', False))
+        self.min_matches = int(spec.get('minMatches', 1))
+        self.report_once = bool(spec.get('reportOnce', False))
+
+        if self.severity not in SEVERITIES:
+            raise RulePackError(
+                f"{source}: rule {self.id} has unknown severity '{self.severity}' "
+                f"(expected: {', '.join(SEVERITIES)})"
+            )
+        if _UNSUPPORTED_SYNTAX.search(self.pattern):
+            raise RulePackError(
+                f"{source}: rule {self.id} uses named groups or backreferences, "
+                f"which cannot be combined with other rules"
+            )
+        try:
+            self.regex = re.compile(self.pattern, re.IGNORECASE if self.ignore_case else 0)
+        except re.error as e:
+            raise RulePackError(f"{source}: rule {self.id} has an invalid pattern: {e}") from None
+
+    def scoped_pattern(self):
+        """The pattern with its own flags, safe to embed in a combined pattern"""
+        return f"(?i:{self.pattern})" if self.ignore_case else f"(?:{self.pattern})"
+
+
+class Finding:
+    """A reported rule match"""
+
+    def __init__(self, rule, start, end, text, line, column, count=1):
+        self.rule = rule
+        self.start = start
+        self.end = end
+        self.text = text
+        self.line = line
+        self.column = column
+        self.count = count
+
+    @property
+    def message(self):
+        return self.rule.message.replace('{match}', self.text).replace('{count}', str(self.count))
+
+
+def load_rule_pack(path):
+    """
+    Read the rule specs from a rule pack file
+
+    Raises:
+        FileNotFoundError: if the pack does not exist
+        RulePackError: if it is not valid JSON or has no rules list
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            pack = json.load(f)
+        except ValueError as e:
+            raise RulePackError(f"{path}: not valid JSON: {e}") from None
+    rules = pack.get('rules') if isinstance(pack, dict) else None
+    if not isinstance(rules, list):
+        raise RulePackError(f"{path}: expected an object with a \"rules\" list")
+    return rules
+
+
+class RuleSet:
+    """Rules from one or more packs, compiled into a single scanning pattern"""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        # What the matches depend on (the block memo key)
+        self.key = content_hash(json.dumps([(rule.pattern, rule.ignore_case) for rule in self.rules]))
+        self.combined = re.compile('|'.join(
+            f"(?=(?P<r{index}>{rule.scoped_pattern()}))"
+            for index, rule in enumerate(self.rules)
+        )) if self.rules else None
+
+    @classmethod
+    def from_packs(cls, paths):
+        """Merge packs in order; a rule ID seen again replaces the earlier rule"""
+        merged = {}
+        for path in paths:
+            for spec in load_rule_pack(path):
+                if isinstance(spec, dict) and spec.get('enabled') is False:
+                    merged.pop(str(spec.get('id')), None)
+                    continue
+                rule = Rule(spec, source=str(path))
+                merged.pop(rule.id, None)
+                merged[rule.id] = rule
+        return cls(merged.values())
+
+    def scan(self, content, blocks=None):
+        """
+        Return the findings for every rule, ordered by position
+
+        With blocks (content split into Blocks, see lisa_quality.blocks),
+        each block is matched on its own, so a match never spans two blocks
+        (the bundled rules never span lines).
+        """
+        if self.combined is None:
+            return []
+        matches = [[] for _ in self.rules]
+        for block in blocks if blocks is not None else [Block(content)]:
+            for index, spans in analyze_block('rules', block, self._match, self.key).items():
+                matches[index].extend((block.start + start, block.start + end, block.line + line - 1, column)
+                                      for start, end, line, column in spans)
+
+        findings = []
+        for rule, spans in zip(self.rules, matches):
+            count = len(spans)
+            if not spans or count < rule.min_matches:
+                continue
+            for start, end, line, column in spans[:1] if rule.report_once else spans:
+                findings.append(Finding(rule, start, end, content[start:end], line, column, count))
+        findings.sort(key=lambda finding: (finding.start, finding.rule.id))
+        return findings
+
+    def _match(self, content):
+        """
+        {rule index: [(start, end, line, column), ...]} for the rules that
+        match content
+
+        Each rule reports non-overlapping matches, as re.finditer would on
+        its own. Where several rules match at the same offset, only the first
+        surfaces through the combined pattern, so the later ones are
+        re-tested in place with their own compiled pattern.
+        """
+        rules = self.rules
+        matches = [[] for _ in rules]
+        next_allowed = [0] * len(rules)
+
+        for m in self.combined.finditer(content):
+            first = int(m.lastgroup[1:])
+            position = m.start()
+            for index in range(first, len(rules)):
+                if position < next_allowed[index]:
+                    continue
+                if index == first:
+                    end = m.end(m.lastgroup)
+                else:
+                    hit = rules[index].regex.match(content, position)
+                    if hit is None:
+                        continue
+                    end = hit.end()
+                matches[index].append((position, end))
+                # Empty matches must not block the next position
+                next_allowed[index] = max(end, position + 1)
+
+        lines = LineIndex(content)
+        return {index: [(start, end) + lines.position(start) for start, end in spans]
+                for index, spans in enumerate(matches) if spans}
+
+
+def compile_rule_packs(paths):
+    """RuleSet for the given packs, memoized by their contents"""
+    contents = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            contents.append(f"{path}:{content_hash(f.read())}")
+    digest = content_hash('\n'.join(contents))
+    if digest not in _rule_sets:
+        _rule_sets[digest] = RuleSet.from_packs(paths)
+    return _rule_sets[digest]
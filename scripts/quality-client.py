@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""
+Quality Check Client
+Thin client for quality-server.py: forwards a check to the warm server and
+reproduces the check script's output and exit code. Starts the server on
+first use, and falls back to running the script directly if it can't.
+"""
+
+import os
+import sys
+import time
+import socket
+import subprocess
+from pathlib import Path
+
+from lisa_quality.budget import TIMEOUT_ENV_VAR
+from lisa_quality.checks import CHECK_SCRIPTS
+from lisa_quality.protocol import FORWARDED_ENV_VARS, decode, default_socket_path, encode
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+SERVER_START_TIMEOUT = 10.0
+
+USAGE = """Usage: quality-client.py <check> [check arguments...]
+
+Checks: brand, readability, seo, accessibility, ap-style, gates
+Arguments and exit codes are the same as the matching script, e.g.
+
+  quality-client.py readability deliverables/email.md --threshold 65
+  quality-client.py seo deliverables/landing-page.md "AI analytics"
+  quality-client.py gates deliverables/MKT-001-landing-page.md --brief campaign-brief.json
+
+  quality-client.py --stop     Stop the background server
+"""
+
+
+def connect(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def start_server(socket_path):
+    """Launch quality-server.py in the background and wait for its socket"""
+    subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / 'quality-server.py'), '--socket', socket_path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        sock = connect(socket_path)
+        if sock:
+            return sock
+        time.sleep(0.05)
+    return None
+
+
+def request(sock, message):
+    sock.sendall(encode(message))
+    with sock.makefile('rb') as reader:
+        line = reader.readline()
+    if not line:
+        raise ConnectionError('server closed the connection')
+    return decode(line)
+
+
+def run_directly(check, args):
+    """No server available: behave exactly like calling the script"""
+    script = str(SCRIPT_DIR / CHECK_SCRIPTS[check])
+    os.execv(sys.executable, [sys.executable, script] + args)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ('-h', '--help'):
+        print(USAGE)
+        sys.exit(0 if argv else 2)
+
+    socket_path = default_socket_path()
+
+    if argv[0] == '--stop':
+        sock = connect(socket_path) if hasattr(socket, 'AF_UNIX') else None
+        if sock:
+            with sock:
+                request(sock, {'op': 'shutdown'})
+            print("Quality server stopped.")
+        else:
+            print("No quality server running.")
+        sys.exit(0)
+
+    check, args = argv[0], argv[1:]
+    if check not in CHECK_SCRIPTS:
+        print(f"❌ Error: Unknown check '{check}'", file=sys.stderr)
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+
+    if not hasattr(socket, 'AF_UNIX'):
+        run_directly(check, args)
+
+    sock = connect(socket_path) or start_server(socket_path)
+    if not sock:
+        run_directly(check, args)
+
+    message = {'check': check, 'args': args, 'cwd': os.getcwd(),
+               'env': {name: os.environ[name] for name in FORWARDED_ENV_VARS if name in os.environ}}
+    if os.environ.get(TIMEOUT_ENV_VAR):
+        try:
+            message['timeout'] = float(os.environ[TIMEOUT_ENV_VAR])
+        except ValueError:
+            pass
+    try:
+        with sock:
+            response = request(sock, message)
+    except (OSError, ValueError):
+        run_directly(check, args)
+
+    sys.stdout.write(response.get('stdout', ''))
+    sys.stderr.write(response.get('stderr', ''))
+    sys.exit(response.get('exit_code', 1))
+
+
+if __name__ == '__main__':
+    main()
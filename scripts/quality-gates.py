@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+
+"""
+Quality Gates Runner
+Runs a discipline's full quality gate set against one deliverable in a single
+process, parsing the deliverable once and sharing it across every gate
+"""
+
+import sys
+import re
+import json
+import time
+import argparse
+from pathlib import Path
+
+from lisa_quality import (
+    GATE_LABELS,
+    GATE_SCRIPTS,
+    ResultCache,
+    cache_enabled,
+    gates_for_discipline,
+    open_document,
+)
+from lisa_quality.api import (
+    ap_style_rule_packs,
+    check_accessibility,
+    check_ap_style,
+    check_brand,
+    check_readability,
+    check_seo,
+)
+from lisa_quality.brand import find_brand_config
+from lisa_quality.budget import CheckTimeout, default_timeout, time_budget
+from lisa_quality.cache import code_version, file_hash
+from lisa_quality.cli import add_report_arguments, exit_with_error, print_report, wants_report
+from lisa_quality.errors import QualityCheckError
+from lisa_quality.gates import FAILING_STATUSES, STATUS_ICONS
+from lisa_quality.keywords import format_keyword_table
+from lisa_quality.readability import format_breakdown
+from lisa_campaign.campaigns import Campaign
+from lisa_campaign.learnings import LearningsStore, make_record
+from lisa_campaign.metrics import append_metrics, gate_record
+from lisa_campaign.state import StateError
+
+READABILITY_CRITERION = re.compile(r'readability[^0-9\n]*?(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def gate_result(gate, status, summary, details=None, check=None):
+    """
+    Build the per-gate result record the runner reports on
+
+    details are the text lines shown under a failing gate; check is the
+    CheckResult behind it, whose issues and metrics go into JSON and SARIF
+    reports.
+    """
+    return {
+        'gate': gate,
+        'status': status,
+        'summary': summary,
+        'details': details or [],
+        'issues': [issue.to_dict() for issue in check.issues] if check is not None else [],
+        'metrics': check.metrics if check is not None else {},
+    }
+
+
+def issue_lines(issues):
+    return [str(issue) for issue in issues]
+
+
+def run_brand(document, options):
+    result = check_brand(document)
+    return gate_result('brand', 'passed' if result.passed else 'failed', result.summary,
+                       issue_lines(result.issues), result)
+
+
+def run_readability(document, options):
+    threshold = options['threshold']
+    result = check_readability(document, threshold)
+    details = [f"Interpretation: {result.metrics['interpretation']}"]
+    if not result.passed:
+        details.extend(format_breakdown(result.data['report'], threshold))
+    return gate_result('readability', 'passed' if result.passed else 'failed', result.summary,
+                       details, result)
+
+
+def run_seo(document, options):
+    keywords = options['keywords']
+    if not keywords:
+        return gate_result('seo', 'skipped', 'No target keyword set for this deliverable')
+    result = check_seo(document, keywords)
+    details = issue_lines(result.issues)
+    if len(keywords) > 1:
+        details += ["Keywords:"] + format_keyword_table(result.data['keywords'])
+    return gate_result('seo', 'passed' if result.passed else 'failed', result.summary, details,
+                       result)
+
+
+def run_accessibility(document, options):
+    result = check_accessibility(document)
+    return gate_result('accessibility', 'passed' if result.passed else 'failed', result.summary,
+                       issue_lines(result.issues), result)
+
+
+def run_ap_style(document, options):
+    result = check_ap_style(document)
+    details = issue_lines(result.by_severity('error', 'warning') + result.by_severity('suggestion'))
+    return gate_result('ap-style', 'passed' if result.passed else 'failed', result.summary, details,
+                       result)
+
+
+GATE_RUNNERS = {
+    'brand': run_brand,
+    'readability': run_readability,
+    'seo': run_seo,
+    'accessibility': run_accessibility,
+    'ap-style': run_ap_style,
+}
+
+
+def gate_config(gate, options):
+    """The configuration a gate's result depends on (part of its cache key)"""
+    if gate == 'brand':
+        config_path = find_brand_config()
+        return {'brand_config': file_hash(config_path) if config_path else None}
+    if gate == 'readability':
+        return {'threshold': options['threshold']}
+    if gate == 'seo':
+        return {'keywords': options['keywords']}
+    if gate == 'ap-style':
+        paths = ap_style_rule_packs()
+        return {'rule_packs': {path: file_hash(path) for path in paths}}
+    return {}
+
+
+def run_gate(document, gate, options, cache=None, timeout=None):
+    """
+    Run one gate against the shared document, isolating its failure
+
+    With a cache, a gate whose content, code and configuration are unchanged
+    since a previous run returns its stored result without re-checking. The
+    gate gets timeout seconds of wall-clock time (None/0 = no limit); a gate
+    that runs over is reported as timed out and never cached.
+    """
+    key = None
+    if cache is not None:
+        key = ResultCache.make_key(
+            gate, document.content_hash, code_version(GATE_SCRIPTS[gate]),
+            gate_config(gate, options),
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            cached['cached'] = True
+            return cached
+    try:
+        with time_budget(timeout):
+            result = GATE_RUNNERS[gate](document, options)
+    except CheckTimeout as e:
+        return gate_result(gate, 'timed_out', f"Check {e}")
+    except QualityCheckError as e:
+        return gate_result(gate, 'error', f"Check could not run: {e}", list(e.details))
+    if key is not None:
+        cache.put(key, gate, result)
+    return result
+
+
+def run_gates(document, gates, options, cache=None, timeout=None, timings=None):
+    """
+    Run each gate against the shared document (see run_gate)
+
+    With a timings list, a (gate, wall seconds, parse seconds) tuple is
+    appended per gate; parse is the time the gate spent building document
+    views that the gates before it had not already built.
+    """
+    results = []
+    for gate in gates:
+        started, parsed = time.perf_counter(), document.parse_seconds
+        results.append(run_gate(document, gate, options, cache, timeout))
+        if timings is not None:
+            timings.append((gate, time.perf_counter() - started, document.parse_seconds - parsed))
+    return results
+
+
+def find_deliverable(brief, file_path, deliverable_id=None):
+    """Find the brief entry for a deliverable by ID or by its filename prefix"""
+    name = Path(file_path).name
+    for deliverable in brief.get('deliverables', []):
+        did = deliverable.get('id', '')
+        if deliverable_id:
+            if did == deliverable_id:
+                return deliverable
+        elif did and name.startswith(did):
+            return deliverable
+    return None
+
+
+def readability_threshold(deliverable):
+    """Pull a 'Readability score > N' threshold out of acceptance criteria"""
+    for criterion in deliverable.get('acceptanceCriteria', []):
+        match = READABILITY_CRITERION.search(criterion)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def resolve_options(args):
+    """
+    Work out discipline, keywords and threshold from flags and campaign brief
+    (options['deliverable'] is the deliverable's brief entry, if found)
+    """
+    discipline = args.discipline
+    keywords = args.keyword
+    threshold = args.threshold
+    deliverable = None
+
+    if args.brief:
+        try:
+            with open(args.brief, 'r', encoding='utf-8') as f:
+                brief = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Error reading campaign brief: {e}", file=sys.stderr)
+            sys.exit(2)
+        discipline = discipline or brief.get('campaignType')
+        deliverable = find_deliverable(brief, args.file, args.deliverable)
+        if deliverable:
+            target = deliverable.get('targetKeyword')
+            if isinstance(target, str):
+                target = [target]
+            keywords = keywords or target
+            if threshold is None:
+                threshold = readability_threshold(deliverable)
+        elif args.deliverable:
+            print(f"❌ Error: Deliverable {args.deliverable} not found in {args.brief}",
+                  file=sys.stderr)
+            sys.exit(2)
+
+    if not discipline:
+        print("❌ Error: Provide --discipline or a --brief with campaignType", file=sys.stderr)
+        sys.exit(2)
+
+    return discipline, {
+        'keywords': keywords or [],
+        'threshold': threshold if threshold is not None else 60,
+        'deliverable': deliverable,
+    }
+
+
+def failure_reason(result):
+    """The code of a failed gate's first error (else first issue), or its status"""
+    issues = [issue for issue in result['issues'] if issue['severity'] == 'error'] or result['issues']
+    codes = [issue['code'] for issue in issues if issue.get('code')]
+    return codes[0] if codes else result['status']
+
+
+def record_failures(campaign, discipline, deliverable, failed):
+    """
+    Log each freshly failed gate to the learnings log (a cached result is
+    the same failure as before, so it is not logged again)
+    """
+    records = [
+        make_record('gate-failure', result['summary'], campaign=campaign, discipline=discipline,
+                    deliverable=deliverable.get('id') if deliverable else None,
+                    type=deliverable.get('type') if deliverable else None,
+                    gate=result['gate'], reason=failure_reason(result))
+        for result in failed if not result.get('cached')
+    ]
+    if records:
+        try:
+            LearningsStore().add(*records)
+        except OSError as e:
+            print(f"⚠️  Could not record failures in the learnings log: {e}", file=sys.stderr)
+
+
+def record_metrics(campaign, deliverable, document, results, timings):
+    """Append one timing record per gate to the campaign metrics file"""
+    try:
+        state = Campaign(campaign).store.load()
+    except StateError:
+        state = None
+    iteration = state['iteration'] if state else None
+    size = len(document.content.encode('utf-8'))
+    records = [
+        gate_record(campaign, iteration, deliverable, gate, result['status'], bool(result.get('cached')),
+                    wall, parse, size)
+        for result, (gate, wall, parse) in zip(results, timings)
+    ]
+    try:
+        append_metrics(records)
+    except OSError as e:
+        print(f"⚠️  Could not record gate timings: {e}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Run every quality gate for a deliverable in one pass',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  quality-gates.py deliverables/MKT-001-landing-page.md --brief campaign-brief.json
+  quality-gates.py deliverables/PR-001-press-release.md --discipline pr
+  quality-gates.py deliverables/landing.md -d marketing -k "AI analytics" -t 65
+  quality-gates.py deliverables/landing.md -d marketing -k "AI analytics" -k "BI dashboard"
+
+Gate sets (see QUALITY-GATES.md):
+  marketing: brand, readability, seo, accessibility
+  pr:        brand, readability, ap-style
+  branding:  brand, accessibility
+
+With --brief, the discipline comes from campaignType and the deliverable's
+targetKeyword (a keyword or a list, the first being primary) and "Readability
+score > N" criterion are applied automatically.
+The deliverable is matched by --deliverable or by its ID filename prefix.
+
+Results are cached in .claude/lisa-check-cache/ keyed by file content, check
+version and settings, so unchanged deliverables are not re-checked. Disable
+with --no-cache or LISA_CHECK_CACHE=0.
+
+Each gate has a wall-clock budget (--timeout, or LISA_CHECK_TIMEOUT, default
+30 seconds). A gate that runs over is reported as timed out and counts as a
+failure, so a pathological deliverable cannot stall the campaign loop.
+
+With --campaign, each failing gate is recorded in learnings/learnings.jsonl
+(deliverable type, gate, and the first error's code as the reason), so later
+iterations and campaigns can look up what failed before, and every gate's
+wall, parse and check time goes to .claude/lisa-metrics.jsonl (see
+campaign-metrics.py report).
+
+--format json or sarif prints every gate's issues with rule IDs, severities
+and source positions; --compact prints a short digest of the worst findings
+that fits --max-tokens, for reading results back into an agent's context.
+        """
+    )
+
+    parser.add_argument('file', help='Path to deliverable file to check')
+    parser.add_argument('-d', '--discipline', choices=['marketing', 'pr', 'branding'],
+                        help='Discipline whose gate set to run')
+    parser.add_argument('-b', '--brief', help='Campaign brief JSON (supplies discipline, keyword, threshold)')
+    parser.add_argument('--deliverable', help='Deliverable ID in the brief (default: match by filename)')
+    parser.add_argument('-k', '--keyword', action='append',
+                        help='Target SEO keyword (marketing); repeat for secondary keywords')
+    parser.add_argument('-t', '--threshold', type=float,
+                        help='Minimum Flesch Reading Ease score (default: 60)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-run every gate instead of reusing cached results')
+    parser.add_argument('--campaign', default=None, metavar='ID',
+                        help='Record failing gates in the learnings log, and gate timings in '
+                             'the metrics file, for this campaign')
+    parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                        help='Time budget per gate (default: $LISA_CHECK_TIMEOUT or 30, 0 = no limit)')
+    add_report_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    discipline, options = resolve_options(args)
+    gates = gates_for_discipline(discipline)
+
+    try:
+        document = open_document(args.file)
+    except QualityCheckError as e:
+        exit_with_error(e)
+
+    cache = ResultCache() if cache_enabled() and not args.no_cache else None
+    timeout = args.timeout if args.timeout is not None else default_timeout()
+    timings = []
+    results = run_gates(document, gates, options, cache, timeout, timings)
+    failed = [r for r in results if r['status'] in FAILING_STATUSES]
+    if args.campaign:
+        record_metrics(args.campaign, options['deliverable'], document, results, timings)
+        record_failures(args.campaign, discipline, options['deliverable'], failed)
+    if wants_report(args):
+        print_report(args, results, discipline=discipline)
+
+    lines = [
+        f"Quality gates ({discipline}): {args.file}",
+        "──────────────────────────────────────────────────────",
+    ]
+    for result in results:
+        label = GATE_LABELS[result['gate']]
+        cached = " (cached)" if result.get('cached') else ""
+        lines.append(f"{STATUS_ICONS[result['status']]} {label}: {result['summary']}{cached}")
+    lines.append("──────────────────────────────────────────────────────")
+
+    for result in failed:
+        if result['details']:
+            lines.append("")
+            lines.append(f"{GATE_LABELS[result['gate']]} details:")
+            lines.extend("  " + detail.replace("\n", "\n  ") for detail in result['details'])
+
+    if failed:
+        print(f"❌ {len(failed)} of {len(results)} quality gates failed", file=sys.stderr)
+        print("", file=sys.stderr)
+        print("\n".join(lines), file=sys.stderr)
+        print("", file=sys.stderr)
+        print("Fix failing gates before marking deliverable as approved.", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"✅ All {len(results)} quality gates passed")
+    print("")
+    print("\n".join(lines))
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+
+"""
+Quality Check Server
+Long-lived process that keeps the check scripts, their libraries (markdown,
+textstat) and compiled regexes warm, and answers check requests
+over a Unix socket or stdin/stdout JSON lines
+"""
+
+import io
+import os
+import sys
+import time
+import socket
+import argparse
+import contextlib
+import socketserver
+
+from lisa_quality import Document, ResultCache, cache_enabled
+from lisa_quality.api import (
+    ap_style_rule_packs,
+    check_accessibility,
+    check_ap_style,
+    check_brand,
+    check_readability,
+    check_seo,
+)
+from lisa_quality.budget import TIMEOUT_EXIT_CODE, CheckTimeout, default_timeout, time_budget
+from lisa_quality.cache import CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR, code_version, file_hash
+from lisa_quality.checks import CHECK_SCRIPTS, load_check_module
+from lisa_quality.protocol import FORWARDED_ENV_VARS, decode, default_socket_path, encode
+
+WARMUP_TEXT = """# Warm-up
+
+## Section
+
+This short sample loads every parser and regex before the first real request.
+Over 10 people attended on January 5th, 2026 at 10:30 AM in New York.
+![chart](chart.png) [read more](#)
+"""
+
+
+def warm_up():
+    """Import every check and run it once so libraries and caches are loaded"""
+    for script_name in CHECK_SCRIPTS.values():
+        load_check_module(script_name)
+
+    # Lazy loaders (textstat's hyphenation dictionary, re's pattern cache,
+    # the markdown converter) only initialise on first use
+    sample = Document(WARMUP_TEXT, path='warm-up.md')
+    check_brand(sample)
+    check_readability(sample)
+    check_seo(sample, 'sample')
+    check_accessibility(sample)
+    check_ap_style(sample)
+
+
+_caches = {}
+
+
+def set_env(name, value):
+    if value is None:
+        os.environ.pop(name, None)
+    else:
+        os.environ[name] = value
+
+
+@contextlib.contextmanager
+def request_environment(request):
+    """
+    The client's settings (the request's "env") in place of the server's for
+    one request: each of FORWARDED_ENV_VARS is set as the client has it, or
+    unset. A request without "env" runs with the server's own.
+    """
+    env = request.get('env')
+    if env is None:
+        yield
+        return
+    previous = {name: os.environ.get(name) for name in FORWARDED_ENV_VARS}
+    try:
+        for name in FORWARDED_ENV_VARS:
+            set_env(name, env.get(name))
+        yield
+    finally:
+        for name, value in previous.items():
+            set_env(name, value)
+
+
+def response_cache(request, check, script_name, args):
+    """
+    Cache and key for a single-check response, or (None, None) if uncacheable
+
+    The key covers every argument and forwarded setting plus the content
+    hash of each argument that names a file, so an edited deliverable is
+    always re-checked. The gates runner caches per gate itself, so its
+    responses are not cached here.
+    """
+    if check == 'gates' or not cache_enabled() or request.get('no_cache'):
+        return None, None
+    cwd = request.get('cwd') or os.getcwd()
+    files = {}
+    for arg in args:
+        path = os.path.join(cwd, arg)
+        if os.path.isfile(path):
+            files[arg] = file_hash(path)
+    if not files:
+        return None, None
+    if check == 'ap-style':
+        # Rule packs from $LISA_AP_STYLE_RULES are not named in the arguments
+        for path in ap_style_rule_packs():
+            path = os.path.join(cwd, path)
+            if os.path.isfile(path):
+                files[path] = file_hash(path)
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR) or os.path.join(cwd, DEFAULT_CACHE_DIR)
+    cache = _caches.setdefault(cache_dir, ResultCache(cache_dir))
+    env = {name: os.environ.get(name) for name in FORWARDED_ENV_VARS}
+    key = ResultCache.make_key(check, files, code_version(script_name), {'args': args, 'env': env})
+    return cache, key
+
+
+def run_check(request, timeout=None):
+    """
+    Run one check exactly as its CLI would, capturing output and exit code
+
+    Requests are handled one at a time: stdout/stderr redirection, the
+    working directory and the forwarded environment are process-wide. A
+    check that runs past its budget (the request's "timeout", else timeout)
+    answers with exit code 124. The gates runner budgets each gate itself.
+    """
+    op = request.get('op', 'check')
+    if op == 'ping':
+        return {'exit_code': 0, 'stdout': 'pong\n', 'stderr': ''}
+
+    check = request.get('check')
+    if check not in CHECK_SCRIPTS:
+        return {
+            'exit_code': 2,
+            'stdout': '',
+            'stderr': f"❌ Error: Unknown check '{check}' (expected: {', '.join(CHECK_SCRIPTS)})\n",
+        }
+
+    with request_environment(request):
+        return check_response(request, check, timeout)
+
+
+def check_response(request, check, timeout):
+    """run_check for a known check, in the request's environment"""
+    script_name = CHECK_SCRIPTS[check]
+    args = [str(arg) for arg in request.get('args', [])]
+    cache, key = response_cache(request, check, script_name, args)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    module = load_check_module(script_name)
+    budget = request.get('timeout', timeout) if check != 'gates' else None
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous_cwd, previous_argv = os.getcwd(), sys.argv
+    exit_code = 0
+    try:
+        if request.get('cwd'):
+            os.chdir(request['cwd'])
+        # argparse names the program after argv[0] in usage and error messages
+        sys.argv = [script_name] + args
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                with time_budget(budget):
+                    module.main(args)
+            except CheckTimeout as e:
+                print(f"⏱️  Error: {check} check {e}", file=sys.stderr)
+                exit_code = TIMEOUT_EXIT_CODE
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception as e:  # Never let one bad request take the server down
+                print(f"❌ Error: {check} check crashed: {e}", file=sys.stderr)
+                exit_code = 1
+    finally:
+        sys.argv = previous_argv
+        os.chdir(previous_cwd)
+
+    response = {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+    # Only definitive pass/fail answers are worth keeping (not usage errors)
+    if cache is not None and exit_code in (0, 1):
+        cache.put(key, check, response)
+    return response
+
+
+class CheckHandler(socketserver.StreamRequestHandler):
+    """Answer every JSON line on a connection until the client hangs up"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.server.last_request = time.monotonic()
+            try:
+                request = decode(line)
+            except ValueError as e:
+                response = {'exit_code': 2, 'stdout': '', 'stderr': f"❌ Error: Bad request: {e}\n"}
+            else:
+                if request.get('op') == 'shutdown':
+                    self.wfile.write(encode({'exit_code': 0, 'stdout': '', 'stderr': ''}))
+                    self.server.shutdown_requested = True
+                    return
+                response = run_check(request, self.server.check_timeout)
+            self.wfile.write(encode(response))
+            self.wfile.flush()
+
+
+def serve_socket(socket_path, idle_timeout, check_timeout=None):
+    """Serve requests on a Unix socket until idle for idle_timeout seconds"""
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            # Left behind by a server that died; safe to replace
+            os.unlink(socket_path)
+        else:
+            probe.close()
+            print(f"⚠️  Quality server already running on {socket_path}", file=sys.stderr)
+            return 0
+
+    server = socketserver.UnixStreamServer(socket_path, CheckHandler)
+    os.chmod(socket_path, 0o600)
+    server.timeout = 1.0
+    server.last_request = time.monotonic()
+    server.shutdown_requested = False
+    server.check_timeout = check_timeout
+    try:
+        while not server.shutdown_requested:
+            server.handle_request()
+            if idle_timeout and time.monotonic() - server.last_request > idle_timeout:
+                break
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+    return 0
+
+
+def serve_stdio(check_timeout=None):
+    """Serve JSON-line requests from stdin, writing responses to stdout"""
+    out = sys.stdout.buffer
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            request = decode(line)
+        except ValueError as e:
+            response = {'exit_code': 2, 'stdout': '', 'stderr': f"❌ Error: Bad request: {e}\n"}
+        else:
+            if request.get('op') == 'shutdown':
+                break
+            response = run_check(request, check_timeout)
+        out.write(encode(response))
+        out.flush()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Serve quality check requests from a warm, long-lived process',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  quality-server.py                      # Unix socket (started on demand by quality-client.py)
+  quality-server.py --stdio              # JSON lines on stdin/stdout
+  quality-server.py --idle-timeout 0     # Never exit when idle
+
+Checks served: brand, readability, seo, accessibility, ap-style, gates
+
+Protocol (one JSON object per line):
+  {"check": "readability", "args": ["deliverables/email.md", "-t", "65"], "cwd": "/path/to/workspace",
+   "env": {"LISA_CHECK_CACHE": "0"}}
+  -> {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+"env" carries the client's LISA_AP_STYLE_RULES, LISA_CHECK_CACHE and
+LISA_CHECK_CACHE_DIR; each check runs with those instead of the server's.
+
+Each check has a wall-clock budget (--timeout, a request's "timeout" field,
+or LISA_CHECK_TIMEOUT, default 30 seconds); one that runs over answers with
+exit code 124 instead of blocking the server.
+        """
+    )
+    parser.add_argument('--socket', default=None,
+                        help='Unix socket path (default: per-user temp path, or $LISA_QUALITY_SOCKET)')
+    parser.add_argument('--stdio', action='store_true',
+                        help='Read requests from stdin and write responses to stdout')
+    parser.add_argument('--idle-timeout', type=float, default=1800,
+                        help='Exit after this many idle seconds (default: 1800, 0 = never)')
+    parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                        help='Time budget per check (default: $LISA_CHECK_TIMEOUT or 30, 0 = no limit)')
+
+    args = parser.parse_args(argv)
+
+    warm_up()
+    check_timeout = args.timeout if args.timeout is not None else default_timeout()
+
+    if args.stdio:
+        sys.exit(serve_stdio(check_timeout))
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ Error: Unix sockets are not available on this platform; use --stdio", file=sys.stderr)
+        sys.exit(2)
+
+    sys.exit(serve_socket(args.socket or default_socket_path(), args.idle_timeout, check_timeout))
+
+
+if __name__ == '__main__':
+    main()
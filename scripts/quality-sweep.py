@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""
+Campaign Quality Sweep
+Runs every deliverable in a campaign brief through its discipline's quality
+gates, spreading deliverables across a pool of worker processes
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from lisa_campaign.files import find_deliverable_files
+from lisa_quality import GATE_LABELS, ResultCache, cache_enabled, gates_for_discipline, load_document
+from lisa_quality.budget import default_timeout
+from lisa_quality.checks import load_check_module
+from lisa_quality.gates import FAILING_STATUSES, STATUS_ICONS
+
+# Short matrix column headings
+GATE_COLUMNS = {
+    'brand': 'Brand',
+    'readability': 'Read',
+    'seo': 'SEO',
+    'accessibility': 'A11y',
+    'ap-style': 'AP',
+}
+
+
+def plan_sweep(brief, directory, keywords=None, threshold=None):
+    """
+    One task per deliverable file, with the gate options from the brief
+
+    Returns:
+        tuple: (tasks, missing) where tasks are dicts for sweep_file and
+        missing lists deliverable IDs with no file in directory yet
+    """
+    gates_module = load_check_module('quality-gates.py')
+    tasks, missing = [], []
+    for deliverable in brief.get('deliverables', []):
+        deliverable_id = deliverable.get('id')
+        if not deliverable_id:
+            continue
+        files = find_deliverable_files(directory, deliverable_id)
+        if not files:
+            missing.append(deliverable_id)
+            continue
+        target = deliverable.get('targetKeyword')
+        if isinstance(target, str):
+            target = [target]
+        item_threshold = threshold
+        if item_threshold is None:
+            item_threshold = gates_module.readability_threshold(deliverable)
+        for path in files:
+            tasks.append({
+                'id': deliverable_id,
+                'file': str(path),
+                'options': {
+                    'keywords': keywords or target or [],
+                    'threshold': item_threshold if item_threshold is not None else 60,
+                },
+            })
+    return tasks, missing
+
+
+def sweep_file(task, gates, use_cache, timeout):
+    """
+    Run the gates on one deliverable (in a worker process)
+
+    Output the checks print while running is captured and returned with the
+    results, so lines from concurrent workers never interleave.
+    """
+    gates_module = load_check_module('quality-gates.py')
+    started = time.monotonic()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            document = load_document(task['file'])
+        except Exception as e:
+            results = [gates_module.gate_result(gate, 'error', f"Could not read file: {e}")
+                       for gate in gates]
+        else:
+            cache = ResultCache() if use_cache else None
+            results = gates_module.run_gates(document, gates, task['options'], cache, timeout)
+    return dict(task, results=results, output=output.getvalue(),
+                seconds=time.monotonic() - started)
+
+
+def format_result(done):
+    """One streamed line per finished deliverable"""
+    failed = [r for r in done['results'] if r['status'] in FAILING_STATUSES]
+    icon = '❌' if failed else '✅'
+    total = len(done['results'])
+    if failed:
+        names = ', '.join(GATE_LABELS[r['gate']] for r in failed)
+        summary = f"{len(failed)} of {total} gates failed ({names})"
+    else:
+        summary = f"all {total} gates passed"
+    return f"{icon} {Path(done['file']).name}: {summary} [{done['seconds']:.1f}s]"
+
+
+def format_matrix(finished, gates, missing):
+    """Deliverable x gate matrix of status icons, in brief order"""
+    width = max([len('Deliverable')] + [len(Path(d['file']).name) for d in finished])
+    header = f"{'Deliverable':<{width}}  " + "  ".join(f"{GATE_COLUMNS[g]:<5}" for g in gates)
+    lines = [header.rstrip(), "─" * len(header)]
+    for done in finished:
+        by_gate = {r['gate']: r['status'] for r in done['results']}
+        cells = [STATUS_ICONS[by_gate[gate]].strip() if gate in by_gate else '' for gate in gates]
+        lines.append((f"{Path(done['file']).name:<{width}}  "
+                      + "  ".join(f"{cell:<4}" for cell in cells)).rstrip())
+    for deliverable_id in missing:
+        lines.append(f"{deliverable_id:<{width}}  (no file in deliverables directory)")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Run quality gates on every deliverable in a campaign, in parallel',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  quality-sweep.py
+  quality-sweep.py campaign-brief.json --deliverables-dir deliverables --jobs 16
+  quality-sweep.py campaign-brief.json -j 1 --no-cache
+
+The gate set comes from the brief's campaignType (see quality-gates.py).
+Each deliverable file (named "<ID>-...") gets its targetKeyword and
+"Readability score > N" criterion from its brief entry.
+
+Deliverables are checked in parallel across --jobs worker processes
+(default: one per CPU). Each deliverable is printed as soon as it finishes,
+then a pass/fail matrix follows in brief order. Results are cached like
+quality-gates.py, so only changed deliverables are re-checked.
+
+Exit codes: 0 all gates passed, 1 a gate failed, 2 unusable brief
+        """
+    )
+
+    parser.add_argument('brief', nargs='?', default='campaign-brief.json',
+                        help='Campaign brief JSON (default: campaign-brief.json)')
+    parser.add_argument('-D', '--deliverables-dir', default='deliverables',
+                        help='Directory holding deliverable files (default: deliverables)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: number of CPUs, 1 = run in-process)')
+    parser.add_argument('-k', '--keyword', action='append',
+                        help='Override every deliverable\'s SEO keywords (repeatable)')
+    parser.add_argument('-t', '--threshold', type=float,
+                        help='Override every deliverable\'s Flesch Reading Ease threshold')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-run every gate instead of reusing cached results')
+    parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                        help='Time budget per gate (default: $LISA_CHECK_TIMEOUT or 30, 0 = no limit)')
+
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.brief, 'r', encoding='utf-8') as f:
+            brief = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error reading campaign brief: {e}", file=sys.stderr)
+        sys.exit(2)
+    try:
+        gates = gates_for_discipline(brief.get('campaignType'))
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    tasks, missing = plan_sweep(brief, args.deliverables_dir, args.keyword, args.threshold)
+    if not tasks:
+        print(f"❌ Error: No deliverable files found in {args.deliverables_dir}/", file=sys.stderr)
+        sys.exit(2)
+
+    use_cache = cache_enabled() and not args.no_cache
+    timeout = args.timeout if args.timeout is not None else default_timeout()
+    jobs = max(1, min(args.jobs, len(tasks)))
+    started = time.monotonic()
+
+    print(f"Sweeping {len(tasks)} deliverable(s), {len(gates)} gates each, {jobs} job(s)")
+    print("")
+    finished = []
+
+    def report(done):
+        finished.append(done)
+        print(format_result(done), flush=True)
+        if done['output'].strip():
+            print("   " + done['output'].rstrip().replace("\n", "\n   "), flush=True)
+
+    if jobs == 1:
+        for task in tasks:
+            report(sweep_file(task, gates, use_cache, timeout))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(sweep_file, task, gates, use_cache, timeout) for task in tasks]
+            for future in as_completed(futures):
+                report(future.result())
+
+    # Matrix in brief order, whatever order workers finished in
+    order = {task['file']: index for index, task in enumerate(tasks)}
+    finished.sort(key=lambda done: order[done['file']])
+    failed = [d for d in finished
+              if any(r['status'] in FAILING_STATUSES for r in d['results'])]
+
+    lines = [""] + format_matrix(finished, gates, missing) + [""]
+    elapsed = time.monotonic() - started
+    if failed:
+        lines.append(f"❌ {len(failed)} of {len(finished)} deliverable(s) failed quality gates "
+                     f"({elapsed:.1f}s)")
+        lines.append("Run quality-gates.py on a failing deliverable for details.")
+    else:
+        lines.append(f"✅ All {len(finished)} deliverable(s) passed quality gates ({elapsed:.1f}s)")
+    if missing:
+        lines.append(f"⚠️  {len(missing)} deliverable(s) not written yet: {', '.join(missing)}")
+
+    print("\n".join(lines))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
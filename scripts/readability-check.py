@@ -6,115 +6,59 @@ Validates content readability using Flesch-Kincaid metrics for Lisa campaigns
 """
 
 import sys
-import re
 import argparse
 
-try:
-    import textstat
-except ImportError:
-    print("❌ Error: textstat library not installed", file=sys.stderr)
-    print("   Install with: pip install textstat", file=sys.stderr)
-    print("   Or: pip install -r scripts/requirements.txt", file=sys.stderr)
-    sys.exit(1)
-
-
-def strip_markdown(text):
-    """Remove markdown formatting to get plain text for readability analysis"""
-    # Remove code blocks
-    text = re.sub(r'```[\s\S]*?```', '', text)
-    text = re.sub(r'`[^`]+`', '', text)
-
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # Remove markdown links but keep link text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-    # Remove markdown images
-    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', r'\1', text)
-
-    # Remove markdown headers
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-
-    # Remove bold/italic markers
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^\*]+)\*', r'\1', text)
-    text = re.sub(r'__([^_]+)__', r'\1', text)
-    text = re.sub(r'_([^_]+)_', r'\1', text)
+from lisa_quality.api import check_readability, check_readability_items
+from lisa_quality.cli import add_report_arguments, exit_with_error, print_report, wants_report
+from lisa_quality.errors import QualityCheckError
+from lisa_quality.readability import ITEM_MODES, excerpt, format_breakdown
 
-    # Remove horizontal rules
-    text = re.sub(r'^[\-\*_]{3,}$', '', text, flags=re.MULTILINE)
 
-    # Remove bullet points
-    text = re.sub(r'^\s*[\-\*\+]\s+', '', text, flags=re.MULTILINE)
+def item_table(items, threshold):
+    """One line per item: status, source line, scores and title"""
+    lines = ["       #  line     FRE  grade  words  item"]
+    for number, item in enumerate(items, 1):
+        icon = "✅" if item.reading_ease >= threshold else "❌"
+        label = excerpt(item.title or item.text, 50)
+        lines.append(f"  {icon} {number:>3}  {item.line:>4}  {item.reading_ease:>6.1f}  "
+                     f"{item.grade_level:>5.1f}  {item.words:>5}  {label}")
+    return lines
 
-    # Remove numbered lists
-    text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
 
-    # Clean up extra whitespace
-    text = re.sub(r'\n\s*\n', '\n\n', text)
-
-    return text.strip()
-
-
-def check_readability(file_path, threshold=60):
-    """
-    Check readability of content using Flesch-Kincaid metrics
-
-    Args:
-        file_path: Path to content file
-        threshold: Minimum Flesch Reading Ease score (default: 60)
-
-    Returns:
-        tuple: (passed: bool, reading_ease: float, grade_level: float)
-    """
+def report_items(args):
+    """Batch mode output and exit"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        print(f"❌ Error: File not found: {file_path}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error reading file: {e}", file=sys.stderr)
-        sys.exit(1)
+        result = check_readability_items(args.file, args.threshold, args.items)
+    except QualityCheckError as e:
+        exit_with_error(e)
+    if wants_report(args):
+        print_report(args, [result.to_dict()])
+    passed, items = result.passed, result.data['items']
+    failing = result.metrics['failing']
+    lowest = min(items, key=lambda item: item.reading_ease)
+    out = sys.stdout if passed else sys.stderr
 
-    # Strip markdown/HTML formatting
-    plain_text = strip_markdown(content)
-
-    if not plain_text.strip():
-        print("❌ Error: No text content found after removing formatting", file=sys.stderr)
-        print("   File may be empty or contain only markup/code.", file=sys.stderr)
-        sys.exit(1)
-
-    # Calculate readability metrics
-    reading_ease = textstat.flesch_reading_ease(plain_text)
-    grade_level = textstat.flesch_kincaid_grade(plain_text)
-
-    # Determine pass/fail
-    passed = reading_ease >= threshold
-
-    return passed, reading_ease, grade_level
-
-
-def interpret_score(score):
-    """Provide human-readable interpretation of Flesch Reading Ease score"""
-    if score >= 90:
-        return "Very easy to read (5th grade level)"
-    elif score >= 80:
-        return "Easy to read (6th grade level)"
-    elif score >= 70:
-        return "Fairly easy to read (7th grade level)"
-    elif score >= 60:
-        return "Plain English (8th-9th grade level)"
-    elif score >= 50:
-        return "Fairly difficult to read (10th-12th grade level)"
-    elif score >= 30:
-        return "Difficult to read (college level)"
+    if passed:
+        print(f"✅ Readability check passed ({len(items)} items)", file=out)
     else:
-        return "Very difficult to read (college graduate level)"
+        print(f"❌ Readability check failed ({failing} of {len(items)} items below threshold)",
+              file=out)
+    print("", file=out)
+    print(f"File: {args.file}", file=out)
+    print(f"Threshold: {args.threshold} (every item)", file=out)
+    print(f"Lowest: {lowest.reading_ease:.1f} (item {items.index(lowest) + 1}, line {lowest.line})",
+          file=out)
+    print("", file=out)
+    print("\n".join(item_table(items, args.threshold)), file=out)
+    print("", file=out)
+    if passed:
+        print("All items meet readability standards.", file=out)
+        sys.exit(0)
+    print("Rewrite the ❌ items: shorter sentences and simpler words.", file=out)
+    sys.exit(1)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='Check readability of content using Flesch-Kincaid metrics',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -123,6 +67,9 @@ Examples:
   readability-check.py deliverables/landing-page.md
   readability-check.py deliverables/email.md --threshold 65
   readability-check.py deliverables/blog-post.md -t 60
+  readability-check.py deliverables/press-release.md --sentences 10
+  readability-check.py deliverables/social-posts.md --items
+  readability-check.py deliverables/email-variants.md --items separator -t 65
 
 Flesch Reading Ease interpretation:
   90-100: Very easy (5th grade)
@@ -134,6 +81,14 @@ Flesch Reading Ease interpretation:
   0-29:   Very difficult (college graduate)
 
 Higher scores = easier to read
+
+When the check fails, every heading section scoring below the threshold and
+the hardest sentences are listed with their source line numbers.
+
+With --items, each post or variant is scored on its own and every item must
+meet the threshold. Items are split by heading (each heading at the most
+common level), top-level list item or --- separator; auto picks headings if
+a heading level repeats, else separators, else list items.
         """
     )
 
@@ -144,11 +99,37 @@ Higher scores = easier to read
         default=60,
         help='Minimum Flesch Reading Ease score (default: 60)'
     )
+    parser.add_argument(
+        '-s', '--sentences',
+        type=int,
+        default=5,
+        help='Hardest sentences to list when the check fails (default: 5)'
+    )
+    parser.add_argument(
+        '-i', '--items',
+        nargs='?',
+        const='auto',
+        choices=ITEM_MODES,
+        metavar='MODE',
+        help='Score each item separately; MODE is auto (default), heading, list or separator'
+    )
+    add_report_arguments(parser)
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    if args.items:
+        report_items(args)
 
     # Check readability
-    passed, reading_ease, grade_level = check_readability(args.file, args.threshold)
+    try:
+        result = check_readability(args.file, args.threshold)
+    except QualityCheckError as e:
+        exit_with_error(e)
+    if wants_report(args):
+        print_report(args, [result.to_dict()])
+    passed = result.passed
+    reading_ease, grade_level = result.metrics['reading_ease'], result.metrics['grade_level']
+    interpretation = result.metrics['interpretation']
 
     # Output results
     if passed:
@@ -157,7 +138,7 @@ Higher scores = easier to read
         print(f"File: {args.file}")
         print(f"Flesch Reading Ease: {reading_ease:.1f} (threshold: {args.threshold})")
         print(f"Flesch-Kincaid Grade Level: {grade_level:.1f}")
-        print(f"Interpretation: {interpret_score(reading_ease)}")
+        print(f"Interpretation: {interpretation}")
         print("")
         print("Content meets readability standards.")
         sys.exit(0)
@@ -167,8 +148,12 @@ Higher scores = easier to read
         print(f"File: {args.file}", file=sys.stderr)
         print(f"Flesch Reading Ease: {reading_ease:.1f} (threshold: {args.threshold})", file=sys.stderr)
         print(f"Flesch-Kincaid Grade Level: {grade_level:.1f}", file=sys.stderr)
-        print(f"Interpretation: {interpret_score(reading_ease)}", file=sys.stderr)
+        print(f"Interpretation: {interpretation}", file=sys.stderr)
         print("", file=sys.stderr)
+        details = format_breakdown(result.data['report'], args.threshold, args.sentences)
+        if details:
+            print("\n".join(details), file=sys.stderr)
+            print("", file=sys.stderr)
         print("──────────────────────────────────────────────────────", file=sys.stderr)
         print("To improve readability:", file=sys.stderr)
         print("  • Use shorter sentences (aim for 15-20 words average)", file=sys.stderr)
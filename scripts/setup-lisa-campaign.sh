@@ -18,6 +18,7 @@ fi
 CAMPAIGN_BRIEF_PATH=""
 MAX_ITERATIONS=30
 COMPLETION_PROMISE="COMPLETE"
+CAMPAIGN_ID=""
 
 # Parse options and positional arguments
 while [[ $# -gt 0 ]]; do
@@ -35,16 +36,21 @@ ARGUMENTS:
 OPTIONS:
   --max-iterations <n>           Maximum iterations before auto-stop (default: 30)
   --completion-promise '<text>'  Promise phrase (default: 'COMPLETE')
+  --campaign-id <id>             Campaign ID keying its state and learnings
+                                 (default: derived from the campaign name)
   -h, --help                     Show this help message
 
 DESCRIPTION:
   Initializes a Lisa campaign loop for marketing, PR, or branding deliverables.
   Reads campaign brief JSON and creates state file for the Stop hook.
+  Campaigns with different IDs can run in parallel in one workspace, each in
+  its own Claude Code session.
 
 EXAMPLES:
   setup-lisa-campaign.sh campaign-brief.json
   setup-lisa-campaign.sh campaign-brief.json --max-iterations 50
   setup-lisa-campaign.sh campaign-brief.json --completion-promise 'ALL DONE'
+  setup-lisa-campaign.sh launch-pr-brief.json --campaign-id q1-launch-pr
 HELP_EOF
       exit 0
       ;;
@@ -68,6 +74,14 @@ HELP_EOF
       COMPLETION_PROMISE="$2"
       shift 2
       ;;
+    --campaign-id)
+      if ! [[ "${2:-}" =~ ^[a-z0-9][a-z0-9-]{0,63}$ ]]; then
+        echo "❌ Error: --campaign-id must be lowercase letters, digits and hyphens (at most 64), got: ${2:-}" >&2
+        exit 1
+      fi
+      CAMPAIGN_ID="$2"
+      shift 2
+      ;;
     *)
       # First positional argument is campaign brief path
       if [[ -z "$CAMPAIGN_BRIEF_PATH" ]]; then
@@ -151,95 +165,38 @@ if [[ "$DELIVERABLE_COUNT" -eq 0 ]]; then
   exit 1
 fi
 
+# Validate the deliverable dependency graph (unknown IDs, cycles)
+if ! SCHEDULE_ERRORS=$(python3 "${CLAUDE_PLUGIN_ROOT}/scripts/campaign-schedule.py" validate --brief "$CAMPAIGN_BRIEF_PATH" 2>&1); then
+  echo "$SCHEDULE_ERRORS" >&2
+  echo "" >&2
+  echo "   Fix the dependencies fields in your campaign brief." >&2
+  exit 1
+fi
+
 # Create .claude directory if it doesn't exist
 mkdir -p .claude
 
-# Check if there's already an active campaign
-LISA_STATE_FILE=".claude/lisa-campaign.local.md"
+# Campaign ID keys the campaign's state and learnings, so several campaigns
+# can run in one workspace (default: the campaign name, slugified)
+if [[ -z "$CAMPAIGN_ID" ]]; then
+  CAMPAIGN_ID=$(echo "$CAMPAIGN_NAME" | tr '[:upper:]' '[:lower:]' | sed -E 's/[^a-z0-9]+/-/g; s/^-+//; s/-+$//' | cut -c1-64 | sed -E 's/-+$//')
+  [[ -z "$CAMPAIGN_ID" ]] && CAMPAIGN_ID="campaign"
+fi
+
+# Check if a campaign with this ID is already active
+LISA_STATE_FILE=".claude/lisa-campaigns/$CAMPAIGN_ID/state.json"
 if [[ -f "$LISA_STATE_FILE" ]]; then
-  echo "⚠️  Warning: An active Lisa campaign already exists" >&2
+  echo "⚠️  Warning: Lisa campaign '$CAMPAIGN_ID' is already active" >&2
   echo "   State file: $LISA_STATE_FILE" >&2
   echo "" >&2
-  echo "   Use /cancel-lisa to stop the current campaign first." >&2
+  echo "   Use /cancel-lisa to stop it first, or pass --campaign-id to run" >&2
+  echo "   another campaign alongside it." >&2
   exit 1
 fi
 
-# Initialize learnings.txt if it doesn't exist
-LEARNINGS_FILE="learnings.txt"
-if [[ ! -f "$LEARNINGS_FILE" ]]; then
-  cat > "$LEARNINGS_FILE" <<'LEARNINGS_EOF'
-# Lisa Campaign Learnings
-
-**Institutional memory across campaigns and disciplines**
-
-This file captures insights, patterns, and learnings from every Lisa campaign.
-Lisa automatically appends entries after completing each deliverable.
-
-**IMPORTANT: This is append-only. Never delete or modify existing entries.**
-
-## How to Use This File
-
-- Lisa writes entries automatically - you don't need to do anything
-- Review learnings before starting new campaigns for insights
-- Search for specific deliverable types to see what worked well
-- Look for patterns across campaigns to improve your process
-
-## Entry Format
-
-Each entry follows this structure:
-```
-[YYYY-MM-DD HH:MM] - [Discipline] - [Deliverable ID] - [Campaign Name]
-Created: [deliverable type and filename]
-Key insights: [What worked well, challenges, recommendations]
-[Discipline]-specific notes: [Relevant context for future campaigns]
-```
-
-────────────────────────────────────────────────────────────────────
-
-## Brand Patterns
-
-Consistent brand elements and messaging that resonate across campaigns.
-
-## Campaign Insights
-
-Strategic lessons and tactical wins from campaign executions.
-
-## Discipline-Specific Learnings
-
-### Marketing
-Insights specific to marketing campaigns, channels, and conversion strategies.
-
-### PR
-Lessons from media relations, coverage patterns, and journalist engagement.
-
-### Branding
-Strategic patterns in positioning, messaging, and brand expression.
-
-────────────────────────────────────────────────────────────────────
-
-## Example Entries
-
-[2026-01-10 14:30] - Marketing - MKT-001 - Q1 Product Launch
-Created: Landing page copy (deliverables/MKT-001-product-landing-page.md)
-Key insights: Benefit-driven headlines performed better than feature lists. Placing CTAs both above and below the fold increased conversions. Social proof section with customer logos and testimonials generated most engagement.
-Marketing-specific notes: Enterprise buyers respond strongly to ROI messaging and customer proof points. Technical details should be accessible but not oversimplified.
-
-[2026-01-12 09:15] - PR - PR-002 - Product Announcement
-Created: Media pitch for tech journalists (deliverables/PR-002-tech-media-pitch.md)
-Key insights: Leading with customer traction stat (3 Fortune 500 adoptions) generated higher response rate than leading with product features. Personalization to reporter's recent coverage significantly improved engagement.
-PR-specific notes: Tech journalists prefer innovation angle over business impact. Offering customer introductions alongside CEO interview increased pitch success rate. Timing pitch to coincide with industry event (competitor conference) created urgency.
-
-[2026-01-15 16:45] - Branding - BRD-001 - Brand Refresh 2026
-Created: Brand positioning statement (deliverables/BRD-001-brand-positioning.md)
-Key insights: Positioning on accessibility + enterprise power differentiated effectively from competitors (legacy = complex, simple tools = limited). 2x2 competitive positioning map visualized unique space clearly for stakeholders.
-Branding-specific notes: Target audience validation (enterprise tech decision-makers) helped focus all downstream work. Including "reason to believe" with specific proof points (customer count, deployment time) strengthened credibility.
-
-────────────────────────────────────────────────────────────────────
-
-## Your Campaign Learnings Start Below
-
-LEARNINGS_EOF
-fi
+# Gate failures, stuck events and insights from every campaign share one
+# indexed log; the agent queries it by deliverable type instead of reading it
+LEARNINGS_LOG="learnings/learnings.jsonl"
 
 # Load company context files if they exist
 CONTEXT_DIR="${CLAUDE_PLUGIN_ROOT}/context"
@@ -274,7 +231,7 @@ if [[ -d "$CONTEXT_DIR" ]]; then
   # Load company profile
   if PROFILE_CONTENT=$(load_context_file "$CONTEXT_DIR/company-profile.json" "Company Profile"); then
     TEMP_CONTEXT+="$PROFILE_CONTENT"
-    ((CONTEXT_FILES_LOADED++))
+    CONTEXT_FILES_LOADED=$((CONTEXT_FILES_LOADED + 1))
   else
     CONTEXT_WARNINGS+="⚠️  No company-profile.json found - content will be generic\n"
   fi
@@ -282,7 +239,7 @@ if [[ -d "$CONTEXT_DIR" ]]; then
   # Load brand voice
   if VOICE_CONTENT=$(load_context_file "$CONTEXT_DIR/brand-voice.json" "Brand Voice"); then
     TEMP_CONTEXT+="$VOICE_CONTENT"
-    ((CONTEXT_FILES_LOADED++))
+    CONTEXT_FILES_LOADED=$((CONTEXT_FILES_LOADED + 1))
   else
     CONTEXT_WARNINGS+="⚠️  No brand-voice.json found - voice will be generic\n"
   fi
@@ -290,22 +247,19 @@ if [[ -d "$CONTEXT_DIR" ]]; then
   # Load style preferences
   if STYLE_CONTENT=$(load_context_file "$CONTEXT_DIR/style-preferences.json" "Style Preferences"); then
     TEMP_CONTEXT+="$STYLE_CONTENT"
-    ((CONTEXT_FILES_LOADED++))
+    CONTEXT_FILES_LOADED=$((CONTEXT_FILES_LOADED + 1))
   else
     CONTEXT_WARNINGS+="⚠️  No style-preferences.json found - using default style\n"
   fi
 
-  # Load core memory
-  if MEMORY_CORE_CONTENT=$(load_context_file "$CONTEXT_DIR/lisa-memory-core.json" "Core Memory"); then
-    TEMP_CONTEXT+="$MEMORY_CORE_CONTENT"
-    ((CONTEXT_FILES_LOADED++))
-  fi
-
-  # Load contextual memory
-  if MEMORY_CONTEXTUAL_CONTENT=$(load_context_file "$CONTEXT_DIR/lisa-memory-contextual.json" "Contextual Memory"); then
-    TEMP_CONTEXT+="$MEMORY_CONTEXTUAL_CONTENT"
-    ((CONTEXT_FILES_LOADED++))
-  fi
+  # Core and contextual memory are not inlined: they grow with every campaign,
+  # so the Stop hook appends only the entries relevant to the current
+  # deliverable to each iteration's prompt (see context-memory.py select)
+  for MEMORY_FILE in lisa-memory-core.json lisa-memory-contextual.json; do
+    if [[ -f "$CONTEXT_DIR/$MEMORY_FILE" ]]; then
+      CONTEXT_FILES_LOADED=$((CONTEXT_FILES_LOADED + 1))
+    fi
+  done
 
   # If any context loaded, add header
   if [[ $CONTEXT_FILES_LOADED -gt 0 ]]; then
@@ -323,7 +277,7 @@ $TEMP_CONTEXT
 - **Company Profile**: Use facts, metrics, boilerplate in appropriate deliverables
 - **Brand Voice**: Match voice attributes, avoid prohibited patterns, use signature moves
 - **Style Preferences**: Follow style guide, apply spelling/formatting rules, respect readability thresholds
-- **Core Memory**: Reference permanent facts when relevant
+- **Core Memory**: Reference permanent facts when relevant (the entries relevant to your current deliverable are listed under "Relevant Memory")
 - **Contextual Memory**: Apply learned patterns when \`whenToUse\` conditions match
 
 Important: Context files may include readability thresholds per deliverable type. These override default thresholds unless the deliverable's acceptanceCriteria specify a different value.
@@ -352,8 +306,9 @@ ${CONTEXT_SECTION}
    - Note the discipline: $CAMPAIGN_TYPE
 
 2. **Pick the next deliverable**
-   - Find the highest priority deliverable where approved=false
-   - Check dependencies are complete before starting
+   - Run: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/campaign-schedule.py next --campaign $CAMPAIGN_ID --brief $CAMPAIGN_BRIEF_PATH\`
+     (deliverables come after their dependencies, then by priority; the Stop hook also lists it after this prompt)
+   - If it says a deliverable is stale, an upstream deliverable changed after it was approved: rework it against the current upstream content, re-run its quality gates and approve it again
 
 3. **Create the deliverable**
    - Follow the description and acceptance criteria
@@ -362,18 +317,27 @@ ${CONTEXT_SECTION}
 
 4. **Check quality**
    - Run appropriate quality checks for $CAMPAIGN_TYPE discipline
+   - Run the full gate set in one pass: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/quality-client.py gates <deliverable-file> --brief $CAMPAIGN_BRIEF_PATH --campaign $CAMPAIGN_ID\`
+     (the client keeps a warm check server running, so repeat checks skip interpreter and library startup)
    - Ensure all acceptance criteria are met
 
 5. **Update the brief**
    - Mark approved=true in the campaign brief JSON
    - Use Edit tool to update the file
 
-6. **Log learnings**
-   - Append insights to learnings.txt
-   - Include date, discipline, deliverable ID, what you learned
+6. **Update progress tracking**
+   - After every quality check: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/campaign-state.py --campaign $CAMPAIGN_ID check pass|fail "<ID>: <title>"\`
+   - After approving a deliverable: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/campaign-state.py --campaign $CAMPAIGN_ID approve <ID>\`
+   - Never edit $LISA_STATE_FILE by hand
+
+7. **Log learnings**
+   - After approving a deliverable, record what you learned: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/campaign-learnings.py add --campaign $CAMPAIGN_ID --deliverable <ID> --brief $CAMPAIGN_BRIEF_PATH --lesson "<what worked, what to do differently>"\`
+   - Failing quality gates are recorded automatically (via \`--campaign\`)
+   - Before starting a deliverable, check what failed before for its type: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/campaign-learnings.py query --type <deliverable-type>\` (the latest learnings for the current deliverable also follow this prompt)
+   - Never read or edit $LEARNINGS_LOG directly
 
-7. **Check completion**
-   - If ALL deliverables have approved=true, output: <promise>$COMPLETION_PROMISE</promise>
+8. **Check completion**
+   - If ALL deliverables have approved=true and \`campaign-schedule.py next\` reports nothing stale, output: <promise>$COMPLETION_PROMISE</promise>
    - Otherwise, continue to next deliverable
 
 ## Important Guidelines
@@ -382,7 +346,7 @@ ${CONTEXT_SECTION}
 - NEVER mark approved=true unless ALL acceptance criteria are verified
 - Use ${CAMPAIGN_TYPE}-appropriate language and terminology
 - Quality checks must pass before approval
-- Learnings are append-only (never overwrite)
+- Record learnings with campaign-learnings.py (never overwrite the log)
 
 ## Learning From Feedback
 
@@ -394,17 +358,19 @@ When the user provides feedback like:
 
 **Immediately update lisa-memory-contextual.json**:
 
-1. Read the current memory file from: ${CLAUDE_PLUGIN_ROOT}/context/lisa-memory-contextual.json
+1. Other campaigns may be learning at the same time, so never rewrite the memory file
+   (${CLAUDE_PLUGIN_ROOT}/context/lisa-memory-contextual.json) yourself
 2. Add a new entry with:
-   - Unique id (e.g., "mem-\$(date +%s)")
+   - Unique id (e.g., "mem-\$(date +%s)"; filled in if omitted)
    - name: Brief description of the learning
    - category: One of "voice", "formatting", "content-type-specific", "quality-threshold"
    - whenToUse: Specific conditions when this pattern applies (deliverable type, situation)
    - tags: Array of relevant tags (deliverable type, topic, etc.)
    - content: The actual pattern, correction, or preference
-   - learnedFrom: "user-feedback-[campaign-name]"
+   - learnedFrom: "user-feedback-$CAMPAIGN_ID"
    - learnedDate: Current timestamp
-3. Write the updated file back
+3. Save it by piping the entry JSON to: \`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/context-memory.py add\`
+   (adds it under a file lock)
 4. Confirm to user: "✅ Learned: [brief description]. I'll apply this to future [deliverable types]."
 
 **Example memory entry**:
@@ -426,6 +392,7 @@ Apply learned patterns automatically in future deliverables - no need to ask per
 ## Campaign Details
 
 Campaign: $CAMPAIGN_NAME
+Campaign ID: $CAMPAIGN_ID
 Type: $CAMPAIGN_TYPE
 Deliverables: $DELIVERABLE_COUNT
 Brief: $CAMPAIGN_BRIEF_PATH
@@ -434,14 +401,13 @@ Begin by reading the campaign brief and selecting the first deliverable to creat
 PROMPT_EOF
 )
 
-# Sanitize and quote completion promise for YAML
+# Sanitize completion promise (a single line, compared verbatim by the stop hook)
 if [[ -n "$COMPLETION_PROMISE" ]] && [[ "$COMPLETION_PROMISE" != "null" ]]; then
-  # Replace newlines with spaces to prevent YAML parsing issues
+  # Replace newlines with spaces so the promise can be matched in one <promise> tag
   # Handle both \n escape sequences and actual newlines
   COMPLETION_PROMISE_CLEAN=$(echo "$COMPLETION_PROMISE" | tr '\n' ' ' | tr '\r' ' ' | sed 's/\\n/ /g' | sed 's/\\r/ /g' | sed 's/  */ /g' | sed 's/^ *//;s/ *$//')
-  COMPLETION_PROMISE_YAML="\"$COMPLETION_PROMISE_CLEAN\""
 else
-  COMPLETION_PROMISE_YAML="null"
+  COMPLETION_PROMISE_CLEAN="null"
 fi
 
 # Calculate complexity and suggested iterations based on deliverable count
@@ -455,29 +421,37 @@ else
   COMPLEXITY="High"
   SUGGESTED_ITERATIONS=50
 fi
+SUGGESTION_BASIS="$COMPLEXITY complexity"
+
+# Once past campaigns have logged enough approvals, size the suggestion from the
+# forecast for this brief instead: the top of its 80% band
+FORECAST_NOTE=""
+if FORECAST_VARS=$(python3 "${CLAUDE_PLUGIN_ROOT}/scripts/campaign-forecast.py" estimate \
+  --brief "$CAMPAIGN_BRIEF_PATH" --complexity "$COMPLEXITY" --shell 2>/dev/null); then
+  eval "$FORECAST_VARS"
+  if [[ "$FORECAST_BASIS" == "history" ]]; then
+    SUGGESTED_ITERATIONS=$FORECAST_HIGH
+    SUGGESTION_BASIS="$FORECAST_HISTORY past approvals"
+    FORECAST_NOTE="
+Forecast: ~$FORECAST_ITERATION iterations (80% band $FORECAST_LOW–$FORECAST_HIGH)"
+  fi
+fi
 
-# Create state file with YAML frontmatter
-cat > "$LISA_STATE_FILE" <<EOF
----
-active: true
-iteration: 1
-max_iterations: $MAX_ITERATIONS
-completion_promise: $COMPLETION_PROMISE_YAML
-campaign_name: "$CAMPAIGN_NAME"
-campaign_type: "$CAMPAIGN_TYPE"
-started_at: "$(date -u +%Y-%m-%dT%H:%M:%SZ)"
-deliverables_total: $DELIVERABLE_COUNT
-deliverables_completed: 0
-quality_checks_passed: 0
-quality_checks_failed: 0
-current_deliverable: "Starting campaign"
-complexity: "$COMPLEXITY"
-last_deliverable: ""
-consecutive_failures: 0
----
-
-$PROMPT_BODY
-EOF
+# Create the campaign state store (the loop prompt is read from stdin)
+if ! printf '%s\n' "$PROMPT_BODY" | python3 "${CLAUDE_PLUGIN_ROOT}/scripts/campaign-state.py" \
+  --campaign "$CAMPAIGN_ID" init \
+  max_iterations="$MAX_ITERATIONS" \
+  completion_promise="$COMPLETION_PROMISE_CLEAN" \
+  campaign_name="$CAMPAIGN_NAME" \
+  campaign_type="$CAMPAIGN_TYPE" \
+  campaign_brief="$CAMPAIGN_BRIEF_PATH" \
+  started_at="$(date -u +%Y-%m-%dT%H:%M:%SZ)" \
+  deliverables_total="$DELIVERABLE_COUNT" \
+  current_deliverable="Starting campaign" \
+  complexity="$COMPLEXITY" > /dev/null; then
+  echo "❌ Error: Could not create campaign state file: $LISA_STATE_FILE" >&2
+  exit 1
+fi
 
 # Output setup message with discipline-appropriate emojis
 case "$CAMPAIGN_TYPE" in
@@ -511,16 +485,17 @@ fi
 ITERATION_NOTE=""
 if [[ $MAX_ITERATIONS -ne $SUGGESTED_ITERATIONS ]]; then
   ITERATION_NOTE="
-💡 Tip: Based on $COMPLEXITY complexity, suggested --max-iterations $SUGGESTED_ITERATIONS"
+💡 Tip: Based on $SUGGESTION_BASIS, suggested --max-iterations $SUGGESTED_ITERATIONS"
 fi
 
 cat <<EOF
 $EMOJI Lisa campaign activated!
 
 $DISCIPLINE_NAME: $CAMPAIGN_NAME
+Campaign ID: $CAMPAIGN_ID
 Type: $CAMPAIGN_TYPE
 Deliverables: $DELIVERABLE_COUNT
-Complexity: $COMPLEXITY (suggested: $SUGGESTED_ITERATIONS iterations)
+Complexity: $COMPLEXITY (suggested: $SUGGESTED_ITERATIONS iterations)$FORECAST_NOTE
 Max iterations: $(if [[ $MAX_ITERATIONS -gt 0 ]]; then echo $MAX_ITERATIONS; else echo "unlimited"; fi)$ITERATION_NOTE
 Completion promise: $COMPLETION_PROMISE
 
@@ -528,7 +503,7 @@ The Stop hook is now active. Lisa will work through each deliverable,
 checking quality and updating the campaign brief as she progresses.
 
 Campaign brief: $CAMPAIGN_BRIEF_PATH
-Learnings log: $LEARNINGS_FILE
+Learnings log: $LEARNINGS_LOG
 Output folder: deliverables/
 Context: $CONTEXT_STATUS
 
@@ -544,6 +519,18 @@ if [[ -n "$CONTEXT_WARNINGS" ]]; then
   echo ""
 fi
 
-# Output the prompt body to start the loop
+# Output the prompt body to start the loop, with the memory entries and latest
+# learnings relevant to the first deliverable (the Stop hook selects them afresh
+# each iteration)
 echo ""
 echo "$PROMPT_BODY"
+if MEMORY_SECTION=$(python3 "${CLAUDE_PLUGIN_ROOT}/scripts/context-memory.py" select \
+  --brief "$CAMPAIGN_BRIEF_PATH" --context-dir "$CONTEXT_DIR" 2>/dev/null) && [[ -n "$MEMORY_SECTION" ]]; then
+  echo ""
+  echo "$MEMORY_SECTION"
+fi
+if LEARNINGS_SECTION=$(python3 "${CLAUDE_PLUGIN_ROOT}/scripts/campaign-learnings.py" query \
+  --brief "$CAMPAIGN_BRIEF_PATH" 2>/dev/null) && [[ -n "$LEARNINGS_SECTION" ]]; then
+  echo ""
+  echo "$LEARNINGS_SECTION"
+fi
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Transcript Tail
+Prints the text of the last assistant message in a Claude Code session
+transcript: what the Lisa stop hook reads (in-process, see
+lisa_campaign/hook.py) to decide how an iteration ended. A standalone tool
+for debugging the hook. Reads backwards from the end of the file and, with
+--bookmark, only reads what was appended since the previous call.
+"""
+
+import sys
+import argparse
+
+from lisa_campaign.transcript import TranscriptError, last_assistant_message
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Print the last assistant message of a session transcript (JSONL)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  transcript-tail.py ~/.claude/projects/.../session.jsonl
+  transcript-tail.py session.jsonl --bookmark .claude/lisa-campaigns/<campaign-id>/transcript.json
+
+The message's text blocks are printed joined by newlines. The bookmark
+records where the last message starts and how much of the transcript has
+been read; it is ignored if the transcript was replaced or truncated. The
+stop hook keeps one per campaign (as above); reading with it shows what the
+next stop resumes from, and leaves it valid for the hook.
+
+Exit codes: 0 message printed, 1 no assistant message, 2 transcript
+unreadable or last assistant message not valid JSON
+        """
+    )
+
+    parser.add_argument('transcript', help='Path to the JSONL session transcript')
+    parser.add_argument('-b', '--bookmark', metavar='FILE',
+                        help='File remembering the read position between calls')
+
+    args = parser.parse_args(argv)
+
+    try:
+        text = last_assistant_message(args.transcript, args.bookmark)
+    except OSError as e:
+        print(f"❌ Error: Could not read transcript: {e}", file=sys.stderr)
+        sys.exit(2)
+    except TranscriptError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if text is None:
+        print(f"❌ Error: No assistant messages found in {args.transcript}", file=sys.stderr)
+        sys.exit(1)
+    print(text)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
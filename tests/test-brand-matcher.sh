@@ -0,0 +1,129 @@
+#!/bin/bash
+
+# Test: Aho-Corasick brand term matcher (lisa_quality/brand.py)
+#
+# Checks:
+# 1. Finds the same prohibited terms on the same lines as the old per-term
+#    grep scan (brand-check.sh before the automaton), on every example
+#    deliverable and on a generated document with many hits
+# 2. Matches whole tokens only, where the old substring scan did not
+# 3. Reports overlapping terms and terms sharing a suffix (fail links)
+# 4. An automaton loaded from the on-disk cache matches like a fresh one
+
+set -euo pipefail
+
+echo "Testing brand term matcher"
+echo "=========================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import re
+import sys
+import glob
+import random
+
+from lisa_quality import brand
+from lisa_quality.brand import TermAutomaton, check_brand_terms, load_brand_config
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def old_scan(content, terms):
+    """{(term, line)} as brand-check.sh found them: grep -n -i per term"""
+    found = set()
+    for term in terms:
+        pattern = re.compile(re.escape(term), re.IGNORECASE)
+        for number, line in enumerate(content.split('\n'), 1):
+            if pattern.search(line):
+                found.add((term, number))
+    return found
+
+
+def new_scan(content, terms_by_kind):
+    result = check_brand_terms(content, terms_by_kind, cache_dir=None)
+    return {(term, line) for term, hits in result['prohibited'].items() for line, _, _ in hits}
+
+
+plugin_root = os.environ['PLUGIN_ROOT']
+config = load_brand_config(os.path.join(plugin_root, 'scripts', 'brand-config.json'))
+prohibited = config['prohibited']
+
+print("✓ Test 1: Same hits as the old per-term scan")
+examples = sorted(glob.glob(os.path.join(plugin_root, 'examples', 'deliverables', '*.md')))
+check(examples, f"{len(examples)} example deliverables found")
+for path in examples:
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    old, new = old_scan(content, prohibited), new_scan(content, config)
+    check(old == new, f"{os.path.basename(path)}: {len(new)} prohibited hit(s), same as the old scan")
+
+# A generated document: brand terms in varied case among filler words that
+# contain none of them
+random.seed(12)
+filler = ['the', 'platform', 'helps', 'teams', 'ship', 'reports', 'faster', 'with', 'clear', 'data',
+          'and', 'fewer', 'meetings', 'every', 'quarter', 'our', 'customers', 'say']
+vocabulary = filler * 4 + prohibited + [term.upper() for term in prohibited] + [term.title() for term in prohibited]
+lines = [' '.join(random.choice(vocabulary) for _ in range(random.randint(3, 14))) + '.'
+         for _ in range(400)]
+content = '\n'.join(lines)
+old, new = old_scan(content, prohibited), new_scan(content, config)
+check(len(new) > 200, f"generated document has {len(new)} prohibited hits")
+check(old == new, "generated document: same (term, line) hits as the old scan")
+print("")
+
+print("✓ Test 2: Whole-token matching")
+terms = {'prohibited': ['art', 'cheap', 'game-changer'], 'required': [], 'approved': []}
+content = "Start the smart art show.\nCheaply made? Not cheap.\nA game-changers list, not one game-changer."
+result = check_brand_terms(content, terms, cache_dir=None)
+check(old_scan(content, ['art']) == {('art', 1)}, "old substring scan flags 'art' on line 1 (in 'Start')")
+check([column for _, column, _ in result['prohibited']['art']] == [17],
+      "'art' matches only the word at column 17, not inside 'Start' or 'smart'")
+check([(line, column) for line, column, _ in result['prohibited']['cheap']] == [(2, 19)],
+      "'cheap' matches 'cheap' but not 'Cheaply'")
+check([(line, column) for line, column, _ in result['prohibited']['game-changer']] == [(3, 31)],
+      "'game-changer' matches the hyphenated token, not 'game-changers'")
+print("")
+
+print("✓ Test 3: Overlapping terms and shared suffixes")
+automaton = TermAutomaton.build(['very unique', 'unique', 'a b c', 'b c d', 'c'])
+hits = sorted((automaton.terms[index], start, end) for index, start, end in automaton.scan("It is a b c d, very unique."))
+check(hits == sorted([
+    ('a b c', 6, 11), ('b c d', 8, 13), ('c', 10, 11), ('very unique', 15, 26), ('unique', 20, 26),
+]), "every overlapping occurrence is reported with its offsets")
+result = check_brand_terms("Truly VERY  unique.", {'prohibited': ['very unique'], 'required': ['unique'],
+                                                   'approved': []}, cache_dir=None)
+check(list(result['prohibited']) == ['very unique'] and result['missing_required'] == [],
+      "multi-word terms match across extra spaces and case; the nested required term counts as found")
+print("")
+
+print("✓ Test 4: Cached automaton")
+cache_dir = os.path.join(os.getcwd(), 'brand-cache')
+content = ' '.join(lines[:50])
+brand._automata.clear()
+fresh = check_brand_terms(content, config, cache_dir=cache_dir)
+check(len(glob.glob(os.path.join(cache_dir, 'automaton-*.json'))) == 1, "automaton written to the cache")
+brand._automata.clear()
+
+
+def rebuild(terms):
+    raise AssertionError("automaton rebuilt instead of loaded from the cache")
+
+
+TermAutomaton.build = rebuild
+cached = check_brand_terms(content, config, cache_dir=cache_dir)
+check(cached == fresh, "automaton loaded from the cache (not rebuilt) finds the same terms")
+PYTHON
+
+echo ""
+echo "✅ Brand term matcher tests passed"
@@ -0,0 +1,215 @@
+#!/bin/bash
+
+# Test: iteration forecast model (lisa_campaign/forecast.py)
+#
+# Checks:
+# 1. Estimates come from the most specific group with enough samples, with
+#    the sample mean and variance (floored), else the prior; approvals of 0
+#    iterations and other events are left out
+# 2. Without a pace the forecast is the iteration plus the remaining means,
+#    with the band from their summed variances; a slow campaign's pace
+#    scales the estimates, and overrunning the deliverable in progress
+#    counts toward it
+# 3. Backtest on simulated campaigns: the 80% band holds the actual
+#    completion iteration about 80% of the time, and narrows as a campaign
+#    goes on
+# 4. campaign_forecast keeps the campaign's own approvals out of the
+#    history; brief_forecast rates complexity from the deliverable count
+# 5. The stop hook warns from the forecast only once there is enough
+#    history; before that it labels the forecast a prior estimate and warns
+#    from 80% of max iterations
+
+set -euo pipefail
+
+echo "Testing campaign forecast"
+echo "========================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import json
+import math
+import random
+import statistics
+import subprocess
+
+from lisa_campaign.forecast import (
+    BAND_Z,
+    MIN_VARIANCE,
+    PRIOR_ITERATIONS,
+    Forecast,
+    IterationModel,
+    brief_forecast,
+    campaign_forecast,
+    forecast_fields,
+)
+from lisa_campaign.metrics import append_metrics
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def approval(iterations, deliverable_type, campaign_type='marketing', complexity='Moderate', **fields):
+    return dict({'event': 'approval', 'iterations': iterations, 'type': deliverable_type,
+                 'campaign_type': campaign_type, 'complexity': complexity}, **fields)
+
+
+# How many iterations each deliverable type takes in the simulated campaigns
+TYPICAL = {'press-release': (4, 1.5), 'social-posts': (2, 0.8), 'email-sequence': (5, 2.0), 'blog-post': (3, 1.0)}
+
+
+def draw(deliverable_type):
+    mean, spread = TYPICAL[deliverable_type]
+    return max(1, round(random.gauss(mean, spread)))
+
+
+print("✓ Test 1: Estimates")
+records = ([approval(n, 'press-release', 'pr', 'High') for n in (5, 7, 6)]
+           + [approval(n, 'press-release', 'pr', 'Low') for n in (2, 3)]
+           + [approval(n, 'social-posts', 'marketing') for n in (2, 2, 2, 2)]
+           + [approval(0, 'press-release', 'pr', 'Low') for _ in range(5)]
+           + [{'event': 'iteration', 'iterations': 9, 'type': 'press-release'},
+              approval(True, 'press-release', 'pr', 'Low')])
+model = IterationModel(records)
+check(model.samples == 9, "0-iteration approvals, other events and non-numbers are left out")
+estimate = model.estimate('press-release', 'pr', 'High')
+check((estimate.mean, estimate.variance, estimate.samples) == (6, statistics.variance([5, 7, 6]), 3),
+      "type, campaign type and complexity: the sample mean and variance of its 3 approvals")
+estimate = model.estimate('press-release', 'pr', 'Low')
+check((estimate.mean, estimate.samples, estimate.group) == (statistics.mean([5, 7, 6, 2, 3]), 5,
+                                                            {'type': 'press-release', 'campaign_type': 'pr'}),
+      "2 samples are too few: falls back to type and campaign type")
+estimate = model.estimate('social-posts', 'marketing', 'Moderate')
+check(estimate.variance == MIN_VARIANCE, "identical samples get the variance floor")
+estimate = model.estimate('white-paper', 'brand', 'Low')
+check(estimate.group == {} and estimate.samples == 9, "an unseen type and campaign type use every approval")
+estimate = IterationModel([]).estimate('white-paper', 'brand', 'Low')
+check((estimate.mean, estimate.variance, estimate.group) == (PRIOR_ITERATIONS, PRIOR_ITERATIONS, None),
+      "no history: the prior")
+print("")
+
+print("✓ Test 2: Expected iteration, band and pace")
+deliverables = [{'id': 'PR-1', 'type': 'press-release'}, {'id': 'PR-2', 'type': 'press-release'},
+                {'id': 'SOC-1', 'type': 'social-posts'}]
+model = IterationModel([approval(n, 'press-release', 'pr') for n in (3, 4, 5)]
+                       + [approval(n, 'social-posts', 'pr') for n in (1, 2, 3)])
+forecast = Forecast(model, deliverables, 'pr', 'Moderate')
+check(forecast.pace == 1 and forecast.expected == 4 + 4 + 2, "before the campaign starts: the sum of the means")
+spread = BAND_Z * math.sqrt(1 + 1 + 1)
+check((forecast.low, forecast.high) == (math.floor(10 - spread), math.ceil(10 + spread)),
+      f"the band is ±{BAND_Z} standard deviations of the summed variances ({forecast.low}–{forecast.high})")
+own = [approval(8, 'press-release', 'pr', deliverable='PR-1', iteration=8)]
+forecast = Forecast(model, deliverables, 'pr', 'Moderate', iteration=8, approvals=own, approved=['PR-1'])
+weight = 2 * (4 + 4 + 2) / 3
+pace = (8 + weight) / (4 + weight)
+check(abs(forecast.pace - pace) < 1e-9 and abs(forecast.expected - (8 + pace * 4 + pace * 2)) < 1e-9,
+      f"taking 8 iterations for a 4-iteration deliverable sets the pace to {pace:.2f}")
+forecast = Forecast(model, deliverables, 'pr', 'Moderate', iteration=14, approvals=own, approved=['PR-1'],
+                    current='PR-2')
+check(forecast.pace > pace and forecast.low >= 15,
+      "6 iterations on a 4-iteration deliverable in progress slow the pace; low is past the current iteration")
+forecast = Forecast(model, deliverables, 'pr', 'Moderate', iteration=11, approved=['PR-1', 'PR-2', 'SOC-1'])
+check((forecast.low, forecast.high, forecast.expected, forecast.remaining) == (11, 11, 11, []),
+      "every deliverable approved: done at the current iteration")
+print("")
+
+print("✓ Test 3: Backtest on simulated campaigns")
+random.seed(4)
+types = list(TYPICAL)
+history = [approval(draw(t), t) for t in random.choices(types, k=400)]
+model = IterationModel(history)
+inside, widths = 0, []
+campaigns = 300
+for _ in range(campaigns):
+    deliverables = [{'id': f"D-{number}", 'type': random.choice(types)} for number in range(random.randint(3, 8))]
+    taken = [draw(d['type']) for d in deliverables]
+    forecast = Forecast(model, deliverables, 'marketing', 'Moderate')
+    inside += forecast.low <= sum(taken) <= forecast.high
+
+    # Re-forecast after each approval, as the stop hook does
+    iteration, approvals, width = 0, [], [forecast.high - forecast.low]
+    for number, (d, iterations) in enumerate(zip(deliverables, taken)):
+        iteration += iterations
+        approvals.append(approval(iterations, d['type'], deliverable=d['id'], iteration=iteration))
+        forecast = Forecast(model, deliverables, 'marketing', 'Moderate', iteration=iteration,
+                            approvals=approvals, approved=[x['id'] for x in deliverables[:number + 1]])
+        width.append(forecast.high - forecast.low)
+    widths.append(width)
+coverage = inside / campaigns
+# The band's ends are rounded outward to whole iterations, so it holds a
+# little more than 80% of outcomes
+check(0.75 <= coverage <= 0.95, f"the band held the actual completion in {coverage:.0%} of {campaigns} campaigns")
+check(all(width[-1] == 0 for width in widths)
+      and statistics.mean(width[0] for width in widths) > statistics.mean(width[len(width) // 2] for width in widths),
+      "the band narrows as deliverables are approved, to a single iteration at the end")
+print("")
+
+print("✓ Test 4: Campaign and brief forecasts")
+brief = {'campaignType': 'pr', 'deliverables': [
+    {'id': 'PR-1', 'type': 'press-release', 'approved': True},
+    {'id': 'PR-2', 'type': 'press-release'},
+    {'id': 'SOC-1', 'type': 'social-posts', 'dependencies': ['PR-2']},
+]}
+state = {'campaign_id': 'this', 'campaign_type': 'pr', 'complexity': 'Low', 'iteration': 5,
+         'completed_deliverables': [], 'current_deliverable': 'PR-2: Follow-up'}
+records = ([approval(n, 'press-release', 'pr', 'Low', campaign='past') for n in (3, 3, 3)]
+           + [approval(20, 'press-release', 'pr', 'Low', campaign='this', deliverable='PR-1', iteration=4)])
+forecast = campaign_forecast(state, brief, records)
+check(forecast.history == 3 and forecast.remaining == ['PR-2', 'SOC-1'],
+      "the campaign's own approvals set its pace, not the history; approved flags in the brief count")
+check(forecast.pace > 1, "and the campaign's slow first deliverable shows in its pace")
+forecast = brief_forecast(brief, records)
+check(forecast.remaining == ['PR-1', 'PR-2', 'SOC-1'] and forecast.estimates['PR-1'].group['complexity'] == 'Low',
+      "a brief of 3 deliverables is estimated at Low complexity, every deliverable to do")
+check(forecast_fields(forecast)['FORECAST_BASIS'] == 'history'
+      and forecast_fields(brief_forecast(brief, records[:2]))['FORECAST_BASIS'] == 'prior',
+      "3 past approvals are a forecast from history, 2 only the prior")
+print("")
+
+print("✓ Test 5: Stop hook warnings")
+plugin_root = os.environ['PLUGIN_ROOT']
+brief = {'campaignType': 'pr', 'deliverables': [{'id': f"PR-{number}", 'type': 'press-release'}
+                                                for number in range(1, 7)]}
+with open('campaign-brief.json', 'w', encoding='utf-8') as f:
+    json.dump(brief, f)
+with open('session.jsonl', 'w', encoding='utf-8') as f:
+    f.write(json.dumps({'message': {'role': 'assistant', 'content': [
+        {'type': 'text', 'text': "Campaign ID: launch"}, {'type': 'text', 'text': "Drafted PR-1."}]}}) + '\n')
+
+
+def first_stop():
+    """The progress summary of a new 6-deliverable campaign's first stop, at max 20 iterations"""
+    subprocess.run([sys.executable, os.path.join(plugin_root, 'scripts', 'campaign-state.py'), '--campaign', 'launch',
+                    'init', 'campaign_name=Launch', 'campaign_type=pr', 'campaign_brief=campaign-brief.json',
+                    'max_iterations=20', 'deliverables_total=6', 'complexity=Moderate'],
+                   input="Work on the brief", text=True, check=True, stdout=subprocess.DEVNULL)
+    result = subprocess.run(['bash', os.path.join(plugin_root, 'hooks', 'stop-hook.sh')],
+                            input=json.dumps({'session_id': 'session-1',
+                                              'transcript_path': os.path.abspath('session.jsonl')}),
+                            text=True, capture_output=True, check=True)
+    subprocess.run([sys.executable, os.path.join(plugin_root, 'scripts', 'campaign-state.py'), '--campaign', 'launch',
+                    'clear'], check=True)
+    return json.loads(result.stdout)['systemMessage']
+
+
+summary = first_stop()
+check("prior estimate" in summary and "Iteration Limit" not in summary and "ITERATION LIMIT" not in summary,
+      "no history: the forecast is labelled a prior estimate and iteration 1 of 20 gets no warning")
+append_metrics([approval(n, 'press-release', 'pr', 'Moderate', campaign='past') for n in (4, 5, 4)])
+summary = first_stop()
+check("80% band" in summary and "ITERATION LIMIT WARNING" in summary,
+      "with history: 6 deliverables at ~4 iterations each are forecast past 20, warned at iteration 1")
+PYTHON
+
+echo ""
+echo "✅ Campaign forecast tests passed"
@@ -0,0 +1,102 @@
+#!/bin/bash
+
+# Test: campaign registry and session binding (lisa_campaign/campaigns.py)
+#
+# Checks:
+# 1. A session claims the unbound campaign its transcript announces most
+#    recently, keeps it once bound, and a session announcing none runs none
+# 2. A campaign whose state is unreadable (a non-numeric counter, or not
+#    JSON) is still found by its announced ID: the stop hook reports the
+#    corrupted state file and removes the campaign, while another session's
+#    stop leaves it alone
+
+set -euo pipefail
+
+echo "Testing campaign registry"
+echo "========================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import json
+import subprocess
+
+from lisa_campaign.campaigns import Campaign, resolve_session
+from lisa_campaign.hook import stop
+
+plugin_root = os.environ['PLUGIN_ROOT']
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def start(campaign_id):
+    subprocess.run([sys.executable, os.path.join(plugin_root, 'scripts', 'campaign-state.py'),
+                    '--campaign', campaign_id, 'init', f"campaign_name={campaign_id}", 'campaign_type=pr'],
+                   input="Work on the brief", text=True, check=True, stdout=subprocess.DEVNULL)
+
+
+def transcript(path, *texts):
+    with open(path, 'w', encoding='utf-8') as f:
+        for text in texts:
+            f.write(json.dumps({'message': {'role': 'assistant', 'content': [{'type': 'text', 'text': text}]}}) + '\n')
+    return path
+
+
+def stop_hook(session_id, path):
+    return subprocess.run(['bash', os.path.join(plugin_root, 'hooks', 'stop-hook.sh')],
+                          input=json.dumps({'session_id': session_id, 'transcript_path': path}),
+                          text=True, capture_output=True)
+
+
+print("✓ Test 1: Session binding")
+start('launch')
+start('rebrand')
+first = transcript('first.jsonl', "Campaign ID: rebrand", "Campaign ID: launch", "Drafted the release.")
+check(resolve_session('session-1', first).id == 'launch' and Campaign('launch').store.load()['session_id'] == 'session-1',
+      "the most recently announced unbound campaign is claimed and bound")
+check(resolve_session('session-1', transcript('later.jsonl', "Campaign ID: rebrand")).id == 'launch',
+      "a bound campaign wins over a later announcement")
+check(resolve_session('session-2', first).id == 'rebrand', "another session claims the campaign still unbound")
+check(resolve_session('session-3', transcript('none.jsonl', "Nothing to do.")) is None,
+      "a session announcing no campaign runs none")
+print("")
+
+print("✓ Test 2: Corrupted state")
+for campaign_id, corrupt in (('counter', lambda data: dict(data, iteration='three')),
+                             ('garbled', lambda data: None)):
+    start(campaign_id)
+    campaign = Campaign(campaign_id)
+    with open(campaign.state_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    with open(campaign.state_path, 'w', encoding='utf-8') as f:
+        corrupted = corrupt(data)
+        f.write(json.dumps(corrupted) if corrupted else '{"iteration": 3,')
+    session = f"session-{campaign_id}"
+    path = transcript(f"{campaign_id}.jsonl", f"Campaign ID: {campaign_id}", "Working.")
+
+    found, state, fields = stop(session, path, os.path.join(plugin_root, 'context'))
+    check(found.id == campaign_id and state is None and fields['HOOK_OUTCOME'] == 'state-corrupt',
+          f"{campaign_id}: the announced campaign is found and its state reported corrupt")
+    result = stop_hook('session-3', os.path.abspath('none.jsonl'))
+    check(result.returncode == 0 and result.stdout == "" and campaign.exists(),
+          f"{campaign_id}: another session's stop leaves it alone")
+    result = stop_hook(session, os.path.abspath(path))
+    check(result.returncode == 0 and "State file corrupted" in result.stderr
+          and campaign.state_path in result.stderr and not os.path.exists(campaign.directory),
+          f"{campaign_id}: the stop hook reports the state file and removes the campaign")
+check(Campaign('launch').exists() and Campaign('rebrand').exists(), "the other campaigns are kept")
+PYTHON
+
+echo ""
+echo "✅ Campaign registry tests passed"
@@ -0,0 +1,185 @@
+#!/bin/bash
+
+# Test: deliverable scheduler (lisa_campaign/schedule.py)
+#
+# Checks:
+# 1. Duplicate, missing and unknown IDs, self-dependencies and cycles are
+#    errors; a dependency with a higher priority number is a warning
+# 2. On random graphs, a cycle is reported exactly when a naive repeated
+#    scan cannot place every deliverable, the reported cycle is made of real
+#    edges, and the order equals the naive lowest-(priority, brief position)
+#    first order
+# 3. Editing an upstream deliverable's file makes its approved dependents
+#    stale, transitively; re-approving clears it; the next deliverable is
+#    the first stale or ready one in order
+# 4. render_next asks for rework of a stale deliverable before new work
+
+set -euo pipefail
+
+echo "Testing campaign scheduler"
+echo "=========================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import random
+
+from lisa_campaign.schedule import (
+    Schedule,
+    ScheduleError,
+    find_cycle,
+    load_snapshots,
+    record_approval,
+    render_next,
+    topological_order,
+    validate,
+)
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def deliverable(deliverable_id, *dependencies, priority=1, approved=False):
+    return {'id': deliverable_id, 'title': f"Title {deliverable_id}", 'priority': priority,
+            'dependencies': list(dependencies), 'approved': approved}
+
+
+def naive_order(deliverables):
+    """Scan for the lowest (priority, position) deliverable whose dependencies are placed, until none is left"""
+    placed, order = set(), []
+    remaining = list(enumerate(deliverables))
+    while remaining:
+        ready = [(d['priority'], position, d) for position, d in remaining if set(d['dependencies']) <= placed]
+        if not ready:
+            return None
+        _, position, chosen = min(ready, key=lambda item: item[:2])
+        order.append(chosen)
+        placed.add(chosen['id'])
+        remaining = [(p, d) for p, d in remaining if p != position]
+    return order
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+print("✓ Test 1: Validation")
+errors, _ = validate([deliverable('A'), deliverable('A'), {'title': 'no id'}])
+check(errors == ["Duplicate deliverable ID 'A'", "Deliverable 3 has no ID"], "duplicate and missing IDs")
+errors, _ = validate([deliverable('A', 'A'), deliverable('B', 'Z')])
+check(errors == ["A depends on itself", "B depends on unknown deliverable 'Z'"], "self and unknown dependencies")
+errors, _ = validate([deliverable('A', 'C'), deliverable('B', 'A'), deliverable('C', 'B'), deliverable('D')])
+check(errors == ["Dependency cycle: A → C → B → A"], "a cycle is reported along its edges")
+errors, warnings = validate([deliverable('A', priority=3), deliverable('B', 'A', priority=1)])
+check(errors == [] and len(warnings) == 1 and "A is scheduled first" in warnings[0],
+      "a dependency with a higher priority number is only a warning")
+try:
+    topological_order([deliverable('A', 'B'), deliverable('B', 'A')])
+except ScheduleError as e:
+    check(e.problems == ["Dependency cycle: A → B → A"], "topological_order raises ScheduleError with the problems")
+else:
+    check(False, "topological_order raises ScheduleError with the problems")
+print("")
+
+print("✓ Test 2: Random graphs against a naive scheduler")
+random.seed(17)
+acyclic = cyclic = 0
+for trial in range(400):
+    size = random.randint(1, 14)
+    ids = [f"D{number:02d}" for number in range(size)]
+    deliverables = []
+    for number, deliverable_id in enumerate(ids):
+        # Mostly edges to earlier deliverables; sometimes any edge, which may close a cycle
+        candidates = ids[:number] if random.random() < 0.8 else [i for i in ids if i != deliverable_id]
+        dependencies = random.sample(candidates, random.randint(0, min(3, len(candidates))))
+        deliverables.append(deliverable(deliverable_id, *dependencies, priority=random.randint(1, 4)))
+    random.shuffle(deliverables)
+    expected = naive_order(deliverables)
+    graph = {d['id']: d['dependencies'] for d in deliverables}
+    cycle = find_cycle(graph)
+    if expected is None:
+        cyclic += 1
+        if cycle is None or cycle[0] != cycle[-1] or any(b not in graph[a] for a, b in zip(cycle, cycle[1:])):
+            check(False, f"trial {trial}: a cycle along real edges is found")
+        if not any(error.startswith("Dependency cycle") for error in validate(deliverables)[0]):
+            check(False, f"trial {trial}: validate reports the cycle")
+    else:
+        acyclic += 1
+        if cycle is not None or [d['id'] for d in topological_order(deliverables)] != [d['id'] for d in expected]:
+            check(False, f"trial {trial}: no cycle, and the naive order")
+check(acyclic > 100 and cyclic > 50,
+      f"{acyclic} acyclic graphs in the naive order, {cyclic} cyclic graphs with a real cycle found")
+print("")
+
+print("✓ Test 3: Stale detection")
+os.mkdir('deliverables')
+brief = {'deliverables': [
+    deliverable('MSG-01', priority=1, approved=True),
+    deliverable('PR-01', 'MSG-01', priority=2, approved=True),
+    deliverable('TP-01', 'PR-01', priority=3, approved=True),
+    deliverable('SOC-01', 'MSG-01', priority=4, approved=True),
+    deliverable('EM-01', 'SOC-01', priority=5),
+    deliverable('BLOG-01', 'EM-01', priority=6),
+]}
+write('deliverables/MSG-01-messaging.md', "# Messaging\n\nVersion one.\n")
+write('deliverables/PR-01-press-release.md', "# Press release\n")
+write('deliverables/SOC-01-posts.md', "# Posts\n")
+write('deliverables/TP-01-talking-points.md', "# Talking points\n")
+for deliverable_id in ('PR-01', 'TP-01', 'SOC-01'):
+    record_approval('schedule.json', brief, deliverable_id, 'deliverables')
+schedule = Schedule(brief, load_snapshots('schedule.json'), 'deliverables')
+check([schedule.status[d] for d in ('MSG-01', 'PR-01', 'TP-01', 'SOC-01', 'EM-01', 'BLOG-01')]
+      == ['approved', 'approved', 'approved', 'approved', 'next', 'waiting'],
+      "unchanged upstream: approved, then the next deliverable, then one waiting on it")
+
+write('deliverables/MSG-01-messaging.md', "# Messaging\n\nVersion two.\n")
+schedule = Schedule(brief, load_snapshots('schedule.json'), 'deliverables')
+check(schedule.changed == {'PR-01': ['MSG-01'], 'TP-01': ['PR-01'], 'SOC-01': ['MSG-01']},
+      "editing MSG-01 makes PR-01 and SOC-01 stale, and TP-01 through PR-01")
+check(schedule.next['id'] == 'PR-01' and schedule.status['EM-01'] == 'waiting',
+      "rework comes first; EM-01 waits while SOC-01 is stale")
+
+write('deliverables/PR-01-press-release.md', "# Press release\n\nReworked for version two.\n")
+record_approval('schedule.json', brief, 'PR-01', 'deliverables')
+schedule = Schedule(brief, load_snapshots('schedule.json'), 'deliverables')
+check(schedule.changed == {'TP-01': ['PR-01'], 'SOC-01': ['MSG-01']} and schedule.next['id'] == 'TP-01',
+      "reworking and re-approving PR-01 clears it; TP-01 stays stale, now because PR-01 changed")
+record_approval('schedule.json', brief, 'TP-01', 'deliverables')
+record_approval('schedule.json', brief, 'SOC-01', 'deliverables')
+schedule = Schedule(brief, load_snapshots('schedule.json'), 'deliverables')
+check(schedule.stale == [] and schedule.next['id'] == 'EM-01'
+      and [d['id'] for d in schedule.remaining] == ['EM-01', 'BLOG-01'],
+      "once every stale deliverable is re-approved, new work is next")
+write('deliverables/MSG-01-messaging-notes.md', "Added notes.\n")
+check(Schedule(brief, load_snapshots('schedule.json'), 'deliverables').changed.get('PR-01') == ['MSG-01'],
+      "a new file for an upstream deliverable counts as a change")
+print("")
+
+print("✓ Test 4: Next deliverable prompt")
+schedule = Schedule(brief, load_snapshots('schedule.json'), 'deliverables')
+text = render_next(schedule)
+check(text.startswith("# Next Deliverable\n\nRework PR-01: Title PR-01: it was approved, but MSG-01 changed since.")
+      and text.endswith("Also stale, after this one: TP-01, SOC-01."),
+      "a stale deliverable is reworked first, and the others are listed")
+os.remove('deliverables/MSG-01-messaging-notes.md')
+text = render_next(Schedule(brief, load_snapshots('schedule.json'), 'deliverables'))
+check(text == "# Next Deliverable\n\nWork on EM-01: Title EM-01 (its dependencies are approved: SOC-01).",
+      "otherwise the next ready deliverable, with its approved dependencies")
+done = {'deliverables': [dict(d, approved=True) for d in brief['deliverables']]}
+check(render_next(Schedule(done, load_snapshots('schedule.json'), 'deliverables')) == "",
+      "nothing left: no prompt section")
+PYTHON
+
+echo ""
+echo "✅ Campaign scheduler tests passed"
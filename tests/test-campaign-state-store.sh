@@ -0,0 +1,166 @@
+#!/bin/bash
+
+# Test: versioned campaign state store (lisa_campaign/state.py)
+#
+# Checks:
+# 1. create/load/update round trip, defaults for missing fields and the
+#    schema_version stamp
+# 2. Corrupt, non-object, newer-schema and invalid state is rejected
+# 3. A legacy markdown state file is migrated to JSON and removed
+# 4. Concurrent processes updating one state file under the lock lose no
+#    update, and exactly one of several concurrent first approvals runs
+#    on_first
+
+set -euo pipefail
+
+echo "Testing campaign state store"
+echo "============================"
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import json
+import multiprocessing
+
+from lisa_campaign.state import SCHEMA_VERSION, CampaignStore, StateError
+
+PROCESSES = 8
+ROUNDS = 25
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def raises(error, func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except error:
+        return True
+    return False
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+print("✓ Test 1: Round trip")
+store = CampaignStore('state.json', legacy_path='state.md')
+check(store.load() is None and not store.exists(), "no state file: no active campaign")
+store.create(campaign_name='Q1 Launch', max_iterations=12, prompt='Build it')
+check(raises(FileExistsError, store.create, campaign_name='Again'), "a second create is refused")
+state = store.update(iteration=4, campaign_type='marketing')
+with open('state.json', encoding='utf-8') as f:
+    saved = json.load(f)
+check(saved['schema_version'] == SCHEMA_VERSION and 'schema_version' not in state,
+      "the file is stamped with the schema version, the loaded state is not")
+check(store.load() == state and (state['iteration'], state['max_iterations'], state['prompt']) == (4, 12, 'Build it'),
+      "updates are read back")
+write('old.json', json.dumps({'campaign_name': 'Old', 'iteration': 3}))
+state = CampaignStore('old.json', legacy_path=None).load()
+check(state['iteration'] == 3 and state['consecutive_failures'] == 0 and state['completed_deliverables'] == [],
+      "a file without newer fields gets their defaults")
+store.record_check('MKT-001: Email', passed=False)
+store.record_check('MKT-001: Email, second pass', passed=False)
+state = store.record_check('MKT-002: Post', passed=False)
+check((state['quality_checks_failed'], state['consecutive_failures']) == (3, 1),
+      "consecutive failures restart on another deliverable")
+state = store.complete_deliverable('MKT-002: Post')
+state = store.complete_deliverable('MKT-002: Post, again')
+check((state['deliverables_completed'], state['completed_deliverables']) == (1, ['MKT-002']),
+      "a deliverable approved twice counts once")
+store.delete()
+check(not store.exists(), "delete ends the campaign")
+print("")
+
+print("✓ Test 2: Rejected state")
+for name, text, problem in (('corrupt.json', '{"iteration": ', "corrupt JSON"),
+                            ('list.json', '[1, 2]', "a JSON list"),
+                            ('newer.json', json.dumps({'schema_version': SCHEMA_VERSION + 1}), "a newer schema"),
+                            ('negative.json', json.dumps({'iteration': -1}), "a negative counter"),
+                            ('text.json', json.dumps({'max_iterations': 'ten'}), "a counter that is not a number")):
+    write(name, text)
+    check(raises(StateError, CampaignStore(name, legacy_path=None).load), f"{problem} raises StateError")
+store = CampaignStore('valid.json', legacy_path=None)
+store.create()
+check(raises(StateError, store.update, iterations=2) and raises(StateError, store.update, iteration='2'),
+      "an unknown field or an invalid value is refused")
+check(store.load()['iteration'] == 1, "a refused update leaves the file unchanged")
+print("")
+
+print("✓ Test 3: Legacy migration")
+write('legacy.md', '---\nactive: true\niteration: 7\nmax_iterations: 20\ncompletion_promise: "DONE"\n'
+                   'campaign_name: "Spring Push"\ncompleted_deliverables: MKT-001, MKT-002\n---\n\n'
+                   'Write the spring campaign.\n')
+store = CampaignStore('migrated.json', legacy_path='legacy.md')
+state = store.load()
+check((state['iteration'], state['max_iterations'], state['completion_promise'], state['campaign_name'])
+      == (7, 20, 'DONE', 'Spring Push') and state['completed_deliverables'] == ['MKT-001', 'MKT-002'],
+      "frontmatter fields are parsed")
+check(state['prompt'] == 'Write the spring campaign.', "the body becomes the prompt")
+check(os.path.exists('migrated.json') and not os.path.exists('legacy.md'),
+      "the state is rewritten as JSON and the markdown file removed")
+write('broken.md', 'no frontmatter here\n')
+check(raises(StateError, CampaignStore('none.json', legacy_path='broken.md').load),
+      "a legacy file without frontmatter raises StateError")
+print("")
+
+
+def bump(path, worker):
+    store = CampaignStore(path, legacy_path=None)
+    for round_number in range(ROUNDS):
+        store.record_check(f'D-{worker}: worker {worker}', passed=round_number % 2 == 0)
+        with store.transaction() as state:
+            state['iteration'] += 1
+
+
+def approve(path, calls):
+    def on_first(state):
+        with open(calls, 'a', encoding='utf-8') as f:
+            f.write('approved\n')
+
+    CampaignStore(path, legacy_path=None).complete_deliverable('MKT-009: Shared', on_first=on_first)
+
+
+def run_all(target, args):
+    workers = [multiprocessing.Process(target=target, args=args(worker)) for worker in range(PROCESSES)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return all(worker.exitcode == 0 for worker in workers)
+
+
+print("✓ Test 4: Concurrent updates")
+store = CampaignStore('shared.json', legacy_path=None)
+store.create()
+check(run_all(bump, lambda worker: ('shared.json', worker)), f"{PROCESSES} processes finished")
+state = store.load()
+expected = PROCESSES * ROUNDS
+check(state['quality_checks_passed'] + state['quality_checks_failed'] == expected
+      and state['quality_checks_passed'] == PROCESSES * ((ROUNDS + 1) // 2),
+      f"all {expected} recorded checks are counted")
+check(state['iteration'] == 1 + expected, f"all {expected} iteration increments are kept")
+
+store = CampaignStore('approve.json', legacy_path=None)
+store.create()
+check(run_all(approve, lambda worker: ('approve.json', 'calls.txt')), f"{PROCESSES} concurrent approvals finished")
+with open('calls.txt', encoding='utf-8') as f:
+    calls = f.read().split()
+state = store.load()
+check(calls == ['approved'] and state['deliverables_completed'] == 1,
+      "on_first ran once and the deliverable counts once")
+PYTHON
+
+echo ""
+echo "✅ Campaign state store tests passed"
@@ -0,0 +1,132 @@
+#!/bin/bash
+
+# Test: keyword n-gram index (lisa_quality/keywords.py)
+#
+# Checks:
+# 1. The indexed tokens are the document text's words, so the total word
+#    count equals the old seo-check.py count, for every example deliverable
+# 2. N-gram counts equal a sliding-window count over the tokens and a
+#    whole-word regex count over the text, for the most frequent one-, two-
+#    and three-word phrases of every example
+# 3. Whole-word matching where the old substring count was not
+# 4. Density and placements (H1, H2, meta description, first paragraph)
+# 5. The index follows an edited document
+
+set -euo pipefail
+
+echo "Testing keyword index"
+echo "====================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import re
+import sys
+import glob
+from collections import Counter
+
+from lisa_quality.document import Document
+from lisa_quality.keywords import index_document, tokenize
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def window_count(tokens, phrase):
+    """Occurrences of the phrase tokens, one window at a time"""
+    size = len(phrase)
+    return sum(1 for index in range(len(tokens) - size + 1) if tokens[index:index + size] == phrase)
+
+
+def regex_count(text, keyword):
+    """Whole-word occurrences of keyword in text, any non-word run between its words"""
+    pattern = r'(?<!\w)' + r'\W+'.join(map(re.escape, tokenize(keyword))) + r'(?!\w)'
+    return len(re.findall(pattern, text.lower()))
+
+
+def top_phrases(tokens, size, limit=15):
+    return [' '.join(phrase) for phrase, _ in
+            Counter(zip(*(tokens[offset:] for offset in range(size)))).most_common(limit)]
+
+
+plugin_root = os.environ['PLUGIN_ROOT']
+examples = sorted(glob.glob(os.path.join(plugin_root, 'examples', 'deliverables', '*.md')))
+documents = []
+for path in examples:
+    with open(path, 'r', encoding='utf-8') as f:
+        documents.append(Document(f.read(), path))
+
+print("✓ Test 1: Tokens")
+for document in documents:
+    index = index_document(document)
+    check(index.tokens == tokenize(document.text)
+          and index.total_words == len(re.findall(r'\b\w+\b', document.text.lower())),
+          f"{os.path.basename(document.path)}: {index.total_words} words, as seo-check.py counted them")
+print("")
+
+print("✓ Test 2: N-gram counts")
+for document in documents:
+    index = index_document(document)
+    text_tokens = tokenize(document.text)
+    keywords = [phrase for size in (1, 2, 3) for phrase in top_phrases(text_tokens, size)]
+    check(all(index.count(keyword) == window_count(text_tokens, keyword.split()) for keyword in keywords)
+          and all(index.count(keyword) == regex_count(document.text, keyword)
+                  for keyword in keywords if len(set(keyword.split())) == len(keyword.split())),
+          f"{os.path.basename(document.path)}: {len(keywords)} phrases, same counts as the window and regex scans")
+print("")
+
+print("✓ Test 3: Whole words, not substrings")
+document = Document("# Start here\n\nStart the smart art show. Our art-team loves ART.\n", 'art.md')
+index = index_document(document)
+check(document.text.lower().count('art') == 6 and index.count('art') == 3,
+      "'art' counts 3 whole words where the old substring count found 6")
+check(index.count('art team') == 1 and index.count('Art-Team') == 1,
+      "'art team' matches 'art-team', whatever the case or separator")
+check(index.count('') == 0 and index.count('!!') == 0, "a keyword without words counts 0")
+print("")
+
+print("✓ Test 4: Density and placements")
+content = ("# Data Platform Guide\n\nThe data platform helps teams read data.\n\n## Why data matters\n\n"
+           "Teams use the platform daily. Data platform owners agree.\n\n## Pricing\n\nPlans start small.\n")
+index = index_document(Document(content, 'guide.md'))
+stats = index.stats('data platform')
+check(stats.count == 3 and abs(stats.density - 3 * 2 / index.total_words * 100) < 1e-9,
+      f"density is count x phrase length / total words ({stats.density:.2f}%)")
+check(stats.placements == {'h1': True, 'h2': False, 'meta': False, 'first_paragraph': True},
+      "'data platform' is in the H1 and first paragraph, not an H2")
+check(index.stats('data').placements['h2'] and not index.stats('pricing').placements['h1'],
+      "each placement is checked on its own headings")
+html = ('<html><head><meta name="description" content="Analytics for busy teams"></head><body>'
+        '<h1>Dashboards</h1><p>Analytics in one place.</p></body></html>')
+stats = index_document(Document(html, 'page.html')).stats('busy teams')
+check(stats.placements['meta'] and not stats.placements['first_paragraph'],
+      "an HTML meta description is a placement")
+stats = index_document(Document("# Title\n\nSome text.\n", 'plain.md')).stats('read data')
+check(stats.count == 0 and stats.density == 0
+      and stats.missing_placements == ['h1', 'h2', 'meta', 'first_paragraph'],
+      "an absent keyword has no count, density or placements")
+print("")
+
+print("✓ Test 5: Edited document")
+source = documents[0].content
+heading = source.index('\n## ', len(source) // 2) + 1
+edited = source[:heading] + "## Art of data\n\nThe art of data is data art.\n\n" + source[heading:]
+document = Document(edited, 'edited.md')
+index = index_document(document)
+text_tokens = tokenize(document.text)
+check(index.tokens == text_tokens and index.count('data art') == window_count(text_tokens, ['data', 'art']),
+      "the index of the edited document matches its text")
+check(index.stats('art of data').placements['h2'], "the new heading is an H2 placement")
+PYTHON
+
+echo ""
+echo "✅ Keyword index tests passed"
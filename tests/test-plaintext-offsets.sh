@@ -0,0 +1,128 @@
+#!/bin/bash
+
+# Test: single-pass markdown to plain text (lisa_quality/plaintext.py)
+#
+# Checks:
+# 1. Same plain text as the strip_markdown() regex cascade it replaced, on
+#    every example deliverable and on generated markdown, apart from the
+#    documented fixes
+# 2. The documented fixes: image alt text, snake_case, "< 160" and a bare
+#    "###" separator
+# 3. Every plain-text character maps back to the same character in the
+#    source, and source_position() gives 1-based line and column
+# 4. Heading offsets and levels, including HTML headings
+
+set -euo pipefail
+
+echo "Testing plaintext offsets"
+echo "========================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import re
+import sys
+import glob
+import random
+
+from lisa_quality.plaintext import to_plain_text
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def strip_markdown(text):
+    """The regex cascade readability-check.py used before the tokenizer"""
+    text = re.sub(r'```[\s\S]*?```', '', text)
+    text = re.sub(r'`[^`]+`', '', text)
+    text = re.sub(r'<[^<>]+>', '', text)
+    text = re.sub(r'\[([^\[\]]+)\]\([^()]+\)', r'\1', text)
+    text = re.sub(r'!\[([^\[\]]*)\]\([^()]+\)', r'\1', text)
+    text = re.sub(r'^#{1,6}[ \t]+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
+    text = re.sub(r'\*([^\*]+)\*', r'\1', text)
+    text = re.sub(r'__([^_]+)__', r'\1', text)
+    text = re.sub(r'_([^_]+)_', r'\1', text)
+    text = re.sub(r'^[\-\*_]{3,}$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[ \t]*[\-\*\+][ \t]+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[ \t]*\d+\.[ \t]+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\n(?:[^\S\n]*\n)+', '\n\n', text)
+    return text.strip()
+
+
+def offsets_map_back(plain):
+    """Every non-space plain-text character is the source character it maps to"""
+    return all(plain.source[plain.source_offset(i)] == char
+               for i, char in enumerate(plain.text) if not char.isspace())
+
+
+plugin_root = os.environ['PLUGIN_ROOT']
+examples = sorted(glob.glob(os.path.join(plugin_root, 'examples', 'deliverables', '*.md')))
+
+print("✓ Test 1: Same text as the old regex cascade")
+for path in examples:
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    old, new = strip_markdown(content), to_plain_text(content).text
+    # snake_case and the "###" separator are the fixes these examples hit
+    old = old.replace('\n\n###\n\n', '\n\n')
+    check(re.sub(r'_', '', old) == re.sub(r'_', '', new),
+          f"{os.path.basename(path)}: same plain text apart from the documented fixes")
+
+# Generated markdown avoids where the cascade was also wrong: a "* " bullet
+# before italics (the bullet's star paired with the italic's) and nested
+# list markers ("2. 1. Step")
+random.seed(3)
+pieces = ['Plain words here.', '**bold text**', '*italic*', '__strong__', '[a link](http://x.com)',
+          'run `code` here', 'a <span>tagged</span> word', 'more words', 'A sentence ends.', 'step 1. numbered']
+prefixes = ['', '', '', '# ', '## ', '- ', '2. ', '---\n', '```\nfenced\n```\n', '\n']
+lines = [random.choice(prefixes) + ' '.join(random.choice(pieces) for _ in range(random.randint(1, 6)))
+         for _ in range(500)]
+generated = '\n'.join(lines)
+check(strip_markdown(generated) == to_plain_text(generated).text, "generated markdown: identical plain text")
+print("")
+
+print("✓ Test 2: Documented fixes")
+check(to_plain_text("See ![the chart](c.png) now.").text == "See the chart now.",
+      "an image becomes its alt text, without the '!' the cascade left")
+check(to_plain_text("Use user_id and account_name here.").text == "Use user_id and account_name here.",
+      "snake_case keeps its underscores")
+check(to_plain_text("Keep it < 160 characters and > 50.").text == "Keep it < 160 characters and > 50.",
+      "'< 160 ... >' is not taken for an HTML tag")
+check(to_plain_text("Last words.\n\n###\n\nEditor's note.").text == "Last words.\n\nEditor's note.",
+      "a bare '###' separator line is removed")
+print("")
+
+print("✓ Test 3: Offsets map back to the source")
+for path in examples:
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    check(offsets_map_back(to_plain_text(content)), f"{os.path.basename(path)}: every character maps back")
+check(offsets_map_back(to_plain_text(generated)), "generated markdown: every character maps back")
+
+source = "# Title\n\nSome **bold** and [linked](http://x.com) words.\n\n- item one\n  1. nested"
+plain = to_plain_text(source)
+for word, position in (('Title', (1, 3)), ('bold', (3, 8)), ('linked', (3, 20)),
+                       ('words', (3, 42)), ('item', (5, 3)), ('nested', (6, 6))):
+    check(plain.source_position(plain.text.index(word)) == position,
+          f"'{word}' is at line {position[0]}, column {position[1]}")
+print("")
+
+print("✓ Test 4: Headings")
+plain = to_plain_text("# One\n\nText.\n\n### 2. Three\n\n<h2>Two</h2>\n\n###\n\nEnd.")
+check([(plain.text[offset:offset + 3], level) for offset, level in plain.headings]
+      == [('One', 1), ('Thr', 3), ('Two', 2)],
+      "markdown and HTML headings are recorded where their text starts, with their level")
+PYTHON
+
+echo ""
+echo "✅ Plaintext offset tests passed"
@@ -0,0 +1,171 @@
+#!/bin/bash
+
+# Test: block-assembled readability (lisa_quality/readability.py)
+#
+# Checks:
+# 1. Document scores equal textstat's on the old regex-cascade plain text
+#    (how readability-check.py scored before the engine), for every example
+#    deliverable
+# 2. Word, syllable and sentence totals assembled from blocks equal
+#    textstat's counts over the whole plain text, including sentences that
+#    run across block boundaries and sections split for length
+# 3. Section totals add up to the sentences they hold
+# 4. After editing one section only its block is re-analyzed, and the
+#    report equals one scored from scratch
+
+set -euo pipefail
+
+echo "Testing block-assembled readability"
+echo "==================================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import re
+import sys
+import glob
+import random
+
+import textstat
+
+from lisa_quality import blocks, readability
+from lisa_quality.document import Document
+from lisa_quality.readability import analyze_document
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def strip_markdown(text):
+    """The regex cascade readability-check.py scored with textstat before the engine"""
+    text = re.sub(r'```[\s\S]*?```', '', text)
+    text = re.sub(r'`[^`]+`', '', text)
+    text = re.sub(r'<[^<>]+>', '', text)
+    text = re.sub(r'\[([^\[\]]+)\]\([^()]+\)', r'\1', text)
+    text = re.sub(r'!\[([^\[\]]*)\]\([^()]+\)', r'\1', text)
+    text = re.sub(r'^#{1,6}[ \t]+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
+    text = re.sub(r'\*([^\*]+)\*', r'\1', text)
+    text = re.sub(r'__([^_]+)__', r'\1', text)
+    text = re.sub(r'_([^_]+)_', r'\1', text)
+    text = re.sub(r'^[\-\*_]{3,}$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[ \t]*[\-\*\+][ \t]+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[ \t]*\d+\.[ \t]+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\n(?:[^\S\n]*\n)+', '\n\n', text)
+    return text.strip()
+
+
+def textstat_totals(text):
+    return (textstat.lexicon_count(text), textstat.syllable_count(text), max(1, textstat.sentence_count(text)))
+
+
+def report_totals(report):
+    return (report.document.words, report.document.syllables, report.document.sentences)
+
+
+def summary(report):
+    """Everything a report says, for comparing two reports"""
+    return (report_totals(report),
+            [(s.title, s.level, s.line, s.words, s.sentences, s.syllables) for s in report.sections],
+            [(s.text, s.start, s.line, s.words, s.syllables, s.counted) for s in report.sentences])
+
+
+def fresh(content):
+    """Report scored with no block analyses or reports memoized"""
+    blocks._analyses.clear()
+    readability._reports.clear()
+    return analyze_document(Document(content))
+
+
+plugin_root = os.environ['PLUGIN_ROOT']
+examples = sorted(glob.glob(os.path.join(plugin_root, 'examples', 'deliverables', '*.md')))
+
+print("✓ Test 1: Same scores as textstat on the old plain text")
+for path in examples:
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    report = analyze_document(Document(content, path))
+    old = strip_markdown(content)
+    check((report.reading_ease, report.grade_level)
+          == (textstat.flesch_reading_ease(old), textstat.flesch_kincaid_grade(old)),
+          f"{os.path.basename(path)}: {report.reading_ease} / grade {report.grade_level}, same as textstat")
+print("")
+
+print("✓ Test 2: Totals assembled from blocks")
+for path in examples:
+    with open(path, 'r', encoding='utf-8') as f:
+        document = Document(f.read(), path)
+    report = analyze_document(document)
+    check(report_totals(report) == textstat_totals(document.plain_text),
+          f"{os.path.basename(path)}: {len(document.blocks)} blocks, same words, syllables and sentences as textstat")
+
+# Sentences left open before a heading (the sentence pattern runs on into
+# the next block) and sections long enough to be split into several blocks
+random.seed(8)
+words = ['customers', 'report', 'faster', 'onboarding', 'with', 'the', 'new', 'dashboard', 'and',
+         'analytics', 'teams', 'approve', 'budgets', 'every', 'quarter', 'immediately']
+parts = []
+for number in range(12):
+    parts.append(f"{'#' * random.randint(1, 3)} Section {number}\n")
+    for _ in range(random.choice([1, 2, 90])):
+        sentence = ' '.join(random.choice(words) for _ in range(random.randint(1, 18)))
+        parts.append(sentence.capitalize() + random.choice(['.', '!', '?', '', '...']) + '\n\n')
+content = ''.join(parts)
+document = Document(content)
+report = analyze_document(document)
+check(len(document.blocks) > 12, f"generated document splits into {len(document.blocks)} blocks")
+check(report_totals(report) == textstat_totals(document.plain_text),
+      "generated document: same words, syllables and sentences as textstat")
+check((report.reading_ease, report.grade_level)
+      == (textstat.flesch_reading_ease(document.plain_text), textstat.flesch_kincaid_grade(document.plain_text)),
+      "generated document: same scores as textstat")
+check(sum(1 for s in report.sentences if s.counted) == textstat.sentence_count(document.plain_text),
+      "a sentence running across a block boundary counts once")
+print("")
+
+print("✓ Test 3: Sections add up")
+for content in [open(path, encoding='utf-8').read() for path in examples] + [content]:
+    report = analyze_document(Document(content))
+    by_section = [sum(getattr(s, field) for s in report.sections) for field in ('words', 'sentences', 'syllables')]
+    by_sentence = [sum(getattr(s, field) for s in report.sentences) for field in ('words', 'sentences', 'syllables')]
+    check(by_section == by_sentence, f"{len(report.sections)} sections hold every sentence's totals")
+print("")
+
+print("✓ Test 4: Re-scoring an edited document")
+with open(os.path.join(plugin_root, 'examples', 'deliverables', 'messaging-framework.md'), 'r',
+          encoding='utf-8') as f:
+    content = f.read()
+analyze_document(Document(content))
+headings = [m.start() for m in re.finditer(r'^## ', content, re.MULTILINE)]
+heading_end = content.index('\n', headings[3]) + 1
+edited = content[:heading_end] + "\nOne new sentence was added here today.\n" + content[heading_end:]
+
+analyzed = []
+
+
+class CountingBlockText(readability.BlockText):
+    def __init__(self, source):
+        analyzed.append(source)
+        super().__init__(source)
+
+
+original = readability.BlockText
+readability.BlockText = CountingBlockText
+incremental = analyze_document(Document(edited))
+readability.BlockText = original
+check(len(analyzed) == 1 and analyzed[0].startswith(content[headings[3]:heading_end]),
+      "only the edited section's block is analyzed again")
+check(summary(incremental) == summary(fresh(edited)), "the report equals one scored from scratch")
+PYTHON
+
+echo ""
+echo "✅ Block-assembled readability tests passed"
@@ -0,0 +1,138 @@
+#!/bin/bash
+
+# Test: combined-lookahead rule engine (lisa_quality/rules.py)
+#
+# Checks:
+# 1. The single combined pass finds exactly what running each rule's own
+#    re.finditer finds (how ap-style-check.py scanned before the engine),
+#    for the bundled AP Style pack on every example deliverable and on a
+#    generated document
+# 2. Rules matching at the same offset, empty matches and mixed case flags
+# 3. minMatches, reportOnce and message substitution
+# 4. Pack merging: a later rule replaces an earlier one, enabled=false
+#    removes it; unsupported patterns are rejected
+
+set -euo pipefail
+
+echo "Testing rule engine"
+echo "==================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import glob
+import json
+import random
+
+from lisa_quality.rules import Rule, RulePackError, RuleSet, load_rule_pack
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def every_match(specs):
+    """The specs as a RuleSet reporting every match (no minMatches or reportOnce)"""
+    return RuleSet(Rule({key: value for key, value in spec.items() if key not in ('minMatches', 'reportOnce')})
+                   for spec in specs)
+
+
+def combined_spans(rule_set, content):
+    spans = {rule.id: [] for rule in rule_set.rules}
+    for finding in rule_set.scan(content):
+        spans[finding.rule.id].append((finding.start, finding.end))
+    return spans
+
+
+def separate_spans(rule_set, content):
+    """One re.finditer per rule, as the checks ran before the combined pattern"""
+    return {rule.id: [m.span() for m in rule.regex.finditer(content)] for rule in rule_set.rules}
+
+
+plugin_root = os.environ['PLUGIN_ROOT']
+pack = load_rule_pack(os.path.join(plugin_root, 'scripts', 'ap-style-rules.json'))
+rule_set = every_match(pack)
+
+print("✓ Test 1: Same matches as one finditer per rule")
+for path in sorted(glob.glob(os.path.join(plugin_root, 'examples', 'deliverables', '*.md'))):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    spans = combined_spans(rule_set, content)
+    check(spans == separate_spans(rule_set, content),
+          f"{os.path.basename(path)}: {sum(map(len, spans.values()))} match(es), same as separate scans")
+
+random.seed(5)
+phrases = ['red, white, and blue', 'alot', '50 percent', 'over 300', 'March 15th', '2026-03-15',
+           '10:30 AM', 'end.  Next', 'Texas', 'New York', 'Jane Smith, Chief Officer', 'plain words',
+           'ALOT', '7 percent', 'Over 12', 'a, b, and c']
+content = '\n'.join(' '.join(random.choice(phrases) for _ in range(random.randint(1, 8))) for _ in range(300))
+spans = combined_spans(rule_set, content)
+check(all(spans.values()), "generated document triggers every bundled rule")
+check(spans == separate_spans(rule_set, content), "generated document: same matches as separate scans")
+print("")
+
+print("✓ Test 2: Rules at the same offset, empty matches, case flags")
+specs = [
+    {'id': 'digits', 'pattern': r'\d+', 'message': 'm'},
+    {'id': 'digit', 'pattern': r'\d', 'message': 'm'},
+    {'id': 'two-and-word', 'pattern': r'\d{2}\w*', 'message': 'm'},
+    {'id': 'pairs', 'pattern': 'aa', 'message': 'm'},
+    {'id': 'word-start', 'pattern': r'\b(?=\w)', 'message': 'm'},
+    {'id': 'lower', 'pattern': 'abc', 'message': 'm'},
+    {'id': 'any-case', 'pattern': 'abc', 'ignoreCase': True, 'message': 'm'},
+]
+tricky = every_match(specs)
+content = "aaaa 12345x abc ABC 7 aaa\n99 Abc"
+spans = combined_spans(tricky, content)
+check(spans == separate_spans(tricky, content), "overlapping rules each report what their own finditer does")
+check(spans['pairs'] == [(0, 2), (2, 4), (22, 24)], "a rule's own matches do not overlap")
+check(len(spans['word-start']) == 8, "empty matches are reported at every word start")
+check(spans['lower'] == [(12, 15)] and len(spans['any-case']) == 3, "case flags stay scoped to their rule")
+print("")
+
+print("✓ Test 3: minMatches, reportOnce and messages")
+states = RuleSet([Rule(next(spec for spec in pack if spec['id'] == 'AP009'))])
+check(states.scan("Texas, Ohio and Utah.") == [], "three state names stay below minMatches")
+findings = states.scan("Texas, Ohio, Utah and Iowa. Then Maine.")
+check(len(findings) == 1 and findings[0].count == 5 and findings[0].text == 'Texas',
+      "five state names report once, at the first, with the total count")
+check(findings[0].message.startswith("5 full state names found"), "{count} is substituted in the message")
+percent = RuleSet([Rule(next(spec for spec in pack if spec['id'] == 'AP003'))])
+finding, = percent.scan("Up\nby 50 percent.")
+check((finding.line, finding.column) == (2, 4) and "'50 percent'" in finding.message,
+      "findings carry line, column and the {match} text")
+print("")
+
+print("✓ Test 4: Pack merging and validation")
+with open('base.json', 'w') as f:
+    json.dump({'rules': [{'id': 'A', 'pattern': 'foo', 'message': 'base'},
+                         {'id': 'B', 'pattern': 'bar', 'message': 'base'}]}, f)
+with open('custom.json', 'w') as f:
+    json.dump({'rules': [{'id': 'A', 'pattern': 'baz', 'message': 'custom'},
+                         {'id': 'B', 'enabled': False}]}, f)
+merged = RuleSet.from_packs(['base.json', 'custom.json'])
+check([(rule.id, rule.pattern) for rule in merged.rules] == [('A', 'baz')],
+      "a later pack replaces rule A and disables rule B")
+for spec, problem in (({'id': 'X', 'pattern': r'(a)\1', 'message': 'm'}, "backreference"),
+                      ({'id': 'X', 'pattern': '(?P<name>a)', 'message': 'm'}, "named group"),
+                      ({'id': 'X', 'pattern': '(', 'message': 'm'}, "invalid pattern"),
+                      ({'id': 'X', 'pattern': 'a', 'message': 'm', 'severity': 'fatal'}, "unknown severity")):
+    try:
+        Rule(spec)
+    except RulePackError:
+        check(True, f"{problem} rejected")
+    else:
+        check(False, f"{problem} rejected")
+PYTHON
+
+echo ""
+echo "✅ Rule engine tests passed"
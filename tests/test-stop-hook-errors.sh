@@ -0,0 +1,116 @@
+#!/bin/bash
+
+# Test: stop hook failure outcomes (hooks/stop-hook.sh, lisa_campaign/hook.py)
+#
+# Checks:
+# 1. A session running no campaign stops silently, leaving the workspace's
+#    campaigns alone
+# 2. An exception in the hook's Python steps is reported as the error
+#    outcome: the hook prints it and ends the session's campaign
+# 3. Python failing outright is reported too, and leaves the campaigns
+#    alone since it cannot tell whose they are
+# 4. A corrupted single-campaign state file from an older version is
+#    reported and removed
+
+set -euo pipefail
+
+echo "Testing stop hook errors"
+echo "========================"
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import json
+import shutil
+import subprocess
+
+from lisa_campaign.campaigns import Campaign
+
+plugin_root = os.environ['PLUGIN_ROOT']
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def start(campaign_id):
+    subprocess.run([sys.executable, os.path.join(plugin_root, 'scripts', 'campaign-state.py'),
+                    '--campaign', campaign_id, 'init', f"campaign_name={campaign_id}", 'campaign_type=pr'],
+                   input="Work on the brief", text=True, check=True, stdout=subprocess.DEVNULL)
+
+
+def transcript(path, *texts):
+    with open(path, 'w', encoding='utf-8') as f:
+        for text in texts:
+            f.write(json.dumps({'message': {'role': 'assistant', 'content': [{'type': 'text', 'text': text}]}}) + '\n')
+    return os.path.abspath(path)
+
+
+def broken_plugin(name, path, text):
+    """A copy of the plugin with text appended to one of its files"""
+    root = os.path.abspath(name)
+    for folder in ('hooks', 'scripts'):
+        shutil.copytree(os.path.join(plugin_root, folder), os.path.join(root, folder),
+                        ignore=shutil.ignore_patterns('__pycache__'))
+    with open(os.path.join(root, path), 'a', encoding='utf-8') as f:
+        f.write(text)
+    return root
+
+
+def stop_hook(session_id, path, root=plugin_root):
+    return subprocess.run(['bash', os.path.join(root, 'hooks', 'stop-hook.sh')],
+                          input=json.dumps({'session_id': session_id, 'transcript_path': path}),
+                          env=dict(os.environ, CLAUDE_PLUGIN_ROOT=root), text=True, capture_output=True)
+
+
+print("✓ Test 1: No campaign")
+start('launch')
+result = stop_hook('session-1', transcript('none.jsonl', "Nothing to do."))
+check(result.returncode == 0 and result.stdout == "" and result.stderr == "" and Campaign('launch').exists(),
+      "a session running no campaign stops silently")
+print("")
+
+print("✓ Test 2: Exception in the hook's steps")
+root = broken_plugin('broken-reader', os.path.join('scripts', 'lisa_campaign', 'transcript.py'),
+                     "\n\ndef last_assistant_message(*args, **kwargs):\n"
+                     "    raise RuntimeError('transcript reader broke')\n")
+result = stop_hook('session-1', transcript('launch.jsonl', "Campaign ID: launch", "Working."), root)
+check(result.returncode == 0 and "Stop hook failed" in result.stderr
+      and "RuntimeError: transcript reader broke" in result.stderr,
+      "the exception is reported")
+check(not Campaign('launch').exists(), "and the session's campaign is ended")
+print("")
+
+print("✓ Test 3: Python failing outright")
+start('rebrand')
+root = broken_plugin('broken-import', os.path.join('scripts', 'lisa_campaign', 'hook.py'),
+                     "\nraise ImportError('hook module broke')\n")
+result = stop_hook('session-2', transcript('rebrand.jsonl', "Campaign ID: rebrand", "Working."), root)
+check(result.returncode == 0 and "Stop hook failed" in result.stderr and "hook module broke" in result.stderr,
+      "the traceback is reported")
+check(Campaign('rebrand').exists(), "the campaigns are left alone")
+shutil.rmtree('.claude')
+print("")
+
+print("✓ Test 4: Corrupted legacy state file")
+os.makedirs('.claude')
+with open(os.path.join('.claude', 'lisa-campaign.local.md'), 'w', encoding='utf-8') as f:
+    f.write("---\niteration: three\n---\nWork on the brief\n")
+result = stop_hook('session-3', transcript('legacy.jsonl', "Working."))
+check(result.returncode == 0 and "State file corrupted" in result.stderr
+      and "'iteration' field is not a valid number" in result.stderr,
+      "the legacy state file is reported")
+check(not os.path.exists(os.path.join('.claude', 'lisa-campaign.local.md')), "and removed")
+PYTHON
+
+echo ""
+echo "✅ Stop hook error tests passed"
@@ -0,0 +1,180 @@
+#!/bin/bash
+
+# Test: transcript reader with bookmark resume (lisa_campaign/transcript.py)
+#
+# Checks:
+# 1. Across a session of appended turns (long tool results, user-only turns,
+#    lines written in two parts) every call returns what the old stop hook's
+#    grep | tail -1 | jq found
+# 2. A resumed call only searches the bytes appended since the last call
+# 3. A bookmark for another file, or for a file that shrank or was
+#    replaced, is ignored
+# 4. String content, no assistant message and invalid JSON
+
+set -euo pipefail
+
+echo "Testing transcript bookmark"
+echo "==========================="
+echo ""
+
+PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)}"
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+cd "$WORK_DIR"
+
+PLUGIN_ROOT="$PLUGIN_ROOT" PYTHONPATH="$PLUGIN_ROOT/scripts" python3 - <<'PYTHON'
+import os
+import sys
+import json
+import random
+
+from lisa_campaign import transcript
+from lisa_campaign.transcript import BLOCK_SIZE, TranscriptError, last_assistant_message
+
+
+def check(condition, message):
+    if not condition:
+        print(f"  ✗ FAIL: {message}")
+        sys.exit(1)
+    print(f"  ✓ {message}")
+
+
+def line(role, *texts, tool_result=None):
+    content = [{'type': 'text', 'text': text} for text in texts]
+    if tool_result is not None:
+        content.append({'type': 'tool_result', 'content': tool_result})
+    return json.dumps({'type': role, 'message': {'role': role, 'content': content}},
+                      separators=(',', ':')) + '\n'
+
+
+def old_last(path):
+    """The old stop hook: grep '"role":"assistant"' | tail -1 | jq (text blocks joined)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        matches = [text for text in f.read().split('\n') if '"role":"assistant"' in text]
+    if not matches:
+        return None
+    try:
+        content = json.loads(matches[-1])['message']['content']
+        return '\n'.join(block['text'] for block in content if block.get('type') == 'text')
+    except ValueError:
+        return TranscriptError
+
+
+def new_last(path, bookmark):
+    try:
+        return last_assistant_message(path, bookmark)
+    except TranscriptError:
+        return TranscriptError
+
+
+def append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+print("✓ Test 1: Same message as the old grep scan, call after call")
+random.seed(21)
+append('session.jsonl', '')
+pending = ''
+calls = mismatches = 0
+for turn in range(300):
+    kind = random.choice(['assistant', 'assistant', 'user', 'tool', 'split', 'finish'])
+    if kind == 'finish' or pending:
+        append('session.jsonl', pending)
+        pending = ''
+    if kind == 'assistant':
+        texts = [f"Turn {turn} done."] + (["<promise>DONE</promise>"] if turn % 7 == 0 else [])
+        append('session.jsonl', line('assistant', *texts))
+    elif kind == 'user':
+        append('session.jsonl', line('user', f"Continue {turn}"))
+    elif kind == 'tool':
+        append('session.jsonl', line('user', tool_result='x' * random.randint(BLOCK_SIZE // 2, 3 * BLOCK_SIZE)))
+    elif kind == 'split':
+        # A line whose first part is on disk when the hook runs
+        whole = line(random.choice(['assistant', 'user']), f"Split turn {turn}")
+        cut = random.randint(1, len(whole) - 1)
+        append('session.jsonl', whole[:cut])
+        pending = whole[cut:]
+    calls += 1
+    mismatches += old_last('session.jsonl') != new_last('session.jsonl', 'bookmark.json')
+check(mismatches == 0, f"{calls} resumed calls over a {os.path.getsize('session.jsonl') // 1024} KB transcript "
+                       "return what the old scan returns")
+print("")
+
+print("✓ Test 2: Only appended bytes are searched")
+searched = []
+original = transcript.find_last_assistant
+
+
+def recording(f, end, start=0):
+    searched.append(end - start)
+    return original(f, end, start)
+
+
+transcript.find_last_assistant = recording
+append('session.jsonl', pending + line('user', tool_result='y' * 1000))
+size = os.path.getsize('session.jsonl')
+new_last('session.jsonl', 'bookmark.json')
+appended = line('assistant', "Newest turn.")
+append('session.jsonl', appended)
+searched.clear()
+check(last_assistant_message('session.jsonl', 'bookmark.json') == "Newest turn." and searched == [len(appended)],
+      f"a new turn searches {len(appended)} appended bytes, not the {size // 1024} KB before them")
+appended = line('user', "Thanks")
+append('session.jsonl', appended)
+searched.clear()
+check(last_assistant_message('session.jsonl', 'bookmark.json') == "Newest turn." and searched == [len(appended)],
+      "a user-only append re-reads the bookmarked message without searching the rest")
+searched.clear()
+check(last_assistant_message('session.jsonl', None) == "Newest turn."
+      and searched == [os.path.getsize('session.jsonl')],
+      "without a bookmark the whole file is searched")
+transcript.find_last_assistant = original
+print("")
+
+print("✓ Test 3: Stale bookmarks")
+with open('other.jsonl', 'w', encoding='utf-8') as f:
+    f.write(line('assistant', "Other session."))
+check(last_assistant_message('other.jsonl', 'bookmark.json') == "Other session.",
+      "a bookmark for another transcript is ignored")
+with open('session.jsonl', 'r+', encoding='utf-8') as f:
+    f.truncate(0)
+    f.write(line('assistant', "Compacted.") + line('user', "Go on"))
+last_assistant_message('session.jsonl', 'bookmark.json')
+with open('session.jsonl', 'r+', encoding='utf-8') as f:
+    f.truncate(0)
+    f.write(line('assistant', "Shorter."))
+check(last_assistant_message('session.jsonl', 'bookmark.json') == "Shorter.", "a file that shrank is searched again")
+with open('replacement.jsonl', 'w', encoding='utf-8') as f:
+    f.write(line('assistant', "Replaced, and longer than the file it replaces.") + line('user', "Next"))
+os.replace('replacement.jsonl', 'session.jsonl')
+check(last_assistant_message('session.jsonl', 'bookmark.json') == "Replaced, and longer than the file it replaces.",
+      "a file replaced by a longer one (new inode) is searched again")
+with open('bookmark.json', 'w', encoding='utf-8') as f:
+    f.write('{not json')
+check(last_assistant_message('session.jsonl', 'bookmark.json') == "Replaced, and longer than the file it replaces.",
+      "an unreadable bookmark is ignored")
+print("")
+
+print("✓ Test 4: Message formats and errors")
+with open('string.jsonl', 'w', encoding='utf-8') as f:
+    f.write(json.dumps({'message': {'role': 'assistant', 'content': 'Plain string content'}}) + '\n')
+check(last_assistant_message('string.jsonl') == "Plain string content", "string content is returned as is")
+with open('users.jsonl', 'w', encoding='utf-8') as f:
+    f.write(line('user', "Hello") + line('user', "Anyone?"))
+check(last_assistant_message('users.jsonl') is None, "no assistant message returns None")
+with open('empty.jsonl', 'w', encoding='utf-8') as f:
+    pass
+check(last_assistant_message('empty.jsonl', 'empty-bookmark.json') is None, "an empty transcript returns None")
+with open('bad.jsonl', 'w', encoding='utf-8') as f:
+    f.write(line('assistant', "Fine") + '{"message":{"role":"assistant","content":[\n')
+try:
+    last_assistant_message('bad.jsonl')
+except TranscriptError:
+    check(True, "an invalid last assistant line raises TranscriptError")
+else:
+    check(False, "an invalid last assistant line raises TranscriptError")
+PYTHON
+
+echo ""
+echo "✅ Transcript bookmark tests passed"